@@ -3,18 +3,36 @@
 
 This script runs performance benchmarks for different collection scenarios
 and generates a report with timing, memory, and API usage statistics.
+
+With --fake-github the CLI collects from a local fake GitHub API (see
+tests/fake_server.py) serving a synthetic organization, so results do not
+depend on network or quota and can run in CI.
 """
 
 import argparse
+import contextlib
 import json
+import os
 import resource
 import subprocess
 import sys
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import yaml
+
+# The fake GitHub API is a dev-only module in the tests package, not part of
+# the installed distribution
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tests.fake_server import FakeGitHub, FaultProfile, SyntheticOrg, serve_in_thread
+
+# Accepted by GitHubAuth's format check; the fake server takes any token
+FAKE_TOKEN = "ghp_" + "0" * 36
+
 
 @dataclass
 class BenchmarkResult:
@@ -176,6 +194,57 @@ def run_full_pipeline_benchmark(
     return run_benchmark(name, config_path, cmd)
 
 
+def fake_github_config(config_path: str, url: str, org: str, output_dir: str) -> str:
+    """Write a copy of a config that collects ``org`` from the fake server.
+
+    Args:
+        config_path: Config to copy
+        url: Fake server base URL
+        org: Synthetic organization name
+        output_dir: Directory for the copied config
+
+    Returns:
+        Path of the copied config
+    """
+    with Path(config_path).open() as f:
+        config = yaml.safe_load(f)
+    github = config.setdefault("github", {})
+    github["api_url"] = url
+    github["target"] = {"mode": "org", "name": org}
+    token_env = github.get("auth", {}).get("token_env", "GITHUB_TOKEN")
+    os.environ.setdefault(token_env, FAKE_TOKEN)
+
+    fake_config = Path(output_dir) / "fake_github.yaml"
+    with fake_config.open("w") as f:
+        yaml.safe_dump(config, f)
+    return str(fake_config)
+
+
+def record_server_stats(
+    result: BenchmarkResult, server: FakeGitHub, before: dict[str, Any]
+) -> dict[str, Any]:
+    """Attach the requests the fake server answered during a run to its result.
+
+    Args:
+        result: Result of the run
+        server: Fake server the run collected from
+        before: Server summary before the run (empty for the first run)
+
+    Returns:
+        Server summary after the run
+    """
+
+    def limited(summary: dict[str, Any]) -> int:
+        statuses = summary.get("by_status", {})
+        return int(statuses.get("403", 0)) + int(statuses.get("429", 0))
+
+    summary = server.summary()
+    result.api_requests = summary["requests"] - before.get("requests", 0)
+    result.rate_limit_waits = limited(summary) - limited(before)
+    result.extra["fake_github"] = summary
+    return summary
+
+
 def generate_report(results: list[BenchmarkResult], output_path: str) -> None:
     """Generate a benchmark report.
 
@@ -282,6 +351,37 @@ def main():
         default="benchmark_results.json",
         help="Output file for results",
     )
+    fake = parser.add_argument_group("fake GitHub API (offline, deterministic)")
+    fake.add_argument(
+        "--fake-github",
+        action="store_true",
+        help="Collect from a local fake GitHub API instead of api.github.com",
+    )
+    fake.add_argument("--fake-repos", type=int, default=20, help="Synthetic repositories")
+    fake.add_argument("--fake-pulls", type=int, default=50, help="PRs per repository")
+    fake.add_argument("--fake-issues", type=int, default=50, help="Issues per repository")
+    fake.add_argument("--fake-reviews", type=int, default=2, help="Reviews per PR")
+    fake.add_argument("--fake-comments", type=int, default=2, help="Comments per issue or PR")
+    fake.add_argument(
+        "--fake-latency", type=float, default=0.05, help="Median response latency (seconds)"
+    )
+    fake.add_argument(
+        "--fake-latency-sigma", type=float, default=0.5, help="Log-normal latency spread"
+    )
+    fake.add_argument("--fake-error-rate", type=float, default=0.0, help="Share of 5xx responses")
+    fake.add_argument(
+        "--fake-secondary-limit-rate",
+        type=float,
+        default=0.0,
+        help="Share of 403/429 secondary rate limit responses",
+    )
+    fake.add_argument(
+        "--fake-rest-limit", type=int, default=5000, help="REST requests per rate limit window"
+    )
+    fake.add_argument(
+        "--fake-reset-seconds", type=float, default=3600.0, help="Rate limit window length"
+    )
+    fake.add_argument("--fake-seed", type=int, default=0, help="Seed for data and faults")
 
     args = parser.parse_args()
 
@@ -290,7 +390,58 @@ def main():
         print(f"Error: Config file not found: {args.config}")
         sys.exit(1)
 
-    results = []
+    with contextlib.ExitStack() as stack:
+        server = None
+        if args.fake_github:
+            org = SyntheticOrg(
+                repos=args.fake_repos,
+                pulls=args.fake_pulls,
+                issues=args.fake_issues,
+                reviews=args.fake_reviews,
+                comments=args.fake_comments,
+                seed=args.fake_seed,
+            )
+            faults = FaultProfile(
+                latency=args.fake_latency,
+                latency_sigma=args.fake_latency_sigma,
+                error_rate=args.fake_error_rate,
+                secondary_limit_rate=args.fake_secondary_limit_rate,
+                rest_limit=args.fake_rest_limit,
+                reset_seconds=args.fake_reset_seconds,
+                seed=args.fake_seed,
+            )
+            server = FakeGitHub(org, faults)
+            url = stack.enter_context(serve_in_thread(server))
+            workdir = stack.enter_context(tempfile.TemporaryDirectory())
+            args.config = fake_github_config(args.config, url, org.name, workdir)
+            print(f"Fake GitHub API serving {org.name} at {url}")
+
+        results = run_scenario(args, server)
+
+    print_results_table(results)
+    generate_report(results, args.output)
+
+
+def run_scenario(
+    args: argparse.Namespace, server: FakeGitHub | None = None
+) -> list[BenchmarkResult]:
+    """Run the benchmarks of the selected scenario.
+
+    Args:
+        args: Parsed command line arguments
+        server: Fake server the runs collect from, if any
+
+    Returns:
+        One result per run
+    """
+    results: list[BenchmarkResult] = []
+    served: dict[str, Any] = {}
+
+    def add(result: BenchmarkResult) -> None:
+        nonlocal served
+        if server is not None:
+            served = record_server_stats(result, server, served)
+        results.append(result)
 
     if args.scenario == "collect":
         result = run_collection_benchmark(
@@ -298,14 +449,14 @@ def main():
             config_path=args.config,
             force=args.force,
         )
-        results.append(result)
+        add(result)
 
     elif args.scenario == "build":
         result = run_build_benchmark(
             name="Site Build",
             config_path=args.config,
         )
-        results.append(result)
+        add(result)
 
     elif args.scenario == "all":
         result = run_full_pipeline_benchmark(
@@ -313,7 +464,7 @@ def main():
             config_path=args.config,
             force=args.force,
         )
-        results.append(result)
+        add(result)
 
     elif args.scenario == "resume":
         # First run collect, then simulate resume
@@ -322,7 +473,7 @@ def main():
             config_path=args.config,
             force=True,
         )
-        results.append(result1)
+        add(result1)
 
         # Run resume (should be fast since data exists)
         result2 = run_collection_benchmark(
@@ -330,10 +481,9 @@ def main():
             config_path=args.config,
             force=False,
         )
-        results.append(result2)
+        add(result2)
 
-    print_results_table(results)
-    generate_report(results, args.output)
+    return results
 
 
 if __name__ == "__main__":
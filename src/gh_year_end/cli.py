@@ -3,23 +3,76 @@
 Simplified CLI with 2 main commands:
 - collect: Collect GitHub data and generate metrics JSON
 - build: Build static HTML site from metrics JSON
+
+Plus rebuild-metrics, which regenerates metrics JSON from stored raw data,
+and analyze-trace, which summarizes a request trace written by collect.
 """
 
 import asyncio
 import json
+import os
+import shutil
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import click
 from rich.console import Console
 
 from gh_year_end import __version__
-from gh_year_end.config import load_config
+from gh_year_end.config import Config, load_config
 from gh_year_end.logging import setup_logging
 
 console = Console()
 
 
+def _write_metrics_json(metrics: dict[str, Any], data_dir: Path, shard_size: int) -> int:
+    """Write each metrics section to data_dir/<name>.json.
+
+    Full leaderboard rankings, when present, go to sharded files under
+    data_dir/leaderboards_full/ instead of a single JSON file; otherwise any
+    earlier full rankings are removed so the report does not read stale ones.
+
+    Args:
+        metrics: Metrics dict from MetricsAggregator.export() or compute_metrics().
+        data_dir: Output directory (site/{year}/data).
+        shard_size: Entries per full rankings shard.
+
+    Returns:
+        Number of files written.
+    """
+    from gh_year_end.metrics.leaderboards import FULL_RANKINGS_KEY, write_full_rankings
+
+    files_written = 0
+    for name, data in metrics.items():
+        if name == FULL_RANKINGS_KEY:
+            shards = write_full_rankings(data, data_dir / FULL_RANKINGS_KEY, shard_size)
+            console.print(f"  ✓ {data_dir / FULL_RANKINGS_KEY}/ ({len(shards)} files)")
+            files_written += len(shards)
+            continue
+
+        filepath = data_dir / f"{name}.json"
+        with filepath.open("w") as f:
+            json.dump(data, f, indent=2, default=str)
+        console.print(f"  ✓ {filepath}")
+        files_written += 1
+    if FULL_RANKINGS_KEY not in metrics:
+        shutil.rmtree(data_dir / FULL_RANKINGS_KEY, ignore_errors=True)
+    return files_written
+
+
+def _parse_deadline(ctx: click.Context, param: click.Parameter, value: str | None) -> float | None:
+    """Click callback converting --deadline to seconds."""
+    if value is None:
+        return None
+    from gh_year_end.collect.deadline import parse_duration
+
+    try:
+        return parse_duration(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="gh-year-end")
 @click.option("--verbose", "-v", is_flag=True, default=False, help="Enable verbose output")
@@ -67,8 +120,70 @@ def main(ctx: click.Context, verbose: bool) -> None:
     default=None,
     help="Override year from config (recalculates since/until)",
 )
+@click.option(
+    "--plan",
+    "plan_only",
+    is_flag=True,
+    default=False,
+    help="Print the pre-flight request budget plan and exit without collecting",
+)
+@click.option(
+    "--deadline",
+    callback=_parse_deadline,
+    default=None,
+    help="Stop collecting after this long (e.g. 45m, 2h, 1h30m); busiest repos go first",
+)
+@click.option(
+    "--budget",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop collecting after this many API requests; busiest repos go first",
+)
+@click.option(
+    "--trace-requests",
+    is_flag=True,
+    default=False,
+    help="Write a JSONL record per API request (see analyze-trace)",
+)
+@click.option(
+    "--metrics-port",
+    type=click.IntRange(min=0, max=65535),
+    default=None,
+    help="Serve live OpenMetrics on http://127.0.0.1:PORT/metrics while collecting",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Rewrite this file with live OpenMetrics while collecting",
+)
+@click.option(
+    "--trace-events",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write Chrome/Perfetto trace-event JSON of the run to this file",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Profile CPU and memory per phase (written under the telemetry directory)",
+)
 @click.pass_context
-def collect(ctx: click.Context, config: Path, force: bool, year: int | None) -> None:
+def collect(
+    ctx: click.Context,
+    config: Path,
+    force: bool,
+    year: int | None,
+    plan_only: bool,
+    deadline: float | None,
+    budget: int | None,
+    trace_requests: bool,
+    metrics_port: int | None,
+    metrics_file: Path | None,
+    trace_events: Path | None,
+    profile: bool,
+) -> None:
     """Collect GitHub data and generate metrics JSON.
 
     This performs single-pass collection with in-memory metric aggregation,
@@ -102,6 +217,25 @@ def collect(ctx: click.Context, config: Path, force: bool, year: int | None) ->
         cfg.github.windows.since = datetime(year, 1, 1, 0, 0, 0, tzinfo=UTC)
         cfg.github.windows.until = datetime(year + 1, 1, 1, 0, 0, 0, tzinfo=UTC)
 
+    if deadline is not None:
+        cfg.collection.limits.deadline_seconds = deadline
+    if budget is not None:
+        cfg.collection.limits.max_requests = budget
+    if trace_requests:
+        cfg.telemetry.request_trace = True
+    if metrics_port is not None:
+        cfg.telemetry.openmetrics.port = metrics_port
+    if metrics_file is not None:
+        cfg.telemetry.openmetrics.textfile = metrics_file
+    if trace_events is not None:
+        cfg.telemetry.trace_events = trace_events
+    if profile:
+        cfg.telemetry.profile = True
+
+    if plan_only:
+        _print_collection_plan(ctx, cfg)
+        return
+
     console.print(
         f"[bold]Collecting data for {cfg.github.target.name} ({cfg.github.windows.year})[/bold]"
     )
@@ -120,18 +254,32 @@ def collect(ctx: click.Context, config: Path, force: bool, year: int | None) ->
         console.print()
         console.print("[bold cyan]Writing metrics to JSON...[/bold cyan]")
 
-        files_written = 0
-        for name, data in metrics.items():
-            filepath = data_dir / f"{name}.json"
-            with filepath.open("w") as f:
-                json.dump(data, f, indent=2, default=str)
-            console.print(f"  ✓ {filepath}")
-            files_written += 1
+        files_written = _write_metrics_json(metrics, data_dir, cfg.metrics.leaderboard_shard_size)
 
         console.print()
         console.print("[bold green]Collection complete![/bold green]")
         console.print(f"  Files written: {files_written}")
         console.print(f"  Output directory: {data_dir}")
+        if cfg.telemetry.request_trace:
+            from gh_year_end.storage.paths import PathManager
+
+            trace_path = PathManager(cfg).request_trace_path
+            console.print(f"  Request trace: {trace_path} (gh-year-end analyze-trace {trace_path})")
+        if cfg.telemetry.trace_events is not None:
+            console.print(f"  Trace events: {cfg.telemetry.trace_events} (open in ui.perfetto.dev)")
+        if cfg.telemetry.profile:
+            from gh_year_end.storage.paths import PathManager
+
+            summary_path = PathManager(cfg).profile_root / "collect" / "summary.json"
+            if summary_path.exists():
+                _print_profile(json.loads(summary_path.read_text()))
+        coverage = metrics.get("coverage")
+        if coverage and not coverage["complete"]:
+            console.print(
+                f"[yellow]  Partial collection ({coverage['stop_reason'] or 'phases skipped'}): "
+                f"{coverage['repos_started']}/{coverage['repos_total']} repos started, "
+                "see coverage.json[/yellow]"
+            )
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Collection interrupted by user[/yellow]")
@@ -146,6 +294,43 @@ def collect(ctx: click.Context, config: Path, force: bool, year: int | None) ->
         raise click.Abort() from e
 
 
+def _print_collection_plan(ctx: click.Context, cfg: Config) -> None:
+    """Plan a single-pass collection run and print the estimate."""
+    from gh_year_end.collect.orchestrator import plan_run
+    from gh_year_end.collect.preflight import render_plan
+
+    console.print(
+        f"[bold]Planning collection for {cfg.github.target.name} ({cfg.github.windows.year})[/bold]"
+    )
+    try:
+        plan = asyncio.run(plan_run(cfg))
+    except Exception as e:
+        console.print(f"\n[bold red]Error:[/bold red] {e}")
+        if ctx.obj.get("verbose"):
+            import traceback
+
+            console.print(traceback.format_exc())
+        raise click.Abort() from e
+
+    for table in render_plan(plan):
+        console.print()
+        console.print(table)
+    if plan.unresolved:
+        console.print(
+            f"\n[yellow]Counts unavailable for {len(plan.unresolved)} repos; "
+            "their estimates are lower bounds[/yellow]"
+        )
+
+
+def _print_profile(summary: dict[str, Any]) -> None:
+    """Print a per-phase profile summary."""
+    from gh_year_end.telemetry import render_profile
+
+    console.print()
+    console.print(render_profile(summary))
+    console.print(f"  Profiles: {summary['output_dir']} (python -m pstats <file>.prof)")
+
+
 @main.command()
 @click.option(
     "--config",
@@ -160,8 +345,26 @@ def collect(ctx: click.Context, config: Path, force: bool, year: int | None) ->
     default=None,
     help="Override year from config (recalculates since/until)",
 )
+@click.option(
+    "--trace-events",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write Chrome/Perfetto trace-event JSON of the build to this file",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Profile CPU and memory per build stage (written under the telemetry directory)",
+)
 @click.pass_context
-def build(ctx: click.Context, config: Path, year: int | None) -> None:
+def build(
+    ctx: click.Context,
+    config: Path,
+    year: int | None,
+    trace_events: Path | None,
+    profile: bool,
+) -> None:
     """Build static HTML site from metrics JSON.
 
     Reads the JSON files generated by 'collect' and renders HTML templates
@@ -187,6 +390,10 @@ def build(ctx: click.Context, config: Path, year: int | None) -> None:
         cfg.github.windows.year = year
         cfg.github.windows.since = datetime(year, 1, 1, 0, 0, 0, tzinfo=UTC)
         cfg.github.windows.until = datetime(year + 1, 1, 1, 0, 0, 0, tzinfo=UTC)
+    if trace_events is not None:
+        cfg.telemetry.trace_events = trace_events
+    if profile:
+        cfg.telemetry.profile = True
 
     paths = PathManager(cfg)
 
@@ -236,6 +443,8 @@ def build(ctx: click.Context, config: Path, year: int | None) -> None:
         console.print(f"  Assets copied: {assets_copied}")
 
         console.print(f"  Output: {paths.site_root}")
+        if "profile" in build_stats:
+            _print_profile(build_stats["profile"])
 
         # Show errors/warnings if any
         build_errors = build_stats.get("errors", [])
@@ -259,6 +468,176 @@ def build(ctx: click.Context, config: Path, year: int | None) -> None:
         raise click.Abort() from e
 
 
+@main.command(name="rebuild-metrics")
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Path to config.yaml file",
+)
+@click.option(
+    "--year",
+    type=int,
+    default=None,
+    help="Override year from config (recalculates since/until)",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(["python", "duckdb"]),
+    default=None,
+    help="Metrics engine to use (overrides metrics.engine in config)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for the python engine (defaults to CPU count)",
+)
+@click.pass_context
+def rebuild_metrics(
+    ctx: click.Context,
+    config: Path,
+    year: int | None,
+    engine: str | None,
+    workers: int | None,
+) -> None:
+    """Regenerate metrics JSON from stored raw data without API calls.
+
+    Replays the raw JSONL captured by 'collect' (with storage.write_raw
+    enabled) through the metrics engine and rewrites site/{year}/data/.
+    Use this to iterate on metric definitions without re-collecting.
+    """
+    from gh_year_end.collect.enrichment import (
+        UserProfileCache,
+        apply_user_profiles,
+        contributor_logins,
+    )
+    from gh_year_end.metrics import compute_metrics
+    from gh_year_end.storage.paths import PathManager
+
+    cfg = load_config(config)
+
+    # Override year if provided
+    if year is not None:
+        cfg.github.windows.year = year
+        cfg.github.windows.since = datetime(year, 1, 1, 0, 0, 0, tzinfo=UTC)
+        cfg.github.windows.until = datetime(year + 1, 1, 1, 0, 0, 0, tzinfo=UTC)
+
+    if engine is not None:
+        cfg.metrics.engine = engine
+
+    paths = PathManager(cfg)
+
+    if not paths.repos_raw_path.exists():
+        console.print(f"[bold red]Error:[/bold red] No raw data found at {paths.raw_root}")
+        console.print(
+            "[yellow]Run 'collect' with storage.write_raw enabled to capture raw data[/yellow]"
+        )
+        raise click.Abort()
+
+    console.print(
+        f"[bold]Rebuilding metrics for {cfg.github.target.name} ({cfg.github.windows.year})[/bold]"
+    )
+    console.print()
+    console.print(f"[cyan]Replaying raw data with the {cfg.metrics.engine} engine...[/cyan]")
+
+    try:
+        metrics = compute_metrics(cfg, paths, workers=workers or os.cpu_count() or 1)
+
+        # Reuse cached contributor profiles (even expired ones; no API calls here)
+        if cfg.collection.users.enabled:
+            cache = UserProfileCache(
+                paths.user_profile_cache_path, cfg.collection.users.cache_ttl_days * 86400
+            ).load()
+            profiles, _ = cache.lookup(contributor_logins(metrics), include_stale=True)
+            apply_user_profiles(metrics, profiles)
+
+        data_dir = Path(f"site/{cfg.github.windows.year}/data")
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        console.print()
+        console.print("[bold cyan]Writing metrics to JSON...[/bold cyan]")
+
+        files_written = _write_metrics_json(metrics, data_dir, cfg.metrics.leaderboard_shard_size)
+
+        console.print()
+        console.print("[bold green]Metrics rebuilt![/bold green]")
+        console.print(f"  Files written: {files_written}")
+        console.print(f"  Output directory: {data_dir}")
+
+    except Exception as e:
+        console.print(f"\n[bold red]Error:[/bold red] {e}")
+        if ctx.obj.get("verbose"):
+            import traceback
+
+            console.print("\n[dim]Traceback:[/dim]")
+            console.print(traceback.format_exc())
+        raise click.Abort() from e
+
+
+@main.command(name="analyze-trace")
+@click.argument("trace_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--by",
+    "group_by",
+    type=click.Choice(["phase", "endpoint", "repo"]),
+    multiple=True,
+    help="Grouping to summarize (repeatable; defaults to all three)",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=10,
+    help="Rows shown per grouping",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Print the analysis as JSON",
+)
+def analyze_trace_command(
+    trace_file: Path, group_by: tuple[str, ...], top: int, as_json: bool
+) -> None:
+    """Summarize a request trace: where did the time go.
+
+    Reads the JSONL written by 'collect --trace-requests' and reports the
+    critical path (wall time that was network-, rate-limit-, or CPU-bound) for
+    the run and each phase, plus time, bytes, and p50/p90/p99 latency by
+    phase, endpoint, and repo.
+    """
+    from gh_year_end.telemetry import (
+        TraceAnalysisError,
+        analyze_trace,
+        load_trace,
+        render_analysis,
+    )
+
+    try:
+        records = load_trace(trace_file)
+    except TraceAnalysisError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise click.Abort() from e
+
+    analysis = analyze_trace(records, group_by or ("phase", "endpoint", "repo"), top)
+    if as_json:
+        click.echo(json.dumps(analysis, indent=2))
+        return
+
+    console.print(
+        f"[bold]{analysis['requests']} requests, {analysis['ingests']} aggregator ingests[/bold]"
+    )
+    bound = analysis["critical_path"]["run"]["bound"]
+    if bound:
+        console.print(f"Run is mostly [bold]{bound.replace('_', ' ')}[/bold] bound")
+    for table in render_analysis(analysis):
+        console.print()
+        console.print(table)
+
+
 @main.command(name="all")
 @click.option(
     "--config",
@@ -1,5 +1,6 @@
 """Data collectors for GitHub API endpoints."""
 
+from gh_year_end.collect.catalog import CollectionCatalog
 from gh_year_end.collect.comments import (
     CommentCollectionError,
     collect_issue_comments,
@@ -9,15 +10,19 @@ from gh_year_end.collect.comments import (
 )
 from gh_year_end.collect.commits import CommitCollectionError, collect_commits
 from gh_year_end.collect.discovery import DiscoveryError, discover_repos
+from gh_year_end.collect.discovery_catalog import DiscoveryCatalog
+from gh_year_end.collect.enrichment import UserProfileCache, enrich_contributors
 from gh_year_end.collect.hygiene import (
     HygieneCollectionError,
     collect_branch_protection,
     collect_repo_hygiene,
     collect_security_features,
 )
+from gh_year_end.collect.hygiene_engine import HygieneEngine, TreeCache
 from gh_year_end.collect.issues import collect_issues
 from gh_year_end.collect.orchestrator import CollectionError, run_collection
 from gh_year_end.collect.pulls import PullsCollectorError, collect_pulls
+from gh_year_end.collect.repo_store import RepoStore
 from gh_year_end.collect.repos import RepoMetadataError, collect_repo_metadata
 from gh_year_end.collect.reviews import (
     ReviewCollectionStats,
@@ -26,14 +31,20 @@ from gh_year_end.collect.reviews import (
 )
 
 __all__ = [
+    "CollectionCatalog",
     "CollectionError",
     "CommentCollectionError",
     "CommitCollectionError",
+    "DiscoveryCatalog",
     "DiscoveryError",
     "HygieneCollectionError",
+    "HygieneEngine",
     "PullsCollectorError",
     "RepoMetadataError",
+    "RepoStore",
     "ReviewCollectionStats",
+    "TreeCache",
+    "UserProfileCache",
     "collect_branch_protection",
     "collect_commits",
     "collect_issue_comments",
@@ -46,6 +57,7 @@ __all__ = [
     "collect_reviews_from_pr_iterator",
     "collect_security_features",
     "discover_repos",
+    "enrich_contributors",
     "read_issue_numbers",
     "read_pr_numbers",
     "run_collection",
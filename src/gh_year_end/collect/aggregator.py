@@ -3,32 +3,42 @@
 This module provides a single-pass aggregator that computes all metrics
 during collection, eliminating the need for separate normalize and metrics phases.
 
-Note: This module exceeds the 400-line preference from CLAUDE.md (currently 650 lines)
-due to its complexity as the core metrics aggregator. It handles leaderboards, time
+Note: This module exceeds the 400-line preference from CLAUDE.md due to its
+complexity as the core metrics aggregator. It handles leaderboards, time
 series, repository health, hygiene tracking, and awards computation in a single unified
 class. Splitting would break the single-pass aggregation pattern.
 """
 
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any
-
-BOT_PATTERNS = [
-    "[bot]",
-    "-bot-",
-    "github-actions",
-    "dependabot",
-    "renovate",
-    "greenkeeper",
-    "snyk-bot",
-    "codecov",
-    "mergify",
-    "imgbot",
-    "allcontributors",
-    "semantic-release-bot",
-    "stale",
-]
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from gh_year_end.collect.identity import BOT_PATTERNS, BotDetector, get_bot_detector
+from gh_year_end.collect.periods import PeriodCalendar
+from gh_year_end.telemetry.request_trace import traced_ingest
+
+if TYPE_CHECKING:
+    from gh_year_end.collect.sampling import StratifiedSample
+    from gh_year_end.config import Config
+
+__all__ = ["BOT_PATTERNS", "MetricsAggregator"]
+
+
+def _user_counter() -> defaultdict[str, int]:
+    """Create a user -> count mapping (module-level so aggregators pickle)."""
+    return defaultdict(int)
+
+
+def _keyed_user_counter() -> defaultdict[str, defaultdict[str, int]]:
+    """Create a key -> user -> count mapping."""
+    return defaultdict(_user_counter)
+
+
+def _metric_period_counter() -> defaultdict[str, defaultdict[str, defaultdict[str, int]]]:
+    """Create a metric -> period -> user -> count mapping."""
+    return defaultdict(_keyed_user_counter)
 
 
 @dataclass
@@ -38,10 +48,20 @@ class MetricsAggregator:
     year: int
     target_name: str
     target_mode: str = "user"  # or "org"
+    timeseries_layout: str = "legacy"  # or "columnar"
+    leaderboard_top_k: int | None = 100  # None keeps every user
+    leaderboard_full_rankings: bool = True
+    repo_health_mode: str = "exact"  # or "sketch"
+    sketch_k: int = 200
+    hll_precision: int = 12
+    # Shared bot classifier (memoized per login and type)
+    bot_detector: BotDetector = field(default_factory=get_bot_detector, repr=False)
+    # Review/comment sample when collection.sampling is enabled (None = exact)
+    sampling: "StratifiedSample | None" = field(default=None, repr=False)
 
     # Leaderboards: metric_key -> user_id -> count
     leaderboards: defaultdict[str, defaultdict[str, int]] = field(
-        default_factory=lambda: defaultdict(lambda: defaultdict(int))
+        default_factory=_keyed_user_counter
     )
 
     # Time series: period_metric -> list of {date, user_id, count}
@@ -63,10 +83,10 @@ class MetricsAggregator:
 
     # Internal tracking for time series aggregation
     _weekly_counters: defaultdict[str, defaultdict[str, defaultdict[str, int]]] = field(
-        default_factory=lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+        default_factory=_metric_period_counter
     )
     _monthly_counters: defaultdict[str, defaultdict[str, defaultdict[str, int]]] = field(
-        default_factory=lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+        default_factory=_metric_period_counter
     )
 
     # Track contributors for new contributor detection
@@ -79,6 +99,45 @@ class MetricsAggregator:
     # Track PR creation times for review latency calculation (repo_id, pr_number) -> created_at
     _pr_created_at: dict[tuple[str, int], datetime] = field(default_factory=dict)
 
+    # Sample weights of reviewed PRs when reviews are sampled (repo_id, pr_number) -> weight
+    _pr_weights: dict[tuple[str, int], float] = field(default_factory=dict)
+
+    # Scaled counts from sampled events (kind, metric, period, user) -> count, where kind
+    # is leaderboards, weekly, or monthly; rounded into the integer counters at export
+    _weighted_counts: defaultdict[tuple[str, str, str, str], float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+
+    # Week/month bucket keys for every day of the target year
+    _calendar: PeriodCalendar = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the period calendar for the target year."""
+        self._calendar = PeriodCalendar(self.year)
+
+    @classmethod
+    def from_config(cls, config: "Config") -> "MetricsAggregator":
+        """Create an aggregator for the configured target, year, and metrics options.
+
+        Args:
+            config: Application configuration.
+
+        Returns:
+            Empty MetricsAggregator.
+        """
+        return cls(
+            year=config.github.windows.year,
+            target_name=config.github.target.name,
+            target_mode=config.github.target.mode,
+            timeseries_layout=config.metrics.timeseries_layout,
+            leaderboard_top_k=config.metrics.leaderboard_top_k,
+            leaderboard_full_rankings=config.metrics.leaderboard_full_rankings,
+            repo_health_mode=config.metrics.repo_health_mode,
+            sketch_k=config.metrics.sketch_k,
+            hll_precision=config.metrics.hll_precision,
+            bot_detector=get_bot_detector(config.identity),
+        )
+
     def _is_bot(self, user: dict[str, Any] | None) -> bool:
         """Check if user is a bot.
 
@@ -88,24 +147,14 @@ class MetricsAggregator:
         Returns:
             True if user is detected as a bot
         """
-        if not user:
-            return True
-
-        login = user.get("login", "").lower()
-        user_type = user.get("type", "")
-
-        # Check GitHub user type
-        if user_type == "Bot":
-            return True
+        return self.bot_detector.is_bot_user(user)
 
-        # Check login patterns
-        return any(pattern.lower() in login for pattern in BOT_PATTERNS)
-
-    def _cache_user(self, user: dict[str, Any] | None) -> None:
+    def _cache_user(self, user: dict[str, Any] | None, is_bot: bool | None = None) -> None:
         """Cache user info for later enrichment.
 
         Args:
             user: GitHub user object
+            is_bot: Bot classification if already known
         """
         if not user:
             return
@@ -119,7 +168,7 @@ class MetricsAggregator:
             self.users[login] = {
                 "login": login,
                 "avatar_url": user.get("avatar_url", ""),
-                "is_bot": self._is_bot(user),
+                "is_bot": self._is_bot(user) if is_bot is None else is_bot,
                 "type": user.get("type", "User"),
             }
 
@@ -146,69 +195,64 @@ class MetricsAggregator:
                 "private": repo.get("private", False),
             }
 
-    def _get_week_key(self, dt: datetime) -> str:
-        """Get week bucket key (YYYY-WNN).
-
-        Args:
-            dt: Datetime to bucket
-
-        Returns:
-            Week key like "2024-W01"
-        """
-        year, week, _ = dt.isocalendar()
-        return f"{year}-W{week:02d}"
+    def _apply_page_counts(
+        self,
+        boards: dict[tuple[str, str], int],
+        periods: dict[tuple[str, int, str], int],
+        weight: float = 1,
+    ) -> None:
+        """Apply counts accumulated over a page of events.
 
-    def _get_month_key(self, dt: datetime) -> str:
-        """Get month bucket key (YYYY-MM).
+        Page counts iterate in first-seen order, so keys are inserted into the
+        leaderboard and time series mappings in the same order as per-event
+        updates would insert them.
 
         Args:
-            dt: Datetime to bucket
-
-        Returns:
-            Month key like "2024-01"
+            boards: (metric, user) -> count for leaderboards
+            periods: (metric, day index, user) -> count for events in the target year
+            weight: Sample weight; weighted counts are kept apart and rounded
+                into the integer counts at export
         """
-        return f"{dt.year}-{dt.month:02d}"
+        if weight != 1:
+            weighted = self._weighted_counts
+            for (metric, user_login), count in boards.items():
+                weighted["leaderboards", metric, "", user_login] += count * weight
+            for (metric, day, user_login), count in periods.items():
+                week_key, month_key = self._calendar.period_keys(day)
+                weighted["weekly", metric, week_key, user_login] += count * weight
+                weighted["monthly", metric, month_key, user_login] += count * weight
+            return
 
-    def _track_contributor(self, user_login: str, event_dt: datetime) -> None:
-        """Track contributor for new contributor detection.
+        for (metric, user_login), count in boards.items():
+            self.leaderboards[metric][user_login] += count
 
-        Args:
-            user_login: User login to track
-            event_dt: Datetime of the contribution event
-        """
-        # Only track contributions from the target year
-        if event_dt.year != self.year:
-            return
+        period_keys = self._calendar.period_keys
+        for (metric, day, user_login), count in periods.items():
+            week_key, month_key = period_keys(day)
+            self._weekly_counters[metric][week_key][user_login] += count
+            self._monthly_counters[metric][month_key][user_login] += count
 
-        # If this is the first time we've seen this contributor
-        if user_login not in self._all_contributors_ever:
-            self._all_contributors_ever.add(user_login)
-            self._new_contributors_this_year.add(user_login)
+    def _counted_login(self, user: dict[str, Any] | None) -> str | None:
+        """Cache a user and return the login if their events count.
 
-    def _increment_timeseries(
-        self, dt: datetime, metric: str, user_login: str | None = None
-    ) -> None:
-        """Increment time series counters.
+        Bot classification is memoized by the shared detector per (login, type),
+        so each distinct user is classified once rather than once per event.
 
         Args:
-            dt: Timestamp of the event
-            metric: Metric name (e.g., 'prs_opened')
-            user_login: Optional user login for per-user tracking
-        """
-        week_key = self._get_week_key(dt)
-        month_key = self._get_month_key(dt)
-
-        # Weekly counters
-        if user_login:
-            self._weekly_counters[metric][week_key][user_login] += 1
-        else:
-            self._weekly_counters[metric][week_key]["_total"] += 1
+            user: GitHub user object
 
-        # Monthly counters
-        if user_login:
-            self._monthly_counters[metric][month_key][user_login] += 1
-        else:
-            self._monthly_counters[metric][month_key]["_total"] += 1
+        Returns:
+            User login, or None for bots and users without a login
+        """
+        if not user:
+            return None
+        login = user.get("login")
+        is_bot = self.bot_detector.is_bot(login or "", user.get("type") or "")
+        if not login:
+            return None
+        if login not in self.users:
+            self._cache_user(user, is_bot)
+        return None if is_bot else login
 
     def add_repo(self, repo: dict[str, Any]) -> None:
         """Add repository to tracking.
@@ -223,7 +267,13 @@ class MetricsAggregator:
             return
 
         # Initialize repo health tracking
-        if full_name not in self.repo_health:
+        if full_name in self.repo_health:
+            return
+        if self.repo_health_mode == "sketch":
+            from gh_year_end.metrics.sketches import new_repo_health_sketch
+
+            self.repo_health[full_name] = new_repo_health_sketch(self.sketch_k, self.hll_precision)
+        else:
             self.repo_health[full_name] = {
                 "contributors": set(),
                 "pr_count": 0,
@@ -241,73 +291,96 @@ class MetricsAggregator:
             repo_id: Repository full name (owner/repo)
             pr: GitHub pull request object
         """
-        author = pr.get("user")
-        self._cache_user(author)
+        self.add_prs(repo_id, (pr,))
 
-        if self._is_bot(author):
-            return
+    @traced_ingest
+    def add_prs(self, repo_id: str, prs: Iterable[dict[str, Any]]) -> None:
+        """Update metrics for a page of PRs, in order.
 
-        author_login = author.get("login") if author else None
-        if not author_login:
-            return
+        Equivalent to calling add_pr for each PR. Counters are accumulated for
+        the page and applied once; full timestamps are only parsed where
+        durations are needed.
 
-        # Track in repo health
-        if repo_id in self.repo_health:
-            self.repo_health[repo_id]["contributors"].add(author_login)
-            self.repo_health[repo_id]["pr_count"] += 1
-
-        # Increment leaderboards
-        self.leaderboards["prs_opened"][author_login] += 1
+        Args:
+            repo_id: Repository full name (owner/repo)
+            prs: GitHub pull request objects
+        """
+        counted_login = self._counted_login
+        day_index = self._calendar.day_index
+        health = self.repo_health.get(repo_id)
+        authors: list[str] = []
+        boards: defaultdict[tuple[str, str], int] = defaultdict(int)
+        periods: defaultdict[tuple[str, int, str], int] = defaultdict(int)
+
+        for pr in prs:
+            author_login = counted_login(pr.get("user"))
+            if not author_login:
+                continue
+
+            authors.append(author_login)
+            boards["prs_opened", author_login] += 1
+
+            created_at = pr.get("created_at")
+            created_dt = None
+            if created_at:
+                day = day_index(created_at)
+                if day is not None:
+                    periods["prs_opened", day, author_login] += 1
+
+                # Store PR creation time for review latency calculation
+                pr_number = pr.get("number")
+                if pr_number:
+                    created_dt = datetime.fromisoformat(created_at)
+                    self._pr_created_at[(repo_id, pr_number)] = created_dt
+
+            # Track merged PRs
+            merged_at = pr.get("merged_at")
+            if not merged_at:
+                continue
+            boards["prs_merged", author_login] += 1
+            if not created_at:
+                continue
+
+            # Track merge time for repo health (regardless of merge year)
+            if health is not None:
+                if created_dt is None:
+                    created_dt = datetime.fromisoformat(created_at)
+                merged_dt = datetime.fromisoformat(merged_at)
+                time_to_merge_hours = (merged_dt - created_dt).total_seconds() / 3600
+                if self.repo_health_mode == "sketch":
+                    health["merge_times"].update(time_to_merge_hours)
+                else:
+                    health["merge_times"].append(time_to_merge_hours)
+
+                # Store PR details for special mentions
+                additions = pr.get("additions", 0)
+                deletions = pr.get("deletions", 0)
+                self._pr_details.append(
+                    {
+                        "number": pr.get("number"),
+                        "title": pr.get("title", ""),
+                        "url": pr.get("html_url", ""),
+                        "author_login": author_login,
+                        "author_avatar_url": pr["user"].get("avatar_url", ""),
+                        "repo": repo_id,
+                        "lines_changed": additions + deletions,
+                        "additions": additions,
+                        "deletions": deletions,
+                        "merge_time_hours": time_to_merge_hours,
+                        "created_at": created_at,
+                        "merged_at": merged_at,
+                    }
+                )
 
-        created_at = pr.get("created_at")
-        if created_at:
-            created_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            if created_dt.year == self.year:
-                self._increment_timeseries(created_dt, "prs_opened", author_login)
+            # Track in timeseries only if merged in target year
+            day = day_index(merged_at)
+            if day is not None:
+                periods["prs_merged", day, author_login] += 1
 
-            # Store PR creation time for review latency calculation
-            pr_number = pr.get("number")
-            if pr_number:
-                self._pr_created_at[(repo_id, pr_number)] = created_dt
-
-        # Track merged PRs
-        if pr.get("merged_at"):
-            self.leaderboards["prs_merged"][author_login] += 1
-            merged_at = pr.get("merged_at")
-            if merged_at and created_at:
-                merged_dt = datetime.fromisoformat(merged_at.replace("Z", "+00:00"))
-                created_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-
-                # Track merge time for repo health (regardless of merge year)
-                if repo_id in self.repo_health:
-                    time_to_merge_hours = (merged_dt - created_dt).total_seconds() / 3600
-                    self.repo_health[repo_id]["merge_times"].append(time_to_merge_hours)
-
-                    # Store PR details for special mentions
-                    additions = pr.get("additions", 0)
-                    deletions = pr.get("deletions", 0)
-                    lines_changed = additions + deletions
-
-                    self._pr_details.append(
-                        {
-                            "number": pr.get("number"),
-                            "title": pr.get("title", ""),
-                            "url": pr.get("html_url", ""),
-                            "author_login": author_login,
-                            "author_avatar_url": author.get("avatar_url", "") if author else "",
-                            "repo": repo_id,
-                            "lines_changed": lines_changed,
-                            "additions": additions,
-                            "deletions": deletions,
-                            "merge_time_hours": time_to_merge_hours,
-                            "created_at": created_at,
-                            "merged_at": merged_at,
-                        }
-                    )
-
-                # Track in timeseries only if merged in target year
-                if merged_dt.year == self.year:
-                    self._increment_timeseries(merged_dt, "prs_merged", author_login)
+        if health is not None:
+            health["contributors"].update(authors)
+            health["pr_count"] += len(authors)
+        self._apply_page_counts(boards, periods)
 
     def add_issue(self, repo_id: str, issue: dict[str, Any]) -> None:
         """Update metrics when an issue is collected.
@@ -316,42 +389,55 @@ class MetricsAggregator:
             repo_id: Repository full name (owner/repo)
             issue: GitHub issue object
         """
-        # Skip pull requests (they have 'pull_request' key)
-        if "pull_request" in issue:
-            return
-
-        author = issue.get("user")
-        self._cache_user(author)
-
-        if self._is_bot(author):
-            return
-
-        author_login = author.get("login") if author else None
-        if not author_login:
-            return
-
-        # Track in repo health
-        if repo_id in self.repo_health:
-            self.repo_health[repo_id]["contributors"].add(author_login)
-            self.repo_health[repo_id]["issue_count"] += 1
+        self.add_issues(repo_id, (issue,))
 
-        # Increment leaderboards
-        self.leaderboards["issues_opened"][author_login] += 1
+    @traced_ingest
+    def add_issues(self, repo_id: str, issues: Iterable[dict[str, Any]]) -> None:
+        """Update metrics for a page of issues, in order.
 
-        created_at = issue.get("created_at")
-        if created_at:
-            created_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            if created_dt.year == self.year:
-                self._increment_timeseries(created_dt, "issues_opened", author_login)
+        Equivalent to calling add_issue for each issue.
 
-        # Track closed issues
-        if issue.get("state") == "closed" and issue.get("closed_at"):
-            self.leaderboards["issues_closed"][author_login] += 1
+        Args:
+            repo_id: Repository full name (owner/repo)
+            issues: GitHub issue objects
+        """
+        counted_login = self._counted_login
+        day_index = self._calendar.day_index
+        authors: list[str] = []
+        boards: defaultdict[tuple[str, str], int] = defaultdict(int)
+        periods: defaultdict[tuple[str, int, str], int] = defaultdict(int)
+
+        for issue in issues:
+            # Skip pull requests (they have 'pull_request' key)
+            if "pull_request" in issue:
+                continue
+
+            author_login = counted_login(issue.get("user"))
+            if not author_login:
+                continue
+
+            authors.append(author_login)
+            boards["issues_opened", author_login] += 1
+
+            created_at = issue.get("created_at")
+            if created_at:
+                day = day_index(created_at)
+                if day is not None:
+                    periods["issues_opened", day, author_login] += 1
+
+            # Track closed issues
             closed_at = issue.get("closed_at")
-            if closed_at:
-                closed_dt = datetime.fromisoformat(closed_at.replace("Z", "+00:00"))
-                if closed_dt.year == self.year:
-                    self._increment_timeseries(closed_dt, "issues_closed", author_login)
+            if issue.get("state") == "closed" and closed_at:
+                boards["issues_closed", author_login] += 1
+                day = day_index(closed_at)
+                if day is not None:
+                    periods["issues_closed", day, author_login] += 1
+
+        health = self.repo_health.get(repo_id)
+        if health is not None:
+            health["contributors"].update(authors)
+            health["issue_count"] += len(authors)
+        self._apply_page_counts(boards, periods)
 
     def add_review(self, repo_id: str, pr_number: int, review: dict[str, Any]) -> None:
         """Update metrics when a review is collected.
@@ -361,52 +447,82 @@ class MetricsAggregator:
             pr_number: Pull request number
             review: GitHub review object
         """
-        reviewer = review.get("user")
-        self._cache_user(reviewer)
-
-        if self._is_bot(reviewer):
-            return
-
-        reviewer_login = reviewer.get("login") if reviewer else None
-        if not reviewer_login:
-            return
-
-        # Track in repo health
-        if repo_id in self.repo_health:
-            self.repo_health[repo_id]["contributors"].add(reviewer_login)
-            self.repo_health[repo_id]["review_count"] += 1
-            # Track that this PR received a review
-            self.repo_health[repo_id]["prs_with_reviews"].add(pr_number)
-
-        # Increment leaderboards
-        self.leaderboards["reviews_submitted"][reviewer_login] += 1
+        self.add_reviews(repo_id, pr_number, (review,))
+
+    @traced_ingest
+    def add_reviews(
+        self,
+        repo_id: str,
+        pr_number: int,
+        reviews: Iterable[dict[str, Any]],
+        weight: float = 1,
+    ) -> None:
+        """Update metrics for a page of one PR's reviews, in order.
 
-        state = review.get("state", "").upper()
-        if state == "APPROVED":
-            self.leaderboards["approvals"][reviewer_login] += 1
-        elif state == "CHANGES_REQUESTED":
-            self.leaderboards["changes_requested"][reviewer_login] += 1
+        Equivalent to calling add_review for each review.
 
-        submitted_at = review.get("submitted_at")
-        if submitted_at:
-            submitted_dt = datetime.fromisoformat(submitted_at.replace("Z", "+00:00"))
-            if submitted_dt.year == self.year:
-                self._increment_timeseries(submitted_dt, "reviews_submitted", reviewer_login)
+        Args:
+            repo_id: Repository full name (owner/repo)
+            pr_number: Pull request number
+            reviews: GitHub review objects
+            weight: PRs this PR stands for when reviews are sampled; counts are
+                scaled by it and rounded at export
+        """
+        counted_login = self._counted_login
+        day_index = self._calendar.day_index
+        health = self.repo_health.get(repo_id)
+        pr_key = (repo_id, pr_number)
+        reviewers: list[str] = []
+        boards: defaultdict[tuple[str, str], int] = defaultdict(int)
+        periods: defaultdict[tuple[str, int, str], int] = defaultdict(int)
+
+        for review in reviews:
+            reviewer_login = counted_login(review.get("user"))
+            if not reviewer_login:
+                continue
+
+            reviewers.append(reviewer_login)
+            boards["reviews_submitted", reviewer_login] += 1
+
+            state = review.get("state", "").upper()
+            if state == "APPROVED":
+                boards["approvals", reviewer_login] += 1
+            elif state == "CHANGES_REQUESTED":
+                boards["changes_requested", reviewer_login] += 1
+
+            submitted_at = review.get("submitted_at")
+            if not submitted_at:
+                continue
+            day = day_index(submitted_at)
+            if day is not None:
+                periods["reviews_submitted", day, reviewer_login] += 1
 
             # Calculate time-to-first-review for this PR
-            pr_key = (repo_id, pr_number)
-            if pr_key in self._pr_created_at:
-                pr_created = self._pr_created_at[pr_key]
-                latency_hours = (submitted_dt - pr_created).total_seconds() / 3600
+            if self.repo_health_mode == "sketch":
+                # Reviews arrive in submission order, so the first one seen is the
+                # first review; forget the PR afterwards to keep memory bounded
+                pr_created = self._pr_created_at.pop(pr_key, None)
+                if pr_created is not None and health is not None:
+                    submitted_dt = datetime.fromisoformat(submitted_at)
+                    latency_hours = (submitted_dt - pr_created).total_seconds() / 3600
+                    health["review_latencies"].update(latency_hours)
+            elif pr_key in self._pr_created_at and health is not None:
+                submitted_dt = datetime.fromisoformat(submitted_at)
+                latency_hours = (submitted_dt - self._pr_created_at[pr_key]).total_seconds() / 3600
 
                 # Track first review only (shortest latency per PR)
-                if repo_id in self.repo_health:
-                    if "review_latencies" not in self.repo_health[repo_id]:
-                        self.repo_health[repo_id]["review_latencies"] = {}
-                    latencies = self.repo_health[repo_id]["review_latencies"]
-                    # Only store if this is the first review or faster than previous
-                    if pr_number not in latencies or latency_hours < latencies[pr_number]:
-                        latencies[pr_number] = latency_hours
+                latencies = health.setdefault("review_latencies", {})
+                if pr_number not in latencies or latency_hours < latencies[pr_number]:
+                    latencies[pr_number] = latency_hours
+
+        if health is not None and reviewers:
+            health["contributors"].update(reviewers)
+            health["review_count"] += len(reviewers) * weight
+            # Track that this PR received a review
+            health["prs_with_reviews"].add(pr_number)
+            if weight != 1:
+                self._pr_weights[pr_key] = weight
+        self._apply_page_counts(boards, periods, weight)
 
     def add_comment(
         self, repo_id: str, comment: dict[str, Any], comment_type: str = "issue"
@@ -418,33 +534,139 @@ class MetricsAggregator:
             comment: GitHub comment object
             comment_type: Type of comment ('issue', 'pr', 'review')
         """
-        author = comment.get("user")
-        self._cache_user(author)
-
-        if self._is_bot(author):
-            return
-
-        author_login = author.get("login") if author else None
-        if not author_login:
-            return
-
-        # Track in repo health
-        if repo_id in self.repo_health:
-            self.repo_health[repo_id]["contributors"].add(author_login)
-            self.repo_health[repo_id]["comment_count"] += 1
+        self.add_comments(repo_id, (comment,), comment_type=comment_type)
+
+    @traced_ingest
+    def add_comments(
+        self,
+        repo_id: str,
+        comments: Iterable[dict[str, Any]],
+        comment_type: str = "issue",
+        weight: float = 1,
+    ) -> None:
+        """Update metrics for a page of comments, in order.
 
-        # Increment leaderboards
-        self.leaderboards["comments_total"][author_login] += 1
+        Equivalent to calling add_comment for each comment.
 
-        if comment_type in ("pr", "review"):
-            self.leaderboards["review_comments_total"][author_login] += 1
+        Args:
+            repo_id: Repository full name (owner/repo)
+            comments: GitHub comment objects
+            comment_type: Type of comment ('issue', 'pr', 'review')
+            weight: Items the commented issue/PR stands for when comments are
+                sampled; counts are scaled by it and rounded at export
+        """
+        counted_login = self._counted_login
+        day_index = self._calendar.day_index
+        is_review_comment = comment_type in ("pr", "review")
+        authors: list[str] = []
+        boards: defaultdict[tuple[str, str], int] = defaultdict(int)
+        periods: defaultdict[tuple[str, int, str], int] = defaultdict(int)
+
+        for comment in comments:
+            author_login = counted_login(comment.get("user"))
+            if not author_login:
+                continue
+
+            authors.append(author_login)
+            boards["comments_total", author_login] += 1
+            if is_review_comment:
+                boards["review_comments_total", author_login] += 1
+
+            created_at = comment.get("created_at")
+            if created_at:
+                day = day_index(created_at)
+                if day is not None:
+                    periods["comments_total", day, author_login] += 1
+
+        health = self.repo_health.get(repo_id)
+        if health is not None:
+            health["contributors"].update(authors)
+            health["comment_count"] += len(authors) * weight
+        self._apply_page_counts(boards, periods, weight)
+
+    @traced_ingest
+    def add_contributor_stats(self, repo_id: str, contributors: Iterable[dict[str, Any]]) -> None:
+        """Update commit metrics from a repo's /stats/contributors response.
+
+        Each week ("w", its Sunday start as Unix time) adds its commits ("c"),
+        additions ("a"), and deletions ("d") to the author's counts. A week is
+        bucketed by its start date, so the week spanning New Year counts
+        toward the year it starts in.
 
-        created_at = comment.get("created_at")
-        if created_at:
-            created_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            if created_dt.year == self.year:
-                self._increment_timeseries(created_dt, "comments_total", author_login)
+        Args:
+            repo_id: Repository full name (owner/repo)
+            contributors: Contributor stats objects (author plus weekly totals)
+        """
+        counted_login = self._counted_login
+        day_index = self._calendar.day_index
+        authors: list[str] = []
+        boards: defaultdict[tuple[str, str], int] = defaultdict(int)
+        periods: defaultdict[tuple[str, int, str], int] = defaultdict(int)
+
+        for contributor in contributors:
+            author_login = counted_login(contributor.get("author"))
+            if not author_login:
+                continue
+
+            active = False
+            for week in contributor.get("weeks", []):
+                commits = week.get("c", 0)
+                if not commits:
+                    continue
+                week_start = datetime.fromtimestamp(week["w"], UTC).date().isoformat()
+                day = day_index(week_start)
+                if day is None:
+                    continue
+                active = True
+                boards["commits", author_login] += commits
+                periods["commits", day, author_login] += commits
+                for metric, key in (("lines_added", "a"), ("lines_deleted", "d")):
+                    if week.get(key):
+                        boards[metric, author_login] += week[key]
+
+            if active:
+                authors.append(author_login)
+
+        health = self.repo_health.get(repo_id)
+        if health is not None:
+            health["contributors"].update(authors)
+        self._apply_page_counts(boards, periods)
+
+    @traced_ingest
+    def add_commits(self, repo_id: str, commits: Iterable[dict[str, Any]]) -> None:
+        """Update commit counts for a page of commits from the commit history.
+
+        Used when contributor statistics are unavailable; commit listings carry
+        no line counts, so only commits are counted.
 
+        Args:
+            repo_id: Repository full name (owner/repo)
+            commits: GitHub commit objects
+        """
+        counted_login = self._counted_login
+        day_index = self._calendar.day_index
+        authors: list[str] = []
+        boards: defaultdict[tuple[str, str], int] = defaultdict(int)
+        periods: defaultdict[tuple[str, int, str], int] = defaultdict(int)
+
+        for commit in commits:
+            author_login = counted_login(commit.get("author"))
+            if not author_login:
+                continue
+            authored_at = ((commit.get("commit") or {}).get("author") or {}).get("date")
+            day = day_index(authored_at) if authored_at else None
+            if day is None:
+                continue
+            authors.append(author_login)
+            boards["commits", author_login] += 1
+            periods["commits", day, author_login] += 1
+
+        health = self.repo_health.get(repo_id)
+        if health is not None:
+            health["contributors"].update(authors)
+        self._apply_page_counts(boards, periods)
+
+    @traced_ingest
     def set_hygiene(self, repo_id: str, hygiene_data: dict[str, Any]) -> None:
         """Set hygiene data for a repository.
 
@@ -454,6 +676,70 @@ class MetricsAggregator:
         """
         self.hygiene[repo_id] = hygiene_data
 
+    def merge(self, other: "MetricsAggregator") -> None:
+        """Merge another aggregator's state into this one.
+
+        Merging partial aggregators in the order their events would otherwise have
+        been added sequentially produces an identical export, which allows repos to
+        be aggregated independently (e.g., in parallel) and combined afterwards.
+
+        Args:
+            other: Aggregator whose state is added to this one.
+        """
+        for metric, user_counts in other.leaderboards.items():
+            target = self.leaderboards[metric]
+            for user_login, count in user_counts.items():
+                target[user_login] += count
+
+        for mine, theirs in (
+            (self._weekly_counters, other._weekly_counters),
+            (self._monthly_counters, other._monthly_counters),
+        ):
+            for metric, periods in theirs.items():
+                for period, user_counts in periods.items():
+                    target = mine[metric][period]
+                    for user_login, count in user_counts.items():
+                        target[user_login] += count
+
+        for key, entries in other.timeseries.items():
+            self.timeseries[key].extend(entries)
+
+        for repo_id, health in other.repo_health.items():
+            if repo_id not in self.repo_health:
+                self.repo_health[repo_id] = health
+                continue
+            existing = self.repo_health[repo_id]
+            if self.repo_health_mode == "sketch":
+                from gh_year_end.metrics.sketches import merge_repo_health_sketch
+
+                merge_repo_health_sketch(existing, health)
+                continue
+            existing["contributors"] |= health["contributors"]
+            existing["prs_with_reviews"] |= health["prs_with_reviews"]
+            existing["merge_times"].extend(health["merge_times"])
+            for key in ("pr_count", "issue_count", "review_count", "comment_count"):
+                existing[key] += health[key]
+            latencies = existing.setdefault("review_latencies", {})
+            for pr_number, latency in health.get("review_latencies", {}).items():
+                if pr_number not in latencies or latency < latencies[pr_number]:
+                    latencies[pr_number] = latency
+            if not latencies:
+                del existing["review_latencies"]
+
+        self.hygiene.update(other.hygiene)
+        for login, info in other.users.items():
+            self.users.setdefault(login, info)
+        for full_name, info in other.repos.items():
+            self.repos.setdefault(full_name, info)
+
+        self._all_contributors_ever |= other._all_contributors_ever
+        self._new_contributors_this_year |= other._new_contributors_this_year
+        self._pr_details.extend(other._pr_details)
+        self._pr_created_at.update(other._pr_created_at)
+        self._pr_weights.update(other._pr_weights)
+        for weighted_key, weighted_count in other._weighted_counts.items():
+            self._weighted_counts[weighted_key] += weighted_count
+
     def compute_repo_health(self, repo_id: str) -> dict[str, Any]:
         """Compute health metrics for a repository.
 
@@ -467,10 +753,19 @@ class MetricsAggregator:
             return {}
 
         health = self.repo_health[repo_id]
+        if self.repo_health_mode == "sketch":
+            from gh_year_end.metrics.sketches import summarize_repo_health_sketch
 
-        # Calculate review coverage
+            return summarize_repo_health_sketch(repo_id, health)
+
+        # Calculate review coverage (sampled PRs count for the PRs they stand for)
         pr_count = health["pr_count"]
-        prs_with_reviews_count = len(health["prs_with_reviews"])
+        pr_weights = self._pr_weights
+        prs_with_reviews_count = (
+            sum(pr_weights.get((repo_id, number), 1) for number in health["prs_with_reviews"])
+            if pr_weights
+            else len(health["prs_with_reviews"])
+        )
         review_coverage = (prs_with_reviews_count / pr_count * 100) if pr_count > 0 else 0.0
 
         # Calculate median time to merge
@@ -502,8 +797,8 @@ class MetricsAggregator:
             "contributor_count": len(health["contributors"]),
             "pr_count": pr_count,
             "issue_count": health["issue_count"],
-            "review_count": health["review_count"],
-            "comment_count": health["comment_count"],
+            "review_count": round(health["review_count"]),
+            "comment_count": round(health["comment_count"]),
             "review_coverage": round(review_coverage, 1),
             "median_time_to_merge": (
                 round(median_time_to_merge, 1) if median_time_to_merge is not None else None
@@ -540,7 +835,7 @@ class MetricsAggregator:
             pr["lines_changed"] for pr in self._pr_details if pr.get("lines_changed", 0) > 0
         ]
 
-        return {
+        summary = {
             "year": self.year,
             "target_name": self.target_name,
             "target_mode": self.target_mode,
@@ -555,29 +850,40 @@ class MetricsAggregator:
             "new_contributors": len(self._new_contributors_this_year),
             "pr_sizes": pr_sizes,  # List of PR sizes for median calculation
         }
-
-    def _compute_leaderboards(self) -> dict[str, Any]:
+        # Commit metrics exist only when commits were aggregated (contributor stats)
+        if "commits" in self.leaderboards:
+            summary["total_commits"] = sum(self.leaderboards["commits"].values())
+            summary["lines_added"] = sum(self.leaderboards.get("lines_added", {}).values())
+            summary["lines_deleted"] = sum(self.leaderboards.get("lines_deleted", {}).values())
+        return summary
+
+    def _compute_leaderboards(self, top_k: int | None = None) -> dict[str, Any]:
         """Compute ranked leaderboards.
 
+        Args:
+            top_k: Keep only the top K users per metric (selected with a heap);
+                None ranks every user.
+
         Returns:
             Leaderboards dict matching leaderboards.json format
         """
+        from gh_year_end.metrics.leaderboards import rank_users
+
+        def is_bot(user_login: str) -> bool:
+            return bool(self.users.get(user_login, {}).get("is_bot", False))
+
         result = {}
 
         for metric, user_counts in self.leaderboards.items():
-            # Filter out bots and sort by count
-            ranked = [
+            # Filter out bots and rank by count
+            result[metric] = [
                 {
                     "user": user_login,
                     "count": count,
                     "avatar_url": self.users.get(user_login, {}).get("avatar_url", ""),
                 }
-                for user_login, count in user_counts.items()
-                if not self.users.get(user_login, {}).get("is_bot", False)
+                for user_login, count in rank_users(user_counts, is_bot, top_k)
             ]
-            ranked.sort(key=lambda x: x["count"], reverse=True)
-
-            result[metric] = ranked
 
         return result
 
@@ -587,6 +893,14 @@ class MetricsAggregator:
         Returns:
             Time series dict matching timeseries.json format
         """
+        if self.timeseries_layout == "columnar":
+            from gh_year_end.metrics.timeseries import build_columnar_timeseries
+
+            bots = {login for login, info in self.users.items() if info.get("is_bot", False)}
+            return build_columnar_timeseries(
+                self._weekly_counters, self._monthly_counters, exclude=bots | {"_total"}
+            )
+
         result: dict[str, dict[str, list[dict[str, Any]]]] = {
             "weekly": {},
             "monthly": {},
@@ -626,67 +940,22 @@ class MetricsAggregator:
 
         return result
 
-    def _compute_awards(self) -> dict[str, Any]:
+    def _compute_awards(self, leaderboards: dict[str, Any] | None = None) -> dict[str, Any]:
         """Compute awards based on metrics.
 
+        Args:
+            leaderboards: Already ranked leaderboards to take the winners from;
+                computed (top entry only) if not given.
+
         Returns:
             Awards dict matching awards.json format
         """
-        awards: dict[str, Any] = {}
-
-        # Top PR author
-        if self.leaderboards["prs_opened"]:
-            top_pr = max(
-                [
-                    (user, count)
-                    for user, count in self.leaderboards["prs_opened"].items()
-                    if not self.users.get(user, {}).get("is_bot", False)
-                ],
-                key=lambda x: x[1],
-                default=(None, 0),
-            )
-            if top_pr[0]:
-                awards["top_pr_author"] = {
-                    "user": top_pr[0],
-                    "count": top_pr[1],
-                    "avatar_url": self.users.get(top_pr[0], {}).get("avatar_url", ""),
-                }
+        from gh_year_end.metrics.leaderboards import awards_from_leaderboards
 
-        # Top reviewer
-        if self.leaderboards["reviews_submitted"]:
-            top_reviewer = max(
-                [
-                    (user, count)
-                    for user, count in self.leaderboards["reviews_submitted"].items()
-                    if not self.users.get(user, {}).get("is_bot", False)
-                ],
-                key=lambda x: x[1],
-                default=(None, 0),
-            )
-            if top_reviewer[0]:
-                awards["top_reviewer"] = {
-                    "user": top_reviewer[0],
-                    "count": top_reviewer[1],
-                    "avatar_url": self.users.get(top_reviewer[0], {}).get("avatar_url", ""),
-                }
+        if leaderboards is None:
+            leaderboards = self._compute_leaderboards(top_k=1)
 
-        # Top issue opener
-        if self.leaderboards["issues_opened"]:
-            top_issue = max(
-                [
-                    (user, count)
-                    for user, count in self.leaderboards["issues_opened"].items()
-                    if not self.users.get(user, {}).get("is_bot", False)
-                ],
-                key=lambda x: x[1],
-                default=(None, 0),
-            )
-            if top_issue[0]:
-                awards["top_issue_opener"] = {
-                    "user": top_issue[0],
-                    "count": top_issue[1],
-                    "avatar_url": self.users.get(top_issue[0], {}).get("avatar_url", ""),
-                }
+        awards: dict[str, Any] = awards_from_leaderboards(leaderboards)
 
         # Compute special mentions
         awards["special_mentions"] = self._compute_special_mentions()
@@ -767,6 +1036,35 @@ class MetricsAggregator:
 
         return special_mentions
 
+    def _fold_weighted_counts(self) -> None:
+        """Round scaled counts from sampled events into the integer counters."""
+        targets = {
+            "weekly": self._weekly_counters,
+            "monthly": self._monthly_counters,
+        }
+        for (kind, metric, period, user_login), count in self._weighted_counts.items():
+            rounded = round(count)
+            if not rounded:
+                continue
+            if kind == "leaderboards":
+                self.leaderboards[metric][user_login] += rounded
+            else:
+                targets[kind][metric][period][user_login] += rounded
+        self._weighted_counts.clear()
+
+    def _weighted_review_latencies(self) -> list[tuple[float, float]]:
+        """First-review latencies of reviewed PRs with their sample weights.
+
+        Sketch mode keeps no per-PR latencies, so nothing is returned there.
+        """
+        if self.repo_health_mode == "sketch":
+            return []
+        return [
+            (latency, self._pr_weights.get((repo_id, pr_number), 1))
+            for repo_id, health in self.repo_health.items()
+            for pr_number, latency in health.get("review_latencies", {}).items()
+        ]
+
     def _export_users(self) -> dict[str, dict[str, Any]]:
         """Export user mapping for ID resolution at build time.
 
@@ -795,9 +1093,16 @@ class MetricsAggregator:
                 'repo_health': [...],
                 'hygiene_scores': {...},
                 'awards': {...},
-                'users': {...}
+                'users': {...},
+                'leaderboards_full': {...},  # only with leaderboard_full_rankings
+                'repo_health_sketches': {...},  # only in sketch mode
+                'sampling': {...}  # only when reviews/comments were sampled
             }
         """
+        from gh_year_end.metrics.leaderboards import FULL_RANKINGS_KEY, truncate_leaderboards
+
+        self._fold_weighted_counts()
+
         # Convert repo_health sets to lists for JSON serialization
         repo_health_list = []
         for repo_id in sorted(self.repo_health.keys()):
@@ -805,12 +1110,32 @@ class MetricsAggregator:
             if health:
                 repo_health_list.append(health)
 
-        return {
-            "summary": self._compute_summary(),
-            "leaderboards": self._compute_leaderboards(),
+        summary = self._compute_summary()
+        full_rankings = None
+        if self.leaderboard_full_rankings:
+            full_rankings = self._compute_leaderboards()
+            leaderboards = truncate_leaderboards(full_rankings, self.leaderboard_top_k)
+        else:
+            leaderboards = self._compute_leaderboards(self.leaderboard_top_k)
+
+        metrics = {
+            "summary": summary,
+            "leaderboards": leaderboards,
             "timeseries": self._compute_timeseries(),
             "repo_health": repo_health_list,
             "hygiene_scores": self.hygiene,
-            "awards": self._compute_awards(),
+            "awards": self._compute_awards(leaderboards),
             "users": self._export_users(),
         }
+        if full_rankings is not None:
+            metrics[FULL_RANKINGS_KEY] = full_rankings
+        if self.repo_health_mode == "sketch":
+            from gh_year_end.metrics.sketches import repo_health_sketch_to_dict
+
+            metrics["repo_health_sketches"] = {
+                repo_id: repo_health_sketch_to_dict(self.repo_health[repo_id])
+                for repo_id in sorted(self.repo_health)
+            }
+        if self.sampling is not None:
+            metrics["sampling"] = self.sampling.to_dict(self._weighted_review_latencies())
+        return metrics
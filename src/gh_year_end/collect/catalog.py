@@ -0,0 +1,104 @@
+"""In-process catalog of collected PR and issue numbers.
+
+The pulls and issues collectors publish the numbers of everything they write
+as they go. Downstream phases (reviews, comments) read PR and issue numbers
+from the catalog instead of re-opening and re-parsing the raw JSONL files that
+were just written.
+
+Only repos whose collection finished in this process are served from the
+catalog. Repos collected by an earlier run (skipped on resume because the
+checkpoint already marks them complete) are reported as missing, and callers
+fall back to reading their raw files.
+"""
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PULLS = "pulls"
+ISSUES = "issues"
+
+
+class CollectionCatalog:
+    """Per-repo PR and issue numbers published by the collectors.
+
+    Numbers are staged while a repo is being collected and become visible
+    only once ``complete`` is called, so a repo that failed midway is never
+    served from partial data.
+
+    Example:
+        catalog = CollectionCatalog()
+        catalog.begin(PULLS, "org/repo")
+        catalog.publish(PULLS, "org/repo", page_of_prs)
+        catalog.complete(PULLS, "org/repo")
+        numbers, missing = catalog.numbers_by_repo(PULLS, repos)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty catalog."""
+        self._staged: dict[tuple[str, str], set[int]] = {}
+        self._published: dict[tuple[str, str], set[int]] = {}
+
+    def begin(self, kind: str, repo: str) -> None:
+        """Start (or restart) collecting a repo, discarding staged numbers.
+
+        Args:
+            kind: PULLS or ISSUES.
+            repo: Repository full name.
+        """
+        self._staged[(kind, repo)] = set()
+
+    def publish(self, kind: str, repo: str, items: Iterable[dict[str, Any]]) -> None:
+        """Stage numbers of items written to raw storage.
+
+        Args:
+            kind: PULLS or ISSUES.
+            repo: Repository full name.
+            items: Raw PR or issue objects (items without a number are ignored).
+        """
+        staged = self._staged.setdefault((kind, repo), set())
+        staged.update(int(item["number"]) for item in items if item.get("number") is not None)
+
+    def complete(self, kind: str, repo: str) -> None:
+        """Make a repo's staged numbers visible to downstream phases.
+
+        Args:
+            kind: PULLS or ISSUES.
+            repo: Repository full name.
+        """
+        self._published[(kind, repo)] = self._staged.pop((kind, repo), set())
+
+    def has(self, kind: str, repo: str) -> bool:
+        """Whether a repo's numbers were published in this process."""
+        return (kind, repo) in self._published
+
+    def numbers(self, kind: str, repo: str) -> set[int]:
+        """Published numbers for a repo (empty if not published)."""
+        return self._published.get((kind, repo), set())
+
+    def numbers_by_repo(
+        self, kind: str, repos: Iterable[dict[str, Any]]
+    ) -> tuple[dict[str, list[int]], list[dict[str, Any]]]:
+        """Sorted numbers per repo, plus the repos the catalog cannot answer for.
+
+        Repos with no items are omitted from the mapping, matching the raw-file
+        extraction helpers.
+
+        Args:
+            kind: PULLS or ISSUES.
+            repos: Repository metadata dicts.
+
+        Returns:
+            (repo full_name -> sorted numbers, repos not published in this process).
+        """
+        numbers: dict[str, list[int]] = {}
+        missing: list[dict[str, Any]] = []
+        for repo in repos:
+            name = repo["full_name"]
+            if not self.has(kind, name):
+                missing.append(repo)
+            elif published := self.numbers(kind, name):
+                numbers[name] = sorted(published)
+        return numbers, missing
@@ -0,0 +1,137 @@
+"""Per-author commit metrics from repository contributor statistics.
+
+Paging commit history costs one request per 100 commits and carries no line
+counts. ``/repos/{owner}/{repo}/stats/contributors`` returns every author's
+weekly commits, additions, and deletions in one request, but GitHub computes
+it in the background: a repo whose statistics are not cached answers 202
+Accepted and must be asked again later.
+
+``fetch_contributor_stats`` requests every repo at once, so GitHub computes
+statistics for all of them in parallel, then re-polls only the repos still
+pending. Repos whose statistics never arrive (or are unavailable) fall back to
+counting paged commit history when ``collection.commits.history_fallback`` is
+set.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from gh_year_end.collect.aggregator import MetricsAggregator
+from gh_year_end.config import CommitsConfig
+
+if TYPE_CHECKING:
+    from gh_year_end.github.rest import RestClient
+    from gh_year_end.storage.recorder import RawRecorder
+
+logger = logging.getLogger(__name__)
+
+STATS_PENDING = 202
+STATS_EMPTY = 204
+
+
+async def fetch_contributor_stats(
+    repos: list[dict[str, Any]],
+    rest_client: "RestClient",
+    config: CommitsConfig,
+    proceed: Callable[[], bool] | None = None,
+) -> dict[str, list[dict[str, Any]] | None]:
+    """Fetch contributor statistics for many repos, polling while GitHub computes them.
+
+    Args:
+        repos: Repositories to fetch (need ``full_name``).
+        rest_client: REST client (requests go through its rate limiter).
+        config: Commit collection settings (poll interval and count).
+        proceed: Checked before each round of requests; once it returns False,
+            polling stops and repos still pending are unavailable.
+
+    Returns:
+        Full name -> contributor stats. An empty repo maps to an empty list;
+        None means the statistics are unavailable (error, 404, or still being
+        computed after the last poll).
+    """
+
+    async def fetch(full_name: str) -> tuple[str, list[dict[str, Any]] | None, int]:
+        owner, name = full_name.split("/", 1)
+        try:
+            data, status = await rest_client.get_contributor_stats(owner, name)
+        except Exception as e:
+            logger.warning("Contributor stats request failed for %s: %s", full_name, e)
+            return full_name, None, 0
+        return full_name, data, status
+
+    results: dict[str, list[dict[str, Any]] | None] = {}
+    pending = [repo["full_name"] for repo in repos]
+    for poll in range(config.stats_max_polls + 1):
+        if poll:
+            await asyncio.sleep(config.stats_poll_interval)
+        if proceed is not None and not proceed():
+            logger.info("Contributor stats polling stopped with %d repos pending", len(pending))
+            break
+        still_pending = []
+        for full_name, data, status in await asyncio.gather(*(fetch(n) for n in pending)):
+            if status == STATS_PENDING:
+                still_pending.append(full_name)
+            elif status == STATS_EMPTY:
+                results[full_name] = []
+            else:
+                results[full_name] = data
+        pending = still_pending
+        if not pending:
+            break
+        logger.debug("Contributor stats still computing for %d repos", len(pending))
+
+    if pending:
+        logger.info(
+            "Contributor stats not ready after %d polls for %d repos",
+            config.stats_max_polls,
+            len(pending),
+        )
+    for full_name in pending:
+        results[full_name] = None
+    return results
+
+
+async def count_commit_history(
+    repo_full_name: str,
+    rest_client: "RestClient",
+    aggregator: MetricsAggregator,
+    since: str,
+    until: str,
+    max_pages: int | None = None,
+    recorder: "RawRecorder | None" = None,
+) -> int:
+    """Count a repo's in-window commits per author from paged history.
+
+    Args:
+        repo_full_name: Repository full name.
+        rest_client: REST client.
+        aggregator: Aggregator receiving the commits.
+        since: ISO 8601 start of the window.
+        until: ISO 8601 end of the window.
+        max_pages: Maximum pages to read (None = all).
+        recorder: Raw recorder capturing the commits (None = not recorded).
+
+    Returns:
+        Number of commits read.
+    """
+    owner, name = repo_full_name.split("/", 1)
+    count = 0
+    async for commits_page, metadata in rest_client.list_commits(
+        owner=owner, repo=name, since=since, until=until
+    ):
+        aggregator.add_commits(repo_full_name, commits_page)
+        count += len(commits_page)
+        if recorder:
+            for commit in commits_page:
+                await recorder.write(
+                    "commits",
+                    f"/repos/{repo_full_name}/commits",
+                    commit,
+                    page=metadata["page"],
+                )
+        if max_pages is not None and metadata["page"] >= max_pages:
+            logger.info("Reached max_pages limit (%d) for %s", max_pages, repo_full_name)
+            break
+    return count
@@ -0,0 +1,238 @@
+"""Deadline- and budget-bounded collection.
+
+A bounded run (``collect --deadline 45m`` or ``--budget 4000``) visits
+repositories in order of expected value instead of discovery order, so a run
+cut short still covers the busiest repos. Value comes from the discovery
+payload: recent pushes dominate (a repo untouched since before the window has
+little in-window activity), then open issue/PR counts, stars, and forks.
+
+As the bound is used up, lower-value phases are dropped first: hygiene probes
+(branch protection, tree, security analysis) past ``low_value_cutoff``, then
+comment listings and commit history fallbacks past ``secondary_cutoff``. PRs,
+reviews, and issues run until the bound is reached. What was and was not collected is recorded by
+``CoverageTracker`` and exported alongside the metrics.
+"""
+
+import logging
+import math
+import re
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from gh_year_end.config import CollectionLimitsConfig
+from gh_year_end.github.ratelimit import AdaptiveRateLimiter, ProgressState
+
+logger = logging.getLogger(__name__)
+
+# Phase -> tier: 0 always runs, 1 dropped past secondary_cutoff, 2 past low_value_cutoff
+PHASE_TIERS = {
+    "pulls": 0,
+    "reviews": 0,
+    "issues": 0,
+    "comments": 1,
+    "commits": 1,
+    "hygiene": 2,
+}
+
+COMPLETE = "complete"
+PARTIAL = "partial"
+SKIPPED = "skipped"
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)([hms])")
+_DURATION_UNITS = {"h": 3600, "m": 60, "s": 1}
+
+
+def parse_duration(text: str) -> float:
+    """Parse a duration such as ``45m``, ``2h``, ``1h30m``, or ``90`` (seconds).
+
+    Args:
+        text: Duration string.
+
+    Returns:
+        Duration in seconds.
+
+    Raises:
+        ValueError: If the string is not a positive duration.
+    """
+    value = text.strip().lower()
+    if re.fullmatch(r"\d+(?:\.\d+)?", value):
+        seconds = float(value)
+    elif value and re.fullmatch(rf"(?:{_DURATION_PART.pattern})+", value):
+        seconds = sum(
+            float(amount) * _DURATION_UNITS[unit] for amount, unit in _DURATION_PART.findall(value)
+        )
+    else:
+        msg = f"Invalid duration: {text!r} (expected e.g. 45m, 2h, 1h30m)"
+        raise ValueError(msg)
+    if seconds <= 0:
+        msg = f"Duration must be positive: {text!r}"
+        raise ValueError(msg)
+    return seconds
+
+
+def repo_value(repo: dict[str, Any], since: datetime) -> float:
+    """Expected value of collecting a repo, from its discovery metadata.
+
+    Args:
+        repo: Repository metadata from discovery.
+        since: Start of the collection window; naive values are taken as UTC.
+
+    Returns:
+        Non-negative score; higher is collected first.
+    """
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    pushed_at = repo.get("pushed_at")
+    activity = 0.1
+    if pushed_at:
+        pushed = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
+        days_before = (since - pushed).total_seconds() / 86400
+        # Full weight when pushed in the window, halving every 90 days before it
+        activity = 1.0 if days_before <= 0 else 0.5 ** (days_before / 90)
+    size = (
+        1.0
+        + math.log1p(repo.get("open_issues_count") or 0)
+        + 0.5 * math.log1p(repo.get("stargazers_count") or 0)
+        + 0.25 * math.log1p(repo.get("forks_count") or 0)
+    )
+    return activity * size
+
+
+def order_by_value(repos: list[dict[str, Any]], since: datetime) -> list[dict[str, Any]]:
+    """Sort repos by descending expected value (ties keep discovery order)."""
+    return sorted(repos, key=lambda repo: repo_value(repo, since), reverse=True)
+
+
+class RunBudget:
+    """Time and request bound for a collection run.
+
+    Requests are counted by the rate limiter's progress state, so every REST
+    and GraphQL request made after ``start`` counts toward ``max_requests``.
+    An unbounded budget never runs out and allows every phase.
+    """
+
+    def __init__(self, limits: CollectionLimitsConfig, rate_limiter: AdaptiveRateLimiter) -> None:
+        """Initialize the budget.
+
+        Args:
+            limits: Deadline and request bound with phase cutoffs.
+            rate_limiter: Rate limiter whose progress state counts requests.
+        """
+        self.limits = limits
+        self.rate_limiter = rate_limiter
+        self.started = time.monotonic()
+        self.stop_reason: str | None = None
+
+    @property
+    def bounded(self) -> bool:
+        return self.limits.deadline_seconds is not None or self.limits.max_requests is not None
+
+    def start(self, total_repos: int) -> None:
+        """Start the clock and the request count."""
+        self.started = time.monotonic()
+        self.rate_limiter.set_progress_state(ProgressState("collection", total_repos))
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def requests_made(self) -> int:
+        state = self.rate_limiter.get_progress_state()
+        return state.requests_made if state else 0
+
+    def used(self) -> float:
+        """Share of the bound used so far (the larger of time and requests)."""
+        shares = [0.0]
+        if self.limits.deadline_seconds is not None:
+            shares.append(self.elapsed / self.limits.deadline_seconds)
+        if self.limits.max_requests is not None:
+            shares.append(self.requests_made / self.limits.max_requests)
+        return max(shares)
+
+    def exhausted(self) -> bool:
+        """Whether the deadline has passed or the request budget is spent."""
+        if self.stop_reason is None and self.bounded and self.used() >= 1.0:
+            deadline = self.limits.deadline_seconds
+            if deadline is not None and self.elapsed >= deadline:
+                self.stop_reason = "deadline"
+            else:
+                self.stop_reason = "request_budget"
+            logger.warning(
+                "Collection bound reached (%s) after %.0fs and %d requests",
+                self.stop_reason,
+                self.elapsed,
+                self.requests_made,
+            )
+        return self.stop_reason is not None
+
+    def allows(self, phase: str) -> bool:
+        """Whether a phase should still run for the next repo."""
+        if self.exhausted():
+            return False
+        tier = PHASE_TIERS.get(phase, 0)
+        if tier == 0:
+            return True
+        cutoff = self.limits.secondary_cutoff if tier == 1 else self.limits.low_value_cutoff
+        return self.used() < cutoff
+
+
+class CoverageTracker:
+    """Record which phases were collected for which repos.
+
+    Example:
+        coverage = CoverageTracker(repos, budget)
+        coverage.record("org/repo", "pulls", COMPLETE)
+        metrics["coverage"] = coverage.to_dict()
+    """
+
+    def __init__(self, repos: list[dict[str, Any]], budget: RunBudget) -> None:
+        """Initialize coverage for repos in collection order.
+
+        Args:
+            repos: Repositories in the order they will be visited.
+            budget: Run budget (for bound and stop reason).
+        """
+        self.order = [repo["full_name"] for repo in repos]
+        self.budget = budget
+        self.repos: dict[str, dict[str, str]] = {}
+
+    def record(self, repo: str, phase: str, status: str) -> None:
+        """Record a phase outcome for a repo.
+
+        Args:
+            repo: Repository full name.
+            phase: Phase name.
+            status: COMPLETE, PARTIAL, or SKIPPED.
+        """
+        self.repos.setdefault(repo, {})[phase] = status
+
+    def to_dict(self) -> dict[str, Any]:
+        """Coverage summary for export."""
+        phases: dict[str, dict[str, int]] = {}
+        for statuses in self.repos.values():
+            for phase, status in statuses.items():
+                counts = phases.setdefault(phase, {COMPLETE: 0, PARTIAL: 0, SKIPPED: 0})
+                counts[status] += 1
+        not_started = [name for name in self.order if name not in self.repos]
+        complete = not not_started and all(
+            status == COMPLETE for statuses in self.repos.values() for status in statuses.values()
+        )
+        limits = self.budget.limits
+        return {
+            "complete": complete,
+            "stop_reason": self.budget.stop_reason,
+            "bound": {
+                "deadline_seconds": limits.deadline_seconds,
+                "max_requests": limits.max_requests,
+            },
+            "elapsed_seconds": round(self.budget.elapsed, 1),
+            "requests_made": self.budget.requests_made,
+            "repo_order": "value" if limits.order_by_value else "discovery",
+            "repos_total": len(self.order),
+            "repos_started": len(self.repos),
+            "repos_not_started": not_started,
+            "phases": phases,
+            "repos": self.repos,
+        }
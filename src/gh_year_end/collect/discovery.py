@@ -2,13 +2,17 @@
 
 Discovers repositories based on configuration and applies filters for forks,
 archived repos, visibility, activity, size, language, topics, and name patterns.
-Supports quick scan mode using GitHub Search API. Writes raw data to JSONL storage.
+Supports quick scan mode using GitHub Search API. The unfiltered listing is kept
+in a per-target catalog (see ``discovery_catalog``) and refreshed incrementally.
+Writes raw data to JSONL storage.
 """
 
 import logging
 from typing import Any
 
+from gh_year_end.collect.discovery_catalog import DiscoveryCatalog
 from gh_year_end.collect.filters import FilterChain
+from gh_year_end.collect.repo_store import RepoStore
 from gh_year_end.config import Config
 from gh_year_end.github.http import GitHubClient, GitHubResponse
 from gh_year_end.storage.paths import PathManager
@@ -16,6 +20,8 @@ from gh_year_end.storage.writer import AsyncJSONLWriter
 
 logger = logging.getLogger(__name__)
 
+LIST_PAGE_SIZE = 100
+
 
 class DiscoveryError(Exception):
     """Raised when repository discovery fails."""
@@ -25,6 +31,7 @@ async def discover_repos(
     config: Config,
     client: GitHubClient,
     paths: PathManager,
+    store: RepoStore | None = None,
 ) -> list[dict[str, Any]]:
     """Discover repositories based on configuration.
 
@@ -36,6 +43,8 @@ async def discover_repos(
         config: Application configuration.
         client: GitHub HTTP client.
         paths: Path manager for storage locations.
+        store: Per-run repo store receiving the full payloads of the
+            discovered repos.
 
     Returns:
         List of repo metadata dictionaries.
@@ -57,13 +66,13 @@ async def discover_repos(
     # Create filter chain
     filter_chain = FilterChain(discovery_config)
 
-    # Fetch repositories (quick scan or thorough)
-    if discovery_config.quick_scan.enabled:
-        logger.info("Using quick scan (Search API) for discovery")
-        raw_repos = await _quick_scan_discovery(client, target_mode, target_name, filter_chain)
+    # Fetch repositories (catalog refresh, quick scan, or thorough)
+    catalog = None
+    if discovery_config.catalog.enabled:
+        catalog = await _catalog_discovery(config, client, paths, filter_chain)
+        raw_repos = catalog.repos()
     else:
-        logger.info("Using thorough discovery (List API)")
-        raw_repos = await _fetch_repos(client, target_mode, target_name)
+        raw_repos = await _full_discovery(config, client, filter_chain)
 
     logger.info("Fetched %d raw repositories from %s", len(raw_repos), target_name)
 
@@ -88,6 +97,14 @@ async def discover_repos(
 
     # Write raw data to JSONL
     await _write_raw_repos(filtered_repos, client, paths, filter_stats)
+    if store is not None:
+        # Catalog entries not listed in this run may carry stale fields
+        # (security_and_analysis), so the store fetches those repos itself
+        store.add(
+            filtered_repos
+            if catalog is None
+            else [repo for repo in filtered_repos if repo.get("id") in catalog.listed]
+        )
 
     # Extract and return metadata
     repos_metadata = _extract_metadata(filtered_repos)
@@ -97,6 +114,80 @@ async def discover_repos(
     return repos_metadata
 
 
+async def _full_discovery(
+    config: Config,
+    client: GitHubClient,
+    filter_chain: FilterChain,
+) -> list[dict[str, Any]]:
+    """List every repository with the configured method (quick scan or thorough).
+
+    Args:
+        config: Application configuration.
+        client: GitHub HTTP client.
+        filter_chain: Filter chain for building the search query.
+
+    Returns:
+        List of raw repository data from API.
+    """
+    target_mode = config.github.target.mode
+    target_name = config.github.target.name
+    if config.github.discovery.quick_scan.enabled:
+        logger.info("Using quick scan (Search API) for discovery")
+        return await _quick_scan_discovery(client, target_mode, target_name, filter_chain)
+    logger.info("Using thorough discovery (List API)")
+    return await _fetch_repos(client, target_mode, target_name)
+
+
+async def _catalog_discovery(
+    config: Config,
+    client: GitHubClient,
+    paths: PathManager,
+    filter_chain: FilterChain,
+) -> DiscoveryCatalog:
+    """Serve discovery from the persisted catalog, refreshing it as needed.
+
+    An empty, outdated, or differently seeded catalog is replaced by a full
+    listing. A catalog refreshed within ``catalog.fresh_minutes`` is used as
+    is; otherwise only repos pushed since its watermark are listed.
+
+    Args:
+        config: Application configuration.
+        client: GitHub HTTP client.
+        paths: Path manager for the catalog location.
+        filter_chain: Filter chain for building the search query.
+
+    Returns:
+        The refreshed catalog of raw (unfiltered) repository data.
+    """
+    target_mode = config.github.target.mode
+    target_name = config.github.target.name
+    discovery_config = config.github.discovery
+    catalog_config = discovery_config.catalog
+    source = "search" if discovery_config.quick_scan.enabled else "list"
+
+    target = f"{target_mode}:{target_name}@{client.auth_fingerprint}"
+    catalog = DiscoveryCatalog(paths.discovery_catalog_path, target).load()
+    if catalog.needs_full_refresh(source, catalog_config.full_refresh_days):
+        catalog.replace(await _full_discovery(config, client, filter_chain), source)
+    elif catalog.age() < catalog_config.fresh_minutes * 60:
+        logger.info(
+            "Using discovery catalog refreshed %.0fs ago (%d repos)", catalog.age(), len(catalog)
+        )
+    else:
+        watermark = catalog.watermark
+        pushed, pages = await _fetch_pushed_since(client, target_mode, target_name, watermark)
+        added = catalog.merge(pushed)
+        logger.info(
+            "Refreshed discovery catalog in %d requests: %d repos pushed since %s (%d new)",
+            pages,
+            len(pushed),
+            watermark,
+            added,
+        )
+    catalog.save()
+    return catalog
+
+
 async def _quick_scan_discovery(
     client: GitHubClient,
     mode: str,
@@ -203,35 +294,15 @@ async def _fetch_repos(
     Raises:
         DiscoveryError: If API request fails.
     """
-    endpoint = f"/orgs/{name}/repos" if mode == "org" else f"/users/{name}/repos"
+    endpoint = _list_endpoint(mode, name)
 
     repos: list[dict[str, Any]] = []
     page = 1
 
     while True:
-        logger.debug("Fetching repos page %d from %s", page, endpoint)
-
-        try:
-            response: GitHubResponse = await client.get(
-                endpoint,
-                params={"page": page, "per_page": 100, "sort": "created", "direction": "asc"},
-            )
-        except Exception as e:
-            msg = f"Failed to fetch repositories from {endpoint}: {e}"
-            logger.error(msg)
-            raise DiscoveryError(msg) from e
-
-        if not response.is_success:
-            msg = f"API error {response.status_code} for {endpoint}"
-            logger.error(msg)
-            raise DiscoveryError(msg)
-
-        page_data = response.data
-        if not isinstance(page_data, list):
-            msg = f"Expected list response from {endpoint}, got {type(page_data)}"
-            logger.error(msg)
-            raise DiscoveryError(msg)
-
+        page_data = await _fetch_repo_page(
+            client, endpoint, {"page": page, "sort": "created", "direction": "asc"}
+        )
         if not page_data:
             break
 
@@ -243,6 +314,96 @@ async def _fetch_repos(
     return repos
 
 
+async def _fetch_pushed_since(
+    client: GitHubClient,
+    mode: str,
+    name: str,
+    watermark: str | None,
+) -> tuple[list[dict[str, Any]], int]:
+    """Fetch repositories pushed at or after a watermark, newest push first.
+
+    Pages are read until one reaches a repo pushed before the watermark, so a
+    quiet target costs a single request.
+
+    Args:
+        client: GitHub HTTP client.
+        mode: Target mode ("org" or "user").
+        name: Target name (organization or username).
+        watermark: ISO 8601 ``pushed_at`` to stop at (None lists everything).
+
+    Returns:
+        Tuple of (raw repository data, requests made).
+
+    Raises:
+        DiscoveryError: If API request fails.
+    """
+    endpoint = _list_endpoint(mode, name)
+
+    repos: list[dict[str, Any]] = []
+    page = 1
+
+    while True:
+        page_data = await _fetch_repo_page(
+            client, endpoint, {"page": page, "sort": "pushed", "direction": "desc"}
+        )
+        repos.extend(page_data)
+        reached = watermark is not None and any(
+            (repo.get("pushed_at") or "") < watermark for repo in page_data
+        )
+        if reached or len(page_data) < LIST_PAGE_SIZE:
+            return repos, page
+
+        page += 1
+
+
+def _list_endpoint(mode: str, name: str) -> str:
+    """Repository list endpoint for a target."""
+    return f"/orgs/{name}/repos" if mode == "org" else f"/users/{name}/repos"
+
+
+async def _fetch_repo_page(
+    client: GitHubClient,
+    endpoint: str,
+    params: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Fetch one page of a repository list endpoint.
+
+    Args:
+        client: GitHub HTTP client.
+        endpoint: List endpoint.
+        params: Query parameters (``per_page`` is added).
+
+    Returns:
+        Raw repository data on the page.
+
+    Raises:
+        DiscoveryError: If API request fails.
+    """
+    logger.debug("Fetching repos page %d from %s", params["page"], endpoint)
+
+    try:
+        response: GitHubResponse = await client.get(
+            endpoint, params={**params, "per_page": LIST_PAGE_SIZE}
+        )
+    except Exception as e:
+        msg = f"Failed to fetch repositories from {endpoint}: {e}"
+        logger.error(msg)
+        raise DiscoveryError(msg) from e
+
+    if not response.is_success:
+        msg = f"API error {response.status_code} for {endpoint}"
+        logger.error(msg)
+        raise DiscoveryError(msg)
+
+    page_data = response.data
+    if not isinstance(page_data, list):
+        msg = f"Expected list response from {endpoint}, got {type(page_data)}"
+        logger.error(msg)
+        raise DiscoveryError(msg)
+
+    return page_data
+
+
 def _apply_filters(
     repos: list[dict[str, Any]],
     filter_chain: FilterChain,
@@ -0,0 +1,171 @@
+"""Persisted repository catalog for discovery.
+
+Listing a 6,000-repo organization costs 60 requests, and every ``collect``
+(and every year of ``batch-years``) used to repeat it before re-applying the
+same filters. The catalog keeps the unfiltered listing for a target under the
+shared cache root, so it is reused across years and commands. A refresh asks
+the list endpoint for repos ordered by ``pushed_at`` (newest first) and stops
+at the first page reaching the catalog's watermark -- usually one request.
+Filters are always re-run locally on the merged catalog.
+
+Repos whose metadata changes without a push (renames, archival, visibility
+changes) and deleted repos are only picked up by a full listing, which runs
+when the catalog is older than ``catalog.full_refresh_days``. That staleness
+is why the catalog is opt-in. The catalog is keyed by target and token, since
+a listing reflects the permissions of the token that made it.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from gh_year_end.storage.cache import CACHE_VERSION, atomic_write_json, read_json
+
+logger = logging.getLogger(__name__)
+
+
+class DiscoveryCatalog:
+    """On-disk unfiltered repository listing for one discovery target.
+
+    File layout::
+
+        {"version": 1, "target": "org:my-org@<token digest>", "source": "list",
+         "refreshed_at": 1735689600.0, "full_at": 1735689600.0,
+         "repos": [{"id": 1, "full_name": "my-org/repo", ...}]}
+
+    ``source`` records how the catalog was seeded (``list`` or ``search``),
+    so switching ``quick_scan`` re-seeds it. Repos keep the order they were
+    first seen in, which keeps raw output deterministic across refreshes.
+
+    Attributes:
+        listed: IDs of the repos listed during this run; the others come from
+            an earlier listing and may carry stale fields.
+    """
+
+    def __init__(self, path: Path, target: str, clock: Callable[[], float] = time.time) -> None:
+        """Initialize the catalog (call ``load`` to read an existing one).
+
+        Args:
+            path: Catalog file path.
+            target: Target key (``<mode>:<name>@<token digest>``) stored in the file.
+            clock: Time source returning epoch seconds.
+        """
+        self.path = path
+        self.target = target
+        self._clock = clock
+        self.source: str | None = None
+        self.refreshed_at = 0.0
+        self.full_at = 0.0
+        self._repos: dict[int, dict[str, Any]] = {}
+        self.listed: set[int] = set()
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._repos)
+
+    def load(self) -> "DiscoveryCatalog":
+        """Load the catalog from disk, ignoring missing or unreadable files.
+
+        Returns:
+            This catalog, for chaining.
+        """
+        data = read_json(self.path, "discovery catalog")
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != CACHE_VERSION
+            or data.get("target") != self.target
+            or not isinstance(data.get("repos"), list)
+        ):
+            return self
+
+        self.source = data.get("source")
+        self.refreshed_at = float(data.get("refreshed_at", 0))
+        self.full_at = float(data.get("full_at", 0))
+        self._repos = {repo["id"]: repo for repo in data["repos"] if "id" in repo}
+        logger.debug("Loaded discovery catalog with %d repos from %s", len(self), self.path)
+        return self
+
+    def repos(self) -> list[dict[str, Any]]:
+        """Unfiltered catalog repos."""
+        return list(self._repos.values())
+
+    @property
+    def watermark(self) -> str | None:
+        """Latest ``pushed_at`` in the catalog (ISO 8601), or None if empty."""
+        pushed = [repo["pushed_at"] for repo in self._repos.values() if repo.get("pushed_at")]
+        return max(pushed) if pushed else None
+
+    def age(self) -> float:
+        """Seconds since the last refresh."""
+        return self._clock() - self.refreshed_at
+
+    def needs_full_refresh(self, source: str, full_refresh_days: float) -> bool:
+        """Whether the catalog must be re-seeded with a full listing.
+
+        Args:
+            source: Discovery method about to run (``list`` or ``search``).
+            full_refresh_days: Maximum age of the last full listing.
+
+        Returns:
+            True for an empty catalog, a different seed method, or an old
+            full listing.
+        """
+        return (
+            not self._repos
+            or self.source != source
+            or self._clock() - self.full_at > full_refresh_days * 86400
+        )
+
+    def replace(self, repos: list[dict[str, Any]], source: str) -> None:
+        """Replace the catalog with a full listing.
+
+        Args:
+            repos: Unfiltered repos from the listing.
+            source: How they were listed (``list`` or ``search``).
+        """
+        self._repos = {repo["id"]: repo for repo in repos if "id" in repo}
+        self.listed = set(self._repos)
+        self.source = source
+        self.refreshed_at = self.full_at = self._clock()
+        self._dirty = True
+
+    def merge(self, repos: list[dict[str, Any]]) -> int:
+        """Merge repos from an incremental refresh.
+
+        Args:
+            repos: Repos pushed since the watermark.
+
+        Returns:
+            Number of repos that were new to the catalog.
+        """
+        added = 0
+        for repo in repos:
+            if "id" not in repo:
+                continue
+            added += repo["id"] not in self._repos
+            self._repos[repo["id"]] = repo
+            self.listed.add(repo["id"])
+        self.refreshed_at = self._clock()
+        self._dirty = True
+        return added
+
+    def save(self) -> None:
+        """Write the catalog atomically if it changed."""
+        if not self._dirty:
+            return
+        atomic_write_json(
+            self.path,
+            {
+                "version": CACHE_VERSION,
+                "target": self.target,
+                "source": self.source,
+                "refreshed_at": self.refreshed_at,
+                "full_at": self.full_at,
+                "repos": self.repos(),
+            },
+            prefix=".catalog_",
+        )
+        self._dirty = False
+        logger.debug("Saved discovery catalog with %d repos to %s", len(self), self.path)
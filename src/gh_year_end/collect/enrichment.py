@@ -0,0 +1,212 @@
+"""Contributor profile enrichment with a persistent TTL cache.
+
+Events only embed a contributor's login and avatar. Profile fields such as the
+display name are resolved after collection for every distinct contributor,
+through batched GraphQL queries (``GraphQLClient.query_users``), and cached on
+disk under the storage root. The cache is keyed by login only, so it is shared
+across years and targets; entries older than the configured TTL are refetched.
+Logins that do not resolve to a user are cached too, so they are not queried
+again on every run.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from gh_year_end.github.graphql import GraphQLClient, GraphQLError
+from gh_year_end.github.http import GitHubHTTPError, RateLimitExceeded
+from gh_year_end.storage.cache import KeyedCache
+
+logger = logging.getLogger(__name__)
+
+
+class UserProfileCache(KeyedCache):
+    """On-disk login -> profile cache with a time-to-live.
+
+    File layout::
+
+        {"version": 1, "users": {"alice": {"fetched_at": 1735689600.0,
+                                           "profile": {"login": ..., "name": ..., "avatarUrl": ...}}}}
+
+    A ``null`` profile records a login that did not resolve to a user.
+    """
+
+    section = "users"
+    description = "user profile cache"
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache (call ``load`` to read existing entries).
+
+        Args:
+            path: Cache file path.
+            ttl_seconds: Age after which an entry is stale.
+            clock: Time source returning epoch seconds.
+        """
+        super().__init__(path, clock)
+        self.ttl_seconds = ttl_seconds
+
+    def lookup(
+        self, logins: Iterable[str], include_stale: bool = False
+    ) -> tuple[dict[str, dict[str, Any] | None], list[str]]:
+        """Split logins into fresh cached profiles and logins that need fetching.
+
+        Args:
+            logins: Logins to resolve.
+            include_stale: Treat expired entries as fresh (for offline use).
+
+        Returns:
+            (login -> cached profile for fresh entries, logins missing or stale).
+        """
+        max_age = float("inf") if include_stale else self.ttl_seconds
+        now = self._clock()
+        fresh: dict[str, dict[str, Any] | None] = {}
+        stale: list[str] = []
+        for login in logins:
+            entry = self._entries.get(login)
+            if entry is not None and now - entry.get("fetched_at", 0) < max_age:
+                fresh[login] = entry.get("profile")
+            else:
+                stale.append(login)
+        return fresh, stale
+
+    def put(self, profiles: Mapping[str, dict[str, Any] | None]) -> None:
+        """Store freshly fetched profiles.
+
+        Args:
+            profiles: Login -> profile (None if the login did not resolve).
+        """
+        now = self._clock()
+        for login, profile in profiles.items():
+            self._entries[login] = {"fetched_at": now, "profile": profile}
+        if profiles:
+            self._touch()
+
+
+def _leaderboard_lists(metrics: dict[str, Any]) -> list[list[dict[str, Any]]]:
+    """All ranked entry lists in exported metrics (top-K and full rankings)."""
+    lists: list[list[dict[str, Any]]] = []
+    for key in ("leaderboards", "leaderboards_full"):
+        boards = metrics.get(key)
+        if isinstance(boards, dict):
+            lists.extend(entries for entries in boards.values() if isinstance(entries, list))
+    return lists
+
+
+def contributor_logins(metrics: dict[str, Any]) -> list[str]:
+    """Distinct contributor logins in exported metrics, in first-seen order.
+
+    Args:
+        metrics: Output of ``MetricsAggregator.export()``.
+
+    Returns:
+        Logins appearing in the leaderboards (bots are already excluded).
+    """
+    logins: dict[str, None] = {}
+    for entries in _leaderboard_lists(metrics):
+        for entry in entries:
+            if user := entry.get("user"):
+                logins[user] = None
+    return list(logins)
+
+
+def apply_user_profiles(
+    metrics: dict[str, Any], profiles: Mapping[str, dict[str, Any] | None]
+) -> int:
+    """Add display names (and missing avatars) to leaderboard and award entries.
+
+    Args:
+        metrics: Exported metrics, updated in place.
+        profiles: Login -> profile from ``GraphQLClient.query_users``.
+
+    Returns:
+        Number of entries updated.
+    """
+    entries = [entry for ranked in _leaderboard_lists(metrics) for entry in ranked]
+    awards = metrics.get("awards")
+    if isinstance(awards, dict):
+        entries.extend(entry for entry in awards.values() if isinstance(entry, dict))
+
+    updated = 0
+    for entry in entries:
+        profile = profiles.get(entry.get("user", ""))
+        if not profile:
+            continue
+        entry["display_name"] = profile.get("name") or None
+        if not entry.get("avatar_url") and profile.get("avatarUrl"):
+            entry["avatar_url"] = profile["avatarUrl"]
+        updated += 1
+    return updated
+
+
+async def enrich_contributors(
+    metrics: dict[str, Any],
+    graphql_client: GraphQLClient,
+    cache: UserProfileCache,
+    batch_size: int = 50,
+) -> dict[str, int]:
+    """Resolve contributor profiles (cache first, then batched GraphQL) into metrics.
+
+    Enrichment is best effort: a failed batch (GraphQL, HTTP, or network error)
+    is logged and its logins are left unenriched (and uncached, so the next run
+    retries them). Once the rate limit is exhausted the remaining batches are
+    skipped.
+
+    Args:
+        metrics: Exported metrics, updated in place.
+        graphql_client: GraphQL client for profile lookups.
+        cache: Loaded profile cache; saved after fetching.
+        batch_size: Logins resolved per GraphQL request.
+
+    Returns:
+        Stats: contributors, cached, fetched, failed, requests, entries_updated.
+    """
+    logins = contributor_logins(metrics)
+    profiles, missing = cache.lookup(logins)
+    stats = {
+        "contributors": len(logins),
+        "cached": len(profiles),
+        "fetched": 0,
+        "failed": 0,
+        "requests": 0,
+    }
+
+    for start in range(0, len(missing), batch_size):
+        batch = missing[start : start + batch_size]
+        stats["requests"] += 1
+        try:
+            fetched = await graphql_client.query_users(batch)
+        except RateLimitExceeded as e:
+            logger.warning(
+                "Rate limited resolving user profiles, skipping %d: %s",
+                len(missing) - start,
+                e,
+            )
+            stats["failed"] += len(missing) - start
+            break
+        except (GraphQLError, GitHubHTTPError) as e:
+            logger.warning("Failed to resolve %d user profiles: %s", len(batch), e)
+            stats["failed"] += len(batch)
+            continue
+        cache.put(fetched)
+        profiles.update(fetched)
+        stats["fetched"] += len(batch)
+
+    cache.save()
+    stats["entries_updated"] = apply_user_profiles(metrics, profiles)
+
+    logger.info(
+        "Enriched %d contributors: %d cached, %d fetched in %d requests, %d failed",
+        stats["contributors"],
+        stats["cached"],
+        stats["fetched"],
+        stats["requests"],
+        stats["failed"],
+    )
+    return stats
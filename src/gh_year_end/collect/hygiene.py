@@ -1,7 +1,8 @@
 """Repository hygiene collectors for file presence and CI/CD checks.
 
-Collects repository tree data and derives file presence information for
-configured hygiene paths (SECURITY.md, README.md, LICENSE, etc.) and CI workflows.
+Resolves the directory listings the configured hygiene paths (SECURITY.md,
+README.md, LICENSE, etc.) and CI workflow prefixes live in through
+``HygieneEngine``, and derives file presence information from them.
 """
 
 from __future__ import annotations
@@ -9,9 +10,11 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
+from gh_year_end.collect.hygiene_engine import HygieneEngine
 from gh_year_end.storage.writer import AsyncJSONLWriter
 
 if TYPE_CHECKING:
+    from gh_year_end.collect.repo_store import RepoStore
     from gh_year_end.config import Config
     from gh_year_end.github.ratelimit import AdaptiveRateLimiter
     from gh_year_end.github.rest import RestClient
@@ -31,11 +34,12 @@ async def collect_repo_hygiene(
     paths: PathManager,
     rate_limiter: AdaptiveRateLimiter | None = None,
     config: Config | None = None,
+    engine: HygieneEngine | None = None,
 ) -> dict[str, Any]:
     """Collect repository hygiene data (file presence and CI workflows).
 
-    Fetches repository tree for each repo's default branch and checks for
-    presence of configured hygiene files and CI workflows.
+    Lists the directories of each repo's default branch that hold configured
+    hygiene files and CI workflows, and checks for their presence.
 
     Args:
         repos: List of repository metadata dicts from discovery.
@@ -43,6 +47,7 @@ async def collect_repo_hygiene(
         paths: Path manager for storage locations.
         rate_limiter: Optional rate limiter for throttling.
         config: Optional configuration for hygiene paths.
+        engine: Hygiene lookup engine (an uncached REST engine if omitted).
 
     Returns:
         Statistics dict with:
@@ -77,12 +82,14 @@ async def collect_repo_hygiene(
         len(hygiene_paths),
         len(workflow_prefixes),
     )
+    if engine is None:
+        engine = HygieneEngine(rest_client=rest_client)
 
     for repo in repos:
         try:
             repo_stats = await _collect_repo_hygiene(
                 repo=repo,
-                rest_client=rest_client,
+                engine=engine,
                 paths=paths,
                 hygiene_paths=hygiene_paths,
                 workflow_prefixes=workflow_prefixes,
@@ -115,13 +122,14 @@ async def collect_repo_hygiene(
         stats["repos_skipped"],
         stats["repos_errored"],
     )
+    stats["lookups"] = engine.stats()
 
     return stats
 
 
 async def _collect_repo_hygiene(
     repo: dict[str, Any],
-    rest_client: RestClient,
+    engine: HygieneEngine,
     paths: PathManager,
     hygiene_paths: list[str],
     workflow_prefixes: list[str],
@@ -130,7 +138,7 @@ async def _collect_repo_hygiene(
 
     Args:
         repo: Repository metadata dict.
-        rest_client: REST API client for GitHub requests.
+        engine: Hygiene lookup engine.
         paths: Path manager for storage locations.
         hygiene_paths: List of file paths to check for presence.
         workflow_prefixes: List of workflow directory prefixes to check.
@@ -145,7 +153,6 @@ async def _collect_repo_hygiene(
         logger.warning("Repo missing full_name field, skipping")
         return {"files_checked": 0, "skipped": True}
 
-    owner, repo_name = full_name.split("/", 1)
     default_branch = repo.get("default_branch")
 
     # Skip if no default branch (empty repos)
@@ -161,42 +168,30 @@ async def _collect_repo_hygiene(
 
     async with AsyncJSONLWriter(output_path) as writer:
         try:
-            # Fetch repository tree for default branch
-            tree_data = await rest_client.get_repository_tree(
-                owner=owner,
-                repo=repo_name,
-                tree_sha=default_branch,
-                recursive=True,
-            )
+            facts = await engine.lookup(repo, hygiene_paths, workflow_prefixes)
 
-            if tree_data is None:
+            if facts is None:
                 logger.info(
                     "No tree data for %s (likely empty or inaccessible)",
                     full_name,
                 )
                 return {"files_checked": 0, "skipped": True}
 
-            # Write raw tree response
-            await writer.write(
-                source="github_rest",
-                endpoint=f"/repos/{full_name}/git/trees/{default_branch}",
-                data=tree_data,
-            )
-
-            # Build path lookup from tree
-            tree_entries = tree_data.get("tree", [])
-            path_lookup = {entry["path"]: entry for entry in tree_entries}
+            # Write the listings fetched (none when served from the cache)
+            for source, endpoint, data in facts.responses:
+                await writer.write(source=source, endpoint=endpoint, data=data)
 
             logger.debug(
-                "Repository %s tree contains %d entries",
+                "Repository %s lookup (%s) listed %d entries",
                 full_name,
-                len(tree_entries),
+                facts.method,
+                len(facts.entries),
             )
 
             # Check presence of each hygiene path
             for hygiene_path in hygiene_paths:
-                exists = hygiene_path in path_lookup
-                entry = path_lookup.get(hygiene_path)
+                entry = facts.entry(hygiene_path)
+                exists = entry is not None
 
                 presence_data = {
                     "repo": full_name,
@@ -215,14 +210,11 @@ async def _collect_repo_hygiene(
                 files_checked += 1
 
             # Check for CI workflows (any files in workflow directories)
-            workflow_files = []
-            for prefix in workflow_prefixes:
-                matching_files = [
-                    entry
-                    for entry in tree_entries
-                    if entry["path"].startswith(prefix) and entry["type"] == "blob"
-                ]
-                workflow_files.extend(matching_files)
+            workflow_files = [
+                {"path": path, **entry}
+                for prefix in workflow_prefixes
+                for path, entry in facts.files_under(prefix)
+            ]
 
             workflow_data = {
                 "repo": full_name,
@@ -266,6 +258,7 @@ async def collect_security_features(
     paths: PathManager,
     config: Config,
     checkpoint: CheckpointManager | None = None,
+    store: RepoStore | None = None,
 ) -> dict[str, Any]:
     """Collect security feature status for all repositories.
 
@@ -278,6 +271,7 @@ async def collect_security_features(
         paths: Path manager for storage.
         config: Application configuration.
         checkpoint: Optional CheckpointManager for resume support.
+        store: Per-run repo store; facts already in it are not requested again.
 
     Returns:
         Stats dictionary with counts of repos processed, errors, etc.
@@ -340,6 +334,7 @@ async def collect_security_features(
                 owner=owner,
                 name=name,
                 rest_client=rest_client,
+                store=store,
             )
 
             # Open writer for this repo
@@ -418,6 +413,7 @@ async def _get_security_features(
     owner: str,
     name: str,
     rest_client: RestClient,
+    store: RepoStore | None = None,
 ) -> dict[str, Any]:
     """Fetch security features for a single repository.
 
@@ -425,57 +421,68 @@ async def _get_security_features(
         owner: Repository owner.
         name: Repository name.
         rest_client: REST client for API calls.
+        store: Per-run repo store. Its ``security_and_analysis`` payload and
+            ``vulnerability_alerts_enabled`` flag replace the matching requests.
 
     Returns:
         Dictionary with security feature status and error message if applicable.
     """
+    full_name = f"{owner}/{name}"
     features: dict[str, Any] = {
-        "repo": f"{owner}/{name}",
+        "repo": full_name,
         "dependabot_alerts_enabled": None,
         "dependabot_security_updates_enabled": None,
         "secret_scanning_enabled": None,
         "secret_scanning_push_protection_enabled": None,
         "error": None,
     }
+    known = (store.get(full_name) if store is not None else None) or {}
 
     # Check vulnerability alerts (Dependabot alerts)
-    try:
-        vuln_alerts_enabled = await rest_client.check_vulnerability_alerts(owner, name)
-        features["dependabot_alerts_enabled"] = vuln_alerts_enabled
-    except Exception as e:
-        logger.debug(
-            "Error checking vulnerability alerts for %s/%s: %s",
-            owner,
-            name,
-            e,
-        )
+    if isinstance(known.get("vulnerability_alerts_enabled"), bool):
+        features["dependabot_alerts_enabled"] = known["vulnerability_alerts_enabled"]
+    else:
+        try:
+            vuln_alerts_enabled = await rest_client.check_vulnerability_alerts(owner, name)
+            features["dependabot_alerts_enabled"] = vuln_alerts_enabled
+        except Exception as e:
+            logger.debug(
+                "Error checking vulnerability alerts for %s/%s: %s",
+                owner,
+                name,
+                e,
+            )
 
     # Get security_and_analysis field from repo metadata
     try:
-        repo_data = await rest_client.get_repo_security_analysis(owner, name)
-        if repo_data:
-            security_analysis = repo_data.get("security_and_analysis", {})
-
-            # Extract Dependabot security updates
-            dependabot_security = security_analysis.get("dependabot_security_updates", {})
-            if dependabot_security:
-                features["dependabot_security_updates_enabled"] = (
-                    dependabot_security.get("status") == "enabled"
-                )
+        if store is not None:
+            security_analysis = (
+                await store.field(full_name, "security_and_analysis", rest_client) or {}
+            )
+        else:
+            repo_data = await rest_client.get_repo_security_analysis(owner, name)
+            security_analysis = repo_data.get("security_and_analysis", {}) if repo_data else {}
+
+        # Extract Dependabot security updates
+        dependabot_security = security_analysis.get("dependabot_security_updates", {})
+        if dependabot_security:
+            features["dependabot_security_updates_enabled"] = (
+                dependabot_security.get("status") == "enabled"
+            )
 
-            # Extract secret scanning
-            secret_scanning = security_analysis.get("secret_scanning", {})
-            if secret_scanning:
-                features["secret_scanning_enabled"] = secret_scanning.get("status") == "enabled"
+        # Extract secret scanning
+        secret_scanning = security_analysis.get("secret_scanning", {})
+        if secret_scanning:
+            features["secret_scanning_enabled"] = secret_scanning.get("status") == "enabled"
 
-            # Extract secret scanning push protection
-            secret_scanning_push_protection = security_analysis.get(
-                "secret_scanning_push_protection", {}
+        # Extract secret scanning push protection
+        secret_scanning_push_protection = security_analysis.get(
+            "secret_scanning_push_protection", {}
+        )
+        if secret_scanning_push_protection:
+            features["secret_scanning_push_protection_enabled"] = (
+                secret_scanning_push_protection.get("status") == "enabled"
             )
-            if secret_scanning_push_protection:
-                features["secret_scanning_push_protection_enabled"] = (
-                    secret_scanning_push_protection.get("status") == "enabled"
-                )
     except Exception as e:
         logger.debug(
             "Error checking security_and_analysis for %s/%s: %s",
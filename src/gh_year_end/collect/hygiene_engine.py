@@ -0,0 +1,456 @@
+"""File-presence lookups shared by the hygiene collectors.
+
+Hygiene checks only need a few directory listings: the repository root, the
+parents of ``collection.hygiene.paths``, and the ``workflow_prefixes``
+directories. ``HygieneEngine`` resolves exactly those instead of reading the
+whole recursive tree (or one query per path), with one of two methods:
+
+- ``graphql``: one query with an aliased ``object(expression: "<branch>:<dir>")``
+  per directory.
+- ``tree``: a non-recursive REST read of the root tree, then one read per
+  top-level directory holding a needed path (usually only ``.github``), by the
+  subtree SHA from the root listing.
+
+``auto`` picks the API with budget headroom. Listings are cached on disk
+(``TreeCache``) with the tree SHAs they were read at: a repo whose
+``pushed_at`` is unchanged since the cached lookup costs no request, and with
+the ``tree`` method a repo whose root tree SHA is unchanged costs one request.
+Subtrees with an unchanged SHA are reused even when the root changed.
+"""
+
+import logging
+import posixpath
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from gh_year_end.github.planner import APIPlanner
+from gh_year_end.github.ratelimit import APIType
+from gh_year_end.storage.cache import KeyedCache
+
+if TYPE_CHECKING:
+    from gh_year_end.config import Config
+    from gh_year_end.github.graphql import GraphQLClient
+    from gh_year_end.github.ratelimit import AdaptiveRateLimiter
+    from gh_year_end.github.rest import RestClient
+    from gh_year_end.storage.paths import PathManager
+
+logger = logging.getLogger(__name__)
+
+# REST requests of a typical tree lookup: the root and .github
+TREE_LOOKUP_REQUESTS = 2
+
+
+@dataclass
+class TreeFacts:
+    """Directory listings resolved for one repository.
+
+    Attributes:
+        repo: Repository full name.
+        root_sha: SHA of the default branch's root tree.
+        entries: Full path -> entry (``type``, ``sha``, ``size``) for every
+            child of the listed directories.
+        listed: Directories whose children are all in ``entries`` (a missing
+            directory is listed with no children).
+        method: How the facts were resolved: ``graphql``, ``tree``, or ``cache``.
+        requests: API requests made for this lookup.
+        responses: Raw (source, endpoint, data) responses fetched, for callers
+            that record raw data.
+    """
+
+    repo: str
+    root_sha: str | None
+    entries: dict[str, dict[str, Any]]
+    listed: set[str]
+    method: str
+    requests: int = 0
+    responses: list[tuple[Literal["github_rest", "github_graphql"], str, dict[str, Any]]] = field(
+        default_factory=list
+    )
+
+    def exists(self, path: str) -> bool:
+        """Whether a file or directory exists at ``path``."""
+        return path.strip("/") in self.entries
+
+    def entry(self, path: str) -> dict[str, Any] | None:
+        """Tree entry at ``path``, or None if it does not exist."""
+        return self.entries.get(path.strip("/"))
+
+    def names(self, directory: str = "") -> list[str]:
+        """Names of the direct children of a listed directory."""
+        directory = directory.strip("/")
+        return sorted(
+            posixpath.basename(path)
+            for path in self.entries
+            if posixpath.dirname(path) == directory
+        )
+
+    def files_under(self, prefix: str) -> list[tuple[str, dict[str, Any]]]:
+        """Files whose path starts with ``prefix`` (e.g. ``.github/workflows/``).
+
+        Returns:
+            (path, entry) pairs in path order.
+        """
+        return sorted(
+            (path, entry)
+            for path, entry in self.entries.items()
+            if path.startswith(prefix) and entry.get("type") == "blob"
+        )
+
+    def resolves(self, directory: str) -> bool:
+        """Whether the children of ``directory`` are known (possibly none)."""
+        if directory in self.listed:
+            return True
+        if not directory:
+            return False
+        known_parent = self.resolves(posixpath.dirname(directory))
+        return known_parent and (self.entries.get(directory) or {}).get("type") != "tree"
+
+
+def lookup_dirs(paths: Iterable[str], prefixes: Iterable[str] = ()) -> list[str]:
+    """Directories to list so that ``paths`` and ``prefixes`` can be resolved.
+
+    Args:
+        paths: File paths checked for presence.
+        prefixes: Path prefixes whose files are listed; a prefix ending in ``/``
+            names a directory, otherwise its parent directory is listed.
+
+    Returns:
+        Sorted directories, always including the root (``""``).
+    """
+    dirs = {""}
+    dirs.update(posixpath.dirname(path.strip("/")) for path in paths)
+    for prefix in prefixes:
+        dirs.add(prefix.strip("/") if prefix.endswith("/") else posixpath.dirname(prefix))
+    return sorted(dirs)
+
+
+class TreeCache(KeyedCache):
+    """On-disk repo -> directory listings cache.
+
+    File layout::
+
+        {"version": 1, "repos": {"org/repo": {"fetched_at": 1735689600.0,
+            "pushed_at": "2024-12-01T00:00:00Z", "branch": "main", "root_sha": "...",
+            "entries": {"README.md": {"type": "blob", "sha": "...", "size": 1024}},
+            "listed": ["", ".github"]}}}
+    """
+
+    section = "repos"
+    description = "hygiene tree cache"
+
+    def get(self, repo: str) -> TreeFacts | None:
+        """Cached facts for a repository, or None if it was never looked up."""
+        cached = self._entries.get(repo)
+        if not cached:
+            return None
+        return TreeFacts(
+            repo=repo,
+            root_sha=cached.get("root_sha"),
+            entries=dict(cached.get("entries", {})),
+            listed=set(cached.get("listed", [])),
+            method="cache",
+        )
+
+    def stamp(self, repo: str) -> tuple[str | None, str | None]:
+        """(branch, pushed_at) recorded with a repository's cached facts."""
+        cached = self._entries.get(repo) or {}
+        return cached.get("branch"), cached.get("pushed_at")
+
+    def put(self, facts: TreeFacts, branch: str, pushed_at: str | None) -> None:
+        """Store freshly resolved facts.
+
+        Args:
+            facts: Resolved listings.
+            branch: Default branch they were read from.
+            pushed_at: Repository ``pushed_at`` at lookup time.
+        """
+        self._entries[facts.repo] = {
+            "fetched_at": self._clock(),
+            "pushed_at": pushed_at,
+            "branch": branch,
+            "root_sha": facts.root_sha,
+            "entries": facts.entries,
+            "listed": sorted(facts.listed),
+        }
+        self._touch()
+
+
+def _entry(type_: str, sha: str | None, size: int | None) -> dict[str, Any]:
+    return {"type": type_, "sha": sha, "size": size}
+
+
+class HygieneEngine:
+    """Resolve hygiene file presence with the cheapest lookup per repository.
+
+    Example:
+        engine = HygieneEngine(rest_client=rest_client, graphql_client=graphql_client)
+        facts = await engine.lookup(repo, hygiene.paths, hygiene.workflow_prefixes)
+        has_readme = facts is not None and facts.exists("README.md")
+    """
+
+    def __init__(
+        self,
+        rest_client: "RestClient | None" = None,
+        graphql_client: "GraphQLClient | None" = None,
+        method: str = "auto",
+        cache: TreeCache | None = None,
+        planner: APIPlanner | None = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            rest_client: REST client for the ``tree`` method.
+            graphql_client: GraphQL client for the ``graphql`` method.
+            method: ``auto``, ``graphql``, or ``tree``. A method whose client
+                is missing falls back to the other one.
+            cache: Listings cache (None disables caching).
+            planner: Picks the API for ``auto`` by budget headroom; without
+                one, ``auto`` prefers GraphQL (one request per repo).
+        """
+        if rest_client is None and graphql_client is None:
+            msg = "HygieneEngine needs a REST or GraphQL client"
+            raise ValueError(msg)
+        self.rest_client = rest_client
+        self.graphql_client = graphql_client
+        self.method = method
+        self.cache = cache
+        self.planner = planner
+        self.counts: Counter[str] = Counter()
+
+    def _choose_method(self) -> str:
+        if self.graphql_client is None:
+            return "tree"
+        if self.rest_client is None:
+            return "graphql"
+        if self.method != "auto":
+            return self.method
+        if self.planner is None:
+            return "graphql"
+        api = self.planner.choose({APIType.GRAPHQL: 1, APIType.REST: TREE_LOOKUP_REQUESTS})
+        return "graphql" if api is APIType.GRAPHQL else "tree"
+
+    async def lookup(
+        self,
+        repo: dict[str, Any],
+        paths: Iterable[str] = (),
+        prefixes: Iterable[str] = (),
+    ) -> TreeFacts | None:
+        """Resolve the directories needed for ``paths`` and ``prefixes``.
+
+        Args:
+            repo: Repository dict (``full_name``, ``default_branch``, and
+                ``pushed_at`` when known).
+            paths: File paths to check.
+            prefixes: Path prefixes whose files are listed.
+
+        Returns:
+            Facts for the repository, or None when it has no default branch
+            tree (empty or inaccessible).
+
+        Raises:
+            Exception: Request errors from the clients are propagated.
+        """
+        full_name = repo["full_name"]
+        branch = repo.get("default_branch")
+        if not branch:
+            return None
+        pushed_at = repo.get("pushed_at")
+        dirs = lookup_dirs(paths, prefixes)
+
+        cached = None
+        if self.cache is not None:
+            cached_branch, cached_pushed_at = self.cache.stamp(full_name)
+            if cached_branch == branch:
+                cached = self.cache.get(full_name)
+            # Nothing was pushed since the cached lookup: no request needed
+            if (
+                cached
+                and pushed_at
+                and cached_pushed_at == pushed_at
+                and all(cached.resolves(d) for d in dirs)
+            ):
+                self.counts["cache"] += 1
+                return cached
+
+        method = self._choose_method()
+        if method == "graphql":
+            facts = await self._lookup_graphql(full_name, branch, dirs)
+        else:
+            facts = await self._lookup_tree(full_name, branch, dirs, cached)
+
+        if facts is not None:
+            self.counts[method] += 1
+            self.counts["requests"] += facts.requests
+            if self.cache is not None:
+                self.cache.put(facts, branch, pushed_at)
+        return facts
+
+    async def _lookup_graphql(
+        self, full_name: str, branch: str, dirs: list[str]
+    ) -> TreeFacts | None:
+        """One aliased ``object(expression:)`` per directory, in one query."""
+        assert self.graphql_client is not None
+        owner, name = full_name.split("/", 1)
+        expressions = [f"{branch}:{d}" for d in dirs]
+        listings = await self.graphql_client.query_tree_entries(owner, name, expressions)
+
+        root = listings.get(f"{branch}:")
+        if not isinstance(root, dict):
+            return None
+        facts = TreeFacts(
+            repo=full_name,
+            root_sha=root.get("oid"),
+            entries={},
+            listed=set(),
+            method="graphql",
+            requests=1,
+        )
+        facts.responses.append(("github_graphql", f"repository:{full_name}:trees", listings))
+        for d, expression in zip(dirs, expressions, strict=True):
+            listing = listings.get(expression)
+            facts.listed.add(d)
+            if not isinstance(listing, dict):
+                continue
+            for child in listing.get("entries") or []:
+                path = posixpath.join(d, child["name"]) if d else child["name"]
+                facts.entries[path] = _entry(
+                    child.get("type", ""), child.get("oid"), child.get("size")
+                )
+        return facts
+
+    async def _lookup_tree(
+        self, full_name: str, branch: str, dirs: list[str], cached: TreeFacts | None
+    ) -> TreeFacts | None:
+        """Non-recursive root read, then the needed top-level subtrees by SHA."""
+        assert self.rest_client is not None
+        owner, name = full_name.split("/", 1)
+        root = await self.rest_client.get_repository_tree(
+            owner=owner, repo=name, tree_sha=branch, recursive=False
+        )
+        if not root:
+            return None
+
+        facts = TreeFacts(
+            repo=full_name,
+            root_sha=root.get("sha"),
+            entries={},
+            listed={""},
+            method="tree",
+            requests=1,
+        )
+        facts.responses.append(("github_rest", f"/repos/{full_name}/git/trees/{branch}", root))
+        if (
+            cached
+            and cached.root_sha
+            and cached.root_sha == facts.root_sha
+            and all(cached.resolves(d) for d in dirs)
+        ):
+            cached.method, cached.requests = "tree", 1
+            cached.responses = facts.responses
+            return cached
+
+        for child in root.get("tree", []):
+            facts.entries[child["path"]] = _entry(
+                child["type"], child.get("sha"), child.get("size")
+            )
+
+        # Top-level directory -> whether a deeper directory under it is needed
+        tops: dict[str, bool] = {}
+        for d in dirs:
+            if d:
+                top = d.split("/", 1)[0]
+                tops[top] = tops.get(top, False) or "/" in d
+        for top, deep in tops.items():
+            entry = facts.entries.get(top)
+            if not entry or entry["type"] != "tree":
+                continue
+            needed = [d for d in dirs if d == top or d.startswith(f"{top}/")]
+            # Unchanged subtree SHA: reuse the cached listings
+            if (
+                cached
+                and (cached.entries.get(top) or {}).get("sha") == entry["sha"]
+                and all(cached.resolves(d) for d in needed)
+            ):
+                self._reuse_subtree(facts, cached, top)
+                continue
+            subtree = await self.rest_client.get_repository_tree(
+                owner=owner, repo=name, tree_sha=entry["sha"], recursive=deep
+            )
+            facts.requests += 1
+            if not subtree:
+                continue
+            facts.responses.append(
+                ("github_rest", f"/repos/{full_name}/git/trees/{entry['sha']}", subtree)
+            )
+            if subtree.get("truncated"):
+                logger.warning("Tree listing of %s/%s was truncated", full_name, top)
+            facts.listed.add(top)
+            for child in subtree.get("tree", []):
+                path = f"{top}/{child['path']}"
+                facts.entries[path] = _entry(child["type"], child.get("sha"), child.get("size"))
+                if deep and child["type"] == "tree":
+                    facts.listed.add(path)
+        return facts
+
+    @staticmethod
+    def _reuse_subtree(facts: TreeFacts, cached: TreeFacts, top: str) -> None:
+        """Copy a top-level directory's cached listings into ``facts``."""
+        under = f"{top}/"
+        facts.entries.update(
+            (path, entry) for path, entry in cached.entries.items() if path.startswith(under)
+        )
+        facts.listed.update(d for d in cached.listed if d == top or d.startswith(under))
+
+    def save(self) -> None:
+        """Persist the cache (if any) and log how lookups were resolved."""
+        if self.counts:
+            logger.info(
+                "Hygiene lookups: %d graphql, %d tree, %d cached (%d requests)",
+                self.counts["graphql"],
+                self.counts["tree"],
+                self.counts["cache"],
+                self.counts["requests"],
+            )
+        if self.cache is not None:
+            self.cache.save()
+
+    def stats(self) -> dict[str, int]:
+        """Lookups by method and the requests they made."""
+        return {key: self.counts[key] for key in ("graphql", "tree", "cache", "requests")}
+
+
+def build_hygiene_engine(
+    config: "Config",
+    paths: "PathManager | None" = None,
+    rest_client: "RestClient | None" = None,
+    graphql_client: "GraphQLClient | None" = None,
+    rate_limiter: "AdaptiveRateLimiter | None" = None,
+) -> HygieneEngine:
+    """Engine configured from ``collection.hygiene`` with its cache loaded.
+
+    Args:
+        config: Application configuration.
+        paths: Path manager locating the cache (None disables caching).
+        rest_client: REST client, if the caller has one.
+        graphql_client: GraphQL client, if the caller has one.
+        rate_limiter: Rate limiter used to pick the API for ``auto``.
+
+    Returns:
+        The engine; call ``save()`` after the last lookup.
+    """
+    hygiene = config.collection.hygiene
+    cache = None
+    if paths is not None and hygiene.tree_cache:
+        cache = TreeCache(paths.hygiene_tree_cache_path).load()
+    planner = None
+    if rate_limiter is not None:
+        planner = APIPlanner(rate_limiter, config.rate_limit.work_stealing.reserve_percent)
+    return HygieneEngine(
+        rest_client=rest_client,
+        graphql_client=graphql_client,
+        method=hygiene.lookup,
+        cache=cache,
+        planner=planner,
+    )
@@ -1,7 +1,40 @@
-"""Bot detection and identity resolution."""
+"""Bot detection and identity resolution.
+
+A single ``BotDetector`` classifies users everywhere: the metrics aggregator,
+the DuckDB metrics engine, and the report layer. All bot rules (configured
+regexes plus the built-in login substrings) are compiled into one combined
+matcher, and decisions are memoized per (login, type) in a bounded LRU cache,
+so classification is a dictionary lookup once a user has been seen.
+"""
 
 import re
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from functools import _CacheInfo, lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gh_year_end.config import IdentityConfig
+
+# Case-insensitive login substrings that always indicate a bot
+BOT_PATTERNS = [
+    "[bot]",
+    "-bot-",
+    "github-actions",
+    "dependabot",
+    "renovate",
+    "greenkeeper",
+    "snyk-bot",
+    "codecov",
+    "mergify",
+    "imgbot",
+    "allcontributors",
+    "semantic-release-bot",
+    "stale",
+]
+
+# Distinct (login, type) decisions kept per detector
+DEFAULT_CACHE_SIZE = 65536
 
 
 @dataclass
@@ -24,22 +57,116 @@ class BotDetector:
     1. If login is in include_overrides, treat as human
     2. If type is "Bot", treat as bot
     3. If login matches any exclude_patterns, treat as bot
-    4. Otherwise, treat as human
+    4. If login contains any substring_patterns (case-insensitive), treat as bot
+    5. Otherwise, treat as human
 
     Attributes:
         exclude_patterns: Compiled regex patterns for bot detection.
         include_overrides: Set of logins to treat as humans.
+        substring_patterns: Case-insensitive login substrings for bot detection.
+        is_bot: ``is_bot(login, user_type) -> bool``, memoized per (login, type)
+            in a bounded LRU cache.
     """
 
-    def __init__(self, exclude_patterns: list[str], include_overrides: list[str]) -> None:
+    def __init__(
+        self,
+        exclude_patterns: list[str],
+        include_overrides: list[str],
+        substring_patterns: Iterable[str] = (),
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
         """Initialize bot detector.
 
         Args:
             exclude_patterns: Regex patterns to match bot logins.
             include_overrides: Logins to force as human even if matching patterns.
+            substring_patterns: Case-insensitive substrings that mark bot logins.
+            cache_size: Maximum number of (login, type) decisions to memoize.
         """
         self.exclude_patterns = [re.compile(pattern) for pattern in exclude_patterns]
         self.include_overrides = set(include_overrides)
+        self.substring_patterns = list(substring_patterns)
+        self.cache_size = cache_size
+        # Joined, these would have their group numbers and backreferences shifted
+        self._grouped_patterns = [pattern for pattern in self.exclude_patterns if pattern.groups]
+        self._matcher = self._compile_matcher()
+        self._cache = lru_cache(maxsize=cache_size)(self._classify)
+        self.is_bot: Callable[[str, str], bool] = self._cache
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle by configuration; the cache is rebuilt on unpickling."""
+        return (
+            type(self),
+            (
+                [pattern.pattern for pattern in self.exclude_patterns],
+                sorted(self.include_overrides),
+                self.substring_patterns,
+                self.cache_size,
+            ),
+        )
+
+    def _compile_matcher(self) -> re.Pattern[str] | None:
+        """Combine the bot rules into one regex, or None if there are no rules.
+
+        Patterns with groups are left out and matched on their own.
+
+        Returns:
+            Combined pattern, or None if no group-free rules are configured.
+        """
+        alternatives = [
+            f"(?:{pattern.pattern})" for pattern in self.exclude_patterns if not pattern.groups
+        ]
+        if self.substring_patterns:
+            substrings = "|".join(re.escape(s) for s in self.substring_patterns)
+            alternatives.append(f"(?i:.*?(?:{substrings}))")
+        if not alternatives:
+            return None
+        try:
+            return re.compile("|".join(alternatives))
+        except re.error:
+            # Patterns with global inline flags cannot be embedded; match them separately
+            return None
+
+    def _matches(self, login: str) -> bool:
+        """Check a login against the pattern and substring rules."""
+        if self._matcher is not None:
+            if self._matcher.match(login) is not None:
+                return True
+            return any(pattern.match(login) for pattern in self._grouped_patterns)
+        if any(pattern.match(login) for pattern in self.exclude_patterns):
+            return True
+        lowered = login.lower()
+        return any(s.lower() in lowered for s in self.substring_patterns)
+
+    def _classify(self, login: str, user_type: str) -> bool:
+        """Uncached bot classification.
+
+        Args:
+            login: GitHub login/username.
+            user_type: GitHub user type (User, Bot, Organization).
+
+        Returns:
+            True if the user is classified as a bot.
+        """
+        if login in self.include_overrides:
+            return False
+        return user_type == "Bot" or self._matches(login)
+
+    def is_bot_user(self, user: dict[str, Any] | None) -> bool:
+        """Check whether a GitHub user object is a bot.
+
+        Missing users (e.g. deleted accounts, "ghost") are treated as bots so
+        their events are not attributed to anyone.
+
+        Args:
+            user: GitHub user object with 'login' and optionally 'type'.
+
+        Returns:
+            True if the user is missing or classified as a bot.
+        """
+        if not user:
+            return True
+        return self.is_bot(user.get("login") or "", user.get("type") or "")
 
     def detect(self, login: str, user_type: str) -> BotDetectionResult:
         """Detect if a user is a bot.
@@ -51,21 +178,52 @@ class BotDetector:
         Returns:
             BotDetectionResult with is_bot flag and optional reason.
         """
-        # Rule 1: Override takes precedence
-        if login in self.include_overrides:
+        if not self.is_bot(login, user_type):
             return BotDetectionResult(is_bot=False, reason=None)
 
-        # Rule 2: Type is Bot
         if user_type == "Bot":
             return BotDetectionResult(is_bot=True, reason="type is Bot")
 
-        # Rule 3: Check against exclude patterns
+        # Report the first rule that matched
         for pattern in self.exclude_patterns:
             if pattern.match(login):
                 return BotDetectionResult(
                     is_bot=True,
                     reason=f"matches pattern: {pattern.pattern}",
                 )
+        lowered = login.lower()
+        substring = next(s for s in self.substring_patterns if s.lower() in lowered)
+        return BotDetectionResult(is_bot=True, reason=f"contains: {substring}")
+
+    def cache_info(self) -> "_CacheInfo":
+        """Return hit/miss statistics for the classification cache."""
+        return self._cache.cache_info()
 
-        # Rule 4: Default to human
-        return BotDetectionResult(is_bot=False, reason=None)
+
+@lru_cache(maxsize=8)
+def _shared_detector(
+    exclude_patterns: tuple[str, ...], include_overrides: tuple[str, ...]
+) -> BotDetector:
+    """Build (once per distinct configuration) a detector with the built-in substrings."""
+    return BotDetector(
+        list(exclude_patterns), list(include_overrides), substring_patterns=BOT_PATTERNS
+    )
+
+
+def get_bot_detector(identity: "IdentityConfig | None" = None) -> BotDetector:
+    """Get the shared bot detector for an identity configuration.
+
+    The same detector (and cache) is returned for identical configurations, so
+    the aggregator, metrics engines, and report layer classify consistently.
+
+    Args:
+        identity: Identity configuration; None uses the built-in substrings only.
+
+    Returns:
+        Shared BotDetector combining the configured patterns with BOT_PATTERNS.
+    """
+    if identity is None:
+        return _shared_detector((), ())
+    return _shared_detector(
+        tuple(identity.bots.exclude_patterns), tuple(identity.bots.include_overrides)
+    )
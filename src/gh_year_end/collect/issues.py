@@ -9,9 +9,11 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
+from gh_year_end.collect.catalog import ISSUES
 from gh_year_end.storage.writer import AsyncJSONLWriter
 
 if TYPE_CHECKING:
+    from gh_year_end.collect.catalog import CollectionCatalog
     from gh_year_end.config import Config
     from gh_year_end.github.ratelimit import AdaptiveRateLimiter
     from gh_year_end.github.rest import RestClient
@@ -56,6 +58,7 @@ async def collect_issues(
     rate_limiter: AdaptiveRateLimiter,
     config: Config,
     checkpoint: CheckpointManager | None = None,
+    catalog: CollectionCatalog | None = None,
 ) -> dict[str, int]:
     """Collect issues for all discovered repositories.
 
@@ -70,6 +73,7 @@ async def collect_issues(
         rate_limiter: Rate limiter for API throttling.
         config: Application configuration with date range settings.
         checkpoint: Optional CheckpointManager for resume support.
+        catalog: Optional catalog to publish collected issue keys to.
 
     Returns:
         Dictionary with collection statistics (repos_processed, issues_collected, etc.).
@@ -120,7 +124,10 @@ async def collect_issues(
                 since=since,
                 until=until,
                 checkpoint=checkpoint,
+                catalog=catalog,
             )
+            if catalog is not None:
+                catalog.complete(ISSUES, repo_name)
 
             logger.debug(
                 "Collected %d issues for %s (filtered %d PRs)",
@@ -169,6 +176,7 @@ async def _collect_repo_issues(
     since: str,
     until: str,
     checkpoint: CheckpointManager | None = None,
+    catalog: CollectionCatalog | None = None,
 ) -> tuple[int, int]:
     """Collect issues for a single repository.
 
@@ -181,6 +189,7 @@ async def _collect_repo_issues(
         since: ISO format date string for filtering issues.
         until: ISO format date string for filtering issues.
         checkpoint: Optional CheckpointManager for progress tracking.
+        catalog: Optional catalog to stage collected issue keys in.
 
     Returns:
         Tuple of (issue_count, pr_count) collected.
@@ -194,6 +203,8 @@ async def _collect_repo_issues(
 
     # Ensure parent directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    if catalog is not None:
+        catalog.begin(ISSUES, repo_name)
 
     async with AsyncJSONLWriter(output_path) as writer:
         async for items, metadata in rest_client.list_issues(
@@ -223,6 +234,8 @@ async def _collect_repo_issues(
                     page=metadata["page"],
                 )
                 issue_count += 1
+                if catalog is not None:
+                    catalog.publish(ISSUES, repo_name, (item,))
 
             # Update checkpoint with page progress
             if checkpoint:
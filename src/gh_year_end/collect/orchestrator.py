@@ -4,13 +4,14 @@ Coordinates the execution of all collectors in the correct order,
 manages clients and rate limiting, and aggregates statistics.
 Supports checkpoint-based resume for long-running collections.
 
-Note: This module exceeds the 400-line preference from CLAUDE.md (currently 896 lines)
-due to its complexity as the core collection orchestrator. The functionality is cohesive
+Note: This module exceeds the 400-line preference from CLAUDE.md due to its
+complexity as the core collection orchestrator. The functionality is cohesive
 and covers parallel execution, checkpoint coordination, phase sequencing, and error
 aggregation. Splitting would reduce maintainability and obscure the orchestration flow.
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 import os
@@ -18,33 +19,162 @@ from collections.abc import Callable
 from datetime import datetime
 from typing import Any, cast
 
+import httpx
+
 from gh_year_end.collect.aggregator import MetricsAggregator
+from gh_year_end.collect.catalog import CollectionCatalog
+from gh_year_end.collect.contributor_stats import count_commit_history, fetch_contributor_stats
+from gh_year_end.collect.deadline import (
+    COMPLETE,
+    PARTIAL,
+    SKIPPED,
+    CoverageTracker,
+    RunBudget,
+    order_by_value,
+)
 from gh_year_end.collect.discovery import discover_repos
+from gh_year_end.collect.enrichment import UserProfileCache, enrich_contributors
+from gh_year_end.collect.hygiene_engine import HygieneEngine, build_hygiene_engine
 from gh_year_end.collect.phases import (
     run_branch_protection_phase,
     run_comments_phase,
     run_commits_phase,
     run_discovery_phase,
     run_issues_phase,
+    run_pipelined_collection,
     run_pulls_phase,
     run_repo_metadata_phase,
     run_reviews_phase,
     run_security_features_phase,
 )
+from gh_year_end.collect.preflight import (
+    PHASED_PHASES,
+    SINGLE_PASS_PHASES,
+    CollectionPlan,
+    apply_pacing,
+    plan_collection,
+)
 from gh_year_end.collect.progress import ProgressTracker
+from gh_year_end.collect.repo_store import RepoStore
+from gh_year_end.collect.sampling import (
+    SampledUnit,
+    StratifiedSample,
+    issue_stratum,
+    pr_stratum,
+)
 from gh_year_end.config import Config
 from gh_year_end.github.auth import GitHubAuth
 from gh_year_end.github.graphql import GraphQLClient
 from gh_year_end.github.http import GitHubClient
-from gh_year_end.github.ratelimit import AdaptiveRateLimiter
+from gh_year_end.github.ratelimit import AdaptiveRateLimiter, APIType
 from gh_year_end.github.rest import RestClient
 from gh_year_end.storage.checkpoint import CheckpointManager
 from gh_year_end.storage.paths import PathManager
+from gh_year_end.storage.recorder import COMMIT_KINDS, RawRecorder
 from gh_year_end.storage.writer import AsyncJSONLWriter
+from gh_year_end.telemetry import (
+    OpenMetricsExporter,
+    PhaseProfiler,
+    RequestTrace,
+    RunMetrics,
+    TraceEventRecorder,
+    profiling,
+    request_trace,
+    token_fingerprint,
+    trace_events,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _build_http_client(config: Config, auth: GitHubAuth) -> GitHubClient:
+    """Create the run's HTTP client with the configured transport and deduplication.
+
+    The connection pool is sized to the scheduler's total concurrency (REST,
+    GraphQL, and search nodes) plus two for discovery and rate limit checks,
+    unless ``http.max_connections`` is set.
+
+    Args:
+        config: Application configuration (``github.api_url``, ``http``, and
+            scheduler sections).
+        auth: GitHub authentication.
+
+    Returns:
+        HTTP client shared by every phase of the run.
+    """
+    http_config = config.http
+    scheduler = config.collection.scheduler
+    max_connections = http_config.max_connections or (
+        (scheduler.rest_concurrency or config.rate_limit.max_concurrency)
+        + scheduler.graphql_concurrency
+        + 2
+    )
+    keepalive = http_config.max_keepalive_connections
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections if keepalive is None else keepalive,
+        keepalive_expiry=http_config.keepalive_expiry,
+    )
+    timeouts = {
+        name: httpx.Timeout(**timeout)
+        for name, timeout in http_config.timeouts.model_dump().items()
+    }
+    return GitHubClient(
+        auth=auth,
+        base_url=config.github.api_url,
+        coalesce=http_config.coalesce_gets,
+        memo_ttl=http_config.memo_seconds,
+        memo_max_bytes=http_config.memo_max_bytes,
+        http2=http_config.http2,
+        limits=limits,
+        timeouts=timeouts,
+    )
+
+
+def _start_request_trace(config: Config, paths: PathManager) -> RequestTrace | None:
+    """Start the run's request trace when ``telemetry.request_trace`` is enabled."""
+    if not config.telemetry.request_trace:
+        return None
+    return RequestTrace(paths.request_trace_path).start()
+
+
+def _start_trace_events(config: Config) -> TraceEventRecorder | None:
+    """Start recording trace events when ``telemetry.trace_events`` is set."""
+    path = config.telemetry.trace_events
+    if path is None or trace_events.active_recorder() is not None:
+        return None
+    return TraceEventRecorder(path, process_name="gh-year-end collect").start()
+
+
+def _start_profiler(config: Config, paths: PathManager) -> PhaseProfiler | None:
+    """Start per-phase profiling when ``telemetry.profile`` is enabled."""
+    if not config.telemetry.profile or profiling.active_profiler() is not None:
+        return None
+    return PhaseProfiler(paths.profile_root / "collect").start()
+
+
+async def _start_openmetrics(
+    config: Config,
+    rate_limiter: AdaptiveRateLimiter,
+    progress: ProgressTracker,
+    token: str,
+) -> OpenMetricsExporter | None:
+    """Start live metrics export when ``telemetry.openmetrics`` has a target."""
+    openmetrics_config = config.telemetry.openmetrics
+    if not openmetrics_config.enabled:
+        return None
+    metrics = RunMetrics(rate_limiter, progress, token_id=token_fingerprint(token))
+    exporter = OpenMetricsExporter(
+        metrics,
+        textfile=openmetrics_config.textfile,
+        port=openmetrics_config.port,
+        host=openmetrics_config.host,
+        interval=openmetrics_config.interval,
+    )
+    await exporter.start()
+    return exporter
+
+
 async def _collect_repos_parallel(
     repos: list[dict[str, Any]],
     collect_fn: Callable[..., Any],
@@ -81,7 +211,11 @@ async def _collect_repos_parallel(
         async with semaphore:
             try:
                 # Call the collection function - it handles checkpoint management
-                result = await collect_fn(repo, **kwargs)
+                with (
+                    request_trace.trace_scope(phase=endpoint_name, repo=repo_full_name),
+                    trace_events.span(repo_full_name, "repo", phase=endpoint_name),
+                ):
+                    result = await collect_fn(repo, **kwargs)
                 return {"success": True, "repo": repo_full_name, **result}
             except Exception as e:
                 logger.error(
@@ -271,7 +405,7 @@ async def run_collection(
         raise CollectionError(msg)
 
     auth = GitHubAuth(token=token)
-    http_client = GitHubClient(auth=auth)
+    http_client = _build_http_client(config, auth)
     rate_limiter = AdaptiveRateLimiter(config.rate_limit)
     rest_client = RestClient(http_client, rate_limiter)
     graphql_client = GraphQLClient(http_client, rate_limiter)
@@ -296,18 +430,25 @@ async def run_collection(
         "duration_seconds": 0.0,
         "rate_limit_samples": [],
     }
+    run_trace = _start_request_trace(config, paths)
+    run_events = _start_trace_events(config)
+    run_profiler = _start_profiler(config, paths)
+    metrics_exporter: OpenMetricsExporter | None = None
 
     try:
         # Start progress display
         progress.start()
+        metrics_exporter = await _start_openmetrics(config, rate_limiter, progress, token)
 
-        # Step 1: Discovery
+        # Step 1: Discovery (full repo payloads are kept for later phases)
+        repo_store = RepoStore()
         repos, stats["discovery"] = await run_discovery_phase(
             config=config,
             http_client=http_client,
             paths=paths,
             checkpoint=checkpoint,
             progress=progress,
+            store=repo_store,
         )
 
         if not repos:
@@ -325,91 +466,127 @@ async def run_collection(
             len(repos) - len(repos_to_process_names),
         )
 
-        # Step 2: Repo Metadata
-        stats["repos"] = await run_repo_metadata_phase(
-            config=config,
-            repos=repos,
-            graphql_client=graphql_client,
-            rate_limiter=rate_limiter,
-            paths=paths,
-            checkpoint=checkpoint,
-            progress=progress,
+        plan = await _run_preflight(
+            config, repos, http_client, graphql_client, rate_limiter, progress, PHASED_PHASES
         )
+        if plan is not None:
+            stats["preflight"] = plan.to_dict()
+
+        # PR/issue keys published by the pulls and issues phases for reviews/comments
+        catalog = CollectionCatalog()
+
+        if config.collection.scheduler.mode == "dag":
+            # Steps 2-9 as a per-repo dependency graph
+            stats.update(
+                await run_pipelined_collection(
+                    config=config,
+                    repos=repos,
+                    rest_client=rest_client,
+                    graphql_client=graphql_client,
+                    rate_limiter=rate_limiter,
+                    paths=paths,
+                    checkpoint=checkpoint,
+                    progress=progress,
+                    collect_repos_parallel=_collect_repos_parallel,
+                    catalog=catalog,
+                    store=repo_store,
+                )
+            )
+        else:
+            # Step 2: Repo Metadata
+            stats["repos"] = await run_repo_metadata_phase(
+                config=config,
+                repos=repos,
+                graphql_client=graphql_client,
+                rate_limiter=rate_limiter,
+                paths=paths,
+                checkpoint=checkpoint,
+                progress=progress,
+                store=repo_store,
+            )
 
-        # Step 3: Pull Requests
-        stats["pulls"] = await run_pulls_phase(
-            config=config,
-            repos=repos,
-            rest_client=rest_client,
-            paths=paths,
-            checkpoint=checkpoint,
-            progress=progress,
-            collect_repos_parallel=_collect_repos_parallel,
-        )
+            # Step 3: Pull Requests
+            stats["pulls"] = await run_pulls_phase(
+                config=config,
+                repos=repos,
+                rest_client=rest_client,
+                paths=paths,
+                checkpoint=checkpoint,
+                progress=progress,
+                collect_repos_parallel=_collect_repos_parallel,
+                catalog=catalog,
+            )
 
-        # Step 4: Issues
-        stats["issues"] = await run_issues_phase(
-            config=config,
-            repos=repos,
-            rest_client=rest_client,
-            rate_limiter=rate_limiter,
-            paths=paths,
-            checkpoint=checkpoint,
-            progress=progress,
-        )
+            # Step 4: Issues
+            stats["issues"] = await run_issues_phase(
+                config=config,
+                repos=repos,
+                rest_client=rest_client,
+                rate_limiter=rate_limiter,
+                paths=paths,
+                checkpoint=checkpoint,
+                progress=progress,
+                catalog=catalog,
+            )
 
-        # Step 5: Reviews
-        stats["reviews"] = await run_reviews_phase(
-            config=config,
-            repos=repos,
-            rest_client=rest_client,
-            rate_limiter=rate_limiter,
-            paths=paths,
-            checkpoint=checkpoint,
-            progress=progress,
-        )
+            # Step 5: Reviews
+            stats["reviews"] = await run_reviews_phase(
+                config=config,
+                repos=repos,
+                rest_client=rest_client,
+                rate_limiter=rate_limiter,
+                paths=paths,
+                checkpoint=checkpoint,
+                progress=progress,
+                catalog=catalog,
+                graphql_client=graphql_client,
+            )
 
-        # Step 6: Comments
-        stats["comments"] = await run_comments_phase(
-            config=config,
-            repos=repos,
-            rest_client=rest_client,
-            rate_limiter=rate_limiter,
-            paths=paths,
-            checkpoint=checkpoint,
-            progress=progress,
-        )
+            # Step 6: Comments
+            stats["comments"] = await run_comments_phase(
+                config=config,
+                repos=repos,
+                rest_client=rest_client,
+                rate_limiter=rate_limiter,
+                paths=paths,
+                checkpoint=checkpoint,
+                progress=progress,
+                catalog=catalog,
+            )
 
-        # Step 7: Commits
-        stats["commits"] = await run_commits_phase(
-            config=config,
-            repos=repos,
-            rest_client=rest_client,
-            rate_limiter=rate_limiter,
-            paths=paths,
-            checkpoint=checkpoint,
-            progress=progress,
-        )
+            # Step 7: Commits
+            stats["commits"] = await run_commits_phase(
+                config=config,
+                repos=repos,
+                rest_client=rest_client,
+                rate_limiter=rate_limiter,
+                paths=paths,
+                checkpoint=checkpoint,
+                progress=progress,
+            )
 
-        # Step 8: Hygiene - Branch Protection
-        stats["hygiene"] = await run_branch_protection_phase(
-            config=config,
-            repos=repos,
-            rest_client=rest_client,
-            paths=paths,
-            checkpoint=checkpoint,
-            progress=progress,
-        )
+            # Step 8: Hygiene - Branch Protection
+            stats["hygiene"] = await run_branch_protection_phase(
+                config=config,
+                repos=repos,
+                rest_client=rest_client,
+                paths=paths,
+                checkpoint=checkpoint,
+                progress=progress,
+            )
 
-        # Step 9: Security Features
-        stats["security_features"] = await run_security_features_phase(
-            config=config,
-            repos=repos,
-            rest_client=rest_client,
-            paths=paths,
-            checkpoint=checkpoint,
-            progress=progress,
-        )
+            # Step 9: Security Features
+            stats["security_features"] = await run_security_features_phase(
+                config=config,
+                repos=repos,
+                rest_client=rest_client,
+                paths=paths,
+                checkpoint=checkpoint,
+                progress=progress,
+                store=repo_store,
+            )
+
+        stats["repo_store"] = repo_store.stats()
 
         # Collect rate limit samples
         stats["rate_limit_samples"] = rate_limiter.get_samples()
@@ -432,6 +609,14 @@ async def run_collection(
         progress.stop()
         # Cleanup clients
         await http_client.close()
+        if run_trace is not None:
+            run_trace.close()
+        if metrics_exporter is not None:
+            await metrics_exporter.stop()
+        if run_events is not None:
+            run_events.close()
+        if run_profiler is not None:
+            stats["profile"] = run_profiler.close()
 
     # Calculate duration
     end_time = datetime.now()
@@ -478,12 +663,122 @@ async def run_collection(
     return stats
 
 
+async def _run_preflight(
+    config: Config,
+    repos: list[dict[str, Any]],
+    http_client: GitHubClient,
+    graphql_client: GraphQLClient,
+    rate_limiter: AdaptiveRateLimiter,
+    progress: ProgressTracker,
+    phases: tuple[str, ...],
+) -> CollectionPlan | None:
+    """Plan the run's request budget when collection.preflight is enabled.
+
+    Seeds the progress ETA with the planned request count and, with
+    preflight.pace, paces each API whose cost exceeds the current window.
+    Planning failures are logged and collection continues unplanned.
+
+    Returns:
+        The plan, or None if planning is disabled or failed.
+    """
+    preflight = config.collection.preflight
+    if not preflight.enabled or not repos:
+        return None
+
+    progress.set_phase("preflight")
+    try:
+        plan = await plan_collection(
+            config, repos, http_client, graphql_client, rate_limiter, phases
+        )
+    except Exception as e:
+        logger.warning("Pre-flight planning failed, continuing without a plan: %s", e)
+        return None
+
+    progress.set_planned_requests(plan.cost(APIType.REST))
+    if preflight.pace:
+        apply_pacing(plan, rate_limiter)
+    for api_type in APIType:
+        if not plan.fits_in_window(api_type):
+            logger.warning(
+                "%s cost (%d) exceeds the remaining budget (%d): %d reset(s), "
+                "or %d tokens to finish in one window",
+                api_type.value,
+                plan.cost(api_type),
+                plan.budgets[api_type].remaining,
+                plan.resets_needed(api_type),
+                plan.tokens_needed(api_type),
+            )
+    return plan
+
+
+async def plan_run(config: Config, single_pass: bool = True) -> CollectionPlan:
+    """Discover repositories and plan a collection run without collecting.
+
+    Args:
+        config: Application configuration.
+        single_pass: Plan the phases of collect_and_aggregate (True) or of
+            run_collection (False).
+
+    Returns:
+        The collection plan.
+
+    Raises:
+        CollectionError: If no GitHub token is configured.
+    """
+    token = os.getenv(config.github.auth.token_env)
+    if not token:
+        msg = f"GitHub token not found in environment variable {config.github.auth.token_env}"
+        raise CollectionError(msg)
+
+    http_client = _build_http_client(config, GitHubAuth(token=token))
+    rate_limiter = AdaptiveRateLimiter(config.rate_limit)
+    try:
+        paths = PathManager(config)
+        paths.ensure_directories()
+        repos = await discover_repos(config, http_client, paths)
+        return await plan_collection(
+            config,
+            repos,
+            http_client,
+            GraphQLClient(http_client, rate_limiter),
+            rate_limiter,
+            SINGLE_PASS_PHASES if single_pass else PHASED_PHASES,
+        )
+    finally:
+        await http_client.close()
+
+
+# Files the inline hygiene score checks, besides root README/LICENSE files
+INLINE_HYGIENE_PATHS = (
+    "SECURITY.md",
+    "security.md",
+    ".github/SECURITY.md",
+    "CODEOWNERS",
+    ".github/CODEOWNERS",
+    "docs/CODEOWNERS",
+    "CONTRIBUTING.md",
+    "contributing.md",
+    ".github/CONTRIBUTING.md",
+)
+
+# CI configuration files outside the workflow prefixes
+CI_CONFIG_PATHS = (
+    ".gitlab-ci.yml",
+    "circle.yml",
+    ".circleci/config.yml",
+    ".travis.yml",
+    "Jenkinsfile",
+)
+
+
 async def _collect_repo_hygiene_inline(
     repo: dict[str, Any],
     owner: str,
     repo_name: str,
     rest_client: RestClient,
     config: Config,
+    engine: HygieneEngine | None = None,
+    store: RepoStore | None = None,
 ) -> dict[str, Any]:
     """Collect comprehensive hygiene data for a repository inline.
 
@@ -493,6 +788,9 @@ async def _collect_repo_hygiene_inline(
         repo_name: Repository name.
         rest_client: REST client for API calls.
         config: Application configuration.
+        engine: Hygiene lookup engine (an uncached REST engine if omitted).
+        store: Per-run repo store; a ``security_and_analysis`` payload from
+            discovery replaces the repository request.
 
     Returns:
         Dictionary with hygiene data including file presence, branch protection, and security features.
@@ -530,60 +828,48 @@ async def _collect_repo_hygiene_inline(
     except Exception as e:
         logger.debug("Error checking branch protection for %s: %s", repo_full_name, e)
 
-    # Fetch repository tree to check file presence
+    # Resolve the directories holding hygiene files and CI configuration
+    workflow_prefixes = config.collection.hygiene.workflow_prefixes
+    if engine is None:
+        engine = HygieneEngine(rest_client=rest_client)
     try:
-        tree_data = await rest_client.get_repository_tree(
-            owner=owner,
-            repo=repo_name,
-            tree_sha=default_branch,
-            recursive=True,
+        facts = await engine.lookup(
+            {**repo, "default_branch": default_branch},
+            INLINE_HYGIENE_PATHS + CI_CONFIG_PATHS,
+            workflow_prefixes,
         )
 
-        if tree_data and "tree" in tree_data:
-            tree_entries = tree_data.get("tree", [])
-            paths = {entry.get("path", ""): entry for entry in tree_entries}
+        if facts is not None:
+            root_names = [name.upper() for name in facts.names()]
 
             # Check for key hygiene files
-            hygiene_data["has_readme"] = any(
-                p.upper() == "README.MD" or p.upper() == "README" for p in paths
+            hygiene_data["has_readme"] = any(n in ("README.MD", "README") for n in root_names)
+            hygiene_data["has_security_md"] = any(
+                facts.exists(p) for p in ("SECURITY.md", "security.md", ".github/SECURITY.md")
             )
-            hygiene_data["has_security_md"] = (
-                "SECURITY.md" in paths or "security.md" in paths or ".github/SECURITY.md" in paths
+            hygiene_data["has_codeowners"] = any(
+                facts.exists(p) for p in ("CODEOWNERS", ".github/CODEOWNERS", "docs/CODEOWNERS")
             )
-            hygiene_data["has_codeowners"] = (
-                "CODEOWNERS" in paths or ".github/CODEOWNERS" in paths or "docs/CODEOWNERS" in paths
+            hygiene_data["has_contributing"] = any(
+                facts.exists(p)
+                for p in ("CONTRIBUTING.md", "contributing.md", ".github/CONTRIBUTING.md")
             )
-            hygiene_data["has_contributing"] = (
-                "CONTRIBUTING.md" in paths
-                or "contributing.md" in paths
-                or ".github/CONTRIBUTING.md" in paths
-            )
-            hygiene_data["has_license"] = any(p.upper().startswith("LICENSE") for p in paths)
+            hygiene_data["has_license"] = any(n.startswith("LICENSE") for n in root_names)
 
             # Check for CI workflows
-            ci_workflow_paths = [
-                ".github/workflows/",
-                ".gitlab-ci.yml",
-                "circle.yml",
-                ".circleci/config.yml",
-                ".travis.yml",
-                "Jenkinsfile",
-            ]
             hygiene_data["has_ci_workflows"] = any(
-                any(p.startswith(prefix) for prefix in ci_workflow_paths if "/" in prefix)
-                or p in ci_workflow_paths
-                for p in paths
-            )
+                facts.files_under(prefix) for prefix in workflow_prefixes
+            ) or any(facts.exists(p) for p in CI_CONFIG_PATHS)
 
     except Exception as e:
-        logger.debug("Error fetching repository tree for %s: %s", repo_full_name, e)
+        logger.debug("Error resolving hygiene files for %s: %s", repo_full_name, e)
 
     # Check security features (Dependabot, secret scanning)
     try:
-        repo_data = await rest_client.get_repo_security_analysis(owner, repo_name)
-        if repo_data:
-            security_analysis = repo_data.get("security_and_analysis", {})
-
+        if store is None:
+            store = RepoStore()
+        security_analysis = await store.field(repo_full_name, "security_and_analysis", rest_client)
+        if security_analysis:
             # Check Dependabot
             dependabot_alerts = security_analysis.get("dependabot_security_updates", {})
             hygiene_data["dependabot_enabled"] = dependabot_alerts.get("status") == "enabled"
@@ -628,6 +914,148 @@ async def _collect_repo_hygiene_inline(
     return hygiene_data
 
 
+def _fan_out_units(
+    sample: StratifiedSample | None,
+    phase: str,
+    repo_full_name: str,
+    items: list[dict[str, Any]],
+    stratum_of: Callable[[dict[str, Any]], str],
+) -> list[SampledUnit]:
+    """Items to fetch reviews or comments for: all of them, or a stratified sample.
+
+    Args:
+        sample: Run sample, or None when collecting exactly.
+        phase: Fan-out phase.
+        repo_full_name: Repository full name.
+        items: In-window PRs or issues.
+        stratum_of: Stratum assignment for sampling.
+
+    Returns:
+        Units to fetch, each with its sample weight (1 when exact).
+    """
+    if sample is None:
+        return [SampledUnit(item, 1, (phase, repo_full_name, "")) for item in items]
+    return sample.select(phase, repo_full_name, items, stratum_of)
+
+
+async def _collect_pr_reviews(
+    rest_client: RestClient,
+    aggregator: MetricsAggregator,
+    recorder: RawRecorder | None,
+    repo_full_name: str,
+    unit: SampledUnit,
+) -> int:
+    """Fetch and aggregate the reviews of one sampled PR.
+
+    Args:
+        rest_client: REST client.
+        aggregator: Aggregator receiving weighted reviews.
+        recorder: Raw recorder, if raw capture is enabled.
+        repo_full_name: Repository full name.
+        unit: Sampled PR with its weight.
+
+    Returns:
+        Number of reviews fetched.
+    """
+    owner, repo_name = repo_full_name.split("/", 1)
+    pr_number = unit.item["number"]
+    fetched = 0
+    async for reviews_page, review_meta in rest_client.list_reviews(
+        owner=owner, repo=repo_name, pull_number=pr_number
+    ):
+        if not reviews_page:
+            continue
+        aggregator.add_reviews(repo_full_name, pr_number, reviews_page, weight=unit.weight)
+        fetched += len(reviews_page)
+        if recorder:
+            for review in reviews_page:
+                await recorder.write(
+                    "reviews",
+                    f"/repos/{repo_full_name}/pulls/{pr_number}/reviews",
+                    review,
+                    page=review_meta["page"],
+                )
+    return fetched
+
+
+async def _aggregate_commit_metrics(
+    stats: dict[str, list[dict[str, Any]] | None],
+    repo_names: list[str],
+    rest_client: RestClient,
+    aggregator: MetricsAggregator,
+    budget: RunBudget,
+    coverage: CoverageTracker,
+    config: Config,
+    paths: PathManager,
+) -> None:
+    """Add commit metrics for collected repos, falling back to paged history.
+
+    With ``storage.write_raw`` the contributor stats and fallback commits are
+    recorded per repo, so ``rebuild-metrics`` replays the same commit metrics.
+
+    Args:
+        stats: Contributor stats by repo (None where unavailable).
+        repo_names: Repos whose other data was collected.
+        rest_client: REST client for the history fallback.
+        aggregator: Aggregator receiving commit metrics.
+        budget: Run budget (the fallback is a secondary phase).
+        coverage: Coverage tracker.
+        config: Application configuration.
+        paths: Path manager for raw capture.
+    """
+    commits_config = config.collection.commits
+    from_stats = from_history = 0
+    for repo_full_name in repo_names:
+        recorder = (
+            RawRecorder(paths, repo_full_name, kinds=COMMIT_KINDS)
+            if config.storage.write_raw
+            else None
+        )
+        try:
+            if recorder:
+                await recorder.open()
+            contributors = stats.get(repo_full_name)
+            if contributors is not None:
+                aggregator.add_contributor_stats(repo_full_name, contributors)
+                if recorder:
+                    for contributor in contributors:
+                        await recorder.write(
+                            "contributor_stats",
+                            f"/repos/{repo_full_name}/stats/contributors",
+                            contributor,
+                        )
+                coverage.record(repo_full_name, "commits", COMPLETE)
+                from_stats += 1
+                continue
+            if not commits_config.history_fallback or not budget.allows("commits"):
+                coverage.record(repo_full_name, "commits", SKIPPED)
+                continue
+            try:
+                await count_commit_history(
+                    repo_full_name,
+                    rest_client,
+                    aggregator,
+                    since=config.github.windows.since.isoformat(),
+                    until=config.github.windows.until.isoformat(),
+                    max_pages=commits_config.max_pages,
+                    recorder=recorder,
+                )
+            except Exception as e:
+                logger.error("Error counting commits for %s: %s", repo_full_name, e)
+                coverage.record(repo_full_name, "commits", SKIPPED)
+                continue
+            coverage.record(repo_full_name, "commits", PARTIAL)
+            from_history += 1
+        finally:
+            if recorder:
+                await recorder.close()
+    logger.info(
+        "Commit metrics: %d repos from contributor stats, %d from commit history",
+        from_stats,
+        from_history,
+    )
+
+
 async def collect_and_aggregate(
     config: Config,
     force: bool = False,
@@ -637,8 +1065,9 @@ async def collect_and_aggregate(
     """Single-pass collection with inline metric aggregation.
 
     This function replaces the separate collect, normalize, and metrics phases
-    with a single pass that aggregates metrics during collection. No raw JSONL
-    files are written - metrics are computed in-memory and returned directly.
+    with a single pass that aggregates metrics during collection. Metrics are
+    computed in-memory and returned directly; raw JSONL is only written when
+    ``storage.write_raw`` is enabled, so metrics can be rebuilt offline later.
 
     Args:
         config: Application configuration.
@@ -654,7 +1083,8 @@ async def collect_and_aggregate(
             'timeseries': {...},
             'repo_health': [...],
             'hygiene_scores': {...},
-            'awards': {...}
+            'awards': {...},
+            'coverage': {...}  # only when collection.limits bounds the run
         }
 
     Raises:
@@ -673,11 +1103,7 @@ async def collect_and_aggregate(
     )
 
     # Initialize MetricsAggregator
-    aggregator = MetricsAggregator(
-        year=config.github.windows.year,
-        target_name=config.github.target.name,
-        target_mode=config.github.target.mode,
-    )
+    aggregator = MetricsAggregator.from_config(config)
 
     # Initialize auth and clients
     token = os.getenv(config.github.auth.token_env)
@@ -686,7 +1112,7 @@ async def collect_and_aggregate(
         raise CollectionError(msg)
 
     auth = GitHubAuth(token=token)
-    http_client = GitHubClient(auth=auth)
+    http_client = _build_http_client(config, auth)
     rate_limiter = AdaptiveRateLimiter(config.rate_limit)
     rest_client = RestClient(http_client, rate_limiter)
 
@@ -696,10 +1122,17 @@ async def collect_and_aggregate(
         quiet=quiet,
         rate_limiter=rate_limiter,
     )
+    run_trace: RequestTrace | None = None
+    run_events = _start_trace_events(config)
+    run_profiler = _start_profiler(config, PathManager(config))
+    metrics_exporter: OpenMetricsExporter | None = None
+    stats_task: asyncio.Task[dict[str, list[dict[str, Any]] | None]] | None = None
+    hygiene_writer: AsyncJSONLWriter | None = None
 
     try:
         # Start progress display
         progress.start()
+        metrics_exporter = await _start_openmetrics(config, rate_limiter, progress, token)
 
         # Step 1: Discovery
         logger.info("=" * 80)
@@ -708,11 +1141,16 @@ async def collect_and_aggregate(
         progress.set_phase("discovery")
 
         # Discover repos using existing discovery module
-        # Note: We still need PathManager for discovery, but we won't write JSONL
+        # PathManager serves discovery and, with storage.write_raw, the raw hygiene
+        # and request-trace files; the rest of the raw layer is written per repo
         paths = PathManager(config)
         paths.ensure_directories()
+        if config.storage.write_raw:
+            paths.hygiene_raw_path.unlink(missing_ok=True)
+        run_trace = _start_request_trace(config, paths)
 
-        repos = await discover_repos(config, http_client, paths)
+        repo_store = RepoStore()
+        repos = await discover_repos(config, http_client, paths, store=repo_store)
         progress.set_total_repos(len(repos))
         progress.mark_phase_complete("discovery")
 
@@ -722,6 +1160,70 @@ async def collect_and_aggregate(
             logger.warning("No repositories discovered. Check target configuration.")
             return aggregator.export()
 
+        await _run_preflight(
+            config,
+            repos,
+            http_client,
+            GraphQLClient(http_client, rate_limiter),
+            rate_limiter,
+            progress,
+            SINGLE_PASS_PHASES,
+        )
+
+        # Deadline/budget bound: most valuable repos first, coverage recorded
+        limits = config.collection.limits
+        budget = RunBudget(limits, rate_limiter)
+        if budget.bounded and limits.order_by_value:
+            repos = order_by_value(repos, config.github.windows.since)
+        coverage = CoverageTracker(repos, budget)
+        budget.start(len(repos))
+
+        # Approximate mode: reviews and comments for a stratified sample only
+        sample = None
+        if config.collection.sampling.enabled:
+            sample = StratifiedSample(config.collection.sampling)
+            aggregator.sampling = sample
+            if config.storage.write_raw:
+                # Sample weights are not recorded, so rebuild-metrics must refuse this data
+                logger.warning("Sampling is enabled: raw reviews and comments cover the sample")
+                with paths.sampling_marker_path.open("w") as f:
+                    json.dump(
+                        {
+                            "collection_date": datetime.now().isoformat(),
+                            "sampling": config.collection.sampling.model_dump(),
+                        },
+                        f,
+                        indent=2,
+                    )
+
+        # Commit metrics from contributor statistics, polled in the background
+        # while PRs and issues are collected. A bounded run only asks for the
+        # repos it started, once collection is done and only while commits
+        # (a secondary phase) are still allowed.
+        collect_commits = (
+            config.collection.enable.commits and config.collection.commits.contributor_stats
+        )
+        if collect_commits and not budget.bounded:
+            with request_trace.trace_scope(phase="contributor_stats"):
+                stats_task = asyncio.create_task(
+                    fetch_contributor_stats(repos, rest_client, config.collection.commits)
+                )
+        started_repos: list[str] = []
+
+        # File presence lookups: batched GraphQL or targeted tree reads, cached by tree SHA
+        hygiene_engine = None
+        if config.collection.enable.hygiene:
+            hygiene_engine = build_hygiene_engine(
+                config,
+                paths,
+                rest_client=rest_client,
+                graphql_client=GraphQLClient(http_client, rate_limiter),
+                rate_limiter=rate_limiter,
+            )
+            if config.storage.write_raw:
+                hygiene_writer = AsyncJSONLWriter(paths.hygiene_raw_path)
+                await hygiene_writer.open()
+
         # Step 2: Collect PRs, Issues, Reviews with inline aggregation
         logger.info("=" * 80)
         logger.info("STEP 2: Data Collection with Metric Aggregation")
@@ -737,65 +1239,129 @@ async def collect_and_aggregate(
             repo_full_name = repo["full_name"]
             owner, repo_name = repo_full_name.split("/", 1)
 
+            if budget.exhausted():
+                logger.warning(
+                    "Collection bound reached: %d of %d repos not started",
+                    len(repos) - idx + 1,
+                    len(repos),
+                )
+                break
+
             logger.info("[%d/%d] Processing %s", idx, len(repos), repo_full_name)
 
             # Add repo to aggregator
             aggregator.add_repo(repo)
+            started_repos.append(repo_full_name)
+
+            # Track in-window PRs and issues for review/comment collection
+            window_prs: list[dict[str, Any]] = []
+            window_issues: list[dict[str, Any]] = []
 
-            # Track PR numbers for comment collection
-            pr_numbers = []
-            # Track issue numbers for comment collection
-            issue_numbers = []
+            recorder = RawRecorder(paths, repo_full_name) if config.storage.write_raw else None
+            repo_span = trace_events.span(repo_full_name, "repo")
 
             try:
+                if recorder:
+                    await recorder.open()
+
                 # Collect PRs
                 if config.collection.enable.pulls:
                     logger.debug("  Collecting PRs...")
-                    async for prs_page, _metadata in rest_client.list_pulls(
+                    request_trace.set_phase("pulls")
+                    pulls_status = COMPLETE
+                    async for prs_page, pr_metadata in rest_client.list_pulls(
                         owner=owner,
                         repo=repo_name,
                         state="all",
                     ):
+                        # PRs are added in batches, flushed before each PR's reviews so
+                        # the aggregator sees events in the same order as one-by-one
+                        pending_prs: list[dict[str, Any]] = []
                         for pr in prs_page:
+                            if budget.exhausted():
+                                pulls_status = PARTIAL
+                                break
+
                             # Apply date filter
                             created_at = pr.get("created_at")
-                            if created_at:
-                                created_dt = datetime.fromisoformat(
-                                    created_at.replace("Z", "+00:00")
+                            if not created_at:
+                                continue
+                            created_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                            if not (
+                                config.github.windows.since
+                                <= created_dt
+                                < config.github.windows.until
+                            ):
+                                continue
+
+                            pending_prs.append(pr)
+                            window_prs.append(pr)
+                            total_prs += 1
+                            if recorder:
+                                await recorder.write(
+                                    "pulls",
+                                    f"/repos/{repo_full_name}/pulls/{pr['number']}",
+                                    pr,
+                                    page=pr_metadata["page"],
                                 )
-                                if (
-                                    config.github.windows.since
-                                    <= created_dt
-                                    < config.github.windows.until
+
+                            # Collect reviews for this PR (sampled reviews follow the listing)
+                            if config.collection.enable.reviews and sample is None:
+                                async for reviews_page, review_meta in rest_client.list_reviews(
+                                    owner=owner,
+                                    repo=repo_name,
+                                    pull_number=pr["number"],
                                 ):
-                                    aggregator.add_pr(repo_full_name, pr)
-                                    pr_numbers.append(pr["number"])
-                                    total_prs += 1
-
-                                    # Collect reviews for this PR
-                                    if config.collection.enable.reviews:
-                                        async for (
-                                            reviews_page,
-                                            _review_meta,
-                                        ) in rest_client.list_reviews(
-                                            owner=owner,
-                                            repo=repo_name,
-                                            pull_number=pr["number"],
-                                        ):
-                                            for review in reviews_page:
-                                                aggregator.add_review(
-                                                    repo_full_name, pr["number"], review
-                                                )
-                                                total_reviews += 1
+                                    if not reviews_page:
+                                        continue
+                                    if pending_prs:
+                                        aggregator.add_prs(repo_full_name, pending_prs)
+                                        pending_prs = []
+                                    aggregator.add_reviews(
+                                        repo_full_name, pr["number"], reviews_page
+                                    )
+                                    total_reviews += len(reviews_page)
+                                    if recorder:
+                                        for review in reviews_page:
+                                            await recorder.write(
+                                                "reviews",
+                                                f"/repos/{repo_full_name}/pulls/"
+                                                f"{pr['number']}/reviews",
+                                                review,
+                                                page=review_meta["page"],
+                                            )
+                        aggregator.add_prs(repo_full_name, pending_prs)
+                        if pulls_status == PARTIAL:
+                            break
+                    coverage.record(repo_full_name, "pulls", pulls_status)
+                    reviews_status = pulls_status
+                    if config.collection.enable.reviews and sample is not None:
+                        request_trace.set_phase("reviews")
+                        for unit in sample.select(
+                            "reviews", repo_full_name, window_prs, pr_stratum
+                        ):
+                            if budget.exhausted():
+                                reviews_status = PARTIAL
+                                break
+                            fetched = await _collect_pr_reviews(
+                                rest_client, aggregator, recorder, repo_full_name, unit
+                            )
+                            sample.observe(unit, fetched)
+                            total_reviews += fetched
+                    if config.collection.enable.reviews:
+                        coverage.record(repo_full_name, "reviews", reviews_status)
 
                 # Collect issues
-                if config.collection.enable.issues:
+                if config.collection.enable.issues and budget.allows("issues"):
                     logger.debug("  Collecting issues...")
-                    async for issues_page, _metadata in rest_client.list_issues(
+                    request_trace.set_phase("issues")
+                    issues_status = COMPLETE
+                    async for issues_page, issue_metadata in rest_client.list_issues(
                         owner=owner,
                         repo=repo_name,
                         state="all",
                     ):
+                        kept_issues = []
                         for issue in issues_page:
                             # Skip PRs (GitHub issues API includes PRs)
                             if "pull_request" in issue:
@@ -812,55 +1378,135 @@ async def collect_and_aggregate(
                                     <= created_dt
                                     < config.github.windows.until
                                 ):
-                                    aggregator.add_issue(repo_full_name, issue)
-                                    issue_numbers.append(issue["number"])
+                                    kept_issues.append(issue)
+                                    window_issues.append(issue)
                                     total_issues += 1
+                                    if recorder:
+                                        await recorder.write(
+                                            "issues",
+                                            f"/repos/{repo_full_name}/issues/{issue['number']}",
+                                            issue,
+                                            page=issue_metadata["page"],
+                                        )
+                        aggregator.add_issues(repo_full_name, kept_issues)
+                        if budget.exhausted():
+                            issues_status = PARTIAL
+                            break
+                    coverage.record(repo_full_name, "issues", issues_status)
+                elif config.collection.enable.issues:
+                    coverage.record(repo_full_name, "issues", SKIPPED)
 
                 # Collect comments
-                if config.collection.enable.comments:
+                if config.collection.enable.comments and budget.allows("comments"):
+                    request_trace.set_phase("comments")
+                    comments_status = COMPLETE
+                    issue_units = _fan_out_units(
+                        sample, "issue_comments", repo_full_name, window_issues, issue_stratum
+                    )
+                    pr_units = _fan_out_units(
+                        sample, "review_comments", repo_full_name, window_prs, pr_stratum
+                    )
                     # Collect issue comments
-                    if issue_numbers:
+                    if issue_units:
                         logger.debug(
-                            "  Collecting issue comments for %d issues...", len(issue_numbers)
+                            "  Collecting issue comments for %d issues...", len(issue_units)
                         )
-                        for issue_number in issue_numbers:
-                            async for comments_page, _metadata in rest_client.list_issue_comments(
+                        for unit in issue_units:
+                            if budget.exhausted():
+                                comments_status = PARTIAL
+                                break
+                            issue_number = unit.item["number"]
+                            fetched = 0
+                            async for (
+                                comments_page,
+                                comment_meta,
+                            ) in rest_client.list_issue_comments(
                                 owner=owner,
                                 repo=repo_name,
                                 issue_number=issue_number,
                             ):
-                                for comment in comments_page:
-                                    aggregator.add_comment(
-                                        repo_full_name, comment, comment_type="issue"
-                                    )
-                                    total_comments += 1
+                                aggregator.add_comments(
+                                    repo_full_name,
+                                    comments_page,
+                                    comment_type="issue",
+                                    weight=unit.weight,
+                                )
+                                fetched += len(comments_page)
+                                if recorder:
+                                    for comment in comments_page:
+                                        await recorder.write(
+                                            "issue_comments",
+                                            f"/repos/{repo_full_name}/issues/"
+                                            f"{issue_number}/comments",
+                                            comment,
+                                            page=comment_meta["page"],
+                                        )
+                            if sample is not None:
+                                sample.observe(unit, fetched)
+                            total_comments += fetched
 
                     # Collect review comments (inline PR comments)
-                    if pr_numbers:
-                        logger.debug("  Collecting review comments for %d PRs...", len(pr_numbers))
-                        for pr_number in pr_numbers:
-                            async for comments_page, _metadata in rest_client.list_review_comments(
+                    if pr_units:
+                        logger.debug("  Collecting review comments for %d PRs...", len(pr_units))
+                        for unit in pr_units:
+                            if budget.exhausted():
+                                comments_status = PARTIAL
+                                break
+                            pr_number = unit.item["number"]
+                            fetched = 0
+                            async for (
+                                comments_page,
+                                comment_meta,
+                            ) in rest_client.list_review_comments(
                                 owner=owner,
                                 repo=repo_name,
                                 pull_number=pr_number,
                             ):
-                                for comment in comments_page:
-                                    aggregator.add_comment(
-                                        repo_full_name, comment, comment_type="review"
-                                    )
-                                    total_comments += 1
+                                aggregator.add_comments(
+                                    repo_full_name,
+                                    comments_page,
+                                    comment_type="review",
+                                    weight=unit.weight,
+                                )
+                                fetched += len(comments_page)
+                                if recorder:
+                                    for comment in comments_page:
+                                        await recorder.write(
+                                            "review_comments",
+                                            f"/repos/{repo_full_name}/pulls/{pr_number}/comments",
+                                            comment,
+                                            page=comment_meta["page"],
+                                        )
+                            if sample is not None:
+                                sample.observe(unit, fetched)
+                            total_comments += fetched
+                    coverage.record(repo_full_name, "comments", comments_status)
+                elif config.collection.enable.comments:
+                    coverage.record(repo_full_name, "comments", SKIPPED)
 
                 # Collect hygiene data
-                if config.collection.enable.hygiene:
+                if config.collection.enable.hygiene and budget.allows("hygiene"):
                     logger.debug("  Collecting hygiene data...")
+                    request_trace.set_phase("hygiene")
                     hygiene_data = await _collect_repo_hygiene_inline(
                         repo=repo,
                         owner=owner,
                         repo_name=repo_name,
                         rest_client=rest_client,
                         config=config,
+                        engine=hygiene_engine,
+                        store=repo_store,
                     )
                     aggregator.set_hygiene(repo_full_name, hygiene_data)
+                    if hygiene_writer is not None:
+                        await hygiene_writer.write(
+                            source="derived",
+                            endpoint="hygiene",
+                            data=hygiene_data,
+                        )
+                    coverage.record(repo_full_name, "hygiene", COMPLETE)
+                elif config.collection.enable.hygiene:
+                    coverage.record(repo_full_name, "hygiene", SKIPPED)
 
                 logger.info(
                     "  Processed: %d PRs, %d issues, %d reviews, %d comments",
@@ -873,8 +1519,40 @@ async def collect_and_aggregate(
             except Exception as e:
                 logger.error("Error processing %s: %s", repo_full_name, e)
                 continue
+            finally:
+                if recorder:
+                    await recorder.close()
+                repo_span.end()
+
+        if collect_commits:
+            if stats_task is not None:
+                stats = await stats_task
+            else:
+                request_trace.set_phase("contributor_stats")
+                stats = await fetch_contributor_stats(
+                    [{"full_name": name} for name in started_repos],
+                    rest_client,
+                    config.collection.commits,
+                    proceed=lambda: budget.allows("commits"),
+                )
+            await _aggregate_commit_metrics(
+                stats,
+                started_repos,
+                rest_client,
+                aggregator,
+                budget,
+                coverage,
+                config,
+                paths,
+            )
 
         progress.mark_phase_complete("collection")
+        if hygiene_engine is not None:
+            hygiene_engine.save()
+        if config.storage.write_raw and sample is None and len(started_repos) == len(repos):
+            # Every repo was re-recorded in full, replacing any sampled capture
+            paths.sampling_marker_path.unlink(missing_ok=True)
+        logger.debug("Repo store: %s", repo_store.stats())
 
         logger.info("=" * 80)
         logger.info("COLLECTION COMPLETE")
@@ -886,6 +1564,22 @@ async def collect_and_aggregate(
 
         # Export aggregated metrics
         metrics = aggregator.export()
+        if budget.bounded:
+            metrics["coverage"] = coverage.to_dict()
+
+        # Resolve contributor display names (cached across runs)
+        users_config = config.collection.users
+        if users_config.enabled:
+            request_trace.set_phase("users")
+            cache = UserProfileCache(
+                paths.user_profile_cache_path, users_config.cache_ttl_days * 86400
+            ).load()
+            await enrich_contributors(
+                metrics,
+                GraphQLClient(http_client, rate_limiter),
+                cache,
+                batch_size=users_config.batch_size,
+            )
 
         # Calculate duration
         end_time = datetime.now()
@@ -897,5 +1591,20 @@ async def collect_and_aggregate(
     finally:
         # Stop progress display
         progress.stop()
+        # Stop contributor stats polling (still running if collection failed)
+        if stats_task is not None:
+            stats_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await stats_task
+        if hygiene_writer is not None:
+            await hygiene_writer.close()
         # Cleanup clients
         await http_client.close()
+        if run_trace is not None:
+            run_trace.close()
+        if metrics_exporter is not None:
+            await metrics_exporter.stop()
+        if run_events is not None:
+            run_events.close()
+        if run_profiler is not None:
+            run_profiler.close()
@@ -0,0 +1,74 @@
+"""Precomputed week and month bucket keys for one calendar year.
+
+Time series counters bucket events by ISO week ("2025-W01") and month
+("2025-01") of the event's local date. Instead of parsing every timestamp into
+a datetime and formatting both keys per event, the calendar maps the date
+prefix of an ISO 8601 timestamp (its local date, which is what the bucket keys
+are based on) to a day index within the year and looks up both keys from
+tables built once per year.
+"""
+
+from datetime import date, timedelta
+
+
+class PeriodCalendar:
+    """Day-indexed week and month bucket keys for one year.
+
+    Example:
+        calendar = PeriodCalendar(2025)
+        day = calendar.day_index("2025-01-01T10:00:00Z")  # 0
+        calendar.period_keys(day)  # ("2025-W01", "2025-01")
+        calendar.day_index("2024-12-31T10:00:00Z")  # None (outside the year)
+    """
+
+    def __init__(self, year: int) -> None:
+        """Build bucket tables for every day of the year.
+
+        Args:
+            year: Calendar year to cover.
+        """
+        self.year = year
+        self._day_index: dict[str, int] = {}
+        self._buckets: list[tuple[str, str]] = []
+
+        day = date(year, 1, 1)
+        while day.year == year:
+            iso_year, iso_week, _ = day.isocalendar()
+            self._day_index[day.isoformat()] = len(self._buckets)
+            self._buckets.append((f"{iso_year}-W{iso_week:02d}", f"{year}-{day.month:02d}"))
+            day += timedelta(days=1)
+
+    def day_index(self, timestamp: str) -> int | None:
+        """Day of the year (0-based) of an ISO 8601 timestamp's local date.
+
+        Args:
+            timestamp: ISO 8601 timestamp (e.g., "2025-03-01T10:00:00Z").
+
+        Returns:
+            Day index, or None if the date falls outside the year (or the
+            timestamp does not start with a YYYY-MM-DD date).
+        """
+        return self._day_index.get(timestamp[:10])
+
+    def period_keys(self, day_index: int) -> tuple[str, str]:
+        """Week and month keys for a day index returned by ``day_index``.
+
+        Args:
+            day_index: Day of the year (0-based).
+
+        Returns:
+            (week_key, month_key).
+        """
+        return self._buckets[day_index]
+
+    def buckets(self, timestamp: str) -> tuple[str, str] | None:
+        """Week and month keys for an ISO 8601 timestamp.
+
+        Args:
+            timestamp: ISO 8601 timestamp.
+
+        Returns:
+            (week_key, month_key), or None if the date falls outside the year.
+        """
+        index = self._day_index.get(timestamp[:10])
+        return self._buckets[index] if index is not None else None
@@ -11,6 +11,7 @@ from gh_year_end.collect.phases.hygiene import (
     run_security_features_phase,
 )
 from gh_year_end.collect.phases.issues import run_issues_phase
+from gh_year_end.collect.phases.pipeline import run_pipelined_collection
 from gh_year_end.collect.phases.pulls import run_pulls_phase
 from gh_year_end.collect.phases.repos import run_repo_metadata_phase
 from gh_year_end.collect.phases.reviews import run_reviews_phase
@@ -21,6 +22,7 @@ __all__ = [
     "run_commits_phase",
     "run_discovery_phase",
     "run_issues_phase",
+    "run_pipelined_collection",
     "run_pulls_phase",
     "run_repo_metadata_phase",
     "run_reviews_phase",
@@ -7,6 +7,7 @@ import json
 import logging
 from typing import Any
 
+from gh_year_end.collect.catalog import ISSUES, PULLS, CollectionCatalog
 from gh_year_end.collect.comments import collect_issue_comments, collect_review_comments
 from gh_year_end.collect.progress import ProgressTracker
 from gh_year_end.config import Config
@@ -114,6 +115,60 @@ async def _extract_pr_numbers_from_raw(
     return pr_numbers_by_repo
 
 
+async def collected_issue_numbers(
+    repos: list[dict[str, Any]],
+    paths: PathManager,
+    catalog: CollectionCatalog | None,
+) -> dict[str, list[int]]:
+    """Issue numbers per repo, from the catalog where the issues phase published them.
+
+    Raw issue files are read only for repos the catalog cannot answer for
+    (collected by an earlier run), or for every repo when there is no catalog.
+
+    Args:
+        repos: List of repository metadata.
+        paths: Path manager for storage.
+        catalog: Catalog published by the issues phase, if any.
+
+    Returns:
+        Dictionary mapping repo full_name to sorted issue numbers.
+    """
+    if catalog is None:
+        return await _extract_issue_numbers_from_raw(repos, paths)
+    numbers, missing = catalog.numbers_by_repo(ISSUES, repos)
+    if missing:
+        logger.info("Reading issue numbers from raw files for %d resumed repos", len(missing))
+        numbers.update(await _extract_issue_numbers_from_raw(missing, paths))
+    return numbers
+
+
+async def collected_pr_numbers(
+    repos: list[dict[str, Any]],
+    paths: PathManager,
+    catalog: CollectionCatalog | None,
+) -> dict[str, list[int]]:
+    """PR numbers per repo, from the catalog where the pulls phase published them.
+
+    Raw PR files are read only for repos the catalog cannot answer for
+    (collected by an earlier run), or for every repo when there is no catalog.
+
+    Args:
+        repos: List of repository metadata.
+        paths: Path manager for storage.
+        catalog: Catalog published by the pulls phase, if any.
+
+    Returns:
+        Dictionary mapping repo full_name to sorted PR numbers.
+    """
+    if catalog is None:
+        return await _extract_pr_numbers_from_raw(repos, paths)
+    numbers, missing = catalog.numbers_by_repo(PULLS, repos)
+    if missing:
+        logger.info("Reading PR numbers from raw files for %d resumed repos", len(missing))
+        numbers.update(await _extract_pr_numbers_from_raw(missing, paths))
+    return numbers
+
+
 async def run_comments_phase(
     config: Config,
     repos: list[dict[str, Any]],
@@ -122,6 +177,7 @@ async def run_comments_phase(
     paths: PathManager,
     checkpoint: CheckpointManager,
     progress: ProgressTracker,
+    catalog: CollectionCatalog | None = None,
 ) -> dict[str, Any]:
     """Run comment collection phase.
 
@@ -133,6 +189,7 @@ async def run_comments_phase(
         paths: Path manager for storage.
         checkpoint: Checkpoint manager for resume support.
         progress: Progress tracker.
+        catalog: Catalog of PR and issue keys published by earlier phases.
 
     Returns:
         Stats dict with collection results.
@@ -155,12 +212,12 @@ async def run_comments_phase(
 
     # Extract issue numbers from collected issues
     logger.info("Extracting issue numbers from collected issues...")
-    issue_numbers_by_repo = await _extract_issue_numbers_from_raw(repos, paths)
+    issue_numbers_by_repo = await collected_issue_numbers(repos, paths, catalog)
     logger.info("Found issues in %d repositories", len(issue_numbers_by_repo))
 
     # Extract PR numbers from collected PRs
     logger.info("Extracting PR numbers from collected PRs...")
-    pr_numbers_by_repo = await _extract_pr_numbers_from_raw(repos, paths)
+    pr_numbers_by_repo = await collected_pr_numbers(repos, paths, catalog)
     logger.info("Found PRs in %d repositories", len(pr_numbers_by_repo))
 
     # Collect issue comments
@@ -9,6 +9,7 @@ from typing import Any
 
 from gh_year_end.collect.discovery import discover_repos
 from gh_year_end.collect.progress import ProgressTracker
+from gh_year_end.collect.repo_store import RepoStore
 from gh_year_end.config import Config
 from gh_year_end.github.http import GitHubClient
 from gh_year_end.storage.checkpoint import CheckpointManager
@@ -23,6 +24,7 @@ async def run_discovery_phase(
     paths: PathManager,
     checkpoint: CheckpointManager,
     progress: ProgressTracker,
+    store: RepoStore | None = None,
 ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
     """Run repository discovery phase.
 
@@ -32,6 +34,7 @@ async def run_discovery_phase(
         paths: Path manager for storage.
         checkpoint: Checkpoint manager for resume support.
         progress: Progress tracker.
+        store: Per-run repo store receiving the discovered repo payloads.
 
     Returns:
         Tuple of (repos list, stats dict).
@@ -50,6 +53,8 @@ async def run_discovery_phase(
                 for line in f:
                     record = json.loads(line)
                     repos.append(record.get("data", {}))
+        if store is not None:
+            store.add(repos)
         stats = {"repos_discovered": len(repos), "skipped": True}
         logger.info("Loaded %d repos from checkpoint", len(repos))
         progress.set_total_repos(len(repos))
@@ -57,7 +62,7 @@ async def run_discovery_phase(
         return repos, stats
 
     checkpoint.set_current_phase("discovery")
-    repos = await discover_repos(config, http_client, paths)
+    repos = await discover_repos(config, http_client, paths, store=store)
     stats = {"repos_discovered": len(repos)}
 
     # Register all repos with checkpoint
@@ -8,6 +8,7 @@ from typing import Any
 
 from gh_year_end.collect.hygiene import collect_branch_protection, collect_security_features
 from gh_year_end.collect.progress import ProgressTracker
+from gh_year_end.collect.repo_store import RepoStore
 from gh_year_end.config import Config
 from gh_year_end.github.rest import RestClient
 from gh_year_end.storage.checkpoint import CheckpointManager
@@ -79,6 +80,7 @@ async def run_security_features_phase(
     paths: PathManager,
     checkpoint: CheckpointManager,
     progress: ProgressTracker,
+    store: RepoStore | None = None,
 ) -> dict[str, Any]:
     """Run security features collection phase.
 
@@ -89,6 +91,7 @@ async def run_security_features_phase(
         paths: Path manager for storage.
         checkpoint: Checkpoint manager for resume support.
         progress: Progress tracker.
+        store: Per-run repo store consulted before requesting repo facts.
 
     Returns:
         Stats dict with collection results.
@@ -115,6 +118,7 @@ async def run_security_features_phase(
         paths=paths,
         config=config,
         checkpoint=checkpoint,
+        store=store,
     )
 
     checkpoint.mark_phase_complete("security_features")
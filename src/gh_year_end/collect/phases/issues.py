@@ -6,6 +6,7 @@ Collects issues from all repositories.
 import logging
 from typing import Any
 
+from gh_year_end.collect.catalog import CollectionCatalog
 from gh_year_end.collect.issues import collect_issues
 from gh_year_end.collect.progress import ProgressTracker
 from gh_year_end.config import Config
@@ -25,6 +26,7 @@ async def run_issues_phase(
     paths: PathManager,
     checkpoint: CheckpointManager,
     progress: ProgressTracker,
+    catalog: CollectionCatalog | None = None,
 ) -> dict[str, Any]:
     """Run issue collection phase.
 
@@ -36,6 +38,7 @@ async def run_issues_phase(
         paths: Path manager for storage.
         checkpoint: Checkpoint manager for resume support.
         progress: Progress tracker.
+        catalog: Catalog to publish collected issue keys to.
 
     Returns:
         Stats dict with collection results.
@@ -63,6 +66,7 @@ async def run_issues_phase(
         rate_limiter=rate_limiter,
         config=config,
         checkpoint=checkpoint,
+        catalog=catalog,
     )
 
     checkpoint.mark_phase_complete("issues")
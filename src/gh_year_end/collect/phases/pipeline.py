@@ -0,0 +1,367 @@
+"""Pipelined collection of all per-repo phases.
+
+Instead of running each phase across every repository before starting the
+next, each (repo, phase) becomes a node in a PhaseScheduler graph:
+
+- repo_metadata (GraphQL), pulls, issues, commits, security_features: no deps
+- reviews and review_comments: after that repo's pulls
+- issue_comments: after that repo's issues
+- branch_protection: one org-wide node (sample mode ranks all repos)
+
+Per-repo checkpointing is unchanged because every node calls the same
+collector as the phased pipeline with a single repo; a phase is marked
+complete in the checkpoint once all of its nodes succeed. Returned stats use
+the same keys and shapes as the phased pipeline.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from gh_year_end.collect.catalog import CollectionCatalog
+from gh_year_end.collect.comments import collect_issue_comments, collect_review_comments
+from gh_year_end.collect.commits import collect_commits
+from gh_year_end.collect.hygiene import collect_branch_protection, collect_security_features
+from gh_year_end.collect.hygiene_engine import build_hygiene_engine
+from gh_year_end.collect.issues import collect_issues
+from gh_year_end.collect.phases.comments import collected_issue_numbers, collected_pr_numbers
+from gh_year_end.collect.progress import ProgressTracker
+from gh_year_end.collect.pulls import collect_single_repo_pulls
+from gh_year_end.collect.repo_store import RepoStore
+from gh_year_end.collect.repos import collect_repo_metadata
+from gh_year_end.collect.reviews import collect_reviews
+from gh_year_end.collect.scheduler import (
+    GLOBAL,
+    PhaseNode,
+    PhaseScheduler,
+    ResourceClass,
+    merge_stats,
+)
+from gh_year_end.config import Config
+from gh_year_end.github.graphql import GraphQLClient
+from gh_year_end.github.ratelimit import AdaptiveRateLimiter
+from gh_year_end.github.rest import RestClient
+from gh_year_end.storage.checkpoint import CheckpointManager
+from gh_year_end.storage.paths import PathManager
+from gh_year_end.storage.writer import AsyncJSONLWriter
+
+logger = logging.getLogger(__name__)
+
+# Checkpoint/progress phase -> (stats key in run_collection, item count key)
+PIPELINE_PHASES = {
+    "repo_metadata": ("repos", "repos_processed"),
+    "pulls": ("pulls", "pulls_collected"),
+    "issues": ("issues", "issues_collected"),
+    "reviews": ("reviews", "reviews_collected"),
+    "comments": ("comments", "total_comments"),
+    "commits": ("commits", "commits_collected"),
+    "branch_protection": ("hygiene", "repos_processed"),
+    "security_features": ("security_features", "repos_processed"),
+}
+
+# Node phase -> checkpoint phase it belongs to
+_NODE_PHASES = {"issue_comments": "comments", "review_comments": "comments"}
+
+
+def _phase_enabled(config: Config, phase: str) -> bool:
+    """Whether a checkpoint phase is enabled in config."""
+    enable = config.collection.enable
+    if phase in ("repo_metadata", "branch_protection", "security_features"):
+        return enable.hygiene
+    return bool(getattr(enable, phase))
+
+
+async def run_pipelined_collection(
+    config: Config,
+    repos: list[dict[str, Any]],
+    rest_client: RestClient,
+    graphql_client: GraphQLClient,
+    rate_limiter: AdaptiveRateLimiter,
+    paths: PathManager,
+    checkpoint: CheckpointManager,
+    progress: ProgressTracker,
+    collect_repos_parallel: Any,  # Function for parallel processing
+    catalog: CollectionCatalog | None = None,
+    store: RepoStore | None = None,
+) -> dict[str, Any]:
+    """Run every per-repo collection phase as a dependency graph.
+
+    Args:
+        config: Application configuration.
+        repos: List of discovered repositories.
+        rest_client: REST client for API calls.
+        graphql_client: GraphQL client for repo metadata.
+        rate_limiter: Rate limiter for API calls.
+        paths: Path manager for storage.
+        checkpoint: Checkpoint manager for resume support.
+        progress: Progress tracker.
+        collect_repos_parallel: Helper used for per-repo pull collection.
+        catalog: Catalog the pulls and issues nodes publish keys to for their
+            dependents (a new one is used if omitted).
+        store: Per-run repo store shared by the repo metadata and security
+            features nodes (security features wait for repo metadata so they
+            can reuse what it learned).
+
+    Returns:
+        Stats keyed like run_collection's phase stats (repos, pulls, issues,
+        reviews, comments, commits, hygiene, security_features).
+    """
+    scheduler_config = config.collection.scheduler
+    if catalog is None:
+        catalog = CollectionCatalog()
+    limits = {
+        ResourceClass.REST: scheduler_config.rest_concurrency or config.rate_limit.max_concurrency,
+        ResourceClass.GRAPHQL: scheduler_config.graphql_concurrency,
+    }
+
+    stats: dict[str, Any] = {}
+    scheduled: set[str] = set()
+    for phase, (stats_key, count_key) in PIPELINE_PHASES.items():
+        if not _phase_enabled(config, phase):
+            logger.info("Skipping %s (disabled in config)", phase)
+        elif checkpoint.is_phase_complete(phase):
+            logger.info("Phase %s already complete, skipping", phase)
+        else:
+            scheduled.add(phase)
+            checkpoint.set_current_phase(phase)
+            stats[stats_key] = {}
+            continue
+        stats[stats_key] = {count_key: 0, "skipped": True}
+        progress.mark_phase_complete(phase)
+
+    if "comments" in scheduled:
+        stats["comments"] = {"issue_comments": {}, "review_comments": {}}
+
+    remaining: dict[str, int] = {}
+    failed: set[str] = set()
+
+    def on_finish(node: PhaseNode, succeeded: bool) -> None:
+        phase = _NODE_PHASES.get(node.phase, node.phase)
+        if not succeeded:
+            failed.add(phase)
+        remaining[phase] -= 1
+        if remaining[phase] == 0:
+            if phase in failed:
+                logger.warning("Phase %s incomplete; failed repos retry on resume", phase)
+            else:
+                checkpoint.mark_phase_complete(phase)
+            progress.mark_phase_complete(phase)
+
+    scheduler = PhaseScheduler(limits, on_finish=on_finish)
+    writer = AsyncJSONLWriter(paths.raw_root / "repo_metadata.jsonl")
+    hygiene_engine = None
+    if "repo_metadata" in scheduled:
+        hygiene_engine = build_hygiene_engine(config, paths, graphql_client=graphql_client)
+
+    def add(
+        phase: str,
+        repo: str,
+        resource: ResourceClass,
+        run: Callable[[], Awaitable[dict[str, Any]]],
+        after: tuple[str, ...] = (),
+    ) -> None:
+        deps = [(dep, repo) for dep in after if dep in scheduled]
+        scheduler.add(phase, repo, resource, run, depends_on=deps)
+        checkpoint_phase = _NODE_PHASES.get(phase, phase)
+        remaining[checkpoint_phase] = remaining.get(checkpoint_phase, 0) + 1
+
+    for repo in repos:
+        name = repo["full_name"]
+        single = [repo]
+        if "repo_metadata" in scheduled:
+            add(
+                "repo_metadata",
+                name,
+                ResourceClass.GRAPHQL,
+                bind(
+                    collect_repo_metadata,
+                    repos=single,
+                    graphql_client=graphql_client,
+                    writer=writer,
+                    rate_limiter=rate_limiter,
+                    config=config,
+                    engine=hygiene_engine,
+                    store=store,
+                ),
+            )
+        if "pulls" in scheduled:
+            add(
+                "pulls",
+                name,
+                ResourceClass.REST,
+                bind(
+                    collect_repos_parallel,
+                    repos=single,
+                    collect_fn=collect_single_repo_pulls,
+                    endpoint_name="pulls",
+                    checkpoint=checkpoint,
+                    max_concurrency=1,
+                    rest_client=rest_client,
+                    paths=paths,
+                    config=config,
+                    catalog=catalog,
+                ),
+            )
+        common = {
+            "repos": single,
+            "rest_client": rest_client,
+            "paths": paths,
+            "rate_limiter": rate_limiter,
+            "config": config,
+            "checkpoint": checkpoint,
+        }
+        if "issues" in scheduled:
+            add(
+                "issues",
+                name,
+                ResourceClass.REST,
+                bind(collect_issues, **common, catalog=catalog),
+            )
+        if "reviews" in scheduled:
+            add(
+                "reviews",
+                name,
+                ResourceClass.REST,
+                bind(
+                    _collect_reviews,
+                    repo=repo,
+                    common=common,
+                    catalog=catalog,
+                    graphql_client=graphql_client,
+                ),
+                ("pulls",),
+            )
+        if "comments" in scheduled:
+            add(
+                "issue_comments",
+                name,
+                ResourceClass.REST,
+                bind(_collect_issue_comments, repo=repo, common=common, catalog=catalog),
+                ("issues",),
+            )
+            add(
+                "review_comments",
+                name,
+                ResourceClass.REST,
+                bind(_collect_review_comments, repo=repo, common=common, catalog=catalog),
+                ("pulls",),
+            )
+        if "commits" in scheduled:
+            add("commits", name, ResourceClass.REST, bind(collect_commits, **common))
+        if "security_features" in scheduled:
+            add(
+                "security_features",
+                name,
+                ResourceClass.REST,
+                bind(
+                    collect_security_features,
+                    repos=single,
+                    rest_client=rest_client,
+                    paths=paths,
+                    config=config,
+                    checkpoint=checkpoint,
+                    store=store,
+                ),
+                ("repo_metadata",),
+            )
+
+    if "branch_protection" in scheduled:
+
+        async def branch_protection() -> dict[str, Any]:
+            return await collect_branch_protection(
+                repos=repos,
+                rest_client=rest_client,
+                path_manager=paths,
+                config=config,
+                checkpoint=checkpoint,
+            )
+
+        add("branch_protection", GLOBAL, ResourceClass.REST, branch_protection)
+
+    # Phases with no nodes (no repos) are trivially complete
+    for phase in scheduled - remaining.keys():
+        checkpoint.mark_phase_complete(phase)
+        progress.mark_phase_complete(phase)
+
+    logger.info("=" * 80)
+    logger.info(
+        "Pipelined collection: %d nodes across %d repos (limits: %s)",
+        len(scheduler),
+        len(repos),
+        ", ".join(f"{resource}={limit}" for resource, limit in limits.items()),
+    )
+    logger.info("=" * 80)
+    progress.set_phase("pipeline")
+
+    if "repo_metadata" in scheduled:
+        async with writer:
+            outcome = await scheduler.run()
+        if hygiene_engine is not None:
+            hygiene_engine.save()
+    else:
+        outcome = await scheduler.run()
+
+    for (phase, _repo), result in outcome.results.items():
+        if phase in _NODE_PHASES:
+            merge_stats(stats["comments"][phase], result)
+        else:
+            merge_stats(stats[PIPELINE_PHASES[phase][0]], result)
+
+    if "comments" in scheduled:
+        stats["comments"]["total_comments"] = stats["comments"]["issue_comments"].get(
+            "comments_collected", 0
+        ) + stats["comments"]["review_comments"].get("comments_collected", 0)
+
+    for phase in scheduled:
+        stats_key, count_key = PIPELINE_PHASES[phase]
+        if phase not in ("repo_metadata", "branch_protection", "security_features"):
+            progress.update_items_collected(phase, stats[stats_key].get(count_key, 0))
+
+    if outcome.failures:
+        stats["pipeline_failures"] = {
+            f"{phase}:{repo or 'all'}": str(error)
+            for (phase, repo), error in outcome.failures.items()
+        }
+
+    logger.info(
+        "Pipelined collection complete: %d nodes succeeded, %d failed",
+        len(outcome.results),
+        len(outcome.failures),
+    )
+    return stats
+
+
+def bind(
+    fn: Callable[..., Awaitable[dict[str, Any]]], **kwargs: Any
+) -> Callable[[], Awaitable[dict[str, Any]]]:
+    """Bind keyword arguments to a collector, producing a node coroutine factory."""
+    return lambda: fn(**kwargs)
+
+
+async def _collect_reviews(
+    repo: dict[str, Any],
+    common: dict[str, Any],
+    catalog: CollectionCatalog,
+    graphql_client: GraphQLClient,
+) -> dict[str, Any]:
+    """Collect reviews for one repo from its published PR numbers."""
+    pr_numbers = await collected_pr_numbers([repo], common["paths"], catalog)
+    return await collect_reviews(
+        **common, pr_numbers_by_repo=pr_numbers, graphql_client=graphql_client
+    )
+
+
+async def _collect_issue_comments(
+    repo: dict[str, Any], common: dict[str, Any], catalog: CollectionCatalog
+) -> dict[str, Any]:
+    """Collect issue comments for one repo from its published issue numbers."""
+    issue_numbers = await collected_issue_numbers([repo], common["paths"], catalog)
+    return await collect_issue_comments(**common, issue_numbers_by_repo=issue_numbers)
+
+
+async def _collect_review_comments(
+    repo: dict[str, Any], common: dict[str, Any], catalog: CollectionCatalog
+) -> dict[str, Any]:
+    """Collect review comments for one repo from its published PR numbers."""
+    pr_numbers = await collected_pr_numbers([repo], common["paths"], catalog)
+    return await collect_review_comments(**common, pr_numbers_by_repo=pr_numbers)
@@ -6,6 +6,7 @@ Collects pull requests from all repositories in parallel.
 import logging
 from typing import Any
 
+from gh_year_end.collect.catalog import CollectionCatalog
 from gh_year_end.collect.progress import ProgressTracker
 from gh_year_end.collect.pulls import collect_single_repo_pulls
 from gh_year_end.config import Config
@@ -24,6 +25,7 @@ async def run_pulls_phase(
     checkpoint: CheckpointManager,
     progress: ProgressTracker,
     collect_repos_parallel: Any,  # Function for parallel processing
+    catalog: CollectionCatalog | None = None,
 ) -> dict[str, Any]:
     """Run pull request collection phase.
 
@@ -35,6 +37,7 @@ async def run_pulls_phase(
         checkpoint: Checkpoint manager for resume support.
         progress: Progress tracker.
         collect_repos_parallel: Helper function for parallel repo processing.
+        catalog: Catalog to publish collected PR keys to.
 
     Returns:
         Stats dict with collection results.
@@ -71,6 +74,7 @@ async def run_pulls_phase(
         rest_client=rest_client,
         paths=paths,
         config=config,
+        catalog=catalog,
     )
 
     checkpoint.mark_phase_complete("pulls")
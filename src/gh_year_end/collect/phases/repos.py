@@ -6,7 +6,9 @@ Collects detailed metadata for all discovered repositories.
 import logging
 from typing import Any
 
+from gh_year_end.collect.hygiene_engine import build_hygiene_engine
 from gh_year_end.collect.progress import ProgressTracker
+from gh_year_end.collect.repo_store import RepoStore
 from gh_year_end.collect.repos import collect_repo_metadata
 from gh_year_end.config import Config
 from gh_year_end.github.graphql import GraphQLClient
@@ -26,6 +28,7 @@ async def run_repo_metadata_phase(
     paths: PathManager,
     checkpoint: CheckpointManager,
     progress: ProgressTracker,
+    store: RepoStore | None = None,
 ) -> dict[str, Any]:
     """Run repository metadata collection phase.
 
@@ -37,6 +40,7 @@ async def run_repo_metadata_phase(
         paths: Path manager for storage.
         checkpoint: Checkpoint manager for resume support.
         progress: Progress tracker.
+        store: Per-run repo store enriched with facts from the metadata query.
 
     Returns:
         Stats dict with collection results.
@@ -59,6 +63,7 @@ async def run_repo_metadata_phase(
 
     # Open writer for repo metadata
     repo_metadata_path = paths.raw_root / "repo_metadata.jsonl"
+    engine = build_hygiene_engine(config, paths, graphql_client=graphql_client)
     async with AsyncJSONLWriter(repo_metadata_path) as writer:
         repo_stats = await collect_repo_metadata(
             repos=repos,
@@ -66,7 +71,10 @@ async def run_repo_metadata_phase(
             writer=writer,
             rate_limiter=rate_limiter,
             config=config,
+            engine=engine,
+            store=store,
         )
+    engine.save()
 
     checkpoint.mark_phase_complete("repo_metadata")
     progress.mark_phase_complete("repo_metadata")
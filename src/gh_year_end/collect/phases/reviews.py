@@ -6,9 +6,12 @@ Collects pull request reviews from all repositories.
 import logging
 from typing import Any
 
+from gh_year_end.collect.catalog import CollectionCatalog
+from gh_year_end.collect.phases.comments import collected_pr_numbers
 from gh_year_end.collect.progress import ProgressTracker
 from gh_year_end.collect.reviews import collect_reviews
 from gh_year_end.config import Config
+from gh_year_end.github.graphql import GraphQLClient
 from gh_year_end.github.ratelimit import AdaptiveRateLimiter
 from gh_year_end.github.rest import RestClient
 from gh_year_end.storage.checkpoint import CheckpointManager
@@ -25,6 +28,8 @@ async def run_reviews_phase(
     paths: PathManager,
     checkpoint: CheckpointManager,
     progress: ProgressTracker,
+    catalog: CollectionCatalog | None = None,
+    graphql_client: GraphQLClient | None = None,
 ) -> dict[str, Any]:
     """Run review collection phase.
 
@@ -36,6 +41,8 @@ async def run_reviews_phase(
         paths: Path manager for storage.
         checkpoint: Checkpoint manager for resume support.
         progress: Progress tracker.
+        catalog: Catalog of PR keys published by the pulls phase.
+        graphql_client: GraphQL client for work stealing (rate_limit.work_stealing).
 
     Returns:
         Stats dict with collection results.
@@ -56,13 +63,19 @@ async def run_reviews_phase(
     logger.info("=" * 80)
     checkpoint.set_current_phase("reviews")
 
+    # Without a catalog, collect_reviews reads PR numbers from the raw files itself
+    pr_numbers_by_repo = (
+        await collected_pr_numbers(repos, paths, catalog) if catalog is not None else None
+    )
     review_stats = await collect_reviews(
         repos=repos,
         rest_client=rest_client,
         paths=paths,
         rate_limiter=rate_limiter,
         config=config,
+        pr_numbers_by_repo=pr_numbers_by_repo,
         checkpoint=checkpoint,
+        graphql_client=graphql_client,
     )
 
     checkpoint.mark_phase_complete("reviews")
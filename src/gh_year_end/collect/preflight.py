@@ -0,0 +1,534 @@
+"""Pre-flight request budget planning.
+
+Before collection starts, one batched GraphQL query per ``batch_size`` repos
+reads totalCounts (PRs and issues, all-time and created in the window, and
+default-branch commits in the window). A cost model mirroring the calls the
+collectors make turns those counts into REST requests and GraphQL points per
+phase and per repo:
+
+- pulls: one page of 100 per listing (all states, all time)
+- issues: one page of 100 per listing (the issues endpoint also returns PRs)
+- reviews: one listing per PR created in the window
+- comments: one listing per issue and per PR created in the window
+- commits: one page of 100 per listing (capped by commits.max_pages)
+- hygiene (single-pass): branch protection, file lookup, and security analysis
+- repo_metadata: GraphQL metadata, protection, and one batched file lookup
+- branch_protection and security_features: REST per sampled or listed repo
+
+The plan compares the totals with the remaining budgets and reset times. It
+reports whether the run fits in the current rate-limit window, how many
+windows or full-budget tokens it needs, and the request interval that spreads
+it evenly so it never stalls on an exhausted budget.
+"""
+
+import logging
+import math
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from rich.table import Table
+
+from gh_year_end.collect.sampling import sample_size
+from gh_year_end.config import Config, SamplingConfig
+from gh_year_end.github.graphql import GraphQLClient, GraphQLError
+from gh_year_end.github.http import GitHubClient
+from gh_year_end.github.ratelimit import AdaptiveRateLimiter, APIType
+
+logger = logging.getLogger(__name__)
+
+PER_PAGE = 100
+
+# GitHub rate limits reset hourly
+WINDOW_SECONDS = 3600
+
+# Requests made per repo by the single-pass hygiene step
+INLINE_HYGIENE_REQUESTS = 3
+
+# GraphQL queries per repo in the repo metadata phase
+REPO_METADATA_QUERIES = 3
+
+# Contributor stats: the first request (usually 202 Accepted) and one poll
+CONTRIBUTOR_STATS_REQUESTS = 2
+
+# Requests made per repo by the security features phase
+SECURITY_FEATURES_REQUESTS = 2
+
+# Phases run by collect_and_aggregate, and by run_collection
+SINGLE_PASS_PHASES = ("pulls", "reviews", "issues", "comments", "contributor_stats", "hygiene")
+PHASED_PHASES = (
+    "repo_metadata",
+    "pulls",
+    "issues",
+    "reviews",
+    "comments",
+    "commits",
+    "branch_protection",
+    "security_features",
+)
+
+_HYGIENE_PHASES = ("hygiene", "repo_metadata", "branch_protection", "security_features")
+
+
+@dataclass(frozen=True, slots=True)
+class RepoCounts:
+    """Collection-size counts for one repository.
+
+    Attributes:
+        pulls_total: All PRs, any state.
+        issues_total: All issues (excluding PRs), any state.
+        pulls_window: PRs created in the collection window.
+        issues_window: Issues created in the collection window.
+        commits_window: Default-branch commits in the collection window.
+    """
+
+    pulls_total: int = 0
+    issues_total: int = 0
+    pulls_window: int = 0
+    issues_window: int = 0
+    commits_window: int = 0
+
+
+@dataclass
+class RepoEstimate:
+    """Estimated cost of collecting one repository.
+
+    Attributes:
+        repo: Repository full name.
+        counts: Counts the estimate is based on (None if the repo did not
+            resolve, in which case only count-independent work is included).
+        rest: REST requests by phase.
+        graphql: GraphQL points by phase.
+    """
+
+    repo: str
+    counts: RepoCounts | None
+    rest: dict[str, int] = field(default_factory=dict)
+    graphql: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rest_requests(self) -> int:
+        return sum(self.rest.values())
+
+    @property
+    def graphql_points(self) -> int:
+        return sum(self.graphql.values())
+
+
+@dataclass(frozen=True, slots=True)
+class Budget:
+    """Snapshot of one API's rate-limit budget.
+
+    Attributes:
+        limit: Requests (or points) per window.
+        remaining: Remaining in the current window.
+        seconds_until_reset: Seconds until the window resets.
+    """
+
+    limit: int
+    remaining: int
+    seconds_until_reset: float
+
+
+@dataclass
+class CollectionPlan:
+    """Estimated cost of a collection run against the available budgets.
+
+    Attributes:
+        repos: Per-repo estimates, in discovery order.
+        rest_by_phase: Total REST requests by phase.
+        graphql_by_phase: Total GraphQL points by phase.
+        budgets: Budget snapshot per API, taken after planning.
+        preflight_points: GraphQL points spent on planning itself.
+        unresolved: Repos whose counts could not be read.
+    """
+
+    repos: list[RepoEstimate]
+    rest_by_phase: dict[str, int]
+    graphql_by_phase: dict[str, int]
+    budgets: dict[APIType, Budget]
+    preflight_points: int = 0
+    unresolved: list[str] = field(default_factory=list)
+
+    def cost(self, api_type: APIType) -> int:
+        """Planned requests (REST) or points (GraphQL) for the run."""
+        by_phase = self.rest_by_phase if api_type == APIType.REST else self.graphql_by_phase
+        return sum(by_phase.values())
+
+    def fits_in_window(self, api_type: APIType) -> bool:
+        """Whether the run fits in what is left of the current window."""
+        return self.cost(api_type) <= self.budgets[api_type].remaining
+
+    def resets_needed(self, api_type: APIType) -> int:
+        """Number of window resets the run has to wait for."""
+        budget = self.budgets[api_type]
+        overflow = self.cost(api_type) - budget.remaining
+        if overflow <= 0:
+            return 0
+        return math.ceil(overflow / max(budget.limit, 1))
+
+    def tokens_needed(self, api_type: APIType) -> int:
+        """Tokens with a full budget needed to finish within one window."""
+        return max(1, math.ceil(self.cost(api_type) / max(self.budgets[api_type].limit, 1)))
+
+    def budget_seconds(self, api_type: APIType) -> float:
+        """Lower bound on run time imposed by the budget (0 if it fits)."""
+        resets = self.resets_needed(api_type)
+        if resets == 0:
+            return 0.0
+        return self.budgets[api_type].seconds_until_reset + (resets - 1) * WINDOW_SECONDS
+
+    def pace_interval(self, api_type: APIType) -> float:
+        """Seconds between requests that spread the run evenly over its budget time.
+
+        Zero when the run fits in the current window (no pacing needed).
+        """
+        cost = self.cost(api_type)
+        if cost == 0:
+            return 0.0
+        return self.budget_seconds(api_type) / cost
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable summary."""
+        return {
+            "repos": len(self.repos),
+            "unresolved": self.unresolved,
+            "preflight_points": self.preflight_points,
+            "rest_by_phase": self.rest_by_phase,
+            "graphql_by_phase": self.graphql_by_phase,
+            "apis": {
+                api_type.value: {
+                    "cost": self.cost(api_type),
+                    "limit": self.budgets[api_type].limit,
+                    "remaining": self.budgets[api_type].remaining,
+                    "fits_in_window": self.fits_in_window(api_type),
+                    "resets_needed": self.resets_needed(api_type),
+                    "tokens_needed": self.tokens_needed(api_type),
+                    "budget_seconds": round(self.budget_seconds(api_type), 1),
+                }
+                for api_type in APIType
+            },
+        }
+
+
+def _pages(count: int, max_pages: int | None = None) -> int:
+    """Listing requests for ``count`` items (an empty listing is one request)."""
+    pages = max(1, math.ceil(count / PER_PAGE))
+    return min(pages, max_pages) if max_pages is not None else pages
+
+
+def planned_phases(config: Config, phases: Iterable[str]) -> list[str]:
+    """Phases from ``phases`` that are enabled in config."""
+    enable = config.collection.enable
+
+    def enabled(phase: str) -> bool:
+        if phase in _HYGIENE_PHASES:
+            return enable.hygiene
+        if phase == "contributor_stats":
+            return enable.commits and config.collection.commits.contributor_stats
+        return bool(getattr(enable, phase))
+
+    return [phase for phase in phases if enabled(phase)]
+
+
+def _fan_out(items: int, sampling: SamplingConfig, rate: float) -> int:
+    """Per-item requests for reviews or comments, sampled when sampling is enabled.
+
+    Strata are unknown before collection, so the items are treated as one stratum.
+    """
+    if not sampling.enabled:
+        return items
+    return sample_size(items, rate, sampling.min_per_stratum)
+
+
+def estimate_repo(
+    repo: str, counts: RepoCounts | None, config: Config, phases: Iterable[str]
+) -> RepoEstimate:
+    """Estimate the cost of collecting one repository.
+
+    Args:
+        repo: Repository full name.
+        counts: Counts for the repo (None if unknown).
+        config: Application configuration.
+        phases: Enabled phases to include.
+
+    Returns:
+        Per-phase REST and GraphQL estimate. Org-wide branch protection
+        sampling is not included (see ``build_plan``).
+    """
+    c = counts or RepoCounts()
+    sampling = config.collection.sampling
+    estimate = RepoEstimate(repo=repo, counts=counts)
+    for phase in phases:
+        if phase == "pulls":
+            estimate.rest[phase] = _pages(c.pulls_total)
+        elif phase == "issues":
+            estimate.rest[phase] = _pages(c.issues_total + c.pulls_total)
+        elif phase == "reviews":
+            estimate.rest[phase] = _fan_out(c.pulls_window, sampling, sampling.reviews_rate)
+        elif phase == "comments":
+            estimate.rest[phase] = _fan_out(
+                c.issues_window, sampling, sampling.comments_rate
+            ) + _fan_out(c.pulls_window, sampling, sampling.comments_rate)
+        elif phase == "commits":
+            estimate.rest[phase] = _pages(c.commits_window, config.collection.commits.max_pages)
+        elif phase == "contributor_stats":
+            estimate.rest[phase] = CONTRIBUTOR_STATS_REQUESTS
+        elif phase == "hygiene":
+            estimate.rest[phase] = INLINE_HYGIENE_REQUESTS
+        elif phase == "security_features":
+            estimate.rest[phase] = SECURITY_FEATURES_REQUESTS
+        elif phase == "repo_metadata":
+            # Metadata, branch protection, and one batched file lookup
+            estimate.graphql[phase] = REPO_METADATA_QUERIES
+    return estimate
+
+
+def build_plan(
+    repos: list[dict[str, Any]],
+    counts: dict[str, RepoCounts | None],
+    rate_limiter: AdaptiveRateLimiter,
+    config: Config,
+    phases: Iterable[str] = SINGLE_PASS_PHASES,
+    preflight_points: int = 0,
+) -> CollectionPlan:
+    """Combine per-repo estimates with the current budgets.
+
+    Args:
+        repos: Discovered repositories.
+        counts: Counts by repo full name (missing or None means unknown).
+        rate_limiter: Rate limiter holding the current budgets.
+        config: Application configuration.
+        phases: Phases the run will execute (filtered by config).
+        preflight_points: GraphQL points already spent on planning.
+
+    Returns:
+        The collection plan.
+    """
+    enabled = planned_phases(config, phases)
+    estimates = [
+        estimate_repo(repo["full_name"], counts.get(repo["full_name"]), config, enabled)
+        for repo in repos
+    ]
+
+    rest_by_phase: dict[str, int] = {}
+    graphql_by_phase: dict[str, int] = {}
+    for estimate in estimates:
+        for phase, requests in estimate.rest.items():
+            rest_by_phase[phase] = rest_by_phase.get(phase, 0) + requests
+        for phase, points in estimate.graphql.items():
+            graphql_by_phase[phase] = graphql_by_phase.get(phase, 0) + points
+
+    if "branch_protection" in enabled:
+        protection = config.collection.hygiene.branch_protection
+        if protection.mode == "sample":
+            rest_by_phase["branch_protection"] = min(protection.sample_count, len(repos))
+        elif protection.mode == "best_effort":
+            rest_by_phase["branch_protection"] = len(repos)
+
+    budgets = {}
+    for api_type in APIType:
+        state = rate_limiter.get_state(api_type)
+        reset_known = state.reset_at > 0
+        budgets[api_type] = Budget(
+            limit=state.limit,
+            remaining=state.remaining,
+            seconds_until_reset=state.seconds_until_reset if reset_known else WINDOW_SECONDS,
+        )
+
+    return CollectionPlan(
+        repos=estimates,
+        rest_by_phase=rest_by_phase,
+        graphql_by_phase=graphql_by_phase,
+        budgets=budgets,
+        preflight_points=preflight_points,
+        unresolved=[e.repo for e in estimates if e.counts is None],
+    )
+
+
+async def fetch_repo_counts(
+    graphql_client: GraphQLClient,
+    repos: list[dict[str, Any]],
+    config: Config,
+    batch_size: int = 20,
+) -> tuple[dict[str, RepoCounts | None], int]:
+    """Read counts for every repo with batched GraphQL queries.
+
+    Args:
+        graphql_client: GraphQL client.
+        repos: Discovered repositories.
+        config: Application configuration (for the collection window).
+        batch_size: Repos per query.
+
+    Returns:
+        (counts by repo full name, None for repos that did not resolve or
+        whose batch failed; total query point cost).
+    """
+    windows = config.github.windows
+    names = [repo["full_name"] for repo in repos]
+    counts: dict[str, RepoCounts | None] = {}
+    points = 0
+    for start in range(0, len(names), batch_size):
+        batch = names[start : start + batch_size]
+        try:
+            result, cost = await graphql_client.query_repo_counts(
+                batch, windows.since, windows.until
+            )
+        except GraphQLError as e:
+            logger.warning("Pre-flight count query failed for %d repos: %s", len(batch), e)
+            counts.update(dict.fromkeys(batch))
+            continue
+        points += cost
+        for name in batch:
+            raw = result.get(name)
+            counts[name] = RepoCounts(**raw) if raw is not None else None
+    return counts, points
+
+
+async def refresh_budgets(http_client: GitHubClient, rate_limiter: AdaptiveRateLimiter) -> None:
+    """Load current REST and GraphQL budgets from /rate_limit (free to call).
+
+    Args:
+        http_client: HTTP client.
+        rate_limiter: Rate limiter whose state is updated.
+    """
+    response = await http_client.get("/rate_limit")
+    if not response.is_success or not isinstance(response.data, dict):
+        logger.debug("Could not read /rate_limit (status %d)", response.status_code)
+        return
+    resources = response.data.get("resources", {})
+    for api_type, key in ((APIType.REST, "core"), (APIType.GRAPHQL, "graphql")):
+        resource = resources.get(key)
+        if resource:
+            rate_limiter.update(
+                {
+                    "x-ratelimit-limit": str(resource["limit"]),
+                    "x-ratelimit-remaining": str(resource["remaining"]),
+                    "x-ratelimit-reset": str(resource["reset"]),
+                },
+                api_type,
+            )
+
+
+async def plan_collection(
+    config: Config,
+    repos: list[dict[str, Any]],
+    http_client: GitHubClient,
+    graphql_client: GraphQLClient,
+    rate_limiter: AdaptiveRateLimiter,
+    phases: Iterable[str] = SINGLE_PASS_PHASES,
+) -> CollectionPlan:
+    """Run the pre-flight count queries and build a collection plan.
+
+    Args:
+        config: Application configuration.
+        repos: Discovered repositories.
+        http_client: HTTP client (for /rate_limit).
+        graphql_client: GraphQL client for the count queries.
+        rate_limiter: Rate limiter holding the budgets.
+        phases: Phases the run will execute.
+
+    Returns:
+        The collection plan.
+    """
+    started = time.monotonic()
+    counts, points = await fetch_repo_counts(
+        graphql_client, repos, config, config.collection.preflight.batch_size
+    )
+    await refresh_budgets(http_client, rate_limiter)
+    plan = build_plan(repos, counts, rate_limiter, config, phases, preflight_points=points)
+    logger.info(
+        "Pre-flight plan for %d repos in %.1fs: %d REST requests, %d GraphQL points "
+        "(REST fits in window: %s, GraphQL fits in window: %s)",
+        len(repos),
+        time.monotonic() - started,
+        plan.cost(APIType.REST),
+        plan.cost(APIType.GRAPHQL),
+        plan.fits_in_window(APIType.REST),
+        plan.fits_in_window(APIType.GRAPHQL),
+    )
+    return plan
+
+
+def apply_pacing(plan: CollectionPlan, rate_limiter: AdaptiveRateLimiter) -> None:
+    """Pace each API so the run spreads evenly over its budget instead of stalling.
+
+    Args:
+        plan: Collection plan.
+        rate_limiter: Rate limiter to pace.
+    """
+    for api_type in APIType:
+        rate_limiter.set_pace(api_type, plan.pace_interval(api_type))
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    hours, rest = divmod(int(seconds), 3600)
+    return f"{hours}h {rest // 60}m" if hours else f"{rest // 60}m"
+
+
+def render_plan(plan: CollectionPlan, top: int = 10) -> list[Table]:
+    """Render a plan as rich tables (phases, budgets, most expensive repos).
+
+    Args:
+        plan: Collection plan.
+        top: Number of most expensive repos to list.
+
+    Returns:
+        Tables to print.
+    """
+    phases = Table(title="Estimated cost by phase")
+    phases.add_column("Phase")
+    phases.add_column("REST requests", justify="right")
+    phases.add_column("GraphQL points", justify="right")
+    for phase in sorted(plan.rest_by_phase.keys() | plan.graphql_by_phase.keys()):
+        phases.add_row(
+            phase,
+            f"{plan.rest_by_phase.get(phase, 0):,}",
+            f"{plan.graphql_by_phase.get(phase, 0):,}",
+        )
+    phases.add_row(
+        "[bold]total[/bold]",
+        f"[bold]{plan.cost(APIType.REST):,}[/bold]",
+        f"[bold]{plan.cost(APIType.GRAPHQL):,}[/bold]",
+    )
+
+    budgets = Table(title="Budget")
+    for column in ("API", "Cost", "Remaining", "Fits in window", "Resets", "Tokens", "Pace"):
+        budgets.add_column(column, justify="left" if column == "API" else "right")
+    for api_type in APIType:
+        budget = plan.budgets[api_type]
+        fits = plan.fits_in_window(api_type)
+        interval = plan.pace_interval(api_type)
+        budgets.add_row(
+            api_type.value,
+            f"{plan.cost(api_type):,}",
+            f"{budget.remaining:,}/{budget.limit:,}",
+            "[green]yes[/green]" if fits else "[red]no[/red]",
+            "0"
+            if fits
+            else f"{plan.resets_needed(api_type)} (~{_format_seconds(plan.budget_seconds(api_type))})",
+            str(plan.tokens_needed(api_type)),
+            f"{interval:.2f}s/req" if interval else "-",
+        )
+
+    repos = Table(title=f"Most expensive repos (of {len(plan.repos)})")
+    repos.add_column("Repository")
+    repos.add_column("PRs", justify="right")
+    repos.add_column("Issues", justify="right")
+    repos.add_column("REST requests", justify="right")
+    repos.add_column("GraphQL points", justify="right")
+    ranked = sorted(plan.repos, key=lambda e: e.rest_requests + e.graphql_points, reverse=True)
+    for estimate in ranked[:top]:
+        counts = estimate.counts
+        repos.add_row(
+            estimate.repo,
+            str(counts.pulls_window) if counts else "?",
+            str(counts.issues_window) if counts else "?",
+            f"{estimate.rest_requests:,}",
+            f"{estimate.graphql_points:,}",
+        )
+
+    return [phases, budgets, repos]
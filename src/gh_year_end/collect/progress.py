@@ -26,6 +26,8 @@ from rich.progress import (
 )
 from rich.table import Table
 
+from gh_year_end.telemetry import profiling, request_trace, trace_events
+
 if TYPE_CHECKING:
     from types import TracebackType
 
@@ -48,6 +50,7 @@ class ProgressStats:
     # Request tracking for ETA
     request_times: deque[float] = field(default_factory=lambda: deque(maxlen=100))
     total_requests: int = 0
+    planned_requests: int = 0
 
     # Rate limit tracking
     rate_limit_remaining: int = 5000
@@ -232,12 +235,17 @@ class ProgressTracker:
         # Estimate remaining requests
         completed = self.stats.completed_repos + self.stats.skipped_repos
         repos_remaining = self.stats.total_repos - completed
-        if repos_remaining <= 0:
+        if self.stats.planned_requests:
+            # A pre-flight plan knows the run's size before any repo completes
+            estimated_remaining_requests = float(
+                max(self.stats.planned_requests - self.stats.total_requests, 0)
+            )
+        elif repos_remaining <= 0:
             return "Almost done!"
-
-        # Estimate requests per repo based on current phase
-        requests_per_repo = self._estimate_requests_per_repo()
-        estimated_remaining_requests = repos_remaining * requests_per_repo
+        else:
+            # Estimate requests per repo based on current phase
+            requests_per_repo = self._estimate_requests_per_repo()
+            estimated_remaining_requests = repos_remaining * requests_per_repo
 
         # Calculate ETA including rate limit waits
         estimated_seconds = estimated_remaining_requests * avg_request_time
@@ -272,6 +280,10 @@ class ProgressTracker:
         """
         self.stats.current_phase = phase
         self.stats.phase_start_time = time.time()
+        # Requests traced from here on are attributed to this phase
+        request_trace.set_phase(phase)
+        trace_events.set_phase(phase)
+        profiling.set_phase(phase)
 
         if self._progress and self._overall_task is not None:
             completed = len(self._completed_phases)
@@ -290,6 +302,8 @@ class ProgressTracker:
             phase: Phase name.
         """
         self._completed_phases.add(phase)
+        trace_events.end_phase(phase)
+        profiling.end_phase(phase)
 
         if self._progress and self._overall_task is not None:
             self._progress.update(
@@ -354,6 +368,15 @@ class ProgressTracker:
         self.stats.items_collected[item_type] = current + count
         self.update_display()
 
+    def set_planned_requests(self, total: int) -> None:
+        """Set the run's estimated request count from a pre-flight plan.
+
+        Args:
+            total: Planned REST requests for the whole run.
+        """
+        self.stats.planned_requests = total
+        self.update_display()
+
     def set_total_repos(self, total: int) -> None:
         """Set the total number of repos.
 
@@ -10,9 +10,11 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from gh_year_end.collect.catalog import PULLS
 from gh_year_end.storage.writer import AsyncJSONLWriter
 
 if TYPE_CHECKING:
+    from gh_year_end.collect.catalog import CollectionCatalog
     from gh_year_end.config import Config
     from gh_year_end.github.rest import RestClient
     from gh_year_end.storage.checkpoint import CheckpointManager
@@ -31,6 +33,7 @@ async def collect_single_repo_pulls(
     paths: PathManager,
     config: Config,
     checkpoint: CheckpointManager | None = None,
+    catalog: CollectionCatalog | None = None,
 ) -> dict[str, Any]:
     """Collect pull requests for a single repository.
 
@@ -42,6 +45,7 @@ async def collect_single_repo_pulls(
         paths: PathManager for storage locations.
         config: Application configuration with date filters.
         checkpoint: Optional CheckpointManager for resume support.
+        catalog: Optional catalog to publish collected PR keys to.
 
     Returns:
         Stats dictionary with:
@@ -71,7 +75,10 @@ async def collect_single_repo_pulls(
         since=since,
         until=until,
         checkpoint=checkpoint,
+        catalog=catalog,
     )
+    if catalog is not None:
+        catalog.complete(PULLS, repo_full_name)
 
     logger.debug("Collected %d PRs from %s", pr_count, repo_full_name)
 
@@ -84,6 +91,7 @@ async def collect_pulls(
     paths: PathManager,
     config: Config,
     checkpoint: CheckpointManager | None = None,
+    catalog: CollectionCatalog | None = None,
 ) -> dict[str, Any]:
     """Collect pull requests for all discovered repositories.
 
@@ -96,6 +104,7 @@ async def collect_pulls(
         paths: PathManager for storage locations.
         config: Application configuration with date filters.
         checkpoint: Optional CheckpointManager for resume support.
+        catalog: Optional catalog to publish collected PR keys to.
 
     Returns:
         Stats dictionary with:
@@ -158,7 +167,10 @@ async def collect_pulls(
                 since=since,
                 until=until,
                 checkpoint=checkpoint,
+                catalog=catalog,
             )
+            if catalog is not None:
+                catalog.complete(PULLS, repo_full_name)
 
             stats["repos_processed"] += 1
             stats["pulls_collected"] += pr_count
@@ -208,6 +220,7 @@ async def _collect_repo_pulls(
     since: datetime,
     until: datetime,
     checkpoint: CheckpointManager | None = None,
+    catalog: CollectionCatalog | None = None,
 ) -> int:
     """Collect pull requests for a single repository.
 
@@ -220,6 +233,7 @@ async def _collect_repo_pulls(
         since: Filter PRs updated after this date.
         until: Filter PRs updated before this date.
         checkpoint: Optional CheckpointManager for progress tracking.
+        catalog: Optional catalog to stage collected PR keys in.
 
     Returns:
         Number of PRs collected.
@@ -232,6 +246,8 @@ async def _collect_repo_pulls(
 
     # Ensure parent directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    if catalog is not None:
+        catalog.begin(PULLS, repo_full_name)
 
     async with AsyncJSONLWriter(output_path) as writer:
         try:
@@ -253,6 +269,8 @@ async def _collect_repo_pulls(
                         page=metadata["page"],
                     )
                     pr_count += 1
+                if catalog is not None:
+                    catalog.publish(PULLS, repo_full_name, filtered_prs)
 
                 # Update checkpoint with page progress
                 if checkpoint:
@@ -0,0 +1,100 @@
+"""Per-run store of repository payloads.
+
+Discovery lists full repository objects (``default_branch``, ``archived``,
+counts, ``pushed_at``, and ``security_and_analysis`` for admin tokens), but
+only a subset survives into the repo metadata the phases receive. Phases that
+need more used to ``GET /repos/{owner}/{repo}`` again for every repo.
+
+The store keeps the full discovery payloads for the run. Later collectors add
+facts they learn along the way (the repo metadata phase records the GraphQL
+``hasVulnerabilityAlertsEnabled`` flag), and a repo is fetched at most once,
+only when a field is missing from everything already in hand.
+"""
+
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gh_year_end.github.rest import RestClient
+
+logger = logging.getLogger(__name__)
+
+
+class RepoStore:
+    """Repository payloads keyed by full name, enriched lazily.
+
+    Example:
+        store = RepoStore()
+        store.add(raw_repos)
+        analysis = await store.field("org/repo", "security_and_analysis", rest_client)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._repos: dict[str, dict[str, Any]] = {}
+        self._fetched: set[str] = set()
+        self.hits = 0
+        self.fetches = 0
+
+    def __len__(self) -> int:
+        return len(self._repos)
+
+    def __contains__(self, full_name: object) -> bool:
+        return full_name in self._repos
+
+    def add(self, repos: Iterable[dict[str, Any]]) -> None:
+        """Merge repository payloads (later values win).
+
+        Args:
+            repos: REST repository objects (need ``full_name``).
+        """
+        for repo in repos:
+            full_name = repo.get("full_name")
+            if full_name:
+                self._repos[full_name] = {**self._repos.get(full_name, {}), **repo}
+
+    def update(self, full_name: str, facts: dict[str, Any]) -> None:
+        """Record facts learned about a repository by a later phase.
+
+        Args:
+            full_name: Repository full name.
+            facts: Field -> value to merge into the payload.
+        """
+        self._repos[full_name] = {**self._repos.get(full_name, {}), **facts}
+
+    def get(self, full_name: str) -> dict[str, Any] | None:
+        """Payload for a repository, or None if it is unknown."""
+        return self._repos.get(full_name)
+
+    async def field(self, full_name: str, name: str, rest_client: "RestClient") -> Any:
+        """A repository field, fetching the repository only if it is missing.
+
+        Args:
+            full_name: Repository full name.
+            name: Field of the REST repository object.
+            rest_client: REST client used for the fallback request.
+
+        Returns:
+            The field value, or None if the repository (or the field, e.g.
+            ``security_and_analysis`` without admin access) is unavailable.
+        """
+        payload = self._repos.get(full_name)
+        if payload is not None and name in payload:
+            self.hits += 1
+            return payload[name]
+        if full_name in self._fetched:
+            return None
+
+        owner, repo = full_name.split("/", 1)
+        self._fetched.add(full_name)
+        self.fetches += 1
+        data = await rest_client.get_repo_security_analysis(owner, repo)
+        if not data:
+            return None
+        self.update(full_name, data)
+        return data.get(name)
+
+    def stats(self) -> dict[str, int]:
+        """Repos held, fields served from the store, and repos fetched."""
+        return {"repos": len(self._repos), "hits": self.hits, "fetches": self.fetches}
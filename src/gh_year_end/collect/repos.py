@@ -7,6 +7,8 @@ branch protection, license info, and file presence indicators.
 import logging
 from typing import Any
 
+from gh_year_end.collect.hygiene_engine import HygieneEngine
+from gh_year_end.collect.repo_store import RepoStore
 from gh_year_end.config import Config
 from gh_year_end.github.graphql import GraphQLClient, GraphQLError
 from gh_year_end.github.ratelimit import AdaptiveRateLimiter
@@ -139,6 +141,7 @@ query($owner: String!, $name: String!) {
       totalCount
     }
     hasVulnerabilityAlertsEnabled
+    viewerPermission
     dependencyGraphManifests {
       totalCount
     }
@@ -179,42 +182,6 @@ query($owner: String!, $name: String!) {
 }
 """
 
-# Query for checking specific file presence
-FILE_PRESENCE_QUERY = """
-query($owner: String!, $name: String!, $expression: String!) {
-  repository(owner: $owner, name: $name) {
-    object(expression: $expression) {
-      ... on Blob {
-        id
-        byteSize
-        text
-      }
-    }
-  }
-}
-"""
-
-# Query for workflows presence
-WORKFLOWS_QUERY = """
-query($owner: String!, $name: String!) {
-  repository(owner: $owner, name: $name) {
-    defaultBranchRef {
-      target {
-        ... on Commit {
-          tree {
-            entries {
-              name
-              type
-              path
-            }
-          }
-        }
-      }
-    }
-  }
-}
-"""
-
 
 async def collect_repo_metadata(
     repos: list[dict[str, Any]],
@@ -222,6 +189,8 @@ async def collect_repo_metadata(
     writer: AsyncJSONLWriter,
     rate_limiter: AdaptiveRateLimiter,
     config: Config,
+    engine: HygieneEngine | None = None,
+    store: RepoStore | None = None,
 ) -> dict[str, Any]:
     """Collect detailed repository metadata using GraphQL.
 
@@ -231,6 +200,10 @@ async def collect_repo_metadata(
         writer: JSONL writer for raw data output.
         rate_limiter: Rate limiter for throttling.
         config: Application configuration.
+        engine: Hygiene lookup engine for file presence (a GraphQL-only,
+            uncached engine if omitted).
+        store: Per-run repo store; records the vulnerability alerts flag so
+            the security features phase need not request it again.
 
     Returns:
         Stats dictionary with counts of repos processed, errors, etc.
@@ -284,6 +257,15 @@ async def collect_repo_metadata(
             # Add basic metadata from discovery
             metadata["discovery_metadata"] = repo
 
+            # The alerts flag is only meaningful to admins (others read false)
+            alerts_enabled = metadata.get("hasVulnerabilityAlertsEnabled")
+            if (
+                store is not None
+                and metadata.get("viewerPermission") == "ADMIN"
+                and isinstance(alerts_enabled, bool)
+            ):
+                store.update(repo_name, {"vulnerability_alerts_enabled": alerts_enabled})
+
             # Try to fetch branch protection (may fail due to permissions)
             default_branch = metadata.get("defaultBranchRef", {}).get("name", "main")
             branch_protection = await _fetch_branch_protection(
@@ -310,6 +292,8 @@ async def collect_repo_metadata(
                     graphql_client=graphql_client,
                     rate_limiter=rate_limiter,
                     config=config,
+                    engine=engine,
+                    pushed_at=repo.get("pushed_at"),
                 )
                 metadata["filePresence"] = file_presence
 
@@ -460,6 +444,8 @@ async def _check_file_presence(
     graphql_client: GraphQLClient,
     rate_limiter: AdaptiveRateLimiter,
     config: Config,
+    engine: HygieneEngine | None = None,
+    pushed_at: str | None = None,
 ) -> dict[str, bool]:
     """Check presence of specific files in repository.
 
@@ -470,106 +456,39 @@ async def _check_file_presence(
         graphql_client: GraphQL client.
         rate_limiter: Rate limiter.
         config: Application configuration.
+        engine: Hygiene lookup engine (a GraphQL-only engine if omitted).
+        pushed_at: Repository ``pushed_at``, for cached lookups.
 
     Returns:
-        Dictionary mapping file paths to presence boolean.
+        Dictionary mapping file paths to presence boolean, plus
+        ``_has_workflows`` for files under the workflow prefixes.
     """
-    file_presence: dict[str, bool] = {}
-    paths_to_check = config.collection.hygiene.paths
-
-    for path in paths_to_check:
-        try:
-            expression = f"{default_branch}:{path}"
-            data = await graphql_client.execute(
-                FILE_PRESENCE_QUERY,
-                {"owner": owner, "name": name, "expression": expression},
-            )
-
-            repo_data = data.get("repository", {})
-            file_obj = repo_data.get("object")
-
-            # If object exists and has an id, file is present
-            file_presence[path] = file_obj is not None and file_obj.get("id") is not None
-
-        except GraphQLError:
-            # File doesn't exist or not accessible
-            file_presence[path] = False
-
-        except Exception as e:
-            logger.debug(
-                "Error checking file %s for %s/%s: %s",
-                path,
-                owner,
-                name,
-                e,
-            )
-            file_presence[path] = False
-
-    # Check for workflows
-    has_workflows = await _check_workflows_presence(
-        owner=owner,
-        name=name,
-        graphql_client=graphql_client,
-        rate_limiter=rate_limiter,
-        config=config,
-    )
-    file_presence["_has_workflows"] = has_workflows
-
-    return file_presence
+    hygiene = config.collection.hygiene
+    if engine is None:
+        engine = HygieneEngine(graphql_client=graphql_client)
 
-
-async def _check_workflows_presence(
-    owner: str,
-    name: str,
-    graphql_client: GraphQLClient,
-    rate_limiter: AdaptiveRateLimiter,
-    config: Config,
-) -> bool:
-    """Check if repository has any workflow files.
-
-    Args:
-        owner: Repository owner.
-        name: Repository name.
-        graphql_client: GraphQL client.
-        rate_limiter: Rate limiter.
-        config: Application configuration.
-
-    Returns:
-        True if workflows directory exists and has files.
-    """
+    facts = None
     try:
-        data = await graphql_client.execute(
-            WORKFLOWS_QUERY,
-            {"owner": owner, "name": name},
+        facts = await engine.lookup(
+            {
+                "full_name": f"{owner}/{name}",
+                "default_branch": default_branch,
+                "pushed_at": pushed_at,
+            },
+            hygiene.paths,
+            hygiene.workflow_prefixes,
         )
-
-        repo_data = data.get("repository", {})
-        default_branch = repo_data.get("defaultBranchRef", {})
-        target = default_branch.get("target", {})
-        tree = target.get("tree", {})
-        entries = tree.get("entries", [])
-
-        # Check if any entry is in .github/workflows/
-        workflow_prefixes = config.collection.hygiene.workflow_prefixes
-        for entry in entries:
-            entry_path = entry.get("path", "")
-            for prefix in workflow_prefixes:
-                if entry_path.startswith(prefix) and entry.get("type") == "blob":
-                    return True
-
-        return False
-
     except GraphQLError:
-        return False
-
+        # Repository or branch not accessible
+        pass
     except Exception as e:
-        logger.debug(
-            "Error checking workflows for %s/%s: %s",
-            owner,
-            name,
-            e,
-        )
-        return False
+        logger.debug("Error checking file presence for %s/%s: %s", owner, name, e)
+
+    file_presence = {path: facts is not None and facts.exists(path) for path in hygiene.paths}
+    file_presence["_has_workflows"] = facts is not None and any(
+        facts.files_under(prefix) for prefix in hygiene.workflow_prefixes
+    )
+    return file_presence
 
 
 def _parse_repo_name(full_name: str) -> tuple[str, str]:
@@ -8,8 +8,11 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
+from gh_year_end.github.graphql import GraphQLError
+from gh_year_end.github.planner import APIPlanner, graphql_points
+from gh_year_end.github.ratelimit import APIType
 from gh_year_end.storage.writer import AsyncJSONLWriter
 
 if TYPE_CHECKING:
@@ -17,6 +20,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from gh_year_end.config import Config
+    from gh_year_end.github.graphql import GraphQLClient
     from gh_year_end.github.ratelimit import AdaptiveRateLimiter
     from gh_year_end.github.rest import RestClient
     from gh_year_end.storage.checkpoint import CheckpointManager
@@ -40,6 +44,7 @@ class ReviewCollectionStats:
         self.reviews_collected = 0
         self.errors = 0
         self.skipped_404 = 0
+        self.prs_via_graphql = 0
 
     def to_dict(self) -> dict[str, int]:
         """Convert stats to dictionary.
@@ -55,6 +60,7 @@ class ReviewCollectionStats:
             "reviews_collected": self.reviews_collected,
             "errors": self.errors,
             "skipped_404": self.skipped_404,
+            "prs_via_graphql": self.prs_via_graphql,
         }
 
 
@@ -66,6 +72,7 @@ async def collect_reviews(
     config: Config,
     pr_numbers_by_repo: dict[str, list[int]] | None = None,
     checkpoint: CheckpointManager | None = None,
+    graphql_client: GraphQLClient | None = None,
 ) -> dict[str, int]:
     """Collect reviews for all PRs across repositories.
 
@@ -78,6 +85,9 @@ async def collect_reviews(
         pr_numbers_by_repo: Optional dict mapping repo full_name to list of PR numbers.
             If not provided, will read from raw PR JSONL files.
         checkpoint: Optional CheckpointManager for resume support.
+        graphql_client: Optional GraphQL client. With rate_limit.work_stealing
+            enabled, batches of PRs are served by REST or GraphQL depending on
+            which budget has headroom.
 
     Returns:
         Dictionary with collection statistics.
@@ -90,6 +100,10 @@ async def collect_reviews(
         - Supports checkpoint-based resume to skip already completed repos
     """
     stats = ReviewCollectionStats()
+    work_stealing = config.rate_limit.work_stealing
+    planner = None
+    if work_stealing.enabled and graphql_client is not None and rate_limiter is not None:
+        planner = APIPlanner(rate_limiter, work_stealing.reserve_percent)
 
     logger.info("Starting review collection for %d repositories", len(repos))
 
@@ -137,6 +151,9 @@ async def collect_reviews(
                 pr_numbers,
                 rest_client,
                 paths,
+                graphql_client=graphql_client if planner is not None else None,
+                planner=planner,
+                batch_size=work_stealing.review_batch_size,
             )
 
             stats.repos_processed += 1
@@ -144,6 +161,7 @@ async def collect_reviews(
             stats.reviews_collected += repo_stats["reviews_collected"]
             stats.errors += repo_stats["errors"]
             stats.skipped_404 += repo_stats["skipped_404"]
+            stats.prs_via_graphql += repo_stats["prs_via_graphql"]
 
             # Mark as complete
             if checkpoint:
@@ -184,6 +202,12 @@ async def collect_reviews(
         stats.skipped_404,
         stats.repos_resumed,
     )
+    if planner is not None:
+        logger.info(
+            "Review batches by API: %s (%d PRs via GraphQL)",
+            planner.stats(),
+            stats.prs_via_graphql,
+        )
 
     return stats.to_dict()
 
@@ -193,14 +217,25 @@ async def _collect_reviews_for_repo(
     pr_numbers: list[int],
     rest_client: RestClient,
     paths: PathManager,
+    graphql_client: GraphQLClient | None = None,
+    planner: APIPlanner | None = None,
+    batch_size: int = 25,
 ) -> dict[str, int]:
     """Collect reviews for a single repository.
 
+    With a GraphQL client and planner, PRs are processed in batches and each
+    batch is served by whichever API has budget headroom: one GraphQL query
+    for the whole batch, or one REST listing per PR. Both write the same REST
+    review shape and endpoint, so downstream metrics cannot tell them apart.
+
     Args:
         repo_full_name: Repository full name (owner/repo).
         pr_numbers: List of PR numbers to collect reviews for.
         rest_client: REST API client.
         paths: Path manager for storage.
+        graphql_client: Optional GraphQL client for batched review queries.
+        planner: Optional planner choosing the API per batch.
+        batch_size: PRs per GraphQL query.
 
     Returns:
         Dictionary with collection stats for this repo.
@@ -208,63 +243,101 @@ async def _collect_reviews_for_repo(
     stats = ReviewCollectionStats()
     owner, repo = repo_full_name.split("/")
     output_path = paths.reviews_raw_path(repo_full_name)
+    step = batch_size if graphql_client is not None and planner is not None else len(pr_numbers)
 
     async with AsyncJSONLWriter(output_path) as writer:
-        for pr_number in pr_numbers:
-            try:
-                logger.debug(
-                    "Fetching reviews for %s#%d",
-                    repo_full_name,
-                    pr_number,
-                )
 
-                review_count = 0
-                async for reviews, metadata in rest_client.list_reviews(
-                    owner,
-                    repo,
-                    pr_number,
-                ):
-                    # Write each review individually
-                    for review in reviews:
-                        await writer.write(
-                            source="github_rest",
-                            endpoint=f"/repos/{owner}/{repo}/pulls/{pr_number}/reviews",
-                            data=review,
-                            page=metadata["page"],
+        async def write_reviews(
+            pr_number: int,
+            reviews: list[dict[str, Any]],
+            source: Literal["github_rest", "github_graphql"],
+            page: int,
+        ) -> None:
+            for review in reviews:
+                await writer.write(
+                    source=source,
+                    endpoint=f"/repos/{owner}/{repo}/pulls/{pr_number}/reviews",
+                    data=review,
+                    page=page,
+                )
+            stats.reviews_collected += len(reviews)
+
+        for start in range(0, len(pr_numbers), max(step, 1)):
+            batch = pr_numbers[start : start + step]
+            rest_numbers = batch
+
+            if graphql_client is not None and planner is not None:
+                costs = {APIType.GRAPHQL: graphql_points(len(batch)), APIType.REST: len(batch)}
+                if planner.choose(costs) == APIType.GRAPHQL:
+                    try:
+                        by_number = await graphql_client.query_pull_request_reviews(
+                            owner, repo, batch
                         )
-                        review_count += 1
-
-                stats.prs_processed += 1
-                stats.reviews_collected += review_count
-
-                if review_count > 0:
+                    except GraphQLError as e:
+                        logger.warning(
+                            "GraphQL review batch failed for %s, using REST: %s",
+                            repo_full_name,
+                            e,
+                        )
+                    else:
+                        rest_numbers = []
+                        for pr_number in batch:
+                            reviews = by_number.get(pr_number)
+                            if reviews is None:
+                                # Not found or more than one page: REST paginates
+                                rest_numbers.append(pr_number)
+                                continue
+                            await write_reviews(pr_number, reviews, "github_graphql", 1)
+                            stats.prs_processed += 1
+                            stats.prs_via_graphql += 1
+
+            for pr_number in rest_numbers:
+                try:
                     logger.debug(
-                        "Collected %d reviews for %s#%d",
-                        review_count,
+                        "Fetching reviews for %s#%d",
                         repo_full_name,
                         pr_number,
                     )
 
-            except Exception as e:
-                # Check if it's a 404 (PR not found or no access)
-                error_msg = str(e).lower()
-                if "404" in error_msg or "not found" in error_msg:
-                    logger.debug(
-                        "PR not found or no access: %s#%d",
-                        repo_full_name,
+                    review_count = stats.reviews_collected
+                    async for reviews, metadata in rest_client.list_reviews(
+                        owner,
+                        repo,
                         pr_number,
-                    )
-                    stats.skipped_404 += 1
+                    ):
+                        await write_reviews(pr_number, reviews, "github_rest", metadata["page"])
+                    review_count = stats.reviews_collected - review_count
+
                     stats.prs_processed += 1
-                else:
-                    logger.error(
-                        "Error fetching reviews for %s#%d: %s",
-                        repo_full_name,
-                        pr_number,
-                        e,
-                        exc_info=True,
-                    )
-                    stats.errors += 1
+
+                    if review_count > 0:
+                        logger.debug(
+                            "Collected %d reviews for %s#%d",
+                            review_count,
+                            repo_full_name,
+                            pr_number,
+                        )
+
+                except Exception as e:
+                    # Check if it's a 404 (PR not found or no access)
+                    error_msg = str(e).lower()
+                    if "404" in error_msg or "not found" in error_msg:
+                        logger.debug(
+                            "PR not found or no access: %s#%d",
+                            repo_full_name,
+                            pr_number,
+                        )
+                        stats.skipped_404 += 1
+                        stats.prs_processed += 1
+                    else:
+                        logger.error(
+                            "Error fetching reviews for %s#%d: %s",
+                            repo_full_name,
+                            pr_number,
+                            e,
+                            exc_info=True,
+                        )
+                        stats.errors += 1
 
     return stats.to_dict()
 
@@ -0,0 +1,255 @@
+"""Stratified sampling of the review and comment fan-out.
+
+Listing PRs and issues costs one request per 100 items, but reviews and
+comments cost at least one request per item. With ``collection.sampling``
+enabled, the single-pass collector fetches reviews and comments for a
+stratified random sample of each repo's in-window PRs and issues instead of
+all of them. Leaderboard counts for PRs and issues stay exact.
+
+Each repo's items are split into strata by state (merged, closed, or open for
+PRs; closed or open for issues) and a fixed share of each stratum is drawn,
+never fewer than ``min_per_stratum``. A sampled item stands for
+``population / sampled`` items of its stratum; the aggregator scales the
+counts it adds by that weight. Totals are reported with the stratified
+estimator's normal-approximation interval, and the median time to first
+review with a Woodruff interval over the weighted sample.
+"""
+
+import logging
+import math
+import random
+import statistics
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+from gh_year_end.config import SamplingConfig
+
+logger = logging.getLogger(__name__)
+
+# Fan-out phases that are sampled and the rate setting each one uses
+SAMPLED_PHASES = {
+    "reviews": "reviews_rate",
+    "issue_comments": "comments_rate",
+    "review_comments": "comments_rate",
+}
+
+
+def pr_stratum(pr: dict[str, Any]) -> str:
+    """Stratum of a PR: merged, closed (unmerged), or open."""
+    if pr.get("merged_at"):
+        return "merged"
+    return "closed" if pr.get("state") == "closed" else "open"
+
+
+def issue_stratum(issue: dict[str, Any]) -> str:
+    """Stratum of an issue: closed or open."""
+    return "closed" if issue.get("state") == "closed" else "open"
+
+
+def sample_size(population: int, rate: float, min_per_stratum: int) -> int:
+    """Number of items drawn from a stratum.
+
+    Args:
+        population: Items in the stratum.
+        rate: Sampling rate.
+        min_per_stratum: Smallest sample (capped at the population).
+
+    Returns:
+        Sample size between 0 and population.
+    """
+    return min(population, max(min_per_stratum, math.ceil(rate * population)))
+
+
+class SampledUnit(NamedTuple):
+    """An item selected for fan-out with the number of items it stands for."""
+
+    item: dict[str, Any]
+    weight: float
+    key: tuple[str, str, str]  # (phase, repo, stratum)
+
+
+@dataclass
+class Stratum:
+    """Design and observations for one (phase, repo, stratum)."""
+
+    population: int
+    sampled: int
+    values: list[float] = field(default_factory=list)
+
+    def total(self) -> tuple[float, float]:
+        """Estimated stratum total and its variance."""
+        if not self.values:
+            return 0.0, 0.0
+        mean = statistics.fmean(self.values)
+        n = len(self.values)
+        if n < 2 or n >= self.population:
+            return self.population * mean, 0.0
+        fpc = 1 - n / self.population
+        variance = self.population**2 * fpc * statistics.variance(self.values) / n
+        return self.population * mean, variance
+
+
+def weighted_median_interval(
+    observations: Iterable[tuple[float, float]], confidence: float
+) -> dict[str, Any] | None:
+    """Weighted median with a Woodruff confidence interval.
+
+    The interval is read off the weighted empirical CDF at
+    ``0.5 ± z * sqrt(0.25 / n_eff)``, where ``n_eff`` is Kish's effective
+    sample size for the weights.
+
+    Args:
+        observations: (value, weight) pairs.
+        confidence: Confidence level.
+
+    Returns:
+        Dict with median, ci_low, ci_high, and sample_size, or None if empty.
+    """
+    pairs = sorted(observations)
+    if not pairs:
+        return None
+    total_weight = sum(weight for _, weight in pairs)
+    n_eff = total_weight**2 / sum(weight**2 for _, weight in pairs)
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_width = z * math.sqrt(0.25 / n_eff)
+
+    def quantile(p: float) -> float:
+        target = min(max(p, 0.0), 1.0) * total_weight
+        cumulative = 0.0
+        for value, weight in pairs:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return pairs[-1][0]
+
+    return {
+        "median": round(quantile(0.5), 1),
+        "ci_low": round(quantile(0.5 - half_width), 1),
+        "ci_high": round(quantile(0.5 + half_width), 1),
+        "sample_size": len(pairs),
+    }
+
+
+class StratifiedSample:
+    """Sample selection and estimation for one collection run.
+
+    Example:
+        sample = StratifiedSample(config.collection.sampling)
+        for unit in sample.select("reviews", "org/repo", prs, pr_stratum):
+            reviews = ...  # fetch reviews for unit.item
+            aggregator.add_reviews("org/repo", unit.item["number"], reviews, unit.weight)
+            sample.observe(unit, len(reviews))
+    """
+
+    def __init__(self, config: SamplingConfig) -> None:
+        """Initialize an empty sample.
+
+        Args:
+            config: Sampling rates, minimum stratum sample, seed, and confidence.
+        """
+        self.config = config
+        self.strata: dict[tuple[str, str, str], Stratum] = {}
+
+    def rate(self, phase: str) -> float:
+        """Sampling rate configured for a fan-out phase."""
+        rate: float = getattr(self.config, SAMPLED_PHASES[phase])
+        return rate
+
+    def select(
+        self,
+        phase: str,
+        repo_id: str,
+        items: list[dict[str, Any]],
+        stratum_of: Callable[[dict[str, Any]], str],
+    ) -> list[SampledUnit]:
+        """Draw a stratified sample of a repo's items for one phase.
+
+        Selection is reproducible: the same seed, repo, phase, and items give
+        the same sample.
+
+        Args:
+            phase: Fan-out phase (a key of SAMPLED_PHASES).
+            repo_id: Repository full name.
+            items: In-window PRs or issues, in listing order.
+            stratum_of: Function assigning an item to its stratum.
+
+        Returns:
+            Selected items in listing order with their weights.
+        """
+        groups: dict[str, list[int]] = {}
+        for index, item in enumerate(items):
+            groups.setdefault(stratum_of(item), []).append(index)
+
+        selected: dict[int, SampledUnit] = {}
+        for name, indexes in groups.items():
+            population = len(indexes)
+            n = sample_size(population, self.rate(phase), self.config.min_per_stratum)
+            rng = random.Random(f"{self.config.seed}:{phase}:{repo_id}:{name}")
+            key = (phase, repo_id, name)
+            self.strata[key] = Stratum(population=population, sampled=n)
+            weight = population / n if n < population else 1
+            for index in rng.sample(indexes, n):
+                selected[index] = SampledUnit(items[index], weight, key)
+
+        logger.debug(
+            "Sampled %d of %d items for %s in %s", len(selected), len(items), phase, repo_id
+        )
+        return [selected[index] for index in sorted(selected)]
+
+    def observe(self, unit: SampledUnit, value: float) -> None:
+        """Record what fetching a sampled unit returned (e.g. its review count)."""
+        self.strata[unit.key].values.append(value)
+
+    def estimate_total(self, phases: Iterable[str]) -> dict[str, Any]:
+        """Estimated total over the given phases with a confidence interval.
+
+        Args:
+            phases: Fan-out phases to sum (e.g. both comment phases).
+
+        Returns:
+            Dict with estimate, ci_low, ci_high, sampled, and population.
+        """
+        wanted = set(phases)
+        estimate = variance = 0.0
+        sampled = population = 0
+        for (phase, _repo, _name), stratum in self.strata.items():
+            if phase not in wanted:
+                continue
+            total, var = stratum.total()
+            estimate += total
+            variance += var
+            sampled += len(stratum.values)
+            population += stratum.population
+        z = statistics.NormalDist().inv_cdf(0.5 + self.config.confidence / 2)
+        margin = z * math.sqrt(variance)
+        return {
+            "estimate": round(estimate),
+            "ci_low": round(max(estimate - margin, 0.0)),
+            "ci_high": round(estimate + margin),
+            "sampled": sampled,
+            "population": population,
+        }
+
+    def to_dict(self, review_latencies: Iterable[tuple[float, float]] = ()) -> dict[str, Any]:
+        """Sampling summary for export.
+
+        Args:
+            review_latencies: (hours to first review, weight) for sampled PRs.
+
+        Returns:
+            Rates, confidence level, estimated totals, and the median time to
+            first review with their intervals.
+        """
+        return {
+            "confidence": self.config.confidence,
+            "rates": {phase: self.rate(phase) for phase in SAMPLED_PHASES},
+            "min_per_stratum": self.config.min_per_stratum,
+            "totals": {
+                "reviews": self.estimate_total(["reviews"]),
+                "comments": self.estimate_total(["issue_comments", "review_comments"]),
+            },
+            "median_time_to_first_review": weighted_median_interval(
+                review_latencies, self.config.confidence
+            ),
+        }
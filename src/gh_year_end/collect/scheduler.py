@@ -0,0 +1,268 @@
+"""Dependency-aware scheduler for (repo, phase) collection work.
+
+Each unit of work is a node keyed by (phase, repo) with declared dependencies
+and a resource class. A node becomes ready once all of its dependencies have
+succeeded. Ready nodes are dispatched in insertion order, limited per resource
+class, so independent work for one repo (e.g. reviews after its pulls)
+proceeds while other repos are still in earlier phases, and GraphQL work runs
+alongside REST work instead of waiting for a global phase barrier.
+
+Insertion order is the priority: adding nodes repo by repo makes the scheduler
+finish earlier repos first rather than spreading every phase across the org.
+"""
+
+import asyncio
+import heapq
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+from gh_year_end.telemetry import request_trace, trace_events
+
+logger = logging.getLogger(__name__)
+
+# Key of a global (not per-repo) node
+GLOBAL = ""
+
+
+class ResourceClass(StrEnum):
+    """API budget a node draws on."""
+
+    REST = "rest"
+    GRAPHQL = "graphql"
+
+
+class SchedulerError(Exception):
+    """Raised when the phase graph is invalid."""
+
+
+class DependencyFailedError(Exception):
+    """Recorded for nodes skipped because a dependency failed."""
+
+
+NodeKey = tuple[str, str]
+
+
+@dataclass
+class PhaseNode:
+    """One unit of collection work.
+
+    Attributes:
+        phase: Phase name (e.g. "pulls").
+        repo: Repository full name, or GLOBAL for org-wide work.
+        resource: Resource class limiting concurrency.
+        run: Coroutine factory performing the work and returning stats.
+        depends_on: Keys of nodes that must succeed first.
+    """
+
+    phase: str
+    repo: str
+    resource: ResourceClass
+    run: Callable[[], Awaitable[dict[str, Any]]]
+    depends_on: list[NodeKey] = field(default_factory=list)
+
+    @property
+    def key(self) -> NodeKey:
+        return (self.phase, self.repo)
+
+
+@dataclass
+class ScheduleResult:
+    """Outcome of a scheduler run.
+
+    Attributes:
+        results: Node key -> stats returned by successful nodes.
+        failures: Node key -> exception for failed (or dependency-skipped) nodes.
+    """
+
+    results: dict[NodeKey, dict[str, Any]] = field(default_factory=dict)
+    failures: dict[NodeKey, BaseException] = field(default_factory=dict)
+
+
+class PhaseScheduler:
+    """Run a DAG of phase nodes with per-resource-class concurrency limits.
+
+    Example:
+        scheduler = PhaseScheduler({ResourceClass.REST: 4, ResourceClass.GRAPHQL: 2})
+        scheduler.add("pulls", "o/r", ResourceClass.REST, lambda: collect_pulls(...))
+        scheduler.add(
+            "reviews", "o/r", ResourceClass.REST, lambda: collect_reviews(...),
+            depends_on=[("pulls", "o/r")],
+        )
+        outcome = await scheduler.run()
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[ResourceClass, int],
+        on_finish: Callable[[PhaseNode, bool], None] | None = None,
+    ) -> None:
+        """Initialize an empty scheduler.
+
+        Args:
+            limits: Maximum concurrently running nodes per resource class
+                (classes not listed run one node at a time).
+            on_finish: Called with (node, succeeded) when each node finishes or
+                is skipped because a dependency failed.
+        """
+        self.limits = dict(limits)
+        self.on_finish = on_finish
+        self._nodes: dict[NodeKey, PhaseNode] = {}
+        self._order: dict[NodeKey, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def add(
+        self,
+        phase: str,
+        repo: str,
+        resource: ResourceClass,
+        run: Callable[[], Awaitable[dict[str, Any]]],
+        depends_on: Iterable[NodeKey] = (),
+    ) -> NodeKey:
+        """Add a node. Dependencies must already be added, so the graph is acyclic.
+
+        Args:
+            phase: Phase name.
+            repo: Repository full name, or GLOBAL.
+            resource: Resource class.
+            run: Coroutine factory performing the work.
+            depends_on: Keys of previously added nodes.
+
+        Returns:
+            The new node's key.
+
+        Raises:
+            SchedulerError: If the key is duplicated or a dependency is unknown.
+        """
+        node = PhaseNode(phase, repo, resource, run, list(depends_on))
+        if node.key in self._nodes:
+            msg = f"Duplicate phase node: {node.key}"
+            raise SchedulerError(msg)
+        for dep in node.depends_on:
+            if dep not in self._nodes:
+                msg = f"Node {node.key} depends on unknown node {dep}"
+                raise SchedulerError(msg)
+        self._order[node.key] = len(self._order)
+        self._nodes[node.key] = node
+        return node.key
+
+    def nodes(self, phase: str | None = None) -> list[PhaseNode]:
+        """Nodes in insertion order, optionally for one phase."""
+        return [n for n in self._nodes.values() if phase is None or n.phase == phase]
+
+    async def run(self) -> ScheduleResult:
+        """Run every node once its dependencies succeed.
+
+        Node exceptions are recorded rather than raised; dependents of a failed
+        node are skipped and recorded with DependencyFailedError. If the run
+        itself is cancelled, nodes still running are cancelled and awaited.
+
+        Returns:
+            Results and failures by node key.
+        """
+        outcome = ScheduleResult()
+        waiting = {key: len(node.depends_on) for key, node in self._nodes.items()}
+        dependents: dict[NodeKey, list[NodeKey]] = {key: [] for key in self._nodes}
+        for key, node in self._nodes.items():
+            for dep in node.depends_on:
+                dependents[dep].append(key)
+
+        ready: dict[ResourceClass, list[int]] = {}
+        keys_by_order = list(self._nodes)
+        active: dict[ResourceClass, int] = dict.fromkeys(ResourceClass, 0)
+        running: dict[asyncio.Task[dict[str, Any]], NodeKey] = {}
+
+        def make_ready(key: NodeKey) -> None:
+            node = self._nodes[key]
+            heapq.heappush(ready.setdefault(node.resource, []), self._order[key])
+
+        def finish(key: NodeKey, succeeded: bool) -> None:
+            if self.on_finish:
+                self.on_finish(self._nodes[key], succeeded)
+            for child in dependents[key]:
+                if not succeeded:
+                    if child not in outcome.failures:
+                        outcome.failures[child] = DependencyFailedError(
+                            f"{key[0]} failed for {key[1] or 'all repos'}"
+                        )
+                        finish(child, False)
+                    continue
+                waiting[child] -= 1
+                if waiting[child] == 0 and child not in outcome.failures:
+                    make_ready(child)
+
+        for key, count in waiting.items():
+            if count == 0:
+                make_ready(key)
+
+        try:
+            while ready or running:
+                for resource in list(ready):
+                    heap = ready[resource]
+                    limit = max(self.limits.get(resource, 1), 1)
+                    while heap and active[resource] < limit:
+                        key = keys_by_order[heapq.heappop(heap)]
+                        active[resource] += 1
+                        running[asyncio.ensure_future(_run_node(self._nodes[key]))] = key
+                    if not heap:
+                        del ready[resource]
+
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    key = running.pop(task)
+                    active[self._nodes[key].resource] -= 1
+                    try:
+                        outcome.results[key] = task.result()
+                    except Exception as e:
+                        logger.error("Phase %s failed for %s: %s", key[0], key[1] or "all repos", e)
+                        outcome.failures[key] = e
+                        finish(key, False)
+                    else:
+                        finish(key, True)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+        return outcome
+
+
+async def _run_node(node: PhaseNode) -> dict[str, Any]:
+    """Run a node with its phase and repo labelling traced requests."""
+    with (
+        request_trace.trace_scope(phase=node.phase, repo=node.repo or None),
+        trace_events.span(node.repo or node.phase, "repo", phase=node.phase),
+    ):
+        return await node.run()
+
+
+def merge_stats(total: dict[str, Any], part: Mapping[str, Any]) -> dict[str, Any]:
+    """Accumulate per-node collector stats into phase totals.
+
+    Numbers are summed, lists concatenated, and nested dicts merged
+    recursively; any other value keeps the latest.
+
+    Args:
+        total: Running totals, updated in place.
+        part: Stats from one node.
+
+    Returns:
+        The updated totals.
+    """
+    for key, value in part.items():
+        current = total.get(key)
+        if isinstance(value, bool) or not isinstance(value, int | float | list | dict):
+            total[key] = value
+        elif isinstance(value, dict):
+            total[key] = merge_stats(current if isinstance(current, dict) else {}, value)
+        elif isinstance(value, list):
+            total[key] = (current if isinstance(current, list) else []) + value
+        else:
+            total[key] = (current if isinstance(current, int | float) else 0) + value
+    return total
@@ -81,6 +81,28 @@ class QuickScanConfig(BaseModel):
     enabled: bool = False
 
 
+class DiscoveryCatalogConfig(BaseModel):
+    """Persisted discovery catalog refreshed incrementally."""
+
+    enabled: bool = Field(
+        default=False,
+        description=(
+            "Reuse and incrementally refresh a cached repo listing; archival, visibility "
+            "and renames without a push only show up on a full refresh"
+        ),
+    )
+    fresh_minutes: float = Field(
+        default=10,
+        ge=0,
+        description="Use the catalog without any requests if refreshed this recently",
+    )
+    full_refresh_days: float = Field(
+        default=7,
+        ge=0,
+        description="Re-list every repo after this many days (catches deletions and renames)",
+    )
+
+
 class DiscoveryConfig(BaseModel):
     """Repository discovery configuration."""
 
@@ -93,6 +115,7 @@ class DiscoveryConfig(BaseModel):
     topics_filter: TopicsFilterConfig = Field(default_factory=TopicsFilterConfig)
     name_pattern_filter: NamePatternFilterConfig = Field(default_factory=NamePatternFilterConfig)
     quick_scan: QuickScanConfig = Field(default_factory=QuickScanConfig)
+    catalog: DiscoveryCatalogConfig = Field(default_factory=DiscoveryCatalogConfig)
 
 
 class WindowsConfig(BaseModel):
@@ -134,6 +157,13 @@ class GitHubConfig(BaseModel):
 
     target: TargetConfig
     auth: AuthConfig = Field(default_factory=AuthConfig)
+    api_url: str = Field(
+        default="https://api.github.com",
+        description=(
+            "REST base URL (https://HOST/api/v3 for GitHub Enterprise Server); GraphQL "
+            "is served at {api_url}/graphql, or https://HOST/api/graphql for Enterprise"
+        ),
+    )
     discovery: DiscoveryConfig = Field(default_factory=DiscoveryConfig)
     windows: WindowsConfig
 
@@ -166,6 +196,20 @@ class SecondaryLimitConfig(BaseModel):
     )
 
 
+class WorkStealingConfig(BaseModel):
+    """Assignment of work either API can serve to the one with budget headroom."""
+
+    enabled: bool = Field(
+        default=False, description="Serve interchangeable work from REST or GraphQL by headroom"
+    )
+    reserve_percent: float = Field(
+        default=5.0, ge=0, le=50, description="Share of each budget kept for API-specific work"
+    )
+    review_batch_size: int = Field(
+        default=25, ge=1, le=100, description="Pull requests per GraphQL review query"
+    )
+
+
 class RateLimitConfig(BaseModel):
     """Rate limiting configuration."""
 
@@ -176,6 +220,59 @@ class RateLimitConfig(BaseModel):
     sample_rate_limit_endpoint_every_n_requests: int = Field(default=50, ge=1)
     burst: BurstConfig = Field(default_factory=BurstConfig)
     secondary: SecondaryLimitConfig = Field(default_factory=SecondaryLimitConfig)
+    work_stealing: WorkStealingConfig = Field(default_factory=WorkStealingConfig)
+
+
+class HttpTimeoutConfig(BaseModel):
+    """Timeouts (seconds) for one class of endpoints."""
+
+    connect: float = Field(default=10.0, gt=0, description="Establishing a connection")
+    read: float = Field(default=30.0, gt=0, description="Waiting for response data")
+    write: float = Field(default=30.0, gt=0, description="Sending the request")
+    pool: float = Field(default=30.0, gt=0, description="Waiting for a free pooled connection")
+
+
+class HttpTimeoutsConfig(BaseModel):
+    """Per-endpoint-class timeouts."""
+
+    rest: HttpTimeoutConfig = Field(default_factory=HttpTimeoutConfig)
+    graphql: HttpTimeoutConfig = Field(default_factory=lambda: HttpTimeoutConfig(read=60.0))
+    search: HttpTimeoutConfig = Field(default_factory=HttpTimeoutConfig)
+
+
+class HttpConfig(BaseModel):
+    """HTTP client configuration."""
+
+    http2: bool = Field(
+        default=False,
+        description="Multiplex requests over HTTP/2 (needs the h2 package, see the http2 extra)",
+    )
+    max_connections: int | None = Field(
+        default=None,
+        ge=1,
+        description="Connection pool size (defaults to the scheduler's total concurrency + 2)",
+    )
+    max_keepalive_connections: int | None = Field(
+        default=None, ge=0, description="Idle connections kept open (defaults to max_connections)"
+    )
+    keepalive_expiry: float = Field(
+        default=60.0, ge=0, description="Seconds an idle connection is kept for reuse"
+    )
+    timeouts: HttpTimeoutsConfig = Field(default_factory=HttpTimeoutsConfig)
+
+    coalesce_gets: bool = Field(
+        default=True, description="Share one in-flight response among identical concurrent GETs"
+    )
+    memo_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="Serve repeated successful GETs from memory for this long (0 disables)",
+    )
+    memo_max_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=0,
+        description="Total response body bytes kept in the memo (oldest evicted first)",
+    )
 
 
 class BotConfig(BaseModel):
@@ -221,6 +318,19 @@ class CommitsConfig(BaseModel):
         ge=1,
         description="Only collect commits from last N days of year window",
     )
+    contributor_stats: bool = Field(
+        default=False,
+        description="Per-author commit and line metrics from /stats/contributors in collect",
+    )
+    stats_poll_interval: float = Field(
+        default=3.0, gt=0, description="Seconds between polls while GitHub computes stats"
+    )
+    stats_max_polls: int = Field(
+        default=5, ge=0, description="Polls after the first request before giving up on a repo"
+    )
+    history_fallback: bool = Field(
+        default=True, description="Count paged commit history when stats are unavailable"
+    )
 
 
 class BranchProtectionConfig(BaseModel):
@@ -252,16 +362,112 @@ class HygieneConfig(BaseModel):
         ]
     )
     workflow_prefixes: list[str] = Field(default_factory=lambda: [".github/workflows/"])
+    lookup: str = Field(
+        default="auto",
+        pattern=r"^(auto|graphql|tree)$",
+        description="Resolve file presence with one GraphQL query, non-recursive tree reads, "
+        "or whichever API has budget headroom",
+    )
+    tree_cache: bool = Field(
+        default=True, description="Reuse directory listings cached by tree SHA across runs"
+    )
     branch_protection: BranchProtectionConfig = Field(default_factory=BranchProtectionConfig)
     security_features: SecurityFeaturesConfig = Field(default_factory=SecurityFeaturesConfig)
 
 
+class UserEnrichmentConfig(BaseModel):
+    """Contributor profile enrichment configuration."""
+
+    enabled: bool = Field(
+        default=False, description="Resolve contributor display names and avatars via GraphQL"
+    )
+    batch_size: int = Field(default=50, ge=1, le=100, description="Users resolved per query")
+    cache_ttl_days: float = Field(
+        default=30, ge=0, description="Days a cached profile stays fresh (0 always refetches)"
+    )
+
+
+class SchedulerConfig(BaseModel):
+    """Collection phase scheduling configuration."""
+
+    mode: str = Field(
+        default="phased",
+        pattern=r"^(phased|dag)$",
+        description="Run phases one after another, or as a per-repo dependency graph",
+    )
+    rest_concurrency: int | None = Field(
+        default=None, ge=1, description="Concurrent REST nodes (defaults to max_concurrency)"
+    )
+    graphql_concurrency: int = Field(default=2, ge=1, description="Concurrent GraphQL nodes")
+
+
+class PreflightConfig(BaseModel):
+    """Pre-flight budget planning configuration."""
+
+    enabled: bool = Field(
+        default=False, description="Estimate the run's cost from batched totalCounts first"
+    )
+    batch_size: int = Field(default=20, ge=1, le=50, description="Repos per GraphQL count query")
+    pace: bool = Field(
+        default=True, description="Spread requests evenly when the run exceeds one window"
+    )
+
+
+class CollectionLimitsConfig(BaseModel):
+    """Deadline- and budget-bounded collection configuration."""
+
+    deadline_seconds: float | None = Field(
+        default=None, gt=0, description="Stop collecting after this many seconds"
+    )
+    max_requests: int | None = Field(
+        default=None, ge=1, description="Stop collecting after this many API requests"
+    )
+    order_by_value: bool = Field(
+        default=True, description="Visit the most active repos first when bounded"
+    )
+    low_value_cutoff: float = Field(
+        default=0.7, gt=0, le=1, description="Share of the bound after which hygiene is skipped"
+    )
+    secondary_cutoff: float = Field(
+        default=0.85, gt=0, le=1, description="Share of the bound after which comments are skipped"
+    )
+
+
+class SamplingConfig(BaseModel):
+    """Stratified sampling of review and comment fan-out."""
+
+    enabled: bool = Field(
+        default=False, description="Fetch reviews/comments for a stratified sample only"
+    )
+    reviews_rate: float = Field(
+        default=0.1, gt=0, le=1, description="Share of in-window PRs whose reviews are fetched"
+    )
+    comments_rate: float = Field(
+        default=0.1,
+        gt=0,
+        le=1,
+        description="Share of in-window issues/PRs whose comments are fetched",
+    )
+    min_per_stratum: int = Field(
+        default=5, ge=1, description="Smallest sample per repo and stratum (all if fewer)"
+    )
+    seed: int = Field(default=0, description="Seed for reproducible sample selection")
+    confidence: float = Field(
+        default=0.95, gt=0, lt=1, description="Confidence level for reported intervals"
+    )
+
+
 class CollectionConfig(BaseModel):
     """Collection configuration section."""
 
     enable: CollectionEnableConfig = Field(default_factory=CollectionEnableConfig)
     commits: CommitsConfig = Field(default_factory=CommitsConfig)
     hygiene: HygieneConfig = Field(default_factory=HygieneConfig)
+    users: UserEnrichmentConfig = Field(default_factory=UserEnrichmentConfig)
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
+    preflight: PreflightConfig = Field(default_factory=PreflightConfig)
+    limits: CollectionLimitsConfig = Field(default_factory=CollectionLimitsConfig)
+    sampling: SamplingConfig = Field(default_factory=SamplingConfig)
 
 
 class StorageConfig(BaseModel):
@@ -271,6 +477,86 @@ class StorageConfig(BaseModel):
     raw_format: str = Field(default="jsonl", pattern=r"^jsonl$")
     curated_format: str = Field(default="parquet", pattern=r"^parquet$")
     dataset_version: str = Field(default="v1")
+    write_raw: bool = Field(
+        default=False,
+        description="Persist raw API objects during collect so metrics can be rebuilt offline",
+    )
+
+
+class MetricsConfig(BaseModel):
+    """Metrics computation configuration."""
+
+    engine: str = Field(
+        default="python",
+        pattern=r"^(python|duckdb)$",
+        description="Backend used to compute metrics from stored raw data",
+    )
+    threads: int | None = Field(
+        default=None, ge=1, description="DuckDB worker threads (defaults to CPU count)"
+    )
+    memory_limit: str | None = Field(
+        default=None, description="DuckDB memory limit (e.g., '4GB'); unlimited if unset"
+    )
+    timeseries_layout: str = Field(
+        default="legacy",
+        pattern=r"^(legacy|columnar)$",
+        description="timeseries.json layout: one dict per entry, or compact index arrays",
+    )
+    leaderboard_top_k: int | None = Field(
+        default=100, ge=1, description="Entries kept per leaderboard (null keeps all users)"
+    )
+    leaderboard_full_rankings: bool = Field(
+        default=True,
+        description="Also write full rankings to sharded leaderboards_full/ (read by the report)",
+    )
+    leaderboard_shard_size: int = Field(
+        default=1000, ge=1, description="Entries per full rankings shard file"
+    )
+    repo_health_mode: str = Field(
+        default="exact",
+        pattern=r"^(exact|sketch)$",
+        description="Repo health: exact samples and sets, or bounded KLL/HyperLogLog sketches",
+    )
+    sketch_k: int = Field(default=200, ge=8, description="KLL quantile sketch size")
+    hll_precision: int = Field(
+        default=12, ge=4, le=16, description="HyperLogLog precision bits (2**p registers)"
+    )
+
+
+class OpenMetricsConfig(BaseModel):
+    """Live OpenMetrics export of a collection run."""
+
+    textfile: Path | None = Field(
+        default=None, description="File rewritten with the run's metrics every `interval`"
+    )
+    port: int | None = Field(
+        default=None, ge=0, le=65535, description="Serve GET /metrics on this port (0 = any)"
+    )
+    host: str = Field(default="127.0.0.1", description="Interface the metrics endpoint binds")
+    interval: float = Field(default=15.0, gt=0, description="Seconds between textfile rewrites")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any export target is configured."""
+        return self.textfile is not None or self.port is not None
+
+
+class TelemetryConfig(BaseModel):
+    """Run instrumentation configuration (everything is off by default)."""
+
+    request_trace: bool = Field(
+        default=False,
+        description="Write one JSONL record per API request for `gh-year-end analyze-trace`",
+    )
+    openmetrics: OpenMetricsConfig = Field(default_factory=OpenMetricsConfig)
+    trace_events: Path | None = Field(
+        default=None,
+        description="Write Chrome/Perfetto trace-event JSON of the run to this file",
+    )
+    profile: bool = Field(
+        default=False,
+        description="Profile CPU (cProfile) and memory (tracemalloc) of each phase",
+    )
 
 
 class ThresholdsConfig(BaseModel):
@@ -336,11 +622,14 @@ class Config(BaseModel):
 
     github: GitHubConfig
     rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    http: HttpConfig = Field(default_factory=HttpConfig)
     identity: IdentityConfig = Field(default_factory=IdentityConfig)
     collection: CollectionConfig = Field(default_factory=CollectionConfig)
     storage: StorageConfig = Field(default_factory=StorageConfig)
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
     report: ReportConfig = Field(default_factory=ReportConfig)
     thresholds: ThresholdsConfig = Field(default_factory=ThresholdsConfig)
+    telemetry: TelemetryConfig = Field(default_factory=TelemetryConfig)
 
 
 def load_config(path: Path) -> Config:
@@ -11,6 +11,8 @@ from gh_year_end.github.graphql import (
     GraphQLError,
 )
 from gh_year_end.github.http import (
+    ConnectionStats,
+    DedupStats,
     GitHubClient,
     GitHubHTTPError,
     GitHubResponse,
@@ -18,6 +20,7 @@ from gh_year_end.github.http import (
     RateLimitExceeded,
     RateLimitInfo,
 )
+from gh_year_end.github.planner import APIPlanner
 from gh_year_end.github.ratelimit import (
     AdaptiveRateLimiter,
     APIType,
@@ -27,11 +30,15 @@ from gh_year_end.github.ratelimit import (
 from gh_year_end.github.rest import RestClient
 
 __all__ = [
+    # Dual-API planner
+    "APIPlanner",
     "APIType",
     # Adaptive Rate Limiter
     "AdaptiveRateLimiter",
     # Auth
     "AuthenticationError",
+    "ConnectionStats",
+    "DedupStats",
     "GitHubAuth",
     # HTTP Client
     "GitHubClient",
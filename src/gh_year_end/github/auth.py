@@ -4,6 +4,7 @@ Handles loading and validating GitHub API tokens from environment variables
 or the GitHub CLI.
 """
 
+import hashlib
 import logging
 import os
 import re
@@ -146,6 +147,11 @@ class GitHubAuth:
         """
         return self._token
 
+    @property
+    def fingerprint(self) -> str:
+        """Short one-way digest of the token, for keying caches by identity."""
+        return hashlib.sha256(self._token.encode()).hexdigest()[:16]
+
     def get_authorization_header(self) -> dict[str, str]:
         """Get the Authorization header for API requests.
 
@@ -6,12 +6,14 @@ pre-built queries, and integration with adaptive rate limiter.
 
 import logging
 from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
 from typing import Any, cast
 
 import httpx
 
 from gh_year_end.github.http import GitHubClient
 from gh_year_end.github.ratelimit import AdaptiveRateLimiter, APIType
+from gh_year_end.telemetry import trace_events
 
 logger = logging.getLogger(__name__)
 
@@ -289,6 +291,156 @@ query($login: String!) {
 }
 """
 
+# Profile fields resolved per user by batched user queries
+USER_PROFILE_FIELDS = "login name avatarUrl"
+
+
+def build_users_query(count: int) -> str:
+    """Build a query resolving ``count`` users by login through aliased fields.
+
+    Args:
+        count: Number of logins (bound as variables $l0..$l{count-1}).
+
+    Returns:
+        GraphQL query with one ``u{i}: user(login: $l{i})`` field per login.
+    """
+    variables = ", ".join(f"$l{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  u{i}: user(login: $l{i}) {{ {USER_PROFILE_FIELDS} }}" for i in range(count)
+    )
+    return f"query({variables}) {{\n{fields}\n}}\n"
+
+
+# Review fields mapped onto the REST review shape by review_to_rest()
+REVIEW_FIELDS = (
+    "databaseId author { __typename login avatarUrl } authorAssociation state body "
+    "submittedAt url commit { oid }"
+)
+
+
+def build_pull_request_reviews_query(count: int) -> str:
+    """Build a query fetching reviews for ``count`` pull requests of one repo.
+
+    Args:
+        count: Number of PR numbers (bound as variables $n0..$n{count-1}).
+
+    Returns:
+        GraphQL query with one ``p{i}: pullRequest(number: $n{i})`` field per PR,
+        each with its first 100 reviews.
+    """
+    variables = "".join(f", $n{i}: Int!" for i in range(count))
+    fields = "\n".join(
+        f"    p{i}: pullRequest(number: $n{i}) {{\n"
+        f"      reviews(first: 100) {{\n"
+        f"        pageInfo {{ hasNextPage }}\n"
+        f"        nodes {{ {REVIEW_FIELDS} }}\n"
+        f"      }}\n"
+        f"    }}"
+        for i in range(count)
+    )
+    return (
+        f"query($owner: String!, $name: String!{variables}) {{\n"
+        f"  repository(owner: $owner, name: $name) {{\n{fields}\n  }}\n}}\n"
+    )
+
+
+def review_to_rest(node: dict[str, Any]) -> dict[str, Any]:
+    """Convert a GraphQL review node to the REST review shape.
+
+    Args:
+        node: Review node selected with REVIEW_FIELDS.
+
+    Returns:
+        Review dict with the REST fields the metrics read (id, user, state,
+        submitted_at, ...). Deleted authors map to ``user: None`` as in REST,
+        and bot logins get the ``[bot]`` suffix REST reports (GraphQL's
+        ``Bot.login`` omits it).
+    """
+    author = node.get("author")
+    user = None
+    if author:
+        login = author.get("login")
+        is_bot = author.get("__typename") == "Bot"
+        if is_bot and login and not login.endswith("[bot]"):
+            login = f"{login}[bot]"
+        user = {
+            "login": login,
+            "type": "Bot" if is_bot else "User",
+            "avatar_url": author.get("avatarUrl"),
+        }
+    return {
+        "id": node.get("databaseId"),
+        "user": user,
+        "body": node.get("body") or "",
+        "state": node.get("state"),
+        "html_url": node.get("url"),
+        "submitted_at": node.get("submittedAt"),
+        "commit_id": (node.get("commit") or {}).get("oid"),
+        "author_association": node.get("authorAssociation"),
+    }
+
+
+def build_repo_counts_query(count: int) -> str:
+    """Build a query reading collection-size counts for ``count`` repositories.
+
+    Args:
+        count: Number of repositories (bound as variables $o{i}/$n{i} for
+            owner/name and $qp{i}/$qi{i} for the PR and issue search strings).
+
+    Returns:
+        GraphQL query with, per repo, ``r{i}`` (all-time PR and issue counts
+        plus default-branch commits between $since and $until) and ``p{i}`` /
+        ``i{i}`` (search counts of PRs and issues created in the window). The
+        query's own point cost is returned under ``rateLimit``.
+    """
+    variables = "".join(
+        f", $o{i}: String!, $n{i}: String!, $qp{i}: String!, $qi{i}: String!" for i in range(count)
+    )
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $o{i}, name: $n{i}) {{\n"
+        f"    pullRequests {{ totalCount }}\n"
+        f"    issues {{ totalCount }}\n"
+        f"    defaultBranchRef {{ target {{ ... on Commit {{ "
+        f"history(since: $since, until: $until) {{ totalCount }} }} }} }}\n"
+        f"  }}\n"
+        f"  p{i}: search(query: $qp{i}, type: ISSUE) {{ issueCount }}\n"
+        f"  i{i}: search(query: $qi{i}, type: ISSUE) {{ issueCount }}"
+        for i in range(count)
+    )
+    return (
+        f"query($since: GitTimestamp!, $until: GitTimestamp!{variables}) {{\n"
+        f"  rateLimit {{ cost }}\n{fields}\n}}\n"
+    )
+
+
+# Entry fields of a directory listing resolved by object(expression: "branch:dir")
+TREE_ENTRY_FIELDS = "name type oid size"
+
+
+def build_tree_entries_query(count: int) -> str:
+    """Build a query listing ``count`` directories of one repository.
+
+    Args:
+        count: Number of directories (bound as variables $e0..$e{count-1}, each
+            a ``"<branch>:<dir>"`` object expression).
+
+    Returns:
+        GraphQL query with one ``t{i}: object(expression: $e{i})`` field per
+        directory, resolving to the tree's oid and direct entries.
+    """
+    variables = "".join(f", $e{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"    t{i}: object(expression: $e{i}) {{\n"
+        f"      ... on Tree {{ oid entries {{ {TREE_ENTRY_FIELDS} }} }}\n"
+        f"    }}"
+        for i in range(count)
+    )
+    return (
+        f"query($owner: String!, $name: String!{variables}) {{\n"
+        f"  repository(owner: $owner, name: $name) {{\n{fields}\n  }}\n}}\n"
+    )
+
+
 ORGANIZATION_INFO_QUERY = """
 query($login: String!) {
   organization(login: $login) {
@@ -353,12 +505,15 @@ class GraphQLClient:
         self,
         query: str,
         variables: dict[str, Any] | None = None,
+        allow_partial: bool = False,
     ) -> dict[str, Any]:
         """Execute a GraphQL query.
 
         Args:
             query: GraphQL query string.
             variables: Optional query variables.
+            allow_partial: Return partial data when some fields errored (e.g. an
+                aliased lookup of a deleted user) instead of raising.
 
         Returns:
             GraphQL response data payload.
@@ -404,8 +559,11 @@ class GraphQLClient:
             # Check for GraphQL errors
             if "errors" in response.data:
                 errors = response.data["errors"]
-                logger.error("GraphQL errors: %s", errors)
-                raise GraphQLError(errors)
+                if allow_partial and response.data.get("data") is not None:
+                    logger.debug("GraphQL partial errors: %s", errors)
+                else:
+                    logger.error("GraphQL errors: %s", errors)
+                    raise GraphQLError(errors)
 
             # Return data payload
             data = response.data.get("data")
@@ -440,37 +598,38 @@ class GraphQLClient:
         has_next_page = True
         after_cursor: str | None = None
 
-        while has_next_page:
-            # Add pagination variables
-            page_vars = {**variables, "after": after_cursor, "first": page_size}
-
-            # Execute query
-            data = await self.execute(query, page_vars)
-
-            # Navigate to connection object
-            connection = data
-            for key in path_to_connection:
-                connection = connection.get(key, {})
-
-            # Extract page info and edges
-            page_info = connection.get("pageInfo", {})
-            edges = connection.get("edges", [])
-
-            # Yield individual nodes
-            for edge in edges:
-                if node := edge.get("node"):
-                    yield node
-
-            # Check for next page
-            has_next_page = page_info.get("hasNextPage", False)
-            after_cursor = page_info.get("endCursor")
-
-            logger.debug(
-                "Paginated %d items, hasNextPage=%s, cursor=%s",
-                len(edges),
-                has_next_page,
-                after_cursor,
-            )
+        with trace_events.span(f"paginate {'.'.join(path_to_connection)}", "listing"):
+            while has_next_page:
+                # Add pagination variables
+                page_vars = {**variables, "after": after_cursor, "first": page_size}
+
+                # Execute query
+                data = await self.execute(query, page_vars)
+
+                # Navigate to connection object
+                connection = data
+                for key in path_to_connection:
+                    connection = connection.get(key, {})
+
+                # Extract page info and edges
+                page_info = connection.get("pageInfo", {})
+                edges = connection.get("edges", [])
+
+                # Yield individual nodes
+                for edge in edges:
+                    if node := edge.get("node"):
+                        yield node
+
+                # Check for next page
+                has_next_page = page_info.get("hasNextPage", False)
+                after_cursor = page_info.get("endCursor")
+
+                logger.debug(
+                    "Paginated %d items, hasNextPage=%s, cursor=%s",
+                    len(edges),
+                    has_next_page,
+                    after_cursor,
+                )
 
     async def query_repository_info(
         self,
@@ -638,6 +797,141 @@ class GraphQLClient:
 
         return cast("dict[str, Any]", data.get("user", {}))
 
+    async def query_users(self, logins: list[str]) -> dict[str, dict[str, Any] | None]:
+        """Query profiles for several users in one request.
+
+        Args:
+            logins: GitHub usernames (at most 100 per call is advisable).
+
+        Returns:
+            Login -> profile (login, name, avatarUrl), or None if the login does
+            not resolve to a user (deleted accounts, bots, organizations).
+        """
+        if not logins:
+            return {}
+        logger.debug("Querying %d user profiles", len(logins))
+
+        variables = {f"l{i}": login for i, login in enumerate(logins)}
+        data = await self.execute(build_users_query(len(logins)), variables, allow_partial=True)
+
+        return {login: data.get(f"u{i}") for i, login in enumerate(logins)}
+
+    async def query_pull_request_reviews(
+        self, owner: str, name: str, numbers: list[int]
+    ) -> dict[int, list[dict[str, Any]] | None]:
+        """Query reviews for several pull requests in one request.
+
+        Args:
+            owner: Repository owner.
+            name: Repository name.
+            numbers: Pull request numbers (at most 100 per call is advisable).
+
+        Returns:
+            PR number -> reviews in REST shape, or None when the PR was not
+            found or has more than 100 reviews (callers fetch those via REST).
+        """
+        if not numbers:
+            return {}
+        logger.debug("Querying reviews for %d PRs in %s/%s", len(numbers), owner, name)
+
+        variables: dict[str, Any] = {"owner": owner, "name": name}
+        variables.update({f"n{i}": number for i, number in enumerate(numbers)})
+        data = await self.execute(
+            build_pull_request_reviews_query(len(numbers)), variables, allow_partial=True
+        )
+
+        repository = data.get("repository") or {}
+        result: dict[int, list[dict[str, Any]] | None] = {}
+        for i, number in enumerate(numbers):
+            reviews = (repository.get(f"p{i}") or {}).get("reviews")
+            if reviews is None or reviews["pageInfo"]["hasNextPage"]:
+                result[number] = None
+            else:
+                result[number] = [review_to_rest(node) for node in reviews["nodes"]]
+        return result
+
+    async def query_repo_counts(
+        self, full_names: list[str], since: datetime, until: datetime
+    ) -> tuple[dict[str, dict[str, int] | None], int]:
+        """Query collection-size counts for several repositories in one request.
+
+        Args:
+            full_names: Repository full names (owner/name).
+            since: Start of the collection window (inclusive).
+            until: End of the collection window (exclusive).
+
+        Returns:
+            (full name -> counts or None if the repo did not resolve, query
+            point cost). Counts are pulls_total, issues_total, pulls_window,
+            issues_window (created in the window) and commits_window (on the
+            default branch).
+        """
+        if not full_names:
+            return {}, 0
+        logger.debug("Querying collection counts for %d repos", len(full_names))
+
+        # Search ranges are inclusive dates; until is exclusive
+        created = f"created:{since.date()}..{(until - timedelta(microseconds=1)).date()}"
+        variables: dict[str, Any] = {"since": since.isoformat(), "until": until.isoformat()}
+        for i, full_name in enumerate(full_names):
+            owner, name = full_name.split("/", 1)
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = name
+            variables[f"qp{i}"] = f"repo:{full_name} is:pr {created}"
+            variables[f"qi{i}"] = f"repo:{full_name} is:issue {created}"
+        data = await self.execute(
+            build_repo_counts_query(len(full_names)), variables, allow_partial=True
+        )
+
+        result: dict[str, dict[str, int] | None] = {}
+        for i, full_name in enumerate(full_names):
+            repository = data.get(f"r{i}")
+            if repository is None:
+                result[full_name] = None
+                continue
+            target = (repository.get("defaultBranchRef") or {}).get("target") or {}
+            result[full_name] = {
+                "pulls_total": repository["pullRequests"]["totalCount"],
+                "issues_total": repository["issues"]["totalCount"],
+                "pulls_window": (data.get(f"p{i}") or {}).get("issueCount", 0),
+                "issues_window": (data.get(f"i{i}") or {}).get("issueCount", 0),
+                "commits_window": (target.get("history") or {}).get("totalCount", 0),
+            }
+        cost = int((data.get("rateLimit") or {}).get("cost", 1))
+        return result, cost
+
+    async def query_tree_entries(
+        self, owner: str, name: str, expressions: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        """List several directories of one repository in one request.
+
+        Args:
+            owner: Repository owner.
+            name: Repository name.
+            expressions: Object expressions such as ``"main:"`` (root tree) or
+                ``"main:.github"``.
+
+        Returns:
+            Expression -> ``{"oid": ..., "entries": [{name, type, oid, size}]}``,
+            or None when the expression does not resolve to a directory.
+        """
+        if not expressions:
+            return {}
+        logger.debug("Querying %d directory listings in %s/%s", len(expressions), owner, name)
+
+        variables: dict[str, Any] = {"owner": owner, "name": name}
+        variables.update({f"e{i}": expression for i, expression in enumerate(expressions)})
+        data = await self.execute(
+            build_tree_entries_query(len(expressions)), variables, allow_partial=True
+        )
+
+        repository = data.get("repository") or {}
+        result: dict[str, dict[str, Any] | None] = {}
+        for i, expression in enumerate(expressions):
+            tree = repository.get(f"t{i}")
+            result[expression] = tree if tree and "entries" in tree else None
+        return result
+
     async def query_org_info(self, org: str) -> dict[str, Any]:
         """Query organization profile information.
 
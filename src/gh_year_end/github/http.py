@@ -2,22 +2,69 @@
 
 Async HTTP client for GitHub API with automatic rate limit handling,
 retry logic, and request/response tracking.
+
+Identical GETs are deduplicated: concurrent ones share a single in-flight
+request (single-flight), and successful responses are memoized for a short
+time so a repeat from another phase is served from memory. Listing pages are
+never memoized, and the memo is capped by response bytes. Each caller still
+gets its own parsed ``GitHubResponse``, so callers may mutate the data.
+
+The transport is tunable: optional HTTP/2 multiplexing, pool limits, and
+connect/read/write/pool timeouts per endpoint class (REST, GraphQL, search).
+Connection reuse and handshake time are traced per request.
 """
 
 import asyncio
+import importlib.util
 import logging
-from dataclasses import dataclass, field
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Optional
+from urllib.parse import urlparse
 
 import httpx
 from pydantic import BaseModel
 
 from gh_year_end import __version__
 from gh_year_end.github.auth import GitHubAuth
+from gh_year_end.telemetry import openmetrics, profiling, request_trace, trace_events
 
 logger = logging.getLogger(__name__)
 
+# Endpoints whose answer must always be fresh (never memoized)
+NO_MEMO_PATHS = frozenset({"/rate_limit"})
+
+# Query parameters of paginated listings, whose pages are read once (never memoized)
+NO_MEMO_PARAMS = frozenset({"page", "per_page"})
+
+# Endpoint classes with their own timeouts
+ENDPOINT_CLASSES = ("rest", "graphql", "search")
+
+
+def endpoint_class(path: str) -> str:
+    """Endpoint class of an API path: ``graphql``, ``search``, or ``rest``."""
+    path = path.lstrip("/")
+    if path == "graphql":
+        return "graphql"
+    if path.startswith("search/"):
+        return "search"
+    return "rest"
+
+
+def graphql_url(base_url: str) -> str:
+    """GraphQL endpoint for a REST base URL.
+
+    GitHub Enterprise Server serves REST under ``/api/v3`` and GraphQL at
+    ``/api/graphql``; other hosts serve GraphQL at ``{base_url}/graphql``.
+    """
+    base_url = base_url.rstrip("/")
+    if base_url.endswith("/api/v3"):
+        base_url = base_url.removesuffix("/v3")
+    return f"{base_url}/graphql"
+
 
 class RateLimitInfo(BaseModel):
     """GitHub API rate limit information from response headers."""
@@ -63,6 +110,16 @@ class GitHubResponse:
     rate_limit: RateLimitInfo | None = None
     url: str = ""
     retry_after: int | None = None
+    source: str = "network"
+
+    @property
+    def from_network(self) -> bool:
+        """Whether this response was fetched for this call (not memo or coalesced).
+
+        Shared responses carry the rate limit headers of the request that
+        fetched them, which may be stale.
+        """
+        return self.source == "network"
 
     @property
     def is_success(self) -> bool:
@@ -108,6 +165,85 @@ class HTTPRateLimitState:
                 )
 
 
+@dataclass
+class DedupStats:
+    """Counts of GET requests served without a network round trip."""
+
+    coalesced: int = 0
+    memo_hits: int = 0
+
+    @property
+    def saved(self) -> int:
+        """Requests avoided in total."""
+        return self.coalesced + self.memo_hits
+
+    def to_dict(self) -> dict[str, int]:
+        """Serializable counts."""
+        return {**asdict(self), "saved": self.saved}
+
+
+@dataclass
+class ConnectionStats:
+    """Connection-level metrics from httpx trace events.
+
+    A request that opens a TCP connection counts as a new connection; every
+    other request reused a pooled (or multiplexed HTTP/2) connection.
+    Handshake time is the TCP connect plus TLS negotiation time.
+    """
+
+    requests: int = 0
+    new_connections: int = 0
+    handshake_seconds: float = 0.0
+    http_versions: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of requests sent on an already open connection."""
+        if not self.requests:
+            return 0.0
+        return max(self.requests - self.new_connections, 0) / self.requests
+
+    @property
+    def mean_handshake_ms(self) -> float:
+        """Mean connect + TLS time per new connection in milliseconds."""
+        if not self.new_connections:
+            return 0.0
+        return self.handshake_seconds / self.new_connections * 1000
+
+    def tracer(self) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+        """Trace callback for one request (httpx ``trace`` extension)."""
+        started: dict[str, float] = {}
+
+        async def trace(event_name: str, _info: dict[str, Any]) -> None:
+            step, _, phase = event_name.rpartition(".")
+            if step not in ("connection.connect_tcp", "connection.start_tls"):
+                return
+            if phase == "started":
+                started[step] = time.perf_counter()
+            elif phase == "complete" and step in started:
+                self.handshake_seconds += time.perf_counter() - started.pop(step)
+                if step == "connection.connect_tcp":
+                    self.new_connections += 1
+
+        return trace
+
+    def record(self, response: httpx.Response) -> None:
+        """Count a response and its HTTP version."""
+        self.requests += 1
+        version = response.http_version
+        self.http_versions[version] = self.http_versions.get(version, 0) + 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable metrics."""
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reuse_rate": round(self.reuse_rate, 4),
+            "mean_handshake_ms": round(self.mean_handshake_ms, 2),
+            "http_versions": dict(self.http_versions),
+        }
+
+
 class GitHubHTTPError(Exception):
     """Base exception for GitHub HTTP errors."""
 
@@ -130,6 +266,8 @@ class GitHubClient:
     - Rate limit detection and handling
     - Request/response logging
     - Configurable timeouts and retries
+    - Single-flight coalescing and a short-lived memo for identical GETs
+    - Optional HTTP/2, pool limits, and per-endpoint-class timeouts
     """
 
     BASE_URL = "https://api.github.com"
@@ -144,6 +282,12 @@ class GitHubClient:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         base_url: str = BASE_URL,
+        coalesce: bool = True,
+        memo_ttl: float = 0.0,
+        memo_max_bytes: int = 16 * 1024 * 1024,
+        http2: bool = False,
+        limits: httpx.Limits | None = None,
+        timeouts: dict[str, httpx.Timeout] | None = None,
     ) -> None:
         """Initialize GitHub HTTP client.
 
@@ -152,14 +296,68 @@ class GitHubClient:
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for failed requests.
             base_url: Base URL for GitHub API.
+            coalesce: Share one in-flight request among identical GETs.
+            memo_ttl: Seconds to serve a successful GET from memory (0 disables).
+            memo_max_bytes: Maximum total body size of memoized responses
+                (oldest evicted first).
+            http2: Multiplex requests over HTTP/2 (falls back to HTTP/1.1
+                when the h2 package is missing).
+            limits: Connection pool limits (httpx defaults if omitted).
+            timeouts: Timeouts by endpoint class (``rest``, ``graphql``,
+                ``search``); classes left out use ``timeout``.
         """
         self._auth = auth or GitHubAuth()
         self._timeout = timeout
         self._max_retries = max_retries
         self._base_url = base_url.rstrip("/")
+        self._graphql_url = graphql_url(self._base_url)
+        self._coalesce = coalesce
+        self._memo_ttl = memo_ttl
+        self._memo_max_bytes = memo_max_bytes
+        self._http2 = http2
+        self._limits = limits
+        self._timeouts = timeouts or {}
 
         self._client: httpx.AsyncClient | None = None
         self._rate_limit_state = HTTPRateLimitState()
+        self._inflight: dict[Hashable, asyncio.Task[httpx.Response]] = {}
+        self._memo: OrderedDict[Hashable, tuple[float, httpx.Response]] = OrderedDict()
+        self._memo_bytes = 0
+        self._dedup_stats = DedupStats()
+        self._connection_stats = ConnectionStats()
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Connection reuse, handshake time, and HTTP versions seen."""
+        return self._connection_stats
+
+    @property
+    def dedup_stats(self) -> DedupStats:
+        """Counts of coalesced and memoized GET requests."""
+        return self._dedup_stats
+
+    def api_path(self, url: str) -> str:
+        """API path of a full URL under the base URL, such as a Link header target.
+
+        The base URL's own path (``/api/v3`` on GitHub Enterprise Server) is
+        stripped so the path is not applied twice.
+
+        Args:
+            url: Absolute API URL.
+
+        Returns:
+            Path relative to the base URL.
+        """
+        path = urlparse(url).path
+        prefix = urlparse(self._base_url).path
+        if prefix and path.startswith(prefix + "/"):
+            return path[len(prefix) :]
+        return path
+
+    @property
+    def auth_fingerprint(self) -> str:
+        """Digest of the token in use, for keying caches by identity."""
+        return self._auth.fingerprint
 
     @property
     def rate_limit_state(self) -> HTTPRateLimitState:
@@ -191,11 +389,17 @@ class GitHubClient:
             Active httpx.AsyncClient instance.
         """
         if self._client is None:
+            if self._http2 and importlib.util.find_spec("h2") is None:
+                logger.warning("HTTP/2 needs the h2 package (gh-year-end[http2]); using HTTP/1.1")
+                self._http2 = False
+            options: dict[str, Any] = {"limits": self._limits} if self._limits else {}
             self._client = httpx.AsyncClient(
                 base_url=self._base_url,
                 timeout=self._timeout,
                 headers=self._get_headers(),
                 follow_redirects=True,
+                http2=self._http2,
+                **options,
             )
         return self._client
 
@@ -274,6 +478,7 @@ class GitHubClient:
             wait_seconds,
         )
         await asyncio.sleep(wait_seconds)
+        request_trace.add_wait("retry", wait_seconds)
 
         return await self._do_request(method, path, retry_count + 1, **kwargs)
 
@@ -303,14 +508,25 @@ class GitHubClient:
 
         logger.debug("%s %s (attempt %d)", method, path, retry_count + 1)
 
+        api = endpoint_class(path)
+        timeout = self._timeouts.get(api)
+        if timeout is not None:
+            kwargs.setdefault("timeout", timeout)
+        extensions = {"trace": self._connection_stats.tracer(), **kwargs.pop("extensions", {})}
+
         try:
-            response = await client.request(method, path, **kwargs)
+            sent = time.perf_counter()
+            url = self._graphql_url if api == "graphql" else path
+            response = await client.request(method, url, extensions=extensions, **kwargs)
+            self._connection_stats.record(response)
+            openmetrics.observe_request(api, response.status_code, time.perf_counter() - sent)
 
             # Handle rate limiting
             if response.status_code in (429, 403):
                 wait_seconds = await self._handle_rate_limit(response, retry_count)
                 if wait_seconds:
                     await asyncio.sleep(wait_seconds)
+                    request_trace.add_wait("retry", wait_seconds)
                     return await self._retry_request(method, path, retry_count, **kwargs)
 
             # Retry on server errors (5xx)
@@ -352,6 +568,9 @@ class GitHubClient:
     ) -> GitHubResponse:
         """Make an HTTP request to GitHub API.
 
+        Identical GETs (same path, params, and headers) share an in-flight
+        request and, within ``memo_ttl``, a previous successful response.
+
         Args:
             method: HTTP method (GET, POST, etc.).
             path: API path (e.g., "/user" or "repos/owner/repo").
@@ -364,25 +583,48 @@ class GitHubClient:
             GitHubHTTPError: On request failure.
             RateLimitExceeded: If rate limit exceeded.
         """
-        response = await self._do_request(method, path, **kwargs)
-
-        # Extract rate limit info
-        rate_limit = RateLimitInfo.from_headers(response.headers)
-        self._rate_limit_state.update(rate_limit)
-
-        # Extract retry-after if present
-        retry_after = None
-        if "retry-after" in response.headers:
-            retry_after = int(response.headers["retry-after"])
-
-        # Parse JSON response
-        data = None
-        if response.content:
-            try:
-                data = response.json()
-            except Exception as e:
-                logger.warning("Failed to parse JSON response: %s", e)
-                data = response.text
+        with trace_events.span(f"{method} {path}", "http") as http_span:
+            trace = request_trace.active_trace()
+            started = trace.clock() if trace else 0.0
+            key = self._dedup_key(method, path, kwargs)
+            source = "network"
+            if key is None:
+                response = await self._send(method, path, **kwargs)
+            else:
+                response, source = await self._send_deduplicated(key, method, path, **kwargs)
+            received = trace.clock() if trace else 0.0
+
+            # Extract rate limit info
+            rate_limit = RateLimitInfo.from_headers(response.headers)
+
+            # Extract retry-after if present
+            retry_after = None
+            if "retry-after" in response.headers:
+                retry_after = int(response.headers["retry-after"])
+
+            # Parse JSON response
+            data = None
+            if response.content:
+                try:
+                    data = response.json()
+                except Exception as e:
+                    logger.warning("Failed to parse JSON response: %s", e)
+                    data = response.text
+
+            if trace is not None:
+                request_trace.record_request(
+                    method,
+                    path,
+                    body=kwargs.get("json"),
+                    started=started,
+                    status=response.status_code,
+                    source=source,
+                    network=received - started,
+                    nbytes=len(response.content),
+                    decode=trace.clock() - received,
+                )
+            http_span.set(status=response.status_code, source=source)
+            profiling.count_events()
 
         return GitHubResponse(
             status_code=response.status_code,
@@ -391,8 +633,123 @@ class GitHubClient:
             rate_limit=rate_limit,
             url=str(response.url),
             retry_after=retry_after,
+            source=source,
         )
 
+    async def get_shared(self, path: str, **kwargs: Any) -> GitHubResponse | None:
+        """GET from the memo or an identical in-flight request, never the network.
+
+        Args:
+            path: API path.
+            **kwargs: Additional arguments (params, etc.).
+
+        Returns:
+            The shared response, or None if this GET would have to be sent.
+        """
+        key = self._dedup_key("GET", path, kwargs)
+        if key is None or not self._is_shared(key):
+            return None
+        return await self.request("GET", path, **kwargs)
+
+    def _is_shared(self, key: Hashable) -> bool:
+        """Whether a GET can be served from the memo or an in-flight request."""
+        memoized = self._memo.get(key)
+        if memoized is not None and time.monotonic() < memoized[0]:
+            return True
+        return self._coalesce and key in self._inflight
+
+    async def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request over the network and record its rate limit state."""
+        response = await self._do_request(method, path, **kwargs)
+        self._rate_limit_state.update(RateLimitInfo.from_headers(response.headers))
+        return response
+
+    def _dedup_key(self, method: str, path: str, kwargs: dict[str, Any]) -> Hashable | None:
+        """Key identifying interchangeable requests, or None if not deduplicated.
+
+        Only GETs carrying nothing but ``params`` and ``headers`` qualify.
+        """
+        if method.upper() != "GET" or not (self._coalesce or self._memo_ttl > 0):
+            return None
+        if not kwargs.keys() <= {"params", "headers"}:
+            return None
+        params = kwargs.get("params") or {}
+        headers = kwargs.get("headers") or {}
+        return (
+            "/" + path.lstrip("/"),
+            tuple(sorted((str(k), str(v)) for k, v in dict(params).items())),
+            tuple(sorted((str(k).lower(), str(v)) for k, v in dict(headers).items())),
+        )
+
+    async def _send_deduplicated(
+        self, key: Hashable, method: str, path: str, **kwargs: Any
+    ) -> tuple[httpx.Response, str]:
+        """Serve a GET from the memo, an identical in-flight request, or the network.
+
+        Returns:
+            The response and where it came from: ``memo``, ``coalesced``, or
+            ``network``.
+        """
+        memoized = self._memo.get(key)
+        if memoized is not None:
+            expires_at, response = memoized
+            if time.monotonic() < expires_at:
+                self._dedup_stats.memo_hits += 1
+                logger.debug("Memo hit for %s %s", method, path)
+                return response, "memo"
+            self._forget(key)
+
+        task = self._inflight.get(key) if self._coalesce else None
+        source = "network"
+        if task is not None:
+            source = "coalesced"
+            self._dedup_stats.coalesced += 1
+            logger.debug("Coalesced %s %s with an in-flight request", method, path)
+        else:
+            task = asyncio.create_task(self._send(method, path, **kwargs))
+            if self._coalesce:
+                self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        # A cancelled waiter must not cancel the request other waiters share
+        return await asyncio.shield(task), source
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[httpx.Response]") -> None:
+        """Drop a finished request from the in-flight map and memoize successes."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        response = task.result()
+        if self._memo_ttl <= 0 or response.status_code != 200 or not self._memoizable(key):
+            return
+        size = len(response.content)
+        if size > self._memo_max_bytes:
+            return
+        now = time.monotonic()
+        # Entries share one TTL and are kept in insertion order, so expired ones lead
+        while self._memo and next(iter(self._memo.values()))[0] <= now:
+            self._forget(next(iter(self._memo)))
+        self._forget(key)
+        self._memo[key] = (now + self._memo_ttl, response)
+        self._memo_bytes += size
+        while self._memo_bytes > self._memo_max_bytes:
+            self._forget(next(iter(self._memo)))
+
+    @staticmethod
+    def _memoizable(key: Hashable) -> bool:
+        """Whether a deduplicated GET may be memoized (not a listing page or /rate_limit)."""
+        if not isinstance(key, tuple):
+            return False
+        path, params, _headers = key
+        return path not in NO_MEMO_PATHS and not any(name in NO_MEMO_PARAMS for name, _ in params)
+
+    def _forget(self, key: Hashable) -> None:
+        """Drop a memo entry, if present, and its bytes from the memo total."""
+        entry = self._memo.pop(key, None)
+        if entry is not None:
+            self._memo_bytes -= len(entry[1].content)
+
     async def get(self, path: str, **kwargs: Any) -> GitHubResponse:
         """Make a GET request.
 
@@ -422,6 +779,24 @@ class GitHubClient:
         if self._client:
             await self._client.aclose()
             self._client = None
+        self._memo.clear()
+        self._memo_bytes = 0
+        connections = self._connection_stats
+        if connections.requests:
+            logger.info(
+                "HTTP connections: %d requests, %d opened (%.0f%% reuse, %.1f ms mean handshake)",
+                connections.requests,
+                connections.new_connections,
+                connections.reuse_rate * 100,
+                connections.mean_handshake_ms,
+            )
+        if self._dedup_stats.saved:
+            logger.info(
+                "Deduplicated %d GET requests (%d coalesced, %d memo hits)",
+                self._dedup_stats.saved,
+                self._dedup_stats.coalesced,
+                self._dedup_stats.memo_hits,
+            )
 
     async def __aenter__(self) -> "GitHubClient":
         """Async context manager entry."""
@@ -0,0 +1,110 @@
+"""Dual-API work assignment between REST and GraphQL budgets.
+
+REST (requests per hour) and GraphQL (points per hour) have independent
+budgets. Work that either API can serve is assigned by ``APIPlanner`` to the
+API with headroom, so a run keeps making progress on one budget while the
+other is exhausted instead of sleeping until its reset.
+
+Among APIs with enough headroom (remaining budget above a reserve), the one
+for which the work is the smallest share of what is left wins, which spreads
+load across both budgets. If neither has headroom, the API that resets first
+is chosen, so the wait is as short as possible.
+"""
+
+import logging
+import math
+from collections import Counter
+from collections.abc import Mapping
+
+from gh_year_end.github.ratelimit import AdaptiveRateLimiter, APIType
+
+logger = logging.getLogger(__name__)
+
+# GraphQL charges one point per 100 connection requests (minimum one per query)
+GRAPHQL_NODES_PER_POINT = 100
+
+
+def graphql_points(connections: int) -> int:
+    """Estimate the point cost of a query fetching ``connections`` connections.
+
+    Args:
+        connections: Number of first-100 connections in the query.
+
+    Returns:
+        Estimated points (at least 1).
+    """
+    return max(1, math.ceil(connections / GRAPHQL_NODES_PER_POINT))
+
+
+class APIPlanner:
+    """Assign interchangeable work to the API with budget headroom.
+
+    Example:
+        planner = APIPlanner(rate_limiter, reserve_percent=5)
+        api = planner.choose({APIType.GRAPHQL: 1, APIType.REST: len(pr_numbers)})
+    """
+
+    def __init__(self, rate_limiter: AdaptiveRateLimiter, reserve_percent: float = 5.0) -> None:
+        """Initialize the planner.
+
+        Args:
+            rate_limiter: Rate limiter tracking both budgets.
+            reserve_percent: Share of each budget kept back for work only that
+                API can serve.
+        """
+        self.rate_limiter = rate_limiter
+        self.reserve_percent = reserve_percent
+        self.assignments: Counter[APIType] = Counter()
+
+    def headroom(self, api_type: APIType) -> float:
+        """Budget available above the reserve (full limit once the window has reset).
+
+        Args:
+            api_type: API to check.
+
+        Returns:
+            Remaining requests or points usable for interchangeable work.
+        """
+        state = self.rate_limiter.get_state(api_type)
+        remaining = state.remaining
+        if state.reset_at > 0 and state.seconds_until_reset == 0:
+            remaining = state.limit
+        return remaining - state.limit * self.reserve_percent / 100
+
+    def choose(self, costs: Mapping[APIType, float]) -> APIType:
+        """Pick the API to serve a unit of work.
+
+        Args:
+            costs: Estimated cost per API that can serve the work, in that
+                API's units (REST requests, GraphQL points). Ties go to the
+                API listed first.
+
+        Returns:
+            The chosen API.
+        """
+        if not costs:
+            msg = "No API can serve this work"
+            raise ValueError(msg)
+
+        best: APIType | None = None
+        best_share = math.inf
+        for api_type, cost in costs.items():
+            available = self.headroom(api_type)
+            if available >= cost:
+                share = cost / available if available > 0 else 0.0
+                if share < best_share:
+                    best, best_share = api_type, share
+
+        if best is None:
+            best = min(
+                costs,
+                key=lambda api_type: self.rate_limiter.get_state(api_type).seconds_until_reset,
+            )
+            logger.debug("No API has headroom; using %s (resets first)", best.value)
+
+        self.assignments[best] += 1
+        return best
+
+    def stats(self) -> dict[str, int]:
+        """Number of work units assigned to each API."""
+        return {api_type.value: self.assignments[api_type] for api_type in APIType}
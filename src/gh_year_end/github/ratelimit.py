@@ -19,6 +19,7 @@ from enum import Enum, IntEnum
 from typing import Any
 
 from gh_year_end.config import RateLimitConfig
+from gh_year_end.telemetry import request_trace
 
 logger = logging.getLogger(__name__)
 
@@ -276,6 +277,7 @@ class AdaptiveRateLimiter:
         self.config = config
         self._semaphore = asyncio.Semaphore(config.max_concurrency)
         self._lock = asyncio.Lock()
+        self._in_flight = 0
 
         # Separate state tracking for REST and GraphQL
         self._state: dict[APIType, RateLimitState] = {
@@ -300,6 +302,10 @@ class AdaptiveRateLimiter:
         self._request_timestamps: deque[float] = deque(maxlen=200)
         self._secondary_backoff_multiplier = 1.0
 
+        # Even pacing (seconds between requests) per API, set from a pre-flight plan
+        self._pace_interval: dict[APIType, float] = {}
+        self._next_slot: dict[APIType, float] = {}
+
         # Progress tracking
         self._progress_state: ProgressState | None = None
 
@@ -322,6 +328,34 @@ class AdaptiveRateLimiter:
         """
         self._progress_state = progress_state
 
+    def set_pace(self, api_type: APIType, interval_seconds: float) -> None:
+        """Space requests to an API evenly instead of bursting until exhausted.
+
+        Args:
+            api_type: API to pace.
+            interval_seconds: Minimum seconds between request starts (0 disables).
+        """
+        if interval_seconds > 0:
+            self._pace_interval[api_type] = interval_seconds
+            logger.info("Pacing %s API: one request every %.2fs", api_type.value, interval_seconds)
+        else:
+            self._pace_interval.pop(api_type, None)
+        self._next_slot.pop(api_type, None)
+
+    def get_pace(self, api_type: APIType) -> float:
+        """Seconds between requests for an API (0 when not paced)."""
+        return self._pace_interval.get(api_type, 0.0)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a concurrency slot."""
+        return self._in_flight
+
+    @property
+    def api_types(self) -> tuple[APIType, ...]:
+        """APIs with tracked rate limit state."""
+        return tuple(self._state)
+
     def get_progress_state(self) -> ProgressState | None:
         """Get current progress state.
 
@@ -352,8 +386,14 @@ class AdaptiveRateLimiter:
                 msg = "Circuit breaker open, cannot execute requests"
                 raise RuntimeError(msg)
 
+        # Waits are attributed to the next request when a request trace is running
+        waits = request_trace.start_waits()
+        started = time.perf_counter()
+
         # Acquire semaphore slot for concurrency control
         await self._semaphore.acquire()
+        self._in_flight += 1
+        queued = time.perf_counter()
 
         try:
             # Try to acquire token from bucket
@@ -365,10 +405,17 @@ class AdaptiveRateLimiter:
                 await asyncio.sleep(0.1)
             else:
                 logger.debug("Token bucket exhausted, proceeding with caution")
+            bucketed = time.perf_counter()
 
             # Check and apply throttling
             await self._apply_throttling(api_type, priority)
 
+            if waits is not None:
+                waits["queue"] = queued - started
+                waits["bucket"] = bucketed - queued
+                throttled = time.perf_counter() - bucketed
+                waits["throttle"] = max(throttled - waits.get("secondary", 0.0), 0.0)
+
             # Track request timing for secondary limit protection
             async with self._lock:
                 self._request_timestamps.append(time.time())
@@ -377,15 +424,26 @@ class AdaptiveRateLimiter:
 
         except Exception:
             # Release semaphore if we fail
+            self._in_flight -= 1
             self._semaphore.release()
             raise
 
+    def discount_request(self) -> None:
+        """Take back the request counted by ``acquire`` when none was sent.
+
+        Used when the response came from memory (a memo hit or a coalesced
+        request) after the slot was already acquired.
+        """
+        if self._progress_state and self._progress_state.requests_made > 0:
+            self._progress_state.requests_made -= 1
+
     def release(self, success: bool = True) -> None:
         """Release the acquired semaphore slot.
 
         Args:
             success: Whether the request was successful.
         """
+        self._in_flight -= 1
         self._semaphore.release()
 
         # Update circuit breaker - fire and forget
@@ -417,7 +475,18 @@ class AdaptiveRateLimiter:
                 return
 
             # Apply secondary rate limit protection
+            secondary_started = time.perf_counter()
             await self._enforce_secondary_limit()
+            request_trace.add_wait("secondary", time.perf_counter() - secondary_started)
+
+            # Apply pre-flight pacing
+            interval = self._pace_interval.get(api_type)
+            if interval:
+                now = time.time()
+                slot = max(now, self._next_slot.get(api_type, now))
+                self._next_slot[api_type] = slot + interval
+                if slot > now:
+                    await asyncio.sleep(slot - now)
 
             # Apply adaptive delay based on strategy and priority
             if self.config.strategy == "adaptive":
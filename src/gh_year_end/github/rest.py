@@ -8,10 +8,11 @@ import logging
 import re
 from collections.abc import AsyncIterator
 from typing import Any, cast
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urlparse
 
 from gh_year_end.github.http import GitHubClient, GitHubResponse
 from gh_year_end.github.ratelimit import AdaptiveRateLimiter, APIType
+from gh_year_end.telemetry import trace_events
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +63,43 @@ class RestClient:
 
         return links
 
+    async def _get(self, path: str, **kwargs: Any) -> GitHubResponse:
+        """GET through the rate limiter unless the response is already shared.
+
+        Memo hits and coalesced requests carry the rate limit headers of the
+        request that fetched them, so they neither take a rate limiter slot,
+        feed its state, nor count as requests.
+
+        Args:
+            path: API endpoint path.
+            **kwargs: Additional arguments (params, etc.).
+
+        Returns:
+            The response.
+        """
+        shared = await self._http.get_shared(path, **kwargs)
+        if shared is not None:
+            return shared
+
+        if self._rate_limiter:
+            await self._rate_limiter.acquire(APIType.REST)
+
+        try:
+            response = await self._http.get(path, **kwargs)
+
+            if self._rate_limiter:
+                if response.from_network:
+                    self._rate_limiter.update(dict(response.headers), APIType.REST)
+                else:
+                    # Became shared while waiting for the slot
+                    self._rate_limiter.discount_request()
+
+            return response
+
+        finally:
+            if self._rate_limiter:
+                self._rate_limiter.release()
+
     async def _paginate(
         self,
         path: str,
@@ -80,24 +118,9 @@ class RestClient:
         current_params = params or {}
         page_num = 1
 
-        while True:
-            # Acquire rate limit permission
-            if self._rate_limiter:
-                await self._rate_limiter.acquire(APIType.REST)
-
-            try:
-                # Make request
-                response: GitHubResponse = await self._http.get(
-                    current_path,
-                    params=current_params if page_num == 1 else None,
-                )
-
-                # Update rate limiter
-                if self._rate_limiter:
-                    self._rate_limiter.update(
-                        dict(response.headers),
-                        APIType.REST,
-                    )
+        with trace_events.span(f"list {path}", "listing") as listing:
+            while True:
+                response = await self._get(current_path, params=current_params)
 
                 # Handle 404 - return empty for missing resources
                 if response.status_code == 404:
@@ -135,6 +158,7 @@ class RestClient:
                         "reset": response.rate_limit.reset.isoformat(),
                     }
 
+                listing.set(pages=page_num)
                 yield data, metadata
 
                 # Check for next page
@@ -148,19 +172,14 @@ class RestClient:
                 # Parse next URL to extract path and params
                 next_url = links["next"]
                 parsed = urlparse(next_url)
-                current_path = parsed.path
-                # GitHub's Link header includes full URL with query string
-                # We'll use the full path from the next URL
-                current_params = {}
+                current_path = self._http.api_path(next_url)
+                # GitHub's Link header carries the full query string (page,
+                # per_page, and the original filters)
+                current_params = dict(parse_qsl(parsed.query))
                 page_num += 1
 
                 logger.debug("Following pagination to page %d", page_num)
 
-            finally:
-                # Always release rate limiter
-                if self._rate_limiter:
-                    self._rate_limiter.release()
-
     async def list_org_repos(
         self,
         org: str,
@@ -225,27 +244,16 @@ class RestClient:
         """
         path = f"/repos/{owner}/{repo}"
 
-        if self._rate_limiter:
-            await self._rate_limiter.acquire(APIType.REST)
-
-        try:
-            response = await self._http.get(path)
-
-            if self._rate_limiter:
-                self._rate_limiter.update(dict(response.headers), APIType.REST)
-
-            if response.status_code == 404:
-                return None
+        response = await self._get(path)
 
-            if response.is_success:
-                return cast("dict[str, Any]", response.data)
-
-            logger.error("Failed to fetch repo %s/%s: %d", owner, repo, response.status_code)
+        if response.status_code == 404:
             return None
 
-        finally:
-            if self._rate_limiter:
-                self._rate_limiter.release()
+        if response.is_success:
+            return cast("dict[str, Any]", response.data)
+
+        logger.error("Failed to fetch repo %s/%s: %d", owner, repo, response.status_code)
+        return None
 
     async def list_pulls(
         self,
@@ -439,6 +447,40 @@ class RestClient:
         async for items, metadata in self._paginate(path, params):
             yield items, metadata
 
+    async def get_contributor_stats(
+        self, owner: str, repo: str
+    ) -> tuple[list[dict[str, Any]] | None, int]:
+        """Get weekly commit activity per contributor.
+
+        GitHub computes these statistics in the background: the first request
+        for a repo whose statistics are not cached returns 202 Accepted with no
+        data, and the caller should ask again later.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+
+        Returns:
+            Tuple of (contributor stats list or None, HTTP status code).
+            Status 202 means the statistics are still being computed; 204
+            means the repository is empty.
+        """
+        path = f"/repos/{owner}/{repo}/stats/contributors"
+
+        response = await self._get(path)
+
+        if response.status_code == 200 and isinstance(response.data, list):
+            return cast("list[dict[str, Any]]", response.data), 200
+
+        if response.status_code not in (202, 204, 404):
+            logger.warning(
+                "Failed to fetch contributor stats for %s/%s: %d",
+                owner,
+                repo,
+                response.status_code,
+            )
+        return None, response.status_code
+
     async def get_repository_tree(
         self,
         owner: str,
@@ -463,34 +505,23 @@ class RestClient:
         if recursive:
             params["recursive"] = "1"
 
-        if self._rate_limiter:
-            await self._rate_limiter.acquire(APIType.REST)
-
-        try:
-            response = await self._http.get(path, params=params)
-
-            if self._rate_limiter:
-                self._rate_limiter.update(dict(response.headers), APIType.REST)
-
-            if response.status_code == 404:
-                logger.debug("Tree not found (404): %s/%s @ %s", owner, repo, tree_sha)
-                return None
-
-            if response.is_success:
-                return cast("dict[str, Any]", response.data)
+        response = await self._get(path, params=params)
 
-            logger.error(
-                "Failed to fetch tree for %s/%s @ %s: %d",
-                owner,
-                repo,
-                tree_sha,
-                response.status_code,
-            )
+        if response.status_code == 404:
+            logger.debug("Tree not found (404): %s/%s @ %s", owner, repo, tree_sha)
             return None
 
-        finally:
-            if self._rate_limiter:
-                self._rate_limiter.release()
+        if response.is_success:
+            return cast("dict[str, Any]", response.data)
+
+        logger.error(
+            "Failed to fetch tree for %s/%s @ %s: %d",
+            owner,
+            repo,
+            tree_sha,
+            response.status_code,
+        )
+        return None
 
     async def get_rate_limit(self) -> dict[str, Any] | None:
         """Get current rate limit status.
@@ -500,24 +531,13 @@ class RestClient:
         """
         path = "/rate_limit"
 
-        if self._rate_limiter:
-            await self._rate_limiter.acquire(APIType.REST)
+        response = await self._get(path)
 
-        try:
-            response = await self._http.get(path)
+        if response.is_success:
+            return cast("dict[str, Any]", response.data)
 
-            if self._rate_limiter:
-                self._rate_limiter.update(dict(response.headers), APIType.REST)
-
-            if response.is_success:
-                return cast("dict[str, Any]", response.data)
-
-            logger.error("Failed to fetch rate limit: %d", response.status_code)
-            return None
-
-        finally:
-            if self._rate_limiter:
-                self._rate_limiter.release()
+        logger.error("Failed to fetch rate limit: %d", response.status_code)
+        return None
 
     async def get_branch_protection(
         self,
@@ -540,45 +560,34 @@ class RestClient:
         """
         path = f"/repos/{owner}/{repo}/branches/{branch}/protection"
 
-        if self._rate_limiter:
-            await self._rate_limiter.acquire(APIType.REST)
-
-        try:
-            response = await self._http.get(path)
-
-            if self._rate_limiter:
-                self._rate_limiter.update(dict(response.headers), APIType.REST)
+        response = await self._get(path)
 
-            # 404 means no branch protection is set (not an error)
-            if response.status_code == 404:
-                logger.debug("No branch protection for %s/%s:%s", owner, repo, branch)
-                return None, 404
+        # 404 means no branch protection is set (not an error)
+        if response.status_code == 404:
+            logger.debug("No branch protection for %s/%s:%s", owner, repo, branch)
+            return None, 404
 
-            # 403 means no permission to access
-            if response.status_code == 403:
-                logger.debug(
-                    "No permission to access branch protection for %s/%s:%s",
-                    owner,
-                    repo,
-                    branch,
-                )
-                return None, 403
-
-            if response.is_success:
-                return cast("dict[str, Any]", response.data), response.status_code
-
-            logger.warning(
-                "Unexpected status for branch protection %s/%s:%s - %d",
+        # 403 means no permission to access
+        if response.status_code == 403:
+            logger.debug(
+                "No permission to access branch protection for %s/%s:%s",
                 owner,
                 repo,
                 branch,
-                response.status_code,
             )
-            return None, response.status_code
+            return None, 403
 
-        finally:
-            if self._rate_limiter:
-                self._rate_limiter.release()
+        if response.is_success:
+            return cast("dict[str, Any]", response.data), response.status_code
+
+        logger.warning(
+            "Unexpected status for branch protection %s/%s:%s - %d",
+            owner,
+            repo,
+            branch,
+            response.status_code,
+        )
+        return None, response.status_code
 
     async def check_vulnerability_alerts(self, owner: str, repo: str) -> bool | None:
         """Check if vulnerability alerts (Dependabot alerts) are enabled.
@@ -592,14 +601,8 @@ class RestClient:
         """
         path = f"/repos/{owner}/{repo}/vulnerability-alerts"
 
-        if self._rate_limiter:
-            await self._rate_limiter.acquire(APIType.REST)
-
         try:
-            response = await self._http.get(path)
-
-            if self._rate_limiter:
-                self._rate_limiter.update(dict(response.headers), APIType.REST)
+            response = await self._get(path)
 
             if response.status_code == 204:
                 # 204 No Content means enabled
@@ -633,10 +636,6 @@ class RestClient:
             )
             return None
 
-        finally:
-            if self._rate_limiter:
-                self._rate_limiter.release()
-
     async def get_repo_security_analysis(self, owner: str, repo: str) -> dict[str, Any] | None:
         """Get repository with security_and_analysis field.
 
@@ -649,14 +648,8 @@ class RestClient:
         """
         path = f"/repos/{owner}/{repo}"
 
-        if self._rate_limiter:
-            await self._rate_limiter.acquire(APIType.REST)
-
         try:
-            response = await self._http.get(path)
-
-            if self._rate_limiter:
-                self._rate_limiter.update(dict(response.headers), APIType.REST)
+            response = await self._get(path)
 
             if response.status_code == 404:
                 logger.debug("Repository not found: %s/%s", owner, repo)
@@ -680,7 +673,3 @@ class RestClient:
         except Exception as e:
             logger.debug("Error fetching repo %s/%s: %s", owner, repo, e)
             return None
-
-        finally:
-            if self._rate_limiter:
-                self._rate_limiter.release()
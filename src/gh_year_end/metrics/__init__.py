@@ -0,0 +1,36 @@
+"""Metrics computation from stored raw data."""
+
+from gh_year_end.metrics.duckdb_engine import DuckDBMetricsEngine, MetricsEngineError
+from gh_year_end.metrics.engine import compute_metrics
+from gh_year_end.metrics.leaderboards import rank_users, write_full_rankings
+from gh_year_end.metrics.replay import (
+    load_raw_repos,
+    replay_commits,
+    replay_raw_data,
+    replay_repo,
+)
+from gh_year_end.metrics.sketches import HyperLogLog, KLLSketch
+from gh_year_end.metrics.timeseries import (
+    TimeseriesFrame,
+    build_columnar_timeseries,
+    expand_timeseries,
+    load_timeseries,
+)
+
+__all__ = [
+    "DuckDBMetricsEngine",
+    "HyperLogLog",
+    "KLLSketch",
+    "MetricsEngineError",
+    "TimeseriesFrame",
+    "build_columnar_timeseries",
+    "compute_metrics",
+    "expand_timeseries",
+    "load_raw_repos",
+    "load_timeseries",
+    "rank_users",
+    "replay_commits",
+    "replay_raw_data",
+    "replay_repo",
+    "write_full_rankings",
+]
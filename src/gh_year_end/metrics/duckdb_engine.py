@@ -0,0 +1,995 @@
+"""DuckDB-backed metrics engine over stored raw JSONL.
+
+Computes the same outputs as ``MetricsAggregator.export()`` using SQL, so that
+large collections can be re-aggregated with DuckDB's vectorized, multi-threaded
+execution instead of materialising every event as a Python dict. Only
+aggregated rows (per user, per period, per repo) are pulled back into Python
+for final JSON shaping.
+
+Events are replayed in the same order as ``replay_raw_data`` (and therefore
+``collect_and_aggregate``); that order is encoded as a sequence number so ties
+in rankings resolve exactly as they do in the in-memory aggregator. Commit
+metrics carry counts rather than one event per contribution, so rankings sum
+an amount per contribution.
+"""
+
+import json
+import logging
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import duckdb
+import pyarrow as pa
+
+from gh_year_end.collect.identity import get_bot_detector
+from gh_year_end.config import Config
+from gh_year_end.metrics.leaderboards import (
+    FULL_RANKINGS_KEY,
+    awards_from_leaderboards,
+    truncate_leaderboards,
+)
+from gh_year_end.metrics.replay import (
+    ISSUE_COMMENTS_ENDPOINT_PATTERN,
+    REVIEW_COMMENTS_ENDPOINT_PATTERN,
+    REVIEWS_ENDPOINT_PATTERN,
+    load_raw_hygiene,
+    load_raw_repos,
+)
+from gh_year_end.metrics.sketches import (
+    REPO_HEALTH_COUNTS,
+    new_repo_health_sketch,
+    repo_health_sketch_to_dict,
+    summarize_repo_health_sketch,
+)
+from gh_year_end.metrics.timeseries import build_columnar_timeseries
+from gh_year_end.storage.paths import PathManager
+
+logger = logging.getLogger(__name__)
+
+# Leaderboard keys that MetricsAggregator._compute_summary always materialises
+SUMMARY_METRICS = (
+    "prs_opened",
+    "issues_opened",
+    "reviews_submitted",
+    "comments_total",
+    "prs_merged",
+    "issues_closed",
+)
+
+# Summary keys present only when commit metrics were aggregated, after pr_sizes
+COMMIT_SUMMARY_KEYS = ("total_commits", "lines_added", "lines_deleted")
+
+# Empty, typed first branch of the event union so column types are stable
+_EMPTY_EVENTS_SQL = """
+    SELECT 0::BIGINT AS repo_idx, ''::VARCHAR AS repo, 0 AS stage, 0::BIGINT AS k1,
+        0::BIGINT AS k2, 0::BIGINT AS k3, ''::VARCHAR AS kind, NULL::BIGINT AS parent,
+        NULL::JSON AS data
+    WHERE false
+"""
+
+_RAW_KINDS = (
+    "pulls",
+    "issues",
+    "reviews",
+    "issue_comments",
+    "review_comments",
+    "contributor_stats",
+    "commits",
+)
+
+# Column types of a /stats/contributors week
+_WEEKS_TYPE = '[{"w": "BIGINT", "a": "BIGINT", "d": "BIGINT", "c": "BIGINT"}]'
+
+# Rows fetched per batch when streaming values into sketches
+_FETCH_BATCH_SIZE = 10_000
+
+
+class MetricsEngineError(Exception):
+    """Raised when metrics cannot be computed from stored data."""
+
+
+def _sql_literal(value: str) -> str:
+    """Quote a string as a SQL literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _epoch_us(dt: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return (dt - datetime(1970, 1, 1, tzinfo=UTC)) // timedelta(microseconds=1)
+
+
+def _json_value(raw: str | None, default: Any) -> Any:
+    """Decode a JSON fragment, using default when the key was absent."""
+    if raw is None:
+        return default
+    return json.loads(raw)
+
+
+def _medians(rows: list[tuple[str, int, int, float]]) -> dict[str, float]:
+    """Compute medians from the middle rows of each repo's sorted values.
+
+    Args:
+        rows: (repo, n, rank, value) tuples containing only the middle ranks.
+
+    Returns:
+        Dict mapping repo to median, matching MetricsAggregator's arithmetic.
+    """
+    middles: defaultdict[str, list[float]] = defaultdict(list)
+    for repo, _n, _rank, value in rows:
+        middles[repo].append(value)
+
+    return {
+        repo: values[0] if len(values) == 1 else (values[0] + values[1]) / 2
+        for repo, values in middles.items()
+    }
+
+
+class DuckDBMetricsEngine:
+    """Compute aggregator-equivalent metrics with DuckDB over raw JSONL."""
+
+    def __init__(self, config: Config, paths: PathManager) -> None:
+        """Initialize engine.
+
+        Args:
+            config: Application configuration.
+            paths: Path manager for storage locations.
+        """
+        self.config = config
+        self.paths = paths
+        self.year = config.github.windows.year
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        """Open an in-memory DuckDB connection with configured resources."""
+        settings: dict[str, Any] = {}
+        if self.config.metrics.threads:
+            settings["threads"] = self.config.metrics.threads
+        if self.config.metrics.memory_limit:
+            settings["memory_limit"] = self.config.metrics.memory_limit
+        return duckdb.connect(database=":memory:", config=settings)
+
+    def export(self) -> dict[str, Any]:
+        """Compute all metrics from raw data on disk.
+
+        Returns:
+            Dict with the same structure and values as MetricsAggregator.export().
+
+        Raises:
+            MetricsEngineError: If DuckDB fails to read or aggregate the data.
+        """
+        repos = load_raw_repos(self.paths)
+        hygiene: dict[str, dict[str, Any]] = {}
+        for repo_id, hygiene_data in load_raw_hygiene(self.paths):
+            hygiene[repo_id] = hygiene_data
+
+        logger.info("Computing metrics with DuckDB for %d repos", len(repos))
+
+        con = self._connect()
+        try:
+            self._load_events(con, repos)
+            users = self._load_users(con)
+            leaderboards, totals = self._compute_leaderboards(con, users)
+            timeseries, weekly_rows = self._compute_timeseries(con, users)
+            pr_sizes, largest_prs, fastest_merges = self._compute_pr_details(con)
+            repo_names = [r["full_name"] for r in repos]
+            sketches: dict[str, dict[str, Any]] = {}
+            if self.config.metrics.repo_health_mode == "sketch":
+                sketches = self._build_repo_health_sketches(con, repo_names)
+                repo_health = [
+                    summarize_repo_health_sketch(repo_id, sketches[repo_id])
+                    for repo_id in sorted(repo_names)
+                ]
+            else:
+                repo_health = self._compute_repo_health(con, repo_names)
+        except duckdb.Error as e:
+            msg = f"DuckDB metrics computation failed: {e}"
+            raise MetricsEngineError(msg) from e
+        finally:
+            con.close()
+
+        commit_totals = {key: totals.pop(key) for key in COMMIT_SUMMARY_KEYS if key in totals}
+        summary = {
+            "year": self.year,
+            "target_name": self.config.github.target.name,
+            "target_mode": self.config.github.target.mode,
+            "total_repos": len(repos),
+            **totals,
+            "pr_sizes": pr_sizes,
+            **commit_totals,
+        }
+
+        # SQL ranks every user (totals need the full scan anyway); trim afterwards
+        full_rankings = leaderboards
+        leaderboards = truncate_leaderboards(full_rankings, self.config.metrics.leaderboard_top_k)
+
+        awards: dict[str, Any] = awards_from_leaderboards(leaderboards)
+        awards["special_mentions"] = {
+            # First contributions are not tracked by the aggregator either
+            "first_contributions": [],
+            "consistent_contributors": self._consistent_contributors(weekly_rows, users),
+            "largest_prs": largest_prs,
+            "fastest_merges": fastest_merges,
+        }
+
+        metrics = {
+            "summary": summary,
+            "leaderboards": leaderboards,
+            "timeseries": timeseries,
+            "repo_health": repo_health,
+            "hygiene_scores": hygiene,
+            "awards": awards,
+            "users": {
+                login: {
+                    "login": login,
+                    "avatar_url": info["avatar_url"],
+                    "type": info["type"],
+                }
+                for login, info in users.items()
+                if not info["is_bot"]
+            },
+        }
+        if self.config.metrics.leaderboard_full_rankings:
+            metrics[FULL_RANKINGS_KEY] = full_rankings
+        if self.config.metrics.repo_health_mode == "sketch":
+            metrics["repo_health_sketches"] = {
+                repo_id: repo_health_sketch_to_dict(sketches[repo_id])
+                for repo_id in sorted(sketches)
+            }
+        return metrics
+
+    def _load_events(self, con: duckdb.DuckDBPyConnection, repos: list[dict[str, Any]]) -> None:
+        """Load raw JSONL into an ordered event table and classify users.
+
+        Args:
+            con: DuckDB connection.
+            repos: Repos in replay order.
+        """
+        path_fns = {
+            "pulls": self.paths.pulls_raw_path,
+            "issues": self.paths.issues_raw_path,
+            "reviews": self.paths.reviews_raw_path,
+            "issue_comments": self.paths.issue_comments_raw_path,
+            "review_comments": self.paths.review_comments_raw_path,
+            "contributor_stats": self.paths.contributor_stats_raw_path,
+            "commits": self.paths.commits_raw_path,
+        }
+        files: dict[str, list[tuple[str, int, str]]] = {kind: [] for kind in _RAW_KINDS}
+        for idx, repo in enumerate(repos):
+            for kind, path_fn in path_fns.items():
+                path = path_fn(repo["full_name"])
+                if path.exists():
+                    files[kind].append((str(path), idx, repo["full_name"]))
+
+        raw_files = pa.table(
+            {
+                "kind": [kind for kind in _RAW_KINDS for _ in files[kind]],
+                "path": [f[0] for kind in _RAW_KINDS for f in files[kind]],
+                "repo_idx": pa.array(
+                    [f[1] for kind in _RAW_KINDS for f in files[kind]], type=pa.int64()
+                ),
+                "repo": [f[2] for kind in _RAW_KINDS for f in files[kind]],
+            },
+            schema=pa.schema(
+                [
+                    ("kind", pa.string()),
+                    ("path", pa.string()),
+                    ("repo_idx", pa.int64()),
+                    ("repo", pa.string()),
+                ]
+            ),
+        )
+        con.register("raw_files", raw_files)
+
+        for kind in _RAW_KINDS:
+            con.execute(
+                f"CREATE TEMP TABLE raw_{kind} "
+                "(repo_idx BIGINT, repo VARCHAR, ord BIGINT, endpoint VARCHAR, data JSON)"
+            )
+            if not files[kind]:
+                continue
+            file_list = ", ".join(_sql_literal(f[0]) for f in files[kind])
+            con.execute(
+                f"""
+                INSERT INTO raw_{kind}
+                SELECT f.repo_idx, f.repo, t.ord, t.endpoint, t.data
+                FROM read_json(
+                    [{file_list}],
+                    format = 'newline_delimited',
+                    columns = {{'endpoint': 'VARCHAR', 'data': 'JSON'}},
+                    filename = true,
+                    hive_partitioning = false
+                ) WITH ORDINALITY AS t(endpoint, data, filename, ord)
+                JOIN raw_files f ON f.kind = '{kind}' AND f.path = t.filename
+                """
+            )
+
+        since_us = _epoch_us(self.config.github.windows.since)
+        until_us = _epoch_us(self.config.github.windows.until)
+        window_sql = f"""
+            epoch_us(TRY_CAST(NULLIF(data->>'$.created_at', '') AS TIMESTAMPTZ))
+                BETWEEN {since_us} AND {until_us - 1}
+        """
+        con.execute(
+            f"""
+            CREATE TEMP TABLE kept_pulls AS
+            SELECT repo_idx, repo, ord, data, TRY_CAST(data->>'$.number' AS BIGINT) AS number
+            FROM raw_pulls WHERE {window_sql}
+            """
+        )
+        con.execute(
+            f"""
+            CREATE TEMP TABLE kept_issues AS
+            SELECT repo_idx, repo, ord, data, TRY_CAST(data->>'$.number' AS BIGINT) AS number
+            FROM raw_issues WHERE NOT json_exists(data, '$.pull_request') AND {window_sql}
+            """
+        )
+
+        enable = self.config.collection.enable
+        parts = [_EMPTY_EVENTS_SQL]
+        if enable.pulls:
+            parts.append("SELECT repo_idx, repo, 0, ord, 0, 0, 'pr', number, data FROM kept_pulls")
+            if enable.reviews:
+                parts.append(
+                    f"""
+                    SELECT p.repo_idx, p.repo, 0, p.ord, 1, r.ord, 'review', p.number, r.data
+                    FROM kept_pulls p JOIN raw_reviews r ON r.repo_idx = p.repo_idx
+                        AND TRY_CAST(regexp_extract(
+                            r.endpoint, {_sql_literal(REVIEWS_ENDPOINT_PATTERN)}, 1
+                        ) AS BIGINT) = p.number
+                    """
+                )
+        if enable.issues:
+            parts.append(
+                "SELECT repo_idx, repo, 1, ord, 0, 0, 'issue', number, data FROM kept_issues"
+            )
+            if enable.comments:
+                parts.append(
+                    f"""
+                    SELECT i.repo_idx, i.repo, 2, i.ord, 0, c.ord, 'issue_comment', i.number,
+                        c.data
+                    FROM kept_issues i JOIN raw_issue_comments c ON c.repo_idx = i.repo_idx
+                        AND TRY_CAST(regexp_extract(
+                            c.endpoint, {_sql_literal(ISSUE_COMMENTS_ENDPOINT_PATTERN)}, 1
+                        ) AS BIGINT) = i.number
+                    """
+                )
+        if enable.pulls and enable.comments:
+            parts.append(
+                f"""
+                SELECT p.repo_idx, p.repo, 3, p.ord, 0, c.ord, 'review_comment', p.number, c.data
+                FROM kept_pulls p JOIN raw_review_comments c ON c.repo_idx = p.repo_idx
+                    AND TRY_CAST(regexp_extract(
+                        c.endpoint, {_sql_literal(REVIEW_COMMENTS_ENDPOINT_PATTERN)}, 1
+                    ) AS BIGINT) = p.number
+                """
+            )
+        if enable.commits and self.config.collection.commits.contributor_stats:
+            # Commit metrics follow every repo's other events; history only
+            # stands in for repos without contributor stats
+            after = len(repos)
+            parts.append(
+                f"""
+                SELECT repo_idx + {after}, repo, 0, ord, 0, 0, 'contributor', NULL, data
+                FROM raw_contributor_stats
+                """
+            )
+            parts.append(
+                f"""
+                SELECT repo_idx + {after}, repo, 0, ord, 0, 0, 'commit', NULL, data
+                FROM raw_commits WHERE repo_idx NOT IN (
+                    SELECT repo_idx FROM raw_files WHERE kind = 'contributor_stats'
+                )
+                """
+            )
+
+        union_sql = "\nUNION ALL\n".join(parts)
+        con.execute(
+            f"""
+            CREATE TEMP TABLE events AS
+            SELECT
+                row_number() OVER (ORDER BY repo_idx, stage, k1, k2, k3) AS seq,
+                repo,
+                kind,
+                parent,
+                actor->>'$.login' AS login,
+                actor->>'$.type' AS user_type,
+                actor->'$.avatar_url' AS avatar_json,
+                actor->'$.type' AS type_json,
+                NULLIF(
+                    CASE WHEN kind = 'commit' THEN data->>'$.commit.author.date'
+                    ELSE data->>'$.created_at' END,
+                    ''
+                ) AS created_at,
+                NULLIF(data->>'$.merged_at', '') AS merged_at,
+                NULLIF(data->>'$.closed_at', '') AS closed_at,
+                NULLIF(data->>'$.submitted_at', '') AS submitted_at,
+                data->>'$.state' AS state,
+                CASE WHEN kind = 'pr' THEN data->'$.number' END AS number_json,
+                CASE WHEN kind = 'pr' THEN data->'$.title' END AS title_json,
+                CASE WHEN kind = 'pr' THEN data->'$.html_url' END AS url_json,
+                CASE WHEN kind = 'pr' THEN data->'$.additions' END AS additions_json,
+                CASE WHEN kind = 'pr' THEN data->'$.deletions' END AS deletions_json,
+                CASE WHEN kind = 'contributor' THEN data->'$.weeks' END AS weeks_json
+            FROM (
+                SELECT *,
+                    CASE WHEN kind IN ('contributor', 'commit') THEN data->'$.author'
+                    ELSE data->'$.user' END AS actor
+                FROM ({union_sql})
+            )
+            """
+        )
+
+        # Classify each distinct (login, type) once with the shared identity rules
+        detector = get_bot_detector(self.config.identity)
+        pairs = con.execute(
+            "SELECT DISTINCT login, user_type FROM events WHERE login <> ''"
+        ).fetchall()
+        con.register(
+            "bot_flags",
+            pa.table(
+                {
+                    "login": [login for login, _ in pairs],
+                    "user_type": [user_type for _, user_type in pairs],
+                    "is_bot": [
+                        detector.is_bot(login, user_type or "") for login, user_type in pairs
+                    ],
+                },
+                schema=pa.schema(
+                    [("login", pa.string()), ("user_type", pa.string()), ("is_bot", pa.bool_())]
+                ),
+            ),
+        )
+        con.execute(
+            """
+            CREATE TEMP TABLE counted AS
+            SELECT e.* FROM events e
+            JOIN bot_flags b ON b.login = e.login AND b.user_type IS NOT DISTINCT FROM e.user_type
+            WHERE NOT b.is_bot
+            """
+        )
+
+        # Commits, additions, and deletions per in-year contributor week or commit.
+        # unit_seq orders units after every event and each contributor's weeks
+        # in turn, the order in which the aggregator first counts them.
+        con.execute(
+            f"""
+            CREATE TEMP TABLE commit_units AS
+            SELECT seq, repo, login, ts, commits, additions, deletions,
+                (SELECT count(*) FROM events)
+                    + row_number() OVER (ORDER BY seq, week_ord) AS unit_seq
+            FROM (
+                SELECT seq, repo, login, week_ord,
+                    strftime(CAST(make_timestamp(w.w * 1000000) AS DATE), '%Y-%m-%d') AS ts,
+                    w.c AS commits, COALESCE(w.a, 0) AS additions,
+                    COALESCE(w.d, 0) AS deletions
+                FROM (
+                    SELECT seq, repo, login, unnest(weeks) AS w,
+                        generate_subscripts(weeks, 1) AS week_ord
+                    FROM (
+                        SELECT seq, repo, login,
+                            from_json(weeks_json, {_sql_literal(_WEEKS_TYPE)}) AS weeks
+                        FROM counted WHERE kind = 'contributor'
+                    )
+                )
+                WHERE w.c > 0
+                UNION ALL
+                SELECT seq, repo, login, 0, created_at, 1, 0, 0
+                FROM counted WHERE kind = 'commit'
+            )
+            WHERE year(TRY_CAST(left(ts, 10) AS DATE)) = {int(self.year)}
+            """
+        )
+
+    def _load_users(self, con: duckdb.DuckDBPyConnection) -> dict[str, dict[str, Any]]:
+        """Load first-seen user info in first-seen order.
+
+        Args:
+            con: DuckDB connection.
+
+        Returns:
+            Dict mapping login to avatar_url, type, and is_bot.
+        """
+        rows = con.execute(
+            """
+            SELECT e.login, e.avatar_json, e.type_json, b.is_bot
+            FROM (
+                SELECT *, row_number() OVER (PARTITION BY login ORDER BY seq) AS rn
+                FROM events WHERE login <> ''
+            ) e
+            JOIN bot_flags b ON b.login = e.login AND b.user_type IS NOT DISTINCT FROM e.user_type
+            WHERE e.rn = 1
+            ORDER BY e.seq
+            """
+        ).fetchall()
+
+        return {
+            login: {
+                "avatar_url": _json_value(avatar_json, ""),
+                "type": _json_value(type_json, "User"),
+                "is_bot": is_bot,
+            }
+            for login, avatar_json, type_json, is_bot in rows
+        }
+
+    def _compute_leaderboards(
+        self, con: duckdb.DuckDBPyConnection, users: dict[str, dict[str, Any]]
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, Any]]:
+        """Compute ranked leaderboards and summary totals.
+
+        Args:
+            con: DuckDB connection.
+            users: First-seen user info.
+
+        Returns:
+            Tuple of (leaderboards, summary totals in summary.json key order).
+        """
+        # Sub-ordering (k) mirrors increment order within a single event
+        con.execute(
+            """
+            CREATE TEMP TABLE contrib AS
+            SELECT 'prs_opened' AS metric, login, seq * 8 AS k, 1::BIGINT AS n FROM counted
+                WHERE kind = 'pr'
+            UNION ALL SELECT 'prs_merged', login, seq * 8 + 1, 1 FROM counted
+                WHERE kind = 'pr' AND merged_at IS NOT NULL
+            UNION ALL SELECT 'issues_opened', login, seq * 8, 1 FROM counted WHERE kind = 'issue'
+            UNION ALL SELECT 'issues_closed', login, seq * 8 + 1, 1 FROM counted
+                WHERE kind = 'issue' AND state = 'closed' AND closed_at IS NOT NULL
+            UNION ALL SELECT 'reviews_submitted', login, seq * 8, 1 FROM counted
+                WHERE kind = 'review'
+            UNION ALL SELECT 'approvals', login, seq * 8 + 1, 1 FROM counted
+                WHERE kind = 'review' AND upper(state) = 'APPROVED'
+            UNION ALL SELECT 'changes_requested', login, seq * 8 + 1, 1 FROM counted
+                WHERE kind = 'review' AND upper(state) = 'CHANGES_REQUESTED'
+            UNION ALL SELECT 'comments_total', login, seq * 8, 1 FROM counted
+                WHERE kind IN ('issue_comment', 'review_comment')
+            UNION ALL SELECT 'review_comments_total', login, seq * 8 + 1, 1 FROM counted
+                WHERE kind = 'review_comment'
+            UNION ALL SELECT 'commits', login, unit_seq * 8, commits FROM commit_units
+            UNION ALL SELECT 'lines_added', login, unit_seq * 8 + 1, additions FROM commit_units
+                WHERE additions > 0
+            UNION ALL SELECT 'lines_deleted', login, unit_seq * 8 + 2, deletions
+                FROM commit_units WHERE deletions > 0
+            """
+        )
+        metric_order = [
+            row[0]
+            for row in con.execute(
+                "SELECT metric FROM contrib GROUP BY metric ORDER BY min(k)"
+            ).fetchall()
+        ]
+        rows = con.execute(
+            """
+            SELECT metric, login, sum(n) AS cnt FROM contrib
+            GROUP BY metric, login
+            ORDER BY metric, cnt DESC, min(k)
+            """
+        ).fetchall()
+
+        leaderboards: dict[str, list[dict[str, Any]]] = {metric: [] for metric in metric_order}
+        totals: defaultdict[str, int] = defaultdict(int)
+        contributors: set[str] = set()
+        for metric, login, count in rows:
+            totals[metric] += count
+            if metric in ("prs_opened", "issues_opened", "reviews_submitted"):
+                contributors.add(login)
+            user = users.get(login, {})
+            if user.get("is_bot", False):
+                continue
+            leaderboards[metric].append(
+                {"user": login, "count": count, "avatar_url": user.get("avatar_url", "")}
+            )
+
+        for metric in SUMMARY_METRICS:
+            leaderboards.setdefault(metric, [])
+
+        summary_totals = {
+            "total_contributors": len(contributors),
+            "total_prs": totals["prs_opened"],
+            "total_issues": totals["issues_opened"],
+            "total_reviews": totals["reviews_submitted"],
+            "total_comments": totals["comments_total"],
+            "prs_merged": totals["prs_merged"],
+            "issues_closed": totals["issues_closed"],
+            "new_contributors": 0,
+        }
+        if "commits" in leaderboards:
+            summary_totals["total_commits"] = totals["commits"]
+            summary_totals["lines_added"] = totals["lines_added"]
+            summary_totals["lines_deleted"] = totals["lines_deleted"]
+        return leaderboards, summary_totals
+
+    def _compute_timeseries(
+        self, con: duckdb.DuckDBPyConnection, users: dict[str, dict[str, Any]]
+    ) -> tuple[dict[str, Any], list[tuple[str, str, str, int, int]]]:
+        """Compute weekly and monthly per-user time series.
+
+        Args:
+            con: DuckDB connection.
+            users: First-seen user info.
+
+        Returns:
+            Tuple of (timeseries dict, raw weekly rows used for special mentions).
+        """
+        # Bucket on the timestamp's own wall-clock fields, as datetime.isocalendar() does
+        con.execute(
+            f"""
+            CREATE TEMP TABLE tcontrib AS
+            SELECT metric, login, k, n, local_ts FROM (
+                SELECT metric, login, k, n, CAST(left(ts, 19) AS TIMESTAMP) AS local_ts FROM (
+                    SELECT 'prs_opened' AS metric, login, seq * 8 AS k, 1::BIGINT AS n,
+                        created_at AS ts
+                        FROM counted WHERE kind = 'pr' AND created_at IS NOT NULL
+                    UNION ALL SELECT 'prs_merged', login, seq * 8 + 1, 1, merged_at FROM counted
+                        WHERE kind = 'pr' AND merged_at IS NOT NULL AND created_at IS NOT NULL
+                    UNION ALL SELECT 'issues_opened', login, seq * 8, 1, created_at FROM counted
+                        WHERE kind = 'issue' AND created_at IS NOT NULL
+                    UNION ALL SELECT 'issues_closed', login, seq * 8 + 1, 1, closed_at
+                        FROM counted
+                        WHERE kind = 'issue' AND state = 'closed' AND closed_at IS NOT NULL
+                    UNION ALL SELECT 'reviews_submitted', login, seq * 8, 1, submitted_at
+                        FROM counted WHERE kind = 'review' AND submitted_at IS NOT NULL
+                    UNION ALL SELECT 'comments_total', login, seq * 8, 1, created_at FROM counted
+                        WHERE kind IN ('issue_comment', 'review_comment')
+                        AND created_at IS NOT NULL
+                    UNION ALL SELECT 'commits', login, unit_seq * 8, commits, ts
+                        FROM commit_units
+                )
+            )
+            WHERE year(local_ts) = {int(self.year)}
+            """
+        )
+        metric_order = [
+            row[0]
+            for row in con.execute(
+                "SELECT metric FROM tcontrib GROUP BY metric ORDER BY min(k)"
+            ).fetchall()
+        ]
+
+        period_sql = {
+            "weekly": "CAST(isoyear(local_ts) AS VARCHAR) || '-W' || "
+            "lpad(CAST(week(local_ts) AS VARCHAR), 2, '0')",
+            "monthly": "strftime(local_ts, '%Y-%m')",
+        }
+        result: dict[str, dict[str, list[dict[str, Any]]]] = {"weekly": {}, "monthly": {}}
+        weekly_rows: list[tuple[str, str, str, int, int]] = []
+        counters: dict[str, dict[str, dict[str, dict[str, int]]]] = {}
+
+        for granularity, expr in period_sql.items():
+            rows = con.execute(
+                f"""
+                SELECT metric, {expr} AS period, login, sum(n) AS cnt, min(k) AS first_k
+                FROM tcontrib
+                GROUP BY metric, period, login
+                ORDER BY metric, period, first_k
+                """
+            ).fetchall()
+            if granularity == "weekly":
+                weekly_rows = rows
+
+            if self.config.metrics.timeseries_layout == "columnar":
+                counters[granularity] = {metric: {} for metric in metric_order}
+                for metric, period, login, count, _first_k in rows:
+                    counters[granularity][metric].setdefault(period, {})[login] = count
+                continue
+
+            series: dict[str, list[dict[str, Any]]] = {metric: [] for metric in metric_order}
+            for metric, period, login, count, _first_k in rows:
+                if users.get(login, {}).get("is_bot", False):
+                    continue
+                series[metric].append({"period": period, "user": login, "count": count})
+            result[granularity] = series
+
+        if self.config.metrics.timeseries_layout == "columnar":
+            bots = {login for login, info in users.items() if info.get("is_bot", False)}
+            return (
+                build_columnar_timeseries(counters["weekly"], counters["monthly"], exclude=bots),
+                weekly_rows,
+            )
+
+        return result, weekly_rows
+
+    def _consistent_contributors(
+        self,
+        weekly_rows: list[tuple[str, str, str, int, int]],
+        users: dict[str, dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Rank users by number of active weeks, preserving aggregator tie order.
+
+        Args:
+            weekly_rows: (metric, week, login, count, first_k) rows.
+            users: First-seen user info.
+
+        Returns:
+            Top three consistent contributors.
+        """
+        metric_first: dict[str, int] = {}
+        week_first: dict[tuple[str, str], int] = {}
+        for metric, week, _login, _count, first_k in weekly_rows:
+            metric_first[metric] = min(metric_first.get(metric, first_k), first_k)
+            key = (metric, week)
+            week_first[key] = min(week_first.get(key, first_k), first_k)
+
+        # Reproduce dict iteration order: metric, then week, then user insertion order
+        ordered = sorted(
+            weekly_rows,
+            key=lambda row: (metric_first[row[0]], week_first[(row[0], row[1])], row[4]),
+        )
+        user_weeks: dict[str, set[str]] = {}
+        for _metric, week, login, _count, _first_k in ordered:
+            user_weeks.setdefault(login, set()).add(week)
+
+        consistent = [
+            {
+                "user": login,
+                "avatar_url": users.get(login, {}).get("avatar_url", ""),
+                "weeks": len(weeks),
+            }
+            for login, weeks in user_weeks.items()
+            if not users.get(login, {}).get("is_bot", False) and len(weeks) > 0
+        ]
+        consistent.sort(key=lambda x: x["weeks"], reverse=True)
+        return consistent[:3]
+
+    def _compute_pr_details(
+        self, con: duckdb.DuckDBPyConnection
+    ) -> tuple[list[int], list[dict[str, Any]], list[dict[str, Any]]]:
+        """Compute PR size list and largest/fastest merged PRs.
+
+        Args:
+            con: DuckDB connection.
+
+        Returns:
+            Tuple of (pr_sizes, largest_prs, fastest_merges).
+        """
+        con.execute(
+            """
+            CREATE TEMP TABLE merged_prs AS
+            SELECT seq, repo, login, avatar_json, number_json, title_json, url_json,
+                additions_json, deletions_json, created_at, merged_at,
+                COALESCE(TRY_CAST(additions_json->>'$' AS BIGINT), 0)
+                    + COALESCE(TRY_CAST(deletions_json->>'$' AS BIGINT), 0) AS lines_changed,
+                CAST(
+                    epoch_us(CAST(merged_at AS TIMESTAMPTZ))
+                    - epoch_us(CAST(created_at AS TIMESTAMPTZ)) AS DOUBLE
+                ) / 1000000 / 3600 AS merge_hours
+            FROM counted
+            WHERE kind = 'pr' AND merged_at IS NOT NULL AND created_at IS NOT NULL
+            """
+        )
+        pr_sizes = [
+            row[0]
+            for row in con.execute(
+                "SELECT lines_changed FROM merged_prs WHERE lines_changed > 0 ORDER BY seq"
+            ).fetchall()
+        ]
+
+        columns = (
+            "seq, repo, login, avatar_json, number_json, title_json, url_json, "
+            "additions_json, deletions_json, created_at, merged_at, lines_changed, merge_hours"
+        )
+        largest_rows = con.execute(
+            f"SELECT {columns} FROM merged_prs ORDER BY lines_changed DESC, seq LIMIT 5"
+        ).fetchall()
+        fastest_rows = con.execute(
+            f"""
+            SELECT {columns} FROM merged_prs
+            WHERE merge_hours >= CAST(1 AS DOUBLE) / 60
+            ORDER BY merge_hours, seq LIMIT 5
+            """
+        ).fetchall()
+
+        # Share dicts between lists: the aggregator formats fastest merges in place
+        details: dict[int, dict[str, Any]] = {}
+
+        def detail(row: tuple[Any, ...]) -> dict[str, Any]:
+            seq = row[0]
+            if seq not in details:
+                details[seq] = {
+                    "number": _json_value(row[4], None),
+                    "title": _json_value(row[5], ""),
+                    "url": _json_value(row[6], ""),
+                    "author_login": row[2],
+                    "author_avatar_url": _json_value(row[3], ""),
+                    "repo": row[1],
+                    "lines_changed": row[11],
+                    "additions": _json_value(row[7], 0),
+                    "deletions": _json_value(row[8], 0),
+                    "merge_time_hours": row[12],
+                    "created_at": row[9],
+                    "merged_at": row[10],
+                }
+            return details[seq]
+
+        largest_prs = [detail(row) for row in largest_rows]
+        fastest_merges = [detail(row) for row in fastest_rows]
+        for pr in fastest_merges:
+            hours = pr["merge_time_hours"]
+            if hours < 1:
+                pr["merge_time"] = f"{int(hours * 60)}m"
+            elif hours < 24:
+                pr["merge_time"] = f"{hours:.1f}h"
+            else:
+                pr["merge_time"] = f"{hours / 24:.1f}d"
+
+        return pr_sizes, largest_prs, fastest_merges
+
+    def _repo_counts(self, con: duckdb.DuckDBPyConnection) -> dict[str, tuple[int, ...]]:
+        """Count contributors, events, and reviewed PRs per repo.
+
+        Args:
+            con: DuckDB connection.
+
+        Returns:
+            Repo -> (contributors, prs, issues, reviews, comments, reviewed PRs).
+        """
+        return {
+            row[0]: row[1:]
+            for row in con.execute(
+                """
+                SELECT repo,
+                    count(DISTINCT login) FILTER (
+                        WHERE kind NOT IN ('contributor', 'commit')
+                        OR seq IN (SELECT seq FROM commit_units)
+                    ),
+                    count(*) FILTER (WHERE kind = 'pr'),
+                    count(*) FILTER (WHERE kind = 'issue'),
+                    count(*) FILTER (WHERE kind = 'review'),
+                    count(*) FILTER (WHERE kind IN ('issue_comment', 'review_comment')),
+                    count(DISTINCT parent) FILTER (WHERE kind = 'review')
+                FROM counted GROUP BY repo
+                """
+            ).fetchall()
+        }
+
+    def _create_first_review_table(self, con: duckdb.DuckDBPyConnection) -> None:
+        """Create the per-PR first review latency table.
+
+        ``hours`` is the shortest latency (exact mode); ``first_hours`` is the
+        latency of the first review in replay order and ``seq`` its position
+        (sketch mode, which only looks at the first review it sees).
+
+        Args:
+            con: DuckDB connection.
+        """
+        con.execute(
+            """
+            CREATE TEMP TABLE first_review AS
+            SELECT repo, parent, min(hours) AS hours,
+                arg_min(hours, seq) AS first_hours, min(seq) AS seq
+            FROM (
+                SELECT r.repo, r.parent, r.seq,
+                    CAST(epoch_us(CAST(r.submitted_at AS TIMESTAMPTZ)) - p.created_us AS DOUBLE)
+                    / 1000000 / 3600 AS hours
+                FROM counted r
+                JOIN (
+                    SELECT repo, parent,
+                        any_value(epoch_us(CAST(created_at AS TIMESTAMPTZ))) AS created_us
+                    FROM counted
+                    WHERE kind = 'pr' AND created_at IS NOT NULL AND parent <> 0
+                    GROUP BY repo, parent
+                ) p ON p.repo = r.repo AND p.parent = r.parent
+                WHERE r.kind = 'review' AND r.submitted_at IS NOT NULL
+            )
+            GROUP BY repo, parent
+            """
+        )
+
+    def _build_repo_health_sketches(
+        self, con: duckdb.DuckDBPyConnection, repo_names: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Build sketch-mode repo health state by streaming per-repo values.
+
+        Values are fed in replay order, so the sketches match the ones the
+        aggregator builds in sketch mode.
+
+        Args:
+            con: DuckDB connection.
+            repo_names: All tracked repos.
+
+        Returns:
+            Repo -> sketch-mode repo health state.
+        """
+        metrics_config = self.config.metrics
+        states = {
+            repo_id: new_repo_health_sketch(metrics_config.sketch_k, metrics_config.hll_precision)
+            for repo_id in repo_names
+        }
+
+        for repo_id, (_, *event_counts, _) in self._repo_counts(con).items():
+            if repo_id in states:
+                for key, count in zip(REPO_HEALTH_COUNTS, event_counts, strict=True):
+                    states[repo_id][key] = count
+
+        self._create_first_review_table(con)
+        feeds = (
+            (
+                "contributors",
+                """
+                SELECT DISTINCT repo, login FROM counted
+                WHERE login IS NOT NULL AND (
+                    kind NOT IN ('contributor', 'commit') OR seq IN (SELECT seq FROM commit_units)
+                )
+                """,
+            ),
+            (
+                "prs_with_reviews",
+                "SELECT DISTINCT repo, parent FROM counted WHERE kind = 'review'",
+            ),
+            ("merge_times", "SELECT repo, merge_hours FROM merged_prs ORDER BY seq"),
+            ("review_latencies", "SELECT repo, first_hours FROM first_review ORDER BY seq"),
+        )
+        for key, sql in feeds:
+            cursor = con.execute(sql)
+            while rows := cursor.fetchmany(_FETCH_BATCH_SIZE):
+                for repo_id, value in rows:
+                    state = states.get(repo_id)
+                    if state is None:
+                        continue
+                    if key in ("contributors", "prs_with_reviews"):
+                        state[key].add(value)
+                    else:
+                        state[key].update(value)
+
+        return states
+
+    def _compute_repo_health(
+        self, con: duckdb.DuckDBPyConnection, repo_names: list[str]
+    ) -> list[dict[str, Any]]:
+        """Compute per-repo health metrics.
+
+        Args:
+            con: DuckDB connection.
+            repo_names: All tracked repos.
+
+        Returns:
+            Health dicts sorted by repo name.
+        """
+        counts = self._repo_counts(con)
+        self._create_first_review_table(con)
+
+        middle_sql = """
+            SELECT repo, n, rn, v FROM (
+                SELECT repo, {col} AS v,
+                    row_number() OVER (PARTITION BY repo ORDER BY {col}) AS rn,
+                    count(*) OVER (PARTITION BY repo) AS n
+                FROM {table}
+            )
+            WHERE rn = n // 2 + 1 OR (n % 2 = 0 AND rn = n // 2)
+            ORDER BY repo, rn
+        """
+        merge_medians = _medians(
+            con.execute(middle_sql.format(col="merge_hours", table="merged_prs")).fetchall()
+        )
+        review_medians = _medians(
+            con.execute(middle_sql.format(col="hours", table="first_review")).fetchall()
+        )
+
+        health_list = []
+        for repo_id in sorted(repo_names):
+            contributors, pr_count, issue_count, review_count, comment_count, reviewed = counts.get(
+                repo_id, (0, 0, 0, 0, 0, 0)
+            )
+            review_coverage = (reviewed / pr_count * 100) if pr_count > 0 else 0.0
+            merge_median = merge_medians.get(repo_id)
+            review_median = review_medians.get(repo_id)
+            health_list.append(
+                {
+                    "repo": repo_id,
+                    "contributor_count": contributors,
+                    "pr_count": pr_count,
+                    "issue_count": issue_count,
+                    "review_count": review_count,
+                    "comment_count": comment_count,
+                    "review_coverage": round(review_coverage, 1),
+                    "median_time_to_merge": (
+                        round(merge_median, 1) if merge_median is not None else None
+                    ),
+                    "median_time_to_first_review": (
+                        round(review_median, 1) if review_median is not None else None
+                    ),
+                }
+            )
+
+        return health_list
@@ -0,0 +1,48 @@
+"""Metrics engine selection for computing site metrics from stored raw data."""
+
+import logging
+from typing import Any
+
+from gh_year_end.collect.aggregator import MetricsAggregator
+from gh_year_end.config import Config
+from gh_year_end.metrics.duckdb_engine import DuckDBMetricsEngine, MetricsEngineError
+from gh_year_end.metrics.replay import replay_raw_data
+from gh_year_end.storage.paths import PathManager
+
+logger = logging.getLogger(__name__)
+
+
+def compute_metrics(config: Config, paths: PathManager, workers: int = 1) -> dict[str, Any]:
+    """Compute site metrics from raw data on disk using the configured engine.
+
+    No API calls are made; everything is derived from previously stored raw data.
+
+    Args:
+        config: Application configuration (``metrics.engine`` selects the backend).
+        paths: Path manager for storage locations.
+        workers: Worker processes for the Python engine (DuckDB parallelises
+            internally using ``metrics.threads``).
+
+    Returns:
+        Metrics dict in the format produced by MetricsAggregator.export().
+
+    Raises:
+        MetricsEngineError: If the raw reviews and comments were sampled, or the
+            DuckDB engine fails.
+    """
+    if paths.sampling_marker_path.exists():
+        msg = (
+            f"Raw data in {paths.raw_root} was collected with collection.sampling enabled; "
+            "it holds reviews and comments for a sample only, so metrics cannot be rebuilt "
+            "from it. Re-run collect without sampling to capture complete raw data."
+        )
+        raise MetricsEngineError(msg)
+
+    if config.metrics.engine == "duckdb":
+        logger.info("Computing metrics with the DuckDB engine")
+        return DuckDBMetricsEngine(config, paths).export()
+
+    logger.info("Computing metrics with the Python aggregator")
+    aggregator = MetricsAggregator.from_config(config)
+    replay_raw_data(aggregator, config, paths, workers=workers)
+    return aggregator.export()
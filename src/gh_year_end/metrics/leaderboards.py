@@ -0,0 +1,168 @@
+"""Top-K leaderboard ranking and sharded full rankings.
+
+Leaderboards are ranked by count (descending) with ties kept in first-seen
+order. When only the top K entries are exported, selection uses a bounded heap
+(``heapq.nlargest``), which yields exactly the first K entries of the full
+stable sort without materializing it. Full rankings are written to a separate
+sharded directory so leaderboards.json stays small; the report reads them back
+for pages that list every contributor.
+"""
+
+import heapq
+import json
+import logging
+from collections.abc import Callable, Iterable, Mapping
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Export key and site/{year}/data/ subdirectory holding full rankings
+FULL_RANKINGS_KEY = "leaderboards_full"
+
+# Award name -> leaderboard metric whose top entry wins it
+AWARD_METRICS = {
+    "top_pr_author": "prs_opened",
+    "top_reviewer": "reviews_submitted",
+    "top_issue_opener": "issues_opened",
+}
+
+
+def rank_users(
+    user_counts: Mapping[str, int],
+    is_excluded: Callable[[str], bool],
+    top_k: int | None = None,
+) -> list[tuple[str, int]]:
+    """Rank users by count, descending, ties in first-seen order.
+
+    Args:
+        user_counts: User login -> count, in first-seen order.
+        is_excluded: Predicate for users to leave out (e.g. bots).
+        top_k: Keep only the top K users; None ranks everyone.
+
+    Returns:
+        List of (user, count) tuples in rank order.
+    """
+    candidates: Iterable[tuple[str, int]] = (
+        (user, count) for user, count in user_counts.items() if not is_excluded(user)
+    )
+    if top_k is None:
+        return sorted(candidates, key=itemgetter(1), reverse=True)
+    return heapq.nlargest(top_k, candidates, key=itemgetter(1))
+
+
+def truncate_leaderboards(
+    leaderboards: Mapping[str, list[dict[str, Any]]], top_k: int | None
+) -> dict[str, list[dict[str, Any]]]:
+    """Keep only the top K entries of each ranked leaderboard.
+
+    Args:
+        leaderboards: Metric -> ranked entries.
+        top_k: Entries to keep per metric; None keeps everything.
+
+    Returns:
+        Metric -> ranked entries (shallow copies of the input lists).
+    """
+    return {metric: list(ranked[:top_k]) for metric, ranked in leaderboards.items()}
+
+
+def awards_from_leaderboards(
+    leaderboards: Mapping[str, list[dict[str, Any]]],
+) -> dict[str, dict[str, Any]]:
+    """Derive top-contributor awards from already ranked leaderboards.
+
+    Args:
+        leaderboards: Metric -> ranked entries (top entry first).
+
+    Returns:
+        Award name -> copy of the winning leaderboard entry.
+    """
+    awards: dict[str, dict[str, Any]] = {}
+    for award, metric in AWARD_METRICS.items():
+        ranked = leaderboards.get(metric)
+        if ranked and ranked[0]["user"]:
+            awards[award] = dict(ranked[0])
+    return awards
+
+
+def shard_rankings(rankings: Mapping[str, list[dict[str, Any]]], shard_size: int) -> dict[str, Any]:
+    """Split full rankings into fixed-size shards plus an index.
+
+    Args:
+        rankings: Metric -> full ranked entries.
+        shard_size: Maximum entries per shard.
+
+    Returns:
+        Filename -> JSON content, including "index.json" describing the shards.
+    """
+    files: dict[str, Any] = {}
+    index: dict[str, Any] = {"shard_size": shard_size, "metrics": {}}
+
+    for metric, ranked in rankings.items():
+        shard_names = []
+        for shard_num, start in enumerate(range(0, len(ranked), shard_size)):
+            name = f"{metric}-{shard_num:05d}.json"
+            files[name] = {
+                "metric": metric,
+                "offset": start,
+                "entries": ranked[start : start + shard_size],
+            }
+            shard_names.append(name)
+        index["metrics"][metric] = {"total": len(ranked), "shards": shard_names}
+
+    files["index.json"] = index
+    return files
+
+
+def write_full_rankings(
+    rankings: Mapping[str, list[dict[str, Any]]], directory: Path, shard_size: int
+) -> list[Path]:
+    """Write sharded full rankings, replacing any previous shards.
+
+    Args:
+        rankings: Metric -> full ranked entries.
+        directory: Output directory (e.g. site/2025/data/leaderboards_full).
+        shard_size: Maximum entries per shard.
+
+    Returns:
+        Paths of the files written.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale in directory.glob("*.json"):
+        stale.unlink()
+
+    written = []
+    for name, content in shard_rankings(rankings, shard_size).items():
+        path = directory / name
+        with path.open("w") as f:
+            json.dump(content, f, default=str)
+        written.append(path)
+
+    logger.info("Wrote %d full ranking files to %s", len(written), directory)
+    return written
+
+
+def read_full_rankings(directory: Path) -> dict[str, list[dict[str, Any]]] | None:
+    """Read sharded full rankings written by ``write_full_rankings``.
+
+    Args:
+        directory: Full rankings directory (e.g. site/2025/data/leaderboards_full).
+
+    Returns:
+        Metric -> full ranked entries, or None if there is no index.
+    """
+    index_path = directory / "index.json"
+    if not index_path.exists():
+        return None
+    with index_path.open() as f:
+        index = json.load(f)
+
+    rankings: dict[str, list[dict[str, Any]]] = {}
+    for metric, info in index["metrics"].items():
+        entries: list[dict[str, Any]] = []
+        for name in info["shards"]:
+            with (directory / name).open() as f:
+                entries.extend(json.load(f)["entries"])
+        rankings[metric] = entries
+    return rankings
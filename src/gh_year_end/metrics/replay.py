@@ -0,0 +1,289 @@
+"""Replay stored raw JSONL through the in-memory metrics aggregator.
+
+The replay order mirrors ``collect_and_aggregate`` so that metrics rebuilt from
+disk match the ones computed during live collection: for each discovered repo,
+PRs created in the window (each followed by its reviews), then issues created in
+the window, then issue comments and review comments for the retained items.
+Commit metrics (contributor statistics, or paged commit history where those
+were unavailable) follow once every repo has been replayed.
+"""
+
+import json
+import logging
+import re
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+
+from gh_year_end.collect.aggregator import MetricsAggregator
+from gh_year_end.config import Config
+from gh_year_end.storage.paths import PathManager
+
+logger = logging.getLogger(__name__)
+
+# Endpoint patterns used to recover the parent PR/issue number of child records
+REVIEWS_ENDPOINT_PATTERN = r"/pulls/(\d+)/reviews$"
+ISSUE_COMMENTS_ENDPOINT_PATTERN = r"/issues/(\d+)/comments$"
+REVIEW_COMMENTS_ENDPOINT_PATTERN = r"/pulls/(\d+)/comments$"
+
+
+def iter_raw_data(path: Path) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Iterate (endpoint, data) pairs from an enveloped JSONL file.
+
+    Args:
+        path: Path to raw JSONL file.
+
+    Yields:
+        Tuples of (endpoint, data) for each record. Missing files yield nothing.
+    """
+    if not path.exists():
+        return
+
+    with path.open() as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield record.get("endpoint", ""), record.get("data", {})
+
+
+def load_raw_repos(paths: PathManager) -> list[dict[str, Any]]:
+    """Load discovered repos from raw storage, de-duplicated by full name.
+
+    Args:
+        paths: Path manager for storage locations.
+
+    Returns:
+        List of repo metadata dicts in discovery order.
+    """
+    repos: list[dict[str, Any]] = []
+    seen: set[str] = set()
+
+    for _endpoint, repo in iter_raw_data(paths.repos_raw_path):
+        full_name = repo.get("full_name")
+        if not full_name or full_name in seen:
+            continue
+        seen.add(full_name)
+        repos.append(repo)
+
+    return repos
+
+
+def load_raw_hygiene(paths: PathManager) -> list[tuple[str, dict[str, Any]]]:
+    """Load per-repo hygiene summaries from raw storage.
+
+    Args:
+        paths: Path manager for storage locations.
+
+    Returns:
+        List of (repo_full_name, hygiene_data) tuples in file order.
+    """
+    return [
+        (data["repo"], data)
+        for _endpoint, data in iter_raw_data(paths.hygiene_raw_path)
+        if data.get("repo")
+    ]
+
+
+def _in_window(timestamp: str | None, config: Config) -> bool:
+    """Check whether a timestamp falls inside the configured collection window.
+
+    Args:
+        timestamp: ISO 8601 timestamp string.
+        config: Application configuration.
+
+    Returns:
+        True if since <= timestamp < until.
+    """
+    if not timestamp:
+        return False
+    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    return config.github.windows.since <= dt < config.github.windows.until
+
+
+def _group_by_parent(path: Path, pattern: str) -> dict[int, list[dict[str, Any]]]:
+    """Group child records by the parent number encoded in their endpoint.
+
+    Args:
+        path: Path to raw JSONL file.
+        pattern: Regex with one group capturing the parent number.
+
+    Returns:
+        Dict mapping parent number to records in file order.
+    """
+    regex = re.compile(pattern)
+    grouped: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+
+    for endpoint, data in iter_raw_data(path):
+        match = regex.search(endpoint)
+        if match:
+            grouped[int(match.group(1))].append(data)
+
+    return grouped
+
+
+def replay_repo(
+    aggregator: MetricsAggregator,
+    repo: dict[str, Any],
+    config: Config,
+    paths: PathManager,
+) -> None:
+    """Replay one repository's raw data into the aggregator.
+
+    Args:
+        aggregator: Aggregator to update.
+        repo: Repo metadata dict (must contain 'full_name').
+        config: Application configuration.
+        paths: Path manager for storage locations.
+    """
+    full_name = repo["full_name"]
+    enable = config.collection.enable
+
+    aggregator.add_repo(repo)
+
+    pr_numbers: list[int] = []
+    issue_numbers: list[int] = []
+
+    if enable.pulls:
+        reviews = (
+            _group_by_parent(paths.reviews_raw_path(full_name), REVIEWS_ENDPOINT_PATTERN)
+            if enable.reviews
+            else {}
+        )
+        # Batch PRs, flushing before each PR's reviews to preserve event order
+        pending_prs: list[dict[str, Any]] = []
+        for _endpoint, pr in iter_raw_data(paths.pulls_raw_path(full_name)):
+            if not _in_window(pr.get("created_at"), config):
+                continue
+            pending_prs.append(pr)
+            pr_numbers.append(pr["number"])
+            pr_reviews = reviews.get(pr["number"])
+            if pr_reviews:
+                aggregator.add_prs(full_name, pending_prs)
+                pending_prs = []
+                aggregator.add_reviews(full_name, pr["number"], pr_reviews)
+        aggregator.add_prs(full_name, pending_prs)
+
+    if enable.issues:
+        kept_issues = [
+            issue
+            for _endpoint, issue in iter_raw_data(paths.issues_raw_path(full_name))
+            if "pull_request" not in issue and _in_window(issue.get("created_at"), config)
+        ]
+        aggregator.add_issues(full_name, kept_issues)
+        issue_numbers.extend(issue["number"] for issue in kept_issues)
+
+    if enable.comments:
+        if issue_numbers:
+            issue_comments = _group_by_parent(
+                paths.issue_comments_raw_path(full_name), ISSUE_COMMENTS_ENDPOINT_PATTERN
+            )
+            for issue_number in issue_numbers:
+                aggregator.add_comments(
+                    full_name, issue_comments.get(issue_number, []), comment_type="issue"
+                )
+
+        if pr_numbers:
+            review_comments = _group_by_parent(
+                paths.review_comments_raw_path(full_name), REVIEW_COMMENTS_ENDPOINT_PATTERN
+            )
+            for pr_number in pr_numbers:
+                aggregator.add_comments(
+                    full_name, review_comments.get(pr_number, []), comment_type="review"
+                )
+
+
+def replay_commits(
+    aggregator: MetricsAggregator,
+    repo: dict[str, Any],
+    paths: PathManager,
+) -> None:
+    """Replay one repository's recorded commit metrics into the aggregator.
+
+    Args:
+        aggregator: Aggregator to update.
+        repo: Repo metadata dict (must contain 'full_name').
+        paths: Path manager for storage locations.
+    """
+    full_name = repo["full_name"]
+    stats_path = paths.contributor_stats_raw_path(full_name)
+    if stats_path.exists():
+        aggregator.add_contributor_stats(
+            full_name, [contributor for _endpoint, contributor in iter_raw_data(stats_path)]
+        )
+        return
+
+    commits = [commit for _endpoint, commit in iter_raw_data(paths.commits_raw_path(full_name))]
+    if commits:
+        aggregator.add_commits(full_name, commits)
+
+
+def _replay_repo_partial(
+    config: Config, paths: PathManager, repo: dict[str, Any]
+) -> MetricsAggregator:
+    """Replay one repo into a fresh aggregator (process pool worker).
+
+    Args:
+        config: Application configuration.
+        paths: Path manager for storage locations.
+        repo: Repo metadata dict.
+
+    Returns:
+        Aggregator holding only this repo's state.
+    """
+    aggregator = MetricsAggregator.from_config(config)
+    replay_repo(aggregator, repo, config, paths)
+    return aggregator
+
+
+def replay_raw_data(
+    aggregator: MetricsAggregator,
+    config: Config,
+    paths: PathManager,
+    workers: int = 1,
+) -> int:
+    """Replay all raw data for the configured target and year into the aggregator.
+
+    With more than one worker, repos are replayed into partial aggregators in a
+    process pool and merged back in discovery order, which yields the same
+    result as a sequential replay.
+
+    Args:
+        aggregator: Aggregator to update.
+        config: Application configuration.
+        paths: Path manager for storage locations.
+        workers: Number of worker processes (1 replays in-process).
+
+    Returns:
+        Number of repositories replayed.
+    """
+    repos = load_raw_repos(paths)
+    workers = min(workers, len(repos))
+    logger.info(
+        "Replaying raw data for %d repos from %s (%d workers)",
+        len(repos),
+        paths.raw_root,
+        max(workers, 1),
+    )
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for partial in pool.map(_replay_repo_partial, repeat(config), repeat(paths), repos):
+                aggregator.merge(partial)
+    else:
+        for repo in repos:
+            replay_repo(aggregator, repo, config, paths)
+
+    # Collection aggregates commit metrics after every repo's other data
+    if config.collection.enable.commits and config.collection.commits.contributor_stats:
+        for repo in repos:
+            replay_commits(aggregator, repo, paths)
+
+    for repo_id, hygiene_data in load_raw_hygiene(paths):
+        aggregator.set_hygiene(repo_id, hygiene_data)
+
+    return len(repos)
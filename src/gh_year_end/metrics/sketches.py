@@ -0,0 +1,334 @@
+"""Mergeable quantile and cardinality sketches for repo health.
+
+In the default (exact) mode the aggregator keeps every merge time, every
+first-review latency, and the full contributor set per repo. Sketch mode
+replaces them with fixed-size summaries so memory per repo stays bounded no
+matter how active the repo is:
+
+- ``KLLSketch``: KLL quantile sketch for latency percentiles (p50/p90/p99).
+- ``HyperLogLog``: distinct-count estimate for contributors and reviewed PRs.
+
+Both sketches merge losslessly with respect to their error guarantees, so
+per-shard or per-run sketches can be combined and re-summarized later. Sketch
+state serializes to plain JSON via ``to_dict``/``from_dict``.
+"""
+
+import base64
+import hashlib
+import math
+from collections.abc import Iterable
+from typing import Any
+
+# Latency percentiles reported in sketch mode
+QUANTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+# Per-repo counters kept exactly in both modes
+REPO_HEALTH_COUNTS = ("pr_count", "issue_count", "review_count", "comment_count")
+
+
+class KLLSketch:
+    """KLL quantile sketch over floats.
+
+    Items live in a stack of compactors; level ``h`` items carry weight ``2**h``.
+    When the sketch exceeds its capacity, the lowest full compactor is sorted
+    and every other item is promoted one level up. Compaction alternates
+    between odd and even offsets instead of flipping a coin, so a given input
+    sequence always produces the same sketch. Until the first compaction
+    (``k`` items) quantiles are exact.
+
+    Example:
+        sketch = KLLSketch(k=200)
+        for hours in merge_times:
+            sketch.update(hours)
+        p90 = sketch.quantile(0.9)
+    """
+
+    def __init__(self, k: int = 200) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            k: Top compactor capacity; rank error is roughly 1.7 / k.
+        """
+        if k < 8:
+            msg = f"KLL sketch size must be at least 8, got {k}"
+            raise ValueError(msg)
+        self.k = k
+        self.n = 0
+        self._levels: list[list[float]] = [[]]
+        self._size = 0
+        self._odd_offset = False
+
+    def _capacity(self, level: int) -> int:
+        """Capacity of a compactor; lower levels get geometrically less room."""
+        depth = len(self._levels) - level - 1
+        return max(math.ceil(self.k * (2 / 3) ** depth), 2)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(level) for level in range(len(self._levels)))
+
+    def _compress(self) -> None:
+        """Compact until the sketch fits its capacity."""
+        while self._size > self._max_size():
+            for level, items in enumerate(self._levels):
+                if len(items) < self._capacity(level):
+                    continue
+                if level + 1 == len(self._levels):
+                    self._levels.append([])
+                items.sort()
+                keep = [items.pop()] if len(items) % 2 else []
+                promoted = items[int(self._odd_offset) :: 2]
+                self._odd_offset = not self._odd_offset
+                self._levels[level + 1].extend(promoted)
+                self._levels[level] = keep
+                self._size -= len(items) - len(promoted)
+                break
+
+    def update(self, value: float) -> None:
+        """Add a value to the sketch."""
+        self._levels[0].append(value)
+        self._size += 1
+        self.n += 1
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        """Merge another sketch into this one.
+
+        Args:
+            other: Sketch built with the same ``k``.
+
+        Raises:
+            ValueError: If the sketch sizes differ.
+        """
+        if other.k != self.k:
+            msg = f"Cannot merge KLL sketches with k={self.k} and k={other.k}"
+            raise ValueError(msg)
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+        for level, items in enumerate(other._levels):
+            self._levels[level].extend(items)
+        self._size += other._size
+        self.n += other.n
+        self._compress()
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the q-quantile (nearest rank).
+
+        Args:
+            q: Quantile in [0, 1].
+
+        Returns:
+            Estimated value, or None if the sketch is empty.
+        """
+        if self.n == 0:
+            return None
+        weighted = sorted(
+            (value, 1 << level) for level, items in enumerate(self._levels) for value in items
+        )
+        target = q * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "k": self.k,
+            "n": self.n,
+            "levels": [list(items) for items in self._levels],
+            "odd_offset": self._odd_offset,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "KLLSketch":
+        """Deserialize a sketch produced by ``to_dict``."""
+        sketch = cls(k=data["k"])
+        sketch.n = data["n"]
+        sketch._levels = [[float(v) for v in items] for items in data["levels"]] or [[]]
+        sketch._size = sum(len(items) for items in sketch._levels)
+        sketch._odd_offset = bool(data.get("odd_offset", False))
+        return sketch
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch.
+
+    Uses ``2**precision`` one-byte registers and a 64-bit BLAKE2b hash, with
+    linear counting for small cardinalities. Standard error is about
+    ``1.04 / sqrt(2**precision)`` (1.6% at the default precision of 12).
+    """
+
+    def __init__(self, precision: int = 12) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            precision: Number of index bits (4-16).
+        """
+        if not 4 <= precision <= 16:
+            msg = f"HyperLogLog precision must be between 4 and 16, got {precision}"
+            raise ValueError(msg)
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, item: str | int) -> None:
+        """Add an item (compared by its string form)."""
+        digest = hashlib.blake2b(str(item).encode(), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        width = 64 - self.precision
+        index = hashed >> width
+        remainder = hashed & ((1 << width) - 1)
+        rank = width - remainder.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def update(self, items: Iterable[str | int]) -> None:
+        """Add several items (like ``set.update``)."""
+        for item in items:
+            self.add(item)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Merge another sketch into this one.
+
+        Args:
+            other: Sketch built with the same precision.
+
+        Raises:
+            ValueError: If the precisions differ.
+        """
+        if other.precision != self.precision:
+            msg = (
+                f"Cannot merge HyperLogLog sketches with precision {self.precision} "
+                f"and {other.precision}"
+            )
+            raise ValueError(msg)
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def estimate(self) -> int:
+        """Estimate the number of distinct items added."""
+        m = len(self._registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        raw = alpha * m * m / sum(2.0**-r for r in self._registers)
+        zeros = self._registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "precision": self.precision,
+            "registers": base64.b64encode(bytes(self._registers)).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "HyperLogLog":
+        """Deserialize a sketch produced by ``to_dict``."""
+        sketch = cls(precision=data["precision"])
+        sketch._registers = bytearray(base64.b64decode(data["registers"]))
+        return sketch
+
+
+def latency_quantiles(sketch: KLLSketch) -> dict[str, float | None]:
+    """Report the configured latency percentiles, rounded like repo_health.json.
+
+    Args:
+        sketch: Latency sketch in hours.
+
+    Returns:
+        Dict of percentile name -> hours (None if there are no samples).
+    """
+    result: dict[str, float | None] = {}
+    for name, q in QUANTILES.items():
+        value = sketch.quantile(q)
+        result[name] = round(value, 1) if value is not None else None
+    return result
+
+
+def new_repo_health_sketch(k: int = 200, precision: int = 12) -> dict[str, Any]:
+    """Create empty sketch-mode repo health state.
+
+    The state uses the same keys as exact mode, with sketches in place of the
+    contributor set, reviewed-PR set, merge times, and review latencies.
+
+    Args:
+        k: KLL sketch size.
+        precision: HyperLogLog precision.
+
+    Returns:
+        Repo health state dict.
+    """
+    return {
+        "contributors": HyperLogLog(precision),
+        **dict.fromkeys(REPO_HEALTH_COUNTS, 0),
+        "prs_with_reviews": HyperLogLog(precision),
+        "merge_times": KLLSketch(k),
+        "review_latencies": KLLSketch(k),
+    }
+
+
+def merge_repo_health_sketch(state: dict[str, Any], other: dict[str, Any]) -> None:
+    """Merge sketch-mode repo health state into another.
+
+    Args:
+        state: State to update.
+        other: State to merge in.
+    """
+    for key in ("contributors", "prs_with_reviews", "merge_times", "review_latencies"):
+        state[key].merge(other[key])
+    for key in REPO_HEALTH_COUNTS:
+        state[key] += other[key]
+
+
+def summarize_repo_health_sketch(repo_id: str, state: dict[str, Any]) -> dict[str, Any]:
+    """Compute repo_health.json fields from sketch-mode state.
+
+    Medians are the sketch's p50 (nearest rank, so even-sized samples report
+    the lower middle value rather than the mean of the two middle values).
+
+    Args:
+        repo_id: Repository full name (owner/repo).
+        state: Sketch-mode repo health state.
+
+    Returns:
+        Health metrics dict with additional percentile breakdowns.
+    """
+    pr_count = state["pr_count"]
+    reviewed = min(state["prs_with_reviews"].estimate(), pr_count)
+    review_coverage = (reviewed / pr_count * 100) if pr_count > 0 else 0.0
+    merge_quantiles = latency_quantiles(state["merge_times"])
+    review_quantiles = latency_quantiles(state["review_latencies"])
+
+    return {
+        "repo": repo_id,
+        "contributor_count": state["contributors"].estimate(),
+        "pr_count": pr_count,
+        "issue_count": state["issue_count"],
+        "review_count": round(state["review_count"]),
+        "comment_count": round(state["comment_count"]),
+        "review_coverage": round(review_coverage, 1),
+        "median_time_to_merge": merge_quantiles["p50"],
+        "median_time_to_first_review": review_quantiles["p50"],
+        "time_to_merge_quantiles": merge_quantiles,
+        "time_to_first_review_quantiles": review_quantiles,
+    }
+
+
+def repo_health_sketch_to_dict(state: dict[str, Any]) -> dict[str, Any]:
+    """Serialize sketch-mode repo health state for repo_health_sketches.json."""
+    return {
+        key: value.to_dict() if isinstance(value, KLLSketch | HyperLogLog) else value
+        for key, value in state.items()
+    }
+
+
+def repo_health_sketch_from_dict(data: dict[str, Any]) -> dict[str, Any]:
+    """Deserialize state written by ``repo_health_sketch_to_dict``."""
+    return {
+        "contributors": HyperLogLog.from_dict(data["contributors"]),
+        **{key: int(data.get(key, 0)) for key in REPO_HEALTH_COUNTS},
+        "prs_with_reviews": HyperLogLog.from_dict(data["prs_with_reviews"]),
+        "merge_times": KLLSketch.from_dict(data["merge_times"]),
+        "review_latencies": KLLSketch.from_dict(data["review_latencies"]),
+    }
@@ -0,0 +1,371 @@
+"""Columnar per-user time series.
+
+The legacy ``timeseries.json`` layout stores one ``{period, user, count}`` dict
+per (metric, period, user), which is large on disk and slow to re-scan. This
+module integer-codes periods and users and keeps each metric as sparse
+``(cell index, count)`` arrays over the ``periods x users`` grid, so report
+consumers can compute totals with NumPy reductions instead of Python loops
+without allocating a mostly-zero matrix per metric.
+
+The compact on-disk layout stores the non-zero cells of each metric as parallel
+index arrays::
+
+    {
+      "layout": "columnar",
+      "users": ["alice", "bob"],
+      "weekly": {
+        "periods": ["2025-W01", "2025-W02"],
+        "metrics": {"prs_opened": {"period": [0, 1], "user": [0, 1], "count": [2, 1]}}
+      },
+      "monthly": {...}
+    }
+"""
+
+from collections.abc import Container, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+COLUMNAR_LAYOUT = "columnar"
+GRANULARITIES = ("weekly", "monthly")
+
+IndexArray = npt.NDArray[np.intp]
+CountArray = npt.NDArray[np.int64]
+SparseCounts = tuple[IndexArray, CountArray]
+Counters = Mapping[str, Mapping[str, Mapping[str, int]]]
+
+
+def _sum_duplicates(index: IndexArray, values: CountArray) -> SparseCounts:
+    """Sum values sharing an index; return sorted unique indices and non-zero sums."""
+    unique, inverse = np.unique(index, return_inverse=True)
+    totals = np.zeros(len(unique), dtype=np.int64)
+    np.add.at(totals, inverse, values)
+    keep = totals != 0
+    return unique[keep], totals[keep]
+
+
+@dataclass
+class TimeseriesFrame:
+    """Per-user counts for one granularity as integer-coded sparse cells.
+
+    Attributes:
+        periods: Sorted period labels (grid rows).
+        users: User logins (grid columns).
+        counts: Metric name -> ``(cell, count)`` arrays, where
+            ``cell = period * len(users) + user``, sorted by cell and with
+            zero counts dropped.
+    """
+
+    periods: list[str] = field(default_factory=list)
+    users: list[str] = field(default_factory=list)
+    counts: dict[str, SparseCounts] = field(default_factory=dict)
+
+    @classmethod
+    def from_cells(
+        cls,
+        cells: Mapping[str, Iterable[tuple[str, str, int]]],
+        users: list[str] | None = None,
+    ) -> "TimeseriesFrame":
+        """Build a frame from (period, user, count) cells per metric.
+
+        Repeated (period, user) cells within a metric are summed.
+
+        Args:
+            cells: Metric name -> iterable of (period, user, count) tuples.
+            users: Optional fixed user coding; users not in it are appended.
+
+        Returns:
+            TimeseriesFrame with sorted periods.
+        """
+        materialized = {metric: list(rows) for metric, rows in cells.items()}
+        periods = sorted({period for rows in materialized.values() for period, _, _ in rows})
+        period_index = {period: i for i, period in enumerate(periods)}
+
+        user_list = list(users) if users is not None else []
+        user_index = {user: i for i, user in enumerate(user_list)}
+        for rows in materialized.values():
+            for _, user, _ in rows:
+                if user not in user_index:
+                    user_index[user] = len(user_list)
+                    user_list.append(user)
+
+        width = len(user_list)
+        counts: dict[str, SparseCounts] = {}
+        for metric, rows in materialized.items():
+            index = np.fromiter(
+                (period_index[p] * width + user_index[u] for p, u, _ in rows),
+                dtype=np.intp,
+                count=len(rows),
+            )
+            values = np.fromiter((c for _, _, c in rows), dtype=np.int64, count=len(rows))
+            counts[metric] = _sum_duplicates(index, values)
+
+        return cls(periods=periods, users=user_list, counts=counts)
+
+    @classmethod
+    def from_counters(
+        cls,
+        counters: Counters,
+        exclude: Container[str] = (),
+        users: list[str] | None = None,
+    ) -> "TimeseriesFrame":
+        """Build a frame from nested metric -> period -> user -> count mappings.
+
+        Args:
+            counters: Nested counters as kept by the metrics aggregator.
+            exclude: User keys to drop (e.g. bots and the ``_total`` bucket).
+            users: Optional fixed user coding.
+
+        Returns:
+            TimeseriesFrame.
+        """
+        return cls.from_cells(
+            {
+                metric: [
+                    (period, user, count)
+                    for period, user_counts in periods.items()
+                    for user, count in user_counts.items()
+                    if user not in exclude
+                ]
+                for metric, periods in counters.items()
+            },
+            users=users,
+        )
+
+    @classmethod
+    def from_entries(cls, series: Any) -> "TimeseriesFrame":
+        """Build a frame from the legacy ``{metric: [{period, user, count}]}`` layout.
+
+        Malformed input (non-dict series, non-list metrics, entries without a
+        period) is skipped rather than rejected. Entries without a user are kept
+        under an empty login so period totals still include them.
+
+        Args:
+            series: Legacy per-granularity mapping.
+
+        Returns:
+            TimeseriesFrame.
+        """
+        if not isinstance(series, dict):
+            return cls()
+
+        cells: dict[str, list[tuple[str, str, int]]] = {}
+        for metric, entries in series.items():
+            if not isinstance(entries, list):
+                continue
+            cells[metric] = [
+                (entry["period"], entry.get("user") or "", int(entry.get("count", 0)))
+                for entry in entries
+                if isinstance(entry, dict) and entry.get("period")
+            ]
+        return cls.from_cells(cells)
+
+    @classmethod
+    def from_compact(cls, block: Any, users: list[str]) -> "TimeseriesFrame":
+        """Build a frame from one granularity block of the compact layout.
+
+        Args:
+            block: ``{"periods": [...], "metrics": {metric: {period, user, count}}}``.
+            users: Shared user list from the compact document.
+
+        Returns:
+            TimeseriesFrame.
+        """
+        if not isinstance(block, dict):
+            return cls(users=list(users))
+
+        periods = list(block.get("periods", []))
+        width = len(users)
+        counts: dict[str, SparseCounts] = {}
+        for metric, cells in block.get("metrics", {}).items():
+            index = np.asarray(cells["period"], dtype=np.intp) * width + np.asarray(
+                cells["user"], dtype=np.intp
+            )
+            counts[metric] = _sum_duplicates(index, np.asarray(cells["count"], dtype=np.int64))
+
+        return cls(periods=periods, users=list(users), counts=counts)
+
+    def _combine(self, metrics: Iterable[str]) -> SparseCounts:
+        """Sum the cells of the given metrics (missing metrics count as zero)."""
+        parts = [self.counts[metric] for metric in metrics if metric in self.counts]
+        if not parts:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.int64)
+        if len(parts) == 1:
+            return parts[0]
+        return _sum_duplicates(
+            np.concatenate([index for index, _ in parts]),
+            np.concatenate([values for _, values in parts]),
+        )
+
+    def _rows_and_columns(self, index: IndexArray) -> tuple[IndexArray, IndexArray]:
+        """Split cell indices into (period, user) coordinates."""
+        return np.divmod(index, max(len(self.users), 1))
+
+    def period_totals(self, metrics: Iterable[str]) -> dict[str, int]:
+        """Total counts per period across all users for the given metrics.
+
+        Args:
+            metrics: Metric names to add together.
+
+        Returns:
+            Period -> total, containing only periods with non-zero activity.
+        """
+        index, values = self._combine(metrics)
+        rows, _ = self._rows_and_columns(index)
+        rows, totals = _sum_duplicates(rows, values)
+        return {
+            self.periods[r]: int(t) for r, t in zip(rows.tolist(), totals.tolist(), strict=True)
+        }
+
+    def metric_total(self, metrics: Iterable[str]) -> int:
+        """Total count across all periods and users for the given metrics."""
+        return int(self._combine(metrics)[1].sum())
+
+    def active_users(self, metrics: Iterable[str]) -> dict[str, int]:
+        """Number of distinct users active per period for the given metrics.
+
+        Args:
+            metrics: Metric names that count as activity.
+
+        Returns:
+            Period -> distinct active users, containing only active periods.
+        """
+        index, values = self._combine(metrics)
+        rows, cols = self._rows_and_columns(index[values > 0])
+        if "" in self.users:
+            rows = rows[cols != self.users.index("")]
+        periods, active = np.unique(rows, return_counts=True)
+        return {
+            self.periods[r]: int(n) for r, n in zip(periods.tolist(), active.tolist(), strict=True)
+        }
+
+    def user_activity(self, metrics: Iterable[str]) -> dict[str, list[int]]:
+        """Per-user activity in chronological order for the given metrics.
+
+        Args:
+            metrics: Metric names to add together.
+
+        Returns:
+            User -> counts for the periods in which that user was active.
+        """
+        index, values = self._combine(metrics)
+        positive = values > 0
+        rows, cols = self._rows_and_columns(index[positive])
+        values = values[positive]
+        if not values.size:
+            return {}
+        order = np.lexsort((rows, cols))
+        cols, values = cols[order], values[order]
+        users, starts = np.unique(cols, return_index=True)
+
+        result: dict[str, list[int]] = {}
+        for col, chunk in zip(users.tolist(), np.split(values, starts[1:]), strict=True):
+            user = self.users[col]
+            if user:
+                result[user] = chunk.tolist()
+        return result
+
+    def to_entries(self) -> dict[str, list[dict[str, Any]]]:
+        """Expand to the legacy ``{metric: [{period, user, count}]}`` layout."""
+        series: dict[str, list[dict[str, Any]]] = {}
+        for metric, (index, values) in self.counts.items():
+            rows, cols = self._rows_and_columns(index)
+            series[metric] = [
+                {"period": self.periods[r], "user": self.users[c], "count": v}
+                for r, c, v in zip(rows.tolist(), cols.tolist(), values.tolist(), strict=True)
+            ]
+        return series
+
+    def to_compact(self) -> dict[str, Any]:
+        """Encode as one granularity block of the compact layout."""
+        metrics: dict[str, dict[str, list[int]]] = {}
+        for metric, (index, values) in self.counts.items():
+            rows, cols = self._rows_and_columns(index)
+            metrics[metric] = {
+                "period": rows.tolist(),
+                "user": cols.tolist(),
+                "count": values.tolist(),
+            }
+        return {"periods": list(self.periods), "metrics": metrics}
+
+
+def is_columnar(timeseries_data: Any) -> bool:
+    """Check whether timeseries data uses the compact columnar layout."""
+    return isinstance(timeseries_data, dict) and timeseries_data.get("layout") == COLUMNAR_LAYOUT
+
+
+def build_columnar_timeseries(
+    weekly: Counters,
+    monthly: Counters,
+    exclude: Container[str] = (),
+) -> dict[str, Any]:
+    """Encode weekly and monthly counters in the compact columnar layout.
+
+    Users are coded once, in sorted order, and shared by both granularities.
+
+    Args:
+        weekly: Weekly metric -> period -> user -> count counters.
+        monthly: Monthly metric -> period -> user -> count counters.
+        exclude: User keys to drop.
+
+    Returns:
+        Compact timeseries document.
+    """
+    users = sorted(
+        {
+            user
+            for counters in (weekly, monthly)
+            for periods in counters.values()
+            for user_counts in periods.values()
+            for user in user_counts
+            if user not in exclude
+        }
+    )
+    return {
+        "layout": COLUMNAR_LAYOUT,
+        "users": users,
+        "weekly": TimeseriesFrame.from_counters(weekly, exclude, users).to_compact(),
+        "monthly": TimeseriesFrame.from_counters(monthly, exclude, users).to_compact(),
+    }
+
+
+def load_timeseries(timeseries_data: Any) -> dict[str, TimeseriesFrame]:
+    """Load timeseries data in either layout into per-granularity frames.
+
+    Args:
+        timeseries_data: Contents of timeseries.json (legacy or columnar).
+
+    Returns:
+        Dict with "weekly" and "monthly" frames (empty for malformed input).
+    """
+    if is_columnar(timeseries_data):
+        users = list(timeseries_data.get("users", []))
+        return {
+            granularity: TimeseriesFrame.from_compact(timeseries_data.get(granularity), users)
+            for granularity in GRANULARITIES
+        }
+    if not isinstance(timeseries_data, dict):
+        return {granularity: TimeseriesFrame() for granularity in GRANULARITIES}
+    return {
+        granularity: TimeseriesFrame.from_entries(timeseries_data.get(granularity, {}))
+        for granularity in GRANULARITIES
+    }
+
+
+def expand_timeseries(timeseries_data: Any) -> Any:
+    """Return timeseries data in the legacy layout.
+
+    Legacy (or unrecognized) input is returned unchanged.
+
+    Args:
+        timeseries_data: Contents of timeseries.json.
+
+    Returns:
+        Legacy ``{"weekly": {...}, "monthly": {...}}`` data.
+    """
+    if not is_columnar(timeseries_data):
+        return timeseries_data
+    frames = load_timeseries(timeseries_data)
+    return {granularity: frame.to_entries() for granularity, frame in frames.items()}
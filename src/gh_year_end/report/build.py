@@ -12,13 +12,18 @@ cohesive and splitting would fragment the build pipeline.
 import json
 import logging
 import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 
+from gh_year_end.collect.identity import BotDetector, get_bot_detector
 from gh_year_end.config import Config
+from gh_year_end.metrics.leaderboards import FULL_RANKINGS_KEY, read_full_rankings
+from gh_year_end.metrics.timeseries import is_columnar
 from gh_year_end.report.contributors import (
     get_engineers_list,
     populate_activity_timelines,
@@ -36,10 +41,22 @@ from gh_year_end.report.transformers import (
 )
 from gh_year_end.report.views import repos_view
 from gh_year_end.storage.paths import PathManager
+from gh_year_end.telemetry import PhaseProfiler, TraceEventRecorder, profiling, trace_events
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _build_stage(name: str) -> Iterator[None]:
+    """Trace and, when profiling, profile one build stage."""
+    profiling.set_phase(name)
+    try:
+        with trace_events.span(name, "build"):
+            yield
+    finally:
+        profiling.end_phase(name)
+
+
 def get_available_years(site_base_dir: Path) -> list[int]:
     """Scan site directory for available year subdirectories.
 
@@ -179,18 +196,28 @@ def build_site(config: Config, paths: PathManager) -> dict[str, Any]:
         "assets_copied": 0,
         "errors": [],
     }
+    recorder = None
+    if config.telemetry.trace_events is not None and trace_events.active_recorder() is None:
+        recorder = TraceEventRecorder(
+            config.telemetry.trace_events, process_name="gh-year-end build"
+        ).start()
+    profiler = None
+    if config.telemetry.profile and profiling.active_profiler() is None:
+        profiler = PhaseProfiler(paths.profile_root / "build").start()
 
     try:
         # Load JSON data from site data directory
         logger.info("Loading metrics data from JSON files")
-        data_context = _load_json_data(paths.site_data_path)
+        with _build_stage("load"):
+            data_context = _load_json_data(paths.site_data_path)
         stats["data_files_written"] = len(data_context)
 
         # Copy static assets
         logger.info("Copying static assets")
         assets_source = Path(config.report.output_dir) / "assets"
         if assets_source.exists():
-            stats["assets_copied"] = _copy_assets(assets_source, paths.site_assets_path)
+            with _build_stage("copy"):
+                stats["assets_copied"] = _copy_assets(assets_source, paths.site_assets_path)
         else:
             logger.warning("Assets directory not found at %s", assets_source)
 
@@ -205,9 +232,12 @@ def build_site(config: Config, paths: PathManager) -> dict[str, Any]:
 
         # Export search data for global search functionality
         logger.info("Exporting search data")
-        _export_search_data(paths.site_root, data_context)
+        with _build_stage("search_index"):
+            _export_search_data(paths.site_root, data_context)
 
-        # Create build manifest
+        # Create build manifest (with the profile of the stages above)
+        if profiler is not None:
+            stats["profile"] = profiler.close()
         _write_build_manifest(paths.site_root, config, stats)
 
         # Generate root redirect to most recent year
@@ -222,6 +252,11 @@ def build_site(config: Config, paths: PathManager) -> dict[str, Any]:
         stats["errors"].append(error_msg)
         logger.exception("Site build failed")
         raise
+    finally:
+        if recorder is not None:
+            recorder.close()
+        if profiler is not None:
+            profiler.close()
 
     end_time = datetime.now(UTC)
     stats["end_time"] = end_time.isoformat()
@@ -297,6 +332,13 @@ def _load_json_data(data_dir: Path) -> dict[str, Any]:
         else:
             logger.debug("Optional file not found: %s", filename)
 
+    # leaderboards.json keeps only the top K; pages listing every contributor
+    # (engineers, search, insights) need the full rankings
+    full_rankings = read_full_rankings(data_dir / FULL_RANKINGS_KEY)
+    if full_rankings:
+        data["leaderboards"] = full_rankings
+        logger.info("Loaded full rankings from %s/", FULL_RANKINGS_KEY)
+
     # Check if we need to fall back to metrics_*.json files
     # This handles cases where stub files exist but have empty data
     data = _enrich_from_metrics_files(data_dir, data)
@@ -337,11 +379,14 @@ def _enrich_from_metrics_files(data_dir: Path, data: dict[str, Any]) -> dict[str
     for metrics_file, data_key in metrics_files:
         # Check if existing data is empty or missing
         existing = data.get(data_key, {})
-        is_empty = (
-            not existing
-            or (isinstance(existing, dict) and _is_empty_dict(existing))
-            or (isinstance(existing, list) and len(existing) == 0)
-        )
+        if is_columnar(existing):
+            is_empty = not existing.get("users")
+        else:
+            is_empty = (
+                not existing
+                or (isinstance(existing, dict) and _is_empty_dict(existing))
+                or (isinstance(existing, list) and len(existing) == 0)
+            )
 
         if is_empty:
             metrics_path = data_dir / metrics_file
@@ -647,6 +692,9 @@ def _render_templates(
 ) -> list[str]:
     """Render Jinja2 templates with data context."""
     rendered_templates = []
+    # Building the template context is the transform stage, rendering follows
+    stage = trace_events.span("transform", "build")
+    profiling.set_phase("transform")
 
     try:
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -873,7 +921,8 @@ def _render_templates(
             base_url = f"https://{config.github.target.name}.github.io"
 
         # Pre-compute engineers list (used in multiple context keys)
-        engineers_list = _get_engineers_list(leaderboards_data, timeseries_data)
+        bot_detector = get_bot_detector(config.identity) if config.identity.humans_only else None
+        engineers_list = _get_engineers_list(leaderboards_data, timeseries_data, bot_detector)
 
         # Generate engineer chart data
         engineer_charts = generate_engineer_charts(timeseries_data, summary_data, repo_health_list)
@@ -1000,13 +1049,17 @@ def _render_templates(
         context.update(chart_data)
 
         # Render all HTML templates
+        stage.end()
+        stage = trace_events.span("render", "build")
+        profiling.set_phase("render")
         template_files = list(templates_dir.glob("*.html"))
 
         for template_file in template_files:
             try:
                 template_name = template_file.name
                 template = env.get_template(template_name)
-                rendered = template.render(**context)
+                with trace_events.span(template_name, "build"):
+                    rendered = template.render(**context)
 
                 output_path = output_dir / template_name
                 output_path.write_text(rendered, encoding="utf-8")
@@ -1036,6 +1089,9 @@ def _render_templates(
 
     except Exception as e:
         logger.warning("Template rendering failed: %s", e)
+    finally:
+        stage.end()
+        profiling.end_phase()
 
     return rendered_templates
 
@@ -1074,10 +1130,12 @@ def _calculate_fun_facts(
 
 
 def _get_engineers_list(
-    leaderboards_data: dict[str, Any], timeseries_data: dict[str, Any] | None = None
+    leaderboards_data: dict[str, Any],
+    timeseries_data: dict[str, Any] | None = None,
+    bot_detector: BotDetector | None = None,
 ) -> list[dict[str, Any]]:
     """Backward-compatible wrapper for get_engineers_list."""
-    return get_engineers_list(leaderboards_data, timeseries_data)
+    return get_engineers_list(leaderboards_data, timeseries_data, bot_detector)
 
 
 def _populate_activity_timelines(
@@ -1403,6 +1461,8 @@ def _write_build_manifest(output_dir: Path, config: Config, stats: dict[str, Any
         "assets_copied": stats["assets_copied"],
         "errors": stats["errors"],
     }
+    if "profile" in stats:
+        manifest["profile"] = stats["profile"]
 
     manifest_path = output_dir / "manifest.json"
     with manifest_path.open("w") as f:
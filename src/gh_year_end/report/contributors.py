@@ -1,9 +1,11 @@
 """Contributor data processing for report generation."""
 
 import logging
-from collections import defaultdict
 from typing import Any
 
+from gh_year_end.collect.identity import BotDetector
+from gh_year_end.metrics.timeseries import load_timeseries
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
@@ -13,7 +15,9 @@ __all__ = [
 
 
 def get_engineers_list(
-    leaderboards_data: dict[str, Any], timeseries_data: dict[str, Any] | None = None
+    leaderboards_data: dict[str, Any],
+    timeseries_data: dict[str, Any] | None = None,
+    bot_detector: BotDetector | None = None,
 ) -> list[dict[str, Any]]:
     """Extract engineers list with activity_timeline from leaderboards data.
 
@@ -29,6 +33,8 @@ def get_engineers_list(
     Args:
         leaderboards_data: Leaderboard metrics data.
         timeseries_data: Optional timeseries data for activity sparklines.
+        bot_detector: Optional bot classifier; bot logins are left out (for
+            metrics written before the current identity rules applied).
     """
     # Handle both nested format (leaderboards: {metrics}) and flat format (metrics at top level)
     if "leaderboards" in leaderboards_data:
@@ -70,6 +76,8 @@ def get_engineers_list(
             user_id = entry.get("user_id") or entry.get("user")
             if not user_id:
                 continue
+            if bot_detector and bot_detector.is_bot(user_id, "User"):
+                continue
 
             # Initialize contributor if not seen before
             if user_id not in contributors:
@@ -142,51 +150,25 @@ def populate_activity_timelines(
         contributors: List of contributor dictionaries to update in-place.
         timeseries_data: Timeseries data from timeseries.json.
     """
-    # Build a mapping of user -> week -> total activity count
-    user_weekly_activity: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-
-    weekly_data = timeseries_data.get("weekly", {})
-    # Handle case where weekly_data is a list instead of dict (malformed data)
-    if not isinstance(weekly_data, dict):
-        weekly_data = {}
-
-    # Aggregate activity across all metric types
-    metric_types = [
-        "prs_opened",
-        "prs_merged",
-        "reviews_submitted",
-        "issues_opened",
-        "issues_closed",
-        "comments_total",
-    ]
-
-    for metric_type in metric_types:
-        metric_data = weekly_data.get(metric_type, [])
-
-        for entry in metric_data:
-            user = entry.get("user", "")
-            period = entry.get("period", "")
-            count = entry.get("count", 0)
-
-            if user and period:
-                user_weekly_activity[user][period] += count
+    # Per-user weekly totals across all contribution types, in chronological order.
+    # Accepts both the legacy and the columnar timeseries.json layouts.
+    user_weekly_activity = load_timeseries(timeseries_data)["weekly"].user_activity(
+        [
+            "prs_opened",
+            "prs_merged",
+            "reviews_submitted",
+            "issues_opened",
+            "issues_closed",
+            "comments_total",
+        ]
+    )
 
     # Now populate activity_timeline for each contributor
     for contributor in contributors:
         # Try both login and user_id as keys
         user_key = contributor.get("login") or contributor.get("user_id", "")
 
-        if user_key in user_weekly_activity:
-            weekly_counts = user_weekly_activity[user_key]
-
-            # Sort by period and convert to simple array of counts for sparkline
-            # Sparklines typically just need the values in chronological order
-            sorted_periods = sorted(weekly_counts.keys())
-            activity_values = [weekly_counts[period] for period in sorted_periods]
-
-            contributor["activity_timeline"] = activity_values
-        else:
-            # No activity data for this user
-            contributor["activity_timeline"] = []
+        # Sparklines just need the values in chronological order
+        contributor["activity_timeline"] = user_weekly_activity.get(user_key, [])
 
     logger.info("Populated activity timelines for %d contributors", len(contributors))
@@ -1,10 +1,11 @@
 """Chart data generation functions for D3.js visualization."""
 
 import logging
-from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
+from gh_year_end.metrics.timeseries import TimeseriesFrame, load_timeseries
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
@@ -43,10 +44,8 @@ def generate_chart_data(
         "community_data": [],
     }
 
-    weekly_data = timeseries_data.get("weekly", {})
-    # Handle case where weekly_data is a list instead of dict (malformed data)
-    if not isinstance(weekly_data, dict):
-        weekly_data = {}
+    # Accepts both the legacy and the columnar timeseries.json layouts
+    weekly_data = load_timeseries(timeseries_data)["weekly"]
 
     # Build collaboration_data: reviews, comments, cross_team activity
     collaboration_data = _generate_collaboration_data(weekly_data)
@@ -85,10 +84,7 @@ def generate_engineer_charts(
         - contribution_types: Distribution by activity type (PRs, Reviews, Issues, Comments)
         - contribution_by_repo: Top 10 repos by total contributions
     """
-    weekly_data = timeseries_data.get("weekly", {})
-    # Handle case where weekly_data is a list instead of dict (malformed data)
-    if not isinstance(weekly_data, dict):
-        weekly_data = {}
+    weekly_data = load_timeseries(timeseries_data)["weekly"]
 
     return {
         "contribution_timeline": _generate_contribution_timeline(weekly_data),
@@ -97,7 +93,7 @@ def generate_engineer_charts(
     }
 
 
-def _generate_collaboration_data(weekly_data: dict[str, Any]) -> list[dict[str, Any]]:
+def _generate_collaboration_data(weekly_data: TimeseriesFrame) -> list[dict[str, Any]]:
     """Generate collaboration chart data from weekly timeseries.
 
     Args:
@@ -106,32 +102,9 @@ def _generate_collaboration_data(weekly_data: dict[str, Any]) -> list[dict[str,
     Returns:
         List of {date, reviews, comments, cross_team} dicts sorted chronologically.
     """
-    collaboration_by_week: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"reviews": 0, "comments": 0, "cross_team": 0}
-    )
-
-    # Aggregate reviews submitted
-    reviews_data = weekly_data.get("reviews_submitted", [])
-    for entry in reviews_data:
-        period = entry.get("period", "")
-        count = entry.get("count", 0)
-        if period:
-            collaboration_by_week[period]["reviews"] += count
-
-    # Aggregate comments (review comments + issue comments)
-    review_comments = weekly_data.get("review_comments", [])
-    for entry in review_comments:
-        period = entry.get("period", "")
-        count = entry.get("count", 0)
-        if period:
-            collaboration_by_week[period]["comments"] += count
-
-    issue_comments = weekly_data.get("issue_comments", [])
-    for entry in issue_comments:
-        period = entry.get("period", "")
-        count = entry.get("count", 0)
-        if period:
-            collaboration_by_week[period]["comments"] += count
+    # Reviews submitted, and comments (review comments + issue comments)
+    reviews = weekly_data.period_totals(["reviews_submitted"])
+    comments = weekly_data.period_totals(["review_comments", "issue_comments"])
 
     # Cross-team reviews - requires team/org ownership data not currently tracked.
     # Future enhancement: would need repo ownership mapping and contributor team assignments
@@ -139,16 +112,15 @@ def _generate_collaboration_data(weekly_data: dict[str, Any]) -> list[dict[str,
 
     # Convert to chart format with ISO dates
     result = []
-    for period in sorted(collaboration_by_week.keys()):
+    for period in sorted(reviews.keys() | comments.keys()):
         iso_date = _period_to_iso_date(period)
         if iso_date:
-            data = collaboration_by_week[period]
             result.append(
                 {
                     "date": iso_date,
-                    "reviews": data["reviews"],
-                    "comments": data["comments"],
-                    "cross_team": data["cross_team"],
+                    "reviews": reviews.get(period, 0),
+                    "comments": comments.get(period, 0),
+                    "cross_team": 0,
                 }
             )
 
@@ -156,7 +128,7 @@ def _generate_collaboration_data(weekly_data: dict[str, Any]) -> list[dict[str,
 
 
 def _generate_velocity_data(
-    weekly_data: dict[str, Any], repo_health_list: list[dict[str, Any]]
+    weekly_data: TimeseriesFrame, repo_health_list: list[dict[str, Any]]
 ) -> list[dict[str, Any]]:
     """Generate velocity chart data from weekly timeseries.
 
@@ -167,25 +139,8 @@ def _generate_velocity_data(
     Returns:
         List of {date, prs_opened, prs_merged, time_to_merge} dicts sorted chronologically.
     """
-    velocity_by_week: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"prs_opened": 0, "prs_merged": 0, "time_to_merge": 0}
-    )
-
-    # Aggregate PRs opened
-    prs_opened = weekly_data.get("prs_opened", [])
-    for entry in prs_opened:
-        period = entry.get("period", "")
-        count = entry.get("count", 0)
-        if period:
-            velocity_by_week[period]["prs_opened"] += count
-
-    # Aggregate PRs merged
-    prs_merged = weekly_data.get("prs_merged", [])
-    for entry in prs_merged:
-        period = entry.get("period", "")
-        count = entry.get("count", 0)
-        if period:
-            velocity_by_week[period]["prs_merged"] += count
+    prs_opened = weekly_data.period_totals(["prs_opened"])
+    prs_merged = weekly_data.period_totals(["prs_merged"])
 
     # Calculate overall median time to merge from repo health data
     # Note: This is a global average, not per-week. Weekly time-to-merge would require
@@ -199,15 +154,14 @@ def _generate_velocity_data(
 
     # Convert to chart format with ISO dates
     result = []
-    for period in sorted(velocity_by_week.keys()):
+    for period in sorted(prs_opened.keys() | prs_merged.keys()):
         iso_date = _period_to_iso_date(period)
         if iso_date:
-            data = velocity_by_week[period]
             result.append(
                 {
                     "date": iso_date,
-                    "prs_opened": data["prs_opened"],
-                    "prs_merged": data["prs_merged"],
+                    "prs_opened": prs_opened.get(period, 0),
+                    "prs_merged": prs_merged.get(period, 0),
                     "time_to_merge": overall_median_time_to_merge,
                 }
             )
@@ -278,7 +232,7 @@ def _generate_quality_data_from_hygiene(
 
 
 def _generate_community_data(
-    weekly_data: dict[str, Any], summary_data: dict[str, Any]
+    weekly_data: TimeseriesFrame, summary_data: dict[str, Any]
 ) -> list[dict[str, Any]]:
     """Generate community chart data from weekly timeseries.
 
@@ -289,26 +243,18 @@ def _generate_community_data(
     Returns:
         List of {date, active_contributors, new_contributors} dicts sorted chronologically.
     """
-    community_by_week: dict[str, set[str]] = defaultdict(set)
-
-    # Track unique contributors per week across all activity types
-    metric_types = [
-        "prs_opened",
-        "prs_merged",
-        "reviews_submitted",
-        "issues_opened",
-        "issues_closed",
-        "review_comments",
-        "issue_comments",
-    ]
-
-    for metric_name in metric_types:
-        metric_data = weekly_data.get(metric_name, [])
-        for entry in metric_data:
-            period = entry.get("period", "")
-            user = entry.get("user", "")
-            if period and user:
-                community_by_week[period].add(user)
+    # Count unique contributors per week across all activity types
+    active_by_week = weekly_data.active_users(
+        [
+            "prs_opened",
+            "prs_merged",
+            "reviews_submitted",
+            "issues_opened",
+            "issues_closed",
+            "review_comments",
+            "issue_comments",
+        ]
+    )
 
     # Note: summary_data contains total new_contributors for the year, but tracking
     # first-time contributors per week would require storing the week each contributor
@@ -316,14 +262,13 @@ def _generate_community_data(
 
     # Convert to chart format with ISO dates
     result = []
-    for period in sorted(community_by_week.keys()):
+    for period in sorted(active_by_week.keys()):
         iso_date = _period_to_iso_date(period)
         if iso_date:
-            active_count = len(community_by_week[period])
             result.append(
                 {
                     "date": iso_date,
-                    "active_contributors": active_count,
+                    "active_contributors": active_by_week[period],
                     # Use 0 for per-week new contributors since we only track the year total
                     # Future: track first appearance week to show new contributors per week
                     "new_contributors": 0,
@@ -368,7 +313,7 @@ def _period_to_iso_date(period: str) -> str | None:
         return None
 
 
-def _generate_contribution_timeline(weekly_data: dict[str, Any]) -> list[dict[str, Any]]:
+def _generate_contribution_timeline(weekly_data: TimeseriesFrame) -> list[dict[str, Any]]:
     """Generate contribution timeline chart data for Engineers page.
 
     Aggregates all contribution types (PRs, reviews, issues, comments) per week.
@@ -379,26 +324,17 @@ def _generate_contribution_timeline(weekly_data: dict[str, Any]) -> list[dict[st
     Returns:
         List of {date, count} dicts sorted chronologically.
     """
-    contribution_by_week: dict[str, int] = defaultdict(int)
-
-    # Aggregate all contribution types per week
-    metric_types = [
-        "prs_opened",
-        "prs_merged",
-        "reviews_submitted",
-        "issues_opened",
-        "issues_closed",
-        "review_comments",
-        "issue_comments",
-    ]
-
-    for metric_name in metric_types:
-        metric_data = weekly_data.get(metric_name, [])
-        for entry in metric_data:
-            period = entry.get("period", "")
-            count = entry.get("count", 0)
-            if period:
-                contribution_by_week[period] += count
+    contribution_by_week = weekly_data.period_totals(
+        [
+            "prs_opened",
+            "prs_merged",
+            "reviews_submitted",
+            "issues_opened",
+            "issues_closed",
+            "review_comments",
+            "issue_comments",
+        ]
+    )
 
     # Convert to chart format with ISO dates
     result = []
@@ -417,7 +353,7 @@ def _generate_contribution_timeline(weekly_data: dict[str, Any]) -> list[dict[st
 
 
 def _generate_contribution_types(
-    weekly_data: dict[str, Any], summary_data: dict[str, Any]
+    weekly_data: TimeseriesFrame, summary_data: dict[str, Any]
 ) -> list[dict[str, Any]]:
     """Generate contribution types distribution for Engineers page.
 
@@ -430,33 +366,14 @@ def _generate_contribution_types(
     Returns:
         List of {type, count} dicts for donut chart.
     """
-    # Aggregate totals across all weeks
+    # Aggregate totals across all weeks (opened only, avoiding double-counts)
     totals = {
-        "PRs": 0,
-        "Reviews": 0,
-        "Issues": 0,
-        "Comments": 0,
+        "PRs": weekly_data.metric_total(["prs_opened"]),
+        "Reviews": weekly_data.metric_total(["reviews_submitted"]),
+        "Issues": weekly_data.metric_total(["issues_opened"]),
+        "Comments": weekly_data.metric_total(["review_comments", "issue_comments"]),
     }
 
-    # Count PRs (opened + merged, avoiding double-count)
-    prs_opened = weekly_data.get("prs_opened", [])
-    totals["PRs"] = sum(entry.get("count", 0) for entry in prs_opened)
-
-    # Count Reviews
-    reviews = weekly_data.get("reviews_submitted", [])
-    totals["Reviews"] = sum(entry.get("count", 0) for entry in reviews)
-
-    # Count Issues (opened + closed, avoiding double-count)
-    issues_opened = weekly_data.get("issues_opened", [])
-    totals["Issues"] = sum(entry.get("count", 0) for entry in issues_opened)
-
-    # Count Comments (review + issue)
-    review_comments = weekly_data.get("review_comments", [])
-    issue_comments = weekly_data.get("issue_comments", [])
-    totals["Comments"] = sum(entry.get("count", 0) for entry in review_comments) + sum(
-        entry.get("count", 0) for entry in issue_comments
-    )
-
     # Convert to chart format
     result = [{"type": activity_type, "count": count} for activity_type, count in totals.items()]
 
@@ -5,6 +5,8 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
+from gh_year_end.metrics.timeseries import expand_timeseries, load_timeseries
+
 logger = logging.getLogger(__name__)
 
 __all__ = ["calculate_fun_facts", "calculate_highlights"]
@@ -37,6 +39,7 @@ def calculate_highlights(
     # Calculate most active month from timeseries data
     try:
         monthly_prs: dict[str, int] = defaultdict(int)
+        timeseries_data = expand_timeseries(timeseries_data)
 
         # Handle flat list format: [{"period_start": "2025-01-01", "metric_key": "prs_merged", ...}]
         if isinstance(timeseries_data, list):
@@ -166,50 +169,36 @@ def calculate_fun_facts(
     most_active_day_count = 0
 
     try:
-        weekly_data = timeseries_data.get("weekly", {})
-        # Handle case where weekly_data is a list instead of dict (malformed data)
-        if not isinstance(weekly_data, dict):
-            weekly_data = {}
-        # Use prs_opened as activity indicator
-        prs_opened = weekly_data.get("prs_opened", [])
-
-        if prs_opened:
-            # Group by period and sum counts
-            period_totals: dict[str, int] = defaultdict(int)
-
-            for entry in prs_opened:
-                period = entry.get("period", "")
-                count = entry.get("count", 0)
-                if period:
-                    period_totals[period] += count
-
-            if period_totals:
-                # Find busiest week
-                busiest_period, max_count = max(period_totals.items(), key=lambda x: x[1])
-                most_active_day_count = max_count
-
-                # Convert period to readable date
-                # Handle both formats: "YYYY-WXX" and "YYYY-MM-DD"
-                try:
-                    if "-W" in busiest_period:
-                        # ISO week format: "2025-W07"
-                        year, week = busiest_period.split("-W")
-                        year_int = int(year)
-                        week_int = int(week)
-
-                        # Calculate ISO date for Monday of this week
-                        jan4 = datetime(year_int, 1, 4)
-                        week1_monday = jan4 - timedelta(days=jan4.weekday())
-                        target_monday = week1_monday + timedelta(weeks=week_int - 1)
-
-                        busiest_day = target_monday.strftime("%B %d, %Y")
-                    else:
-                        # Date format: "2025-01-15" - parse and format
-                        dt = datetime.strptime(busiest_period, "%Y-%m-%d")
-                        busiest_day = dt.strftime("%B %d, %Y")
-                except (ValueError, AttributeError) as e:
-                    logger.warning("Failed to parse busiest period %s: %s", busiest_period, e)
-                    busiest_day = None
+        # Use prs_opened as activity indicator, summed per period across users
+        period_totals = load_timeseries(timeseries_data)["weekly"].period_totals(["prs_opened"])
+
+        if period_totals:
+            # Find busiest week
+            busiest_period, max_count = max(period_totals.items(), key=lambda x: x[1])
+            most_active_day_count = max_count
+
+            # Convert period to readable date
+            # Handle both formats: "YYYY-WXX" and "YYYY-MM-DD"
+            try:
+                if "-W" in busiest_period:
+                    # ISO week format: "2025-W07"
+                    year, week = busiest_period.split("-W")
+                    year_int = int(year)
+                    week_int = int(week)
+
+                    # Calculate ISO date for Monday of this week
+                    jan4 = datetime(year_int, 1, 4)
+                    week1_monday = jan4 - timedelta(days=jan4.weekday())
+                    target_monday = week1_monday + timedelta(weeks=week_int - 1)
+
+                    busiest_day = target_monday.strftime("%B %d, %Y")
+                else:
+                    # Date format: "2025-01-15" - parse and format
+                    dt = datetime.strptime(busiest_period, "%Y-%m-%d")
+                    busiest_day = dt.strftime("%B %d, %Y")
+            except (ValueError, AttributeError) as e:
+                logger.warning("Failed to parse busiest period %s: %s", busiest_period, e)
+                busiest_day = None
 
     except Exception as e:
         logger.warning("Failed to calculate busiest day: %s", e)
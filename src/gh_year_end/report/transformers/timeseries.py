@@ -1,10 +1,11 @@
 """Time series data transformation functions."""
 
 import logging
-from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
+from gh_year_end.metrics.timeseries import load_timeseries
+
 logger = logging.getLogger(__name__)
 
 __all__ = ["transform_activity_timeline"]
@@ -23,24 +24,11 @@ def transform_activity_timeline(timeseries_data: dict[str, Any]) -> list[dict[st
     activity_timeline = []
 
     try:
-        # Timeseries data structure: {"weekly": {"prs_merged": [{period, user, count}]}}
-        weekly_data = timeseries_data.get("weekly", {})
-        # Handle case where weekly_data is a list instead of dict (malformed data)
-        if not isinstance(weekly_data, dict):
-            weekly_data = {}
-        prs_merged = weekly_data.get("prs_merged", [])
-
-        if prs_merged:
-            # Group by period and sum counts across all users
-            period_totals: dict[str, int] = defaultdict(int)
-
-            for entry in prs_merged:
-                period = entry.get("period", "")
-                count = entry.get("count", 0)
-
-                if period:
-                    period_totals[period] += count
+        # Group by period and sum counts across all users; accepts both the
+        # legacy and the columnar timeseries.json layouts
+        period_totals = load_timeseries(timeseries_data)["weekly"].period_totals(["prs_merged"])
 
+        if period_totals:
             # Convert to D3.js format: {date: ISO string, value: number}
             # Handle both period formats:
             # - "YYYY-WXX": ISO week format (original aggregator output)
@@ -1,5 +1,11 @@
 """Storage utilities for raw, curated, and metrics data."""
 
+from gh_year_end.storage.cache import (
+    KeyedCache,
+    atomic_write_json,
+    atomic_write_text,
+    read_json,
+)
 from gh_year_end.storage.checkpoint import (
     CheckpointManager,
     CheckpointStatus,
@@ -8,6 +14,7 @@ from gh_year_end.storage.checkpoint import (
 )
 from gh_year_end.storage.manifest import EndpointStats, Manifest
 from gh_year_end.storage.paths import PathManager
+from gh_year_end.storage.recorder import RawRecorder
 from gh_year_end.storage.writer import (
     AsyncJSONLWriter,
     EnvelopedRecord,
@@ -24,9 +31,14 @@ __all__ = [
     "EndpointStats",
     "EnvelopedRecord",
     "JSONLWriter",
+    "KeyedCache",
     "Manifest",
     "PathManager",
+    "RawRecorder",
     "RepoProgress",
     "async_jsonl_writer",
+    "atomic_write_json",
+    "atomic_write_text",
     "jsonl_writer",
+    "read_json",
 ]
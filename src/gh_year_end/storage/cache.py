@@ -0,0 +1,150 @@
+"""Atomic JSON files and keyed on-disk caches.
+
+Checkpoints, the discovery catalog, the hygiene tree cache, the user profile
+cache and the OpenMetrics textfile are all rewritten in place while other runs
+(or a node exporter) may be reading them. They are written to a temporary file
+in the same directory, flushed to disk, and renamed over the target so readers
+only ever see a complete file.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, ClassVar, Self
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+def atomic_write_text(path: Path, text: str, prefix: str = ".tmp_") -> None:
+    """Replace a file with new contents atomically.
+
+    Args:
+        path: File to replace (parent directories are created).
+        text: New file contents.
+        prefix: Temporary file name prefix.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=prefix, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        Path(temp_path).replace(path)
+    except Exception:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_json(
+    path: Path, data: Any, prefix: str = ".tmp_", indent: int | None = None
+) -> None:
+    """Replace a JSON file atomically.
+
+    Args:
+        path: File to replace (parent directories are created).
+        data: JSON-serializable data.
+        prefix: Temporary file name prefix.
+        indent: Indentation passed to ``json.dumps``.
+    """
+    atomic_write_text(path, json.dumps(data, indent=indent), prefix=prefix)
+
+
+def read_json(path: Path, description: str) -> Any | None:
+    """Read a JSON file, ignoring missing or unreadable files.
+
+    Args:
+        path: File to read.
+        description: What the file is, for the warning on unreadable files.
+
+    Returns:
+        Parsed JSON, or None if the file is missing or unreadable.
+    """
+    try:
+        with path.open() as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable %s %s: %s", description, path, e)
+        return None
+
+
+class KeyedCache:
+    """On-disk key -> entry cache shared safely between concurrent runs.
+
+    File layout::
+
+        {"version": 1, "<section>": {"<key>": {"fetched_at": 1735689600.0, ...}}}
+
+    Subclasses set ``section`` and ``description`` and add typed accessors
+    over ``_entries``, calling ``_touch`` after changing it.
+    """
+
+    section: ClassVar[str]
+    description: ClassVar[str]
+
+    def __init__(self, path: Path, clock: Callable[[], float] = time.time) -> None:
+        """Initialize the cache (call ``load`` to read existing entries).
+
+        Args:
+            path: Cache file path.
+            clock: Time source returning epoch seconds.
+        """
+        self.path = path
+        self._clock = clock
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        """Read entries from the cache file, ignoring missing or foreign files."""
+        data = read_json(self.path, self.description)
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        entries = data.get(self.section, {})
+        return entries if isinstance(entries, dict) else {}
+
+    def _touch(self) -> None:
+        """Mark the cache as changed so ``save`` writes it."""
+        self._dirty = True
+
+    def load(self) -> Self:
+        """Load entries from disk.
+
+        Returns:
+            This cache, for chaining.
+        """
+        self._entries = self._read()
+        self._dirty = False
+        logger.debug("Loaded %d %s entries from %s", len(self), self.description, self.path)
+        return self
+
+    def save(self) -> None:
+        """Write the cache atomically if it changed.
+
+        Entries written by concurrent runs since ``load`` are kept when they
+        are newer than ours, so runs for different targets can share the file.
+        """
+        if not self._dirty:
+            return
+        for key, entry in self._read().items():
+            mine = self._entries.get(key)
+            if mine is None or entry.get("fetched_at", 0) > mine.get("fetched_at", 0):
+                self._entries[key] = entry
+
+        atomic_write_json(
+            self.path,
+            {"version": CACHE_VERSION, self.section: self._entries},
+            prefix=f".{self.section}_",
+        )
+        self._dirty = False
+        logger.debug("Saved %d %s entries to %s", len(self), self.description, self.path)
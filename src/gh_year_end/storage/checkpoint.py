@@ -15,9 +15,7 @@ import fcntl
 import hashlib
 import json
 import logging
-import os
 import signal
-import tempfile
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -25,6 +23,7 @@ from pathlib import Path
 from typing import Any
 
 from gh_year_end.config import Config
+from gh_year_end.storage.cache import atomic_write_json
 
 logger = logging.getLogger(__name__)
 
@@ -170,30 +169,8 @@ class CheckpointManager:
         Uses temp file + atomic rename to prevent corruption
         from interrupted writes.
         """
-        # Ensure parent directory exists
-        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write to temp file first
-        fd, temp_path = tempfile.mkstemp(
-            dir=self.checkpoint_path.parent,
-            prefix=".checkpoint_",
-            suffix=".tmp",
-        )
-
-        try:
-            # Write using file descriptor
-            with os.fdopen(fd, "w") as f:
-                json.dump(self._data, f, indent=2)
-
-            # Atomic rename
-            temp_path_obj = Path(temp_path)
-            temp_path_obj.replace(self.checkpoint_path)
-            logger.debug("Saved checkpoint to %s", self.checkpoint_path)
-
-        except Exception:
-            # Clean up temp file on error
-            Path(temp_path).unlink(missing_ok=True)
-            raise
+        atomic_write_json(self.checkpoint_path, self._data, prefix=".checkpoint_", indent=2)
+        logger.debug("Saved checkpoint to %s", self.checkpoint_path)
 
     def delete_if_exists(self) -> None:
         """Delete checkpoint and lock files if they exist."""
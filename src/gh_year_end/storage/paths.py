@@ -42,11 +42,47 @@ class PathManager:
         """Root path for metrics Parquet tables."""
         return self.root / f"metrics/year={self.year}"
 
+    @property
+    def cache_root(self) -> Path:
+        """Root path for caches shared across years and targets."""
+        return self.root / "cache"
+
+    @property
+    def telemetry_root(self) -> Path:
+        """Root path for run instrumentation output."""
+        return self.root / f"telemetry/year={self.year}"
+
+    @property
+    def request_trace_path(self) -> Path:
+        """Path to the per-request JSONL trace."""
+        return self.telemetry_root / "request_trace.jsonl"
+
+    @property
+    def profile_root(self) -> Path:
+        """Root path for per-phase profiles (one directory per command)."""
+        return self.telemetry_root / "profile"
+
     @property
     def site_root(self) -> Path:
         """Root path for generated site."""
         return Path(self.config.report.output_dir) / str(self.year)
 
+    @property
+    def user_profile_cache_path(self) -> Path:
+        """Path to the cached contributor profiles."""
+        return self.cache_root / "users.json"
+
+    @property
+    def hygiene_tree_cache_path(self) -> Path:
+        """Path to the cached hygiene directory listings."""
+        return self.cache_root / "hygiene_trees.json"
+
+    @property
+    def discovery_catalog_path(self) -> Path:
+        """Path to the cached discovery catalog for the target."""
+        mode = self.config.github.target.mode
+        return self.cache_root / "discovery" / f"{mode}={self._safe_name(self.target)}.json"
+
     # Raw data paths
 
     @property
@@ -93,6 +129,10 @@ class PathManager:
         """Path to raw commits JSONL for a repo."""
         return self.raw_root / "commits" / f"{self._safe_name(repo_full_name)}.jsonl"
 
+    def contributor_stats_raw_path(self, repo_full_name: str) -> Path:
+        """Path to raw contributor statistics JSONL for a repo."""
+        return self.raw_root / "contributor_stats" / f"{self._safe_name(repo_full_name)}.jsonl"
+
     def repo_tree_raw_path(self, repo_full_name: str) -> Path:
         """Path to raw repo tree JSONL for a repo."""
         return self.raw_root / "repo_tree" / f"{self._safe_name(repo_full_name)}.jsonl"
@@ -105,6 +145,16 @@ class PathManager:
         """Path to raw security features JSONL for a repo."""
         return self.raw_root / "security_features" / f"{self._safe_name(repo_full_name)}.jsonl"
 
+    @property
+    def hygiene_raw_path(self) -> Path:
+        """Path to per-repo hygiene summaries JSONL."""
+        return self.raw_root / "hygiene.jsonl"
+
+    @property
+    def sampling_marker_path(self) -> Path:
+        """Path to the marker recording that raw reviews and comments were sampled."""
+        return self.raw_root / "sampling.json"
+
     # Curated data paths
 
     def curated_path(
@@ -262,6 +312,7 @@ class PathManager:
             self.raw_root / "issue_comments",
             self.raw_root / "review_comments",
             self.raw_root / "commits",
+            self.raw_root / "contributor_stats",
             self.raw_root / "repo_tree",
             self.raw_root / "branch_protection",
             self.raw_root / "security_features",
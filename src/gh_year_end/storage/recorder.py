@@ -0,0 +1,117 @@
+"""Raw response capture for inline collection.
+
+The single-pass collector aggregates metrics in memory; when raw capture is
+enabled it also records the retained API objects in the same layout the phased
+collectors use, so metrics can later be rebuilt offline without API calls.
+"""
+
+from typing import TYPE_CHECKING, Any, Literal
+
+from gh_year_end.storage.paths import PathManager
+from gh_year_end.storage.writer import AsyncJSONLWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+RawKind = Literal[
+    "pulls",
+    "issues",
+    "reviews",
+    "issue_comments",
+    "review_comments",
+    "contributor_stats",
+    "commits",
+]
+
+# Kinds captured while a repository is collected
+EVENT_KINDS: tuple[RawKind, ...] = (
+    "pulls",
+    "issues",
+    "reviews",
+    "issue_comments",
+    "review_comments",
+)
+
+# Kinds captured once commit metrics are aggregated, after every repository
+COMMIT_KINDS: tuple[RawKind, ...] = ("contributor_stats", "commits")
+
+
+class RawRecorder:
+    """Capture raw records of some kinds for one repository.
+
+    Any previous capture of the recorder's kinds for the repository is
+    replaced when the recorder is opened, so re-running collection does not
+    duplicate records.
+
+    Example:
+        async with RawRecorder(paths, "org/repo") as recorder:
+            await recorder.write("pulls", "/repos/org/repo/pulls/1", pr)
+    """
+
+    def __init__(
+        self,
+        paths: PathManager,
+        repo_full_name: str,
+        kinds: tuple[RawKind, ...] = EVENT_KINDS,
+    ) -> None:
+        """Initialize recorder.
+
+        Args:
+            paths: Path manager for storage locations.
+            repo_full_name: Repository full name (owner/repo).
+            kinds: Raw data kinds this recorder owns.
+        """
+        path_fns = {
+            "pulls": paths.pulls_raw_path,
+            "issues": paths.issues_raw_path,
+            "reviews": paths.reviews_raw_path,
+            "issue_comments": paths.issue_comments_raw_path,
+            "review_comments": paths.review_comments_raw_path,
+            "contributor_stats": paths.contributor_stats_raw_path,
+            "commits": paths.commits_raw_path,
+        }
+        self._paths: dict[str, Path] = {kind: path_fns[kind](repo_full_name) for kind in kinds}
+        self._writers: dict[str, AsyncJSONLWriter] = {}
+
+    async def __aenter__(self) -> "RawRecorder":
+        """Enter async context manager."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit async context manager."""
+        await self.close()
+
+    async def open(self) -> None:
+        """Discard any previous capture of this recorder's kinds for the repository."""
+        for path in self._paths.values():
+            path.unlink(missing_ok=True)
+
+    async def write(
+        self,
+        kind: RawKind,
+        endpoint: str,
+        data: dict[str, Any],
+        page: int = 1,
+    ) -> None:
+        """Record a single API object.
+
+        Args:
+            kind: Raw data kind, which selects the output file.
+            endpoint: API endpoint the object belongs to.
+            data: API object.
+            page: Page number the object was returned on.
+        """
+        writer = self._writers.get(kind)
+        if writer is None:
+            writer = AsyncJSONLWriter(self._paths[kind])
+            await writer.open()
+            self._writers[kind] = writer
+
+        await writer.write(source="github_rest", endpoint=endpoint, data=data, page=page)
+
+    async def close(self) -> None:
+        """Flush and close all open writers."""
+        for writer in self._writers.values():
+            await writer.close()
+        self._writers.clear()
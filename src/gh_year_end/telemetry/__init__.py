@@ -0,0 +1,51 @@
+"""Run instrumentation: request traces, trace events, profiles, and live metrics."""
+
+from gh_year_end.telemetry.analyze import (
+    GroupSummary,
+    TraceAnalysisError,
+    analyze_trace,
+    critical_path,
+    load_trace,
+    render_analysis,
+    summarize,
+)
+from gh_year_end.telemetry.openmetrics import (
+    OpenMetricsExporter,
+    RunMetrics,
+    active_metrics,
+    token_fingerprint,
+)
+from gh_year_end.telemetry.profiling import PhaseProfiler, active_profiler, render_profile
+from gh_year_end.telemetry.request_trace import (
+    RequestTrace,
+    active_trace,
+    endpoint_template,
+    set_phase,
+    trace_scope,
+)
+from gh_year_end.telemetry.trace_events import TraceEventRecorder, active_recorder, span
+
+__all__ = [
+    "GroupSummary",
+    "OpenMetricsExporter",
+    "PhaseProfiler",
+    "RequestTrace",
+    "RunMetrics",
+    "TraceAnalysisError",
+    "TraceEventRecorder",
+    "active_metrics",
+    "active_profiler",
+    "active_recorder",
+    "active_trace",
+    "analyze_trace",
+    "critical_path",
+    "endpoint_template",
+    "load_trace",
+    "render_analysis",
+    "render_profile",
+    "set_phase",
+    "span",
+    "summarize",
+    "token_fingerprint",
+    "trace_scope",
+]
@@ -0,0 +1,285 @@
+"""Summaries of a request trace: where did the time go.
+
+``summarize`` groups trace records by phase, endpoint, or repo with latency
+percentiles. ``critical_path`` replays the timeline and attributes each moment
+of wall time to one cause, in priority order:
+
+- ``network``: at least one request was waiting for GitHub.
+- ``rate_limit``: nothing was on the wire, but a request was waiting in the
+  rate limiter (slot queue, token bucket, secondary limit, throttling, retry
+  back-off).
+- ``cpu``: only JSON decoding or aggregator ingest was running.
+- ``untraced``: none of the above (bookkeeping between requests, disk I/O).
+
+The largest of the first three names what bounds the run.
+"""
+
+import json
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rich.table import Table
+
+from gh_year_end.telemetry.request_trace import WAIT_KINDS
+
+GROUP_BY = ("phase", "endpoint", "repo")
+CAUSES = ("network", "rate_limit", "cpu")
+GROUP_COLUMNS = (
+    "Requests",
+    "Total s",
+    "Wait s",
+    "Network s",
+    "Decode s",
+    "Ingest s",
+    "MB",
+    "p50 ms",
+    "p90 ms",
+    "p99 ms",
+)
+
+
+class TraceAnalysisError(Exception):
+    """Raised when a trace file cannot be read."""
+
+
+def load_trace(path: Path) -> list[dict[str, Any]]:
+    """Read trace records, skipping blank lines.
+
+    Args:
+        path: Request trace JSONL file.
+
+    Returns:
+        Records in file order.
+
+    Raises:
+        TraceAnalysisError: If a line is not a JSON object.
+    """
+    records = []
+    with path.open() as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                msg = f"{path}:{line_number}: invalid JSON: {e}"
+                raise TraceAnalysisError(msg) from e
+            if not isinstance(record, dict):
+                msg = f"{path}:{line_number}: expected a JSON object"
+                raise TraceAnalysisError(msg)
+            records.append(record)
+    return records
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted values (0 for none)."""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def _wait(record: dict[str, Any]) -> float:
+    return float(sum(record.get(kind, 0.0) for kind in WAIT_KINDS))
+
+
+def _group_key(record: dict[str, Any], by: str) -> str:
+    if by == "endpoint" and record.get("type") == "ingest":
+        return f"ingest {record.get('op')}"
+    return str(record.get(by) or "(none)")
+
+
+@dataclass
+class GroupSummary:
+    """Totals and latency percentiles for one group of records."""
+
+    key: str
+    requests: int = 0
+    wait: float = 0.0
+    network: float = 0.0
+    decode: float = 0.0
+    ingest: float = 0.0
+    bytes: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        """Seconds spent across all records of the group."""
+        return self.wait + self.network + self.decode + self.ingest
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Add a request or ingest record."""
+        if record.get("type") == "ingest":
+            self.ingest += record.get("seconds", 0.0)
+            return
+        wait = _wait(record)
+        network = record.get("network", 0.0)
+        decode = record.get("decode", 0.0)
+        self.requests += 1
+        self.wait += wait
+        self.network += network
+        self.decode += decode
+        self.bytes += record.get("bytes", 0)
+        self.latencies.append(wait + network + decode)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable summary (latency percentiles in milliseconds)."""
+        latencies = sorted(self.latencies)
+        return {
+            "key": self.key,
+            "requests": self.requests,
+            "total_seconds": round(self.total, 3),
+            "wait_seconds": round(self.wait, 3),
+            "network_seconds": round(self.network, 3),
+            "decode_seconds": round(self.decode, 3),
+            "ingest_seconds": round(self.ingest, 3),
+            "bytes": self.bytes,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+            "p90_ms": round(percentile(latencies, 90) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        }
+
+
+def summarize(records: Iterable[dict[str, Any]], by: str) -> list[GroupSummary]:
+    """Group records and order the groups by time spent.
+
+    Args:
+        records: Trace records.
+        by: ``phase``, ``endpoint``, or ``repo``.
+
+    Returns:
+        Group summaries, most expensive first.
+    """
+    groups: dict[str, GroupSummary] = {}
+    for record in records:
+        key = _group_key(record, by)
+        groups.setdefault(key, GroupSummary(key)).add(record)
+    return sorted(groups.values(), key=lambda group: group.total, reverse=True)
+
+
+def _intervals(record: dict[str, Any]) -> list[tuple[float, float, str]]:
+    """(start, end, cause) spans of one record on the trace timeline."""
+    start = record.get("start", 0.0)
+    if record.get("type") == "ingest":
+        return [(start, start + record.get("seconds", 0.0), "cpu")]
+    waited = start + _wait(record)
+    received = waited + record.get("network", 0.0)
+    return [
+        (start, waited, "rate_limit"),
+        (waited, received, "network"),
+        (received, received + record.get("decode", 0.0), "cpu"),
+    ]
+
+
+def critical_path(records: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Attribute wall time to network, rate limiting, CPU, or untraced time.
+
+    Args:
+        records: Trace records (typically one run, or one phase of it).
+
+    Returns:
+        Wall seconds, seconds per cause (including ``untraced``), and the
+        ``bound`` cause with the most time.
+    """
+    events: list[tuple[float, int, str]] = []
+    for record in records:
+        for start, end, cause in _intervals(record):
+            if end > start:
+                events.extend([(start, 1, cause), (end, -1, cause)])
+    seconds = dict.fromkeys((*CAUSES, "untraced"), 0.0)
+    if not events:
+        return {"wall_seconds": 0.0, "seconds": seconds, "bound": None}
+
+    events.sort()
+    active: dict[str, int] = defaultdict(int)
+    previous = events[0][0]
+    for time, delta, cause in events:
+        if time > previous:
+            current = next((c for c in CAUSES if active[c] > 0), "untraced")
+            seconds[current] += time - previous
+            previous = time
+        active[cause] += delta
+
+    wall = events[-1][0] - events[0][0]
+    bound = max(CAUSES, key=lambda cause: seconds[cause])
+    return {
+        "wall_seconds": round(wall, 3),
+        "seconds": {cause: round(value, 3) for cause, value in seconds.items()},
+        "bound": bound if seconds[bound] > 0 else None,
+    }
+
+
+def analyze_trace(
+    records: list[dict[str, Any]], group_by: Iterable[str] = GROUP_BY, top: int = 10
+) -> dict[str, Any]:
+    """Full analysis of a trace.
+
+    Args:
+        records: Trace records.
+        group_by: Groupings to summarize.
+        top: Groups kept per grouping.
+
+    Returns:
+        ``requests``, ``ingests``, per-grouping summaries, and the critical
+        path for the whole run and each phase.
+    """
+    by_phase: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for record in records:
+        by_phase[_group_key(record, "phase")].append(record)
+    return {
+        "requests": sum(1 for r in records if r.get("type") == "request"),
+        "ingests": sum(1 for r in records if r.get("type") == "ingest"),
+        "groups": {
+            by: [group.to_dict() for group in summarize(records, by)[:top]] for by in group_by
+        },
+        "critical_path": {
+            "run": critical_path(records),
+            "phases": {phase: critical_path(rs) for phase, rs in by_phase.items()},
+        },
+    }
+
+
+def render_analysis(analysis: dict[str, Any]) -> list[Table]:
+    """Rich tables for an ``analyze_trace`` result."""
+    tables = []
+    path_table = Table(title="Critical path (seconds of wall time)")
+    for column in ("Scope", "Wall", "Network", "Rate limit", "CPU", "Untraced", "Bound by"):
+        path_table.add_column(
+            column, justify="left" if column in ("Scope", "Bound by") else "right"
+        )
+    scopes = {"run": analysis["critical_path"]["run"], **analysis["critical_path"]["phases"]}
+    for scope, path in scopes.items():
+        seconds = path["seconds"]
+        path_table.add_row(
+            scope,
+            f"{path['wall_seconds']:.1f}",
+            *(f"{seconds[cause]:.1f}" for cause in (*CAUSES, "untraced")),
+            path["bound"] or "-",
+        )
+    tables.append(path_table)
+
+    for by, groups in analysis["groups"].items():
+        table = Table(title=f"By {by}")
+        table.add_column(by.title())
+        for column in GROUP_COLUMNS:
+            table.add_column(column, justify="right")
+        for group in groups:
+            table.add_row(
+                group["key"],
+                str(group["requests"]),
+                f"{group['total_seconds']:.1f}",
+                f"{group['wait_seconds']:.1f}",
+                f"{group['network_seconds']:.1f}",
+                f"{group['decode_seconds']:.2f}",
+                f"{group['ingest_seconds']:.2f}",
+                f"{group['bytes'] / 1_000_000:.1f}",
+                f"{group['p50_ms']:.0f}",
+                f"{group['p90_ms']:.0f}",
+                f"{group['p99_ms']:.0f}",
+            )
+        tables.append(table)
+    return tables
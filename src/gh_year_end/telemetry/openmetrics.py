@@ -0,0 +1,409 @@
+"""Live OpenMetrics export for collection runs.
+
+The rate limiter and progress tracker keep their state in memory, and until
+now it only surfaced at the end of a run (``rate_limit_samples``). With
+``telemetry.openmetrics`` configured, a run exposes Prometheus/OpenMetrics
+text on a local HTTP endpoint (``GET /metrics``) and/or rewrites a textfile
+(e.g. for node_exporter's textfile collector) every ``interval`` seconds:
+
+- ``gh_year_end_requests_total{api,status}`` and the
+  ``gh_year_end_request_duration_seconds{api}`` histogram
+- ``gh_year_end_rate_limit_remaining{api,token}`` (plus limit and reset time)
+- ``gh_year_end_requests_in_flight`` and ``gh_year_end_concurrency_limit``
+- ``gh_year_end_items_ingested_total{kind}`` (use ``rate()`` for items/s)
+- ``gh_year_end_process_resident_memory_bytes``
+- ``gh_year_end_phase_info{phase}``, ``gh_year_end_repos{state}``, and
+  ``gh_year_end_last_request_timestamp_seconds`` for stall alerts
+
+Request and ingest counters are fed by hooks that do nothing unless a
+``RunMetrics`` is active; limiter and progress state are read at scrape time.
+No client library is needed.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import os
+import resource
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from gh_year_end.storage.cache import atomic_write_text
+
+if TYPE_CHECKING:
+    from gh_year_end.collect.progress import ProgressTracker
+    from gh_year_end.github.ratelimit import AdaptiveRateLimiter
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "gh_year_end"
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_active: "RunMetrics | None" = None
+
+
+def token_fingerprint(token: str) -> str:
+    """Short, non-reversible label identifying a token."""
+    return hashlib.sha256(token.encode()).hexdigest()[:8]
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process (peak RSS where /proc is unavailable)."""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: object) -> str:
+    """Label set in exposition syntax (empty for no labels)."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize empty buckets with the given upper bounds."""
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class RunMetrics:
+    """Live metrics of one collection run.
+
+    Example:
+        metrics = RunMetrics(rate_limiter, progress, token_id=token_fingerprint(token))
+        metrics.activate()
+        text = metrics.render()
+    """
+
+    def __init__(
+        self,
+        rate_limiter: "AdaptiveRateLimiter | None" = None,
+        progress: "ProgressTracker | None" = None,
+        token_id: str = "",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize empty counters.
+
+        Args:
+            rate_limiter: Limiter whose budgets and concurrency are exported.
+            progress: Tracker whose phase and repo progress are exported.
+            token_id: Label for the token's budgets (see ``token_fingerprint``).
+            clock: Wall clock in epoch seconds.
+        """
+        self.rate_limiter = rate_limiter
+        self.progress = progress
+        self.token_id = token_id
+        self._clock = clock
+        self.started_at = clock()
+        self.last_request_at = 0.0
+        self.requests: dict[tuple[str, str], int] = {}
+        self.latency: dict[str, Histogram] = {}
+        self.items: dict[str, int] = {}
+
+    def activate(self) -> "RunMetrics":
+        """Make this the run's metrics (fed by the request and ingest hooks)."""
+        global _active
+        _active = self
+        return self
+
+    def deactivate(self) -> None:
+        """Stop feeding this instance."""
+        global _active
+        if _active is self:
+            _active = None
+
+    def observe_request(self, api: str, status: int, seconds: float) -> None:
+        """Count a completed request and its latency."""
+        key = (api, f"{status // 100}xx")
+        self.requests[key] = self.requests.get(key, 0) + 1
+        self.latency.setdefault(api, Histogram()).observe(seconds)
+        self.last_request_at = self._clock()
+
+    def observe_items(self, kind: str, count: int) -> None:
+        """Count items handed to the aggregator."""
+        self.items[kind] = self.items.get(kind, 0) + count
+
+    def render(self) -> str:
+        """OpenMetrics text exposition, terminated by ``# EOF``."""
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str, samples: list[tuple[str, Any]]) -> None:
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+            lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+            lines.extend(f"{PREFIX}_{suffix} {value}" for suffix, value in samples)
+
+        family(
+            "requests",
+            "counter",
+            "Completed API requests.",
+            [
+                (f"requests_total{_labels(api=api, status=status)}", count)
+                for (api, status), count in sorted(self.requests.items())
+            ],
+        )
+        histogram_samples: list[tuple[str, Any]] = []
+        for api, histogram in sorted(self.latency.items()):
+            name = "request_duration_seconds"
+            for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+                histogram_samples.append((f"{name}_bucket{_labels(api=api, le=bound)}", count))
+            histogram_samples.append(
+                (f"{name}_bucket{_labels(api=api, le='+Inf')}", histogram.count)
+            )
+            histogram_samples.append((f"{name}_sum{_labels(api=api)}", round(histogram.sum, 6)))
+            histogram_samples.append((f"{name}_count{_labels(api=api)}", histogram.count))
+        family(
+            "request_duration_seconds",
+            "histogram",
+            "API request latency, including retries.",
+            histogram_samples,
+        )
+        family(
+            "items_ingested",
+            "counter",
+            "Items handed to the metrics aggregator.",
+            [
+                (f"items_ingested_total{_labels(kind=kind)}", count)
+                for kind, count in sorted(self.items.items())
+            ],
+        )
+        family(
+            "last_request_timestamp_seconds",
+            "gauge",
+            "When the last request completed (0 before the first).",
+            [("last_request_timestamp_seconds", round(self.last_request_at, 3))],
+        )
+        family(
+            "start_timestamp_seconds",
+            "gauge",
+            "When the run started.",
+            [("start_timestamp_seconds", round(self.started_at, 3))],
+        )
+        family(
+            "process_resident_memory_bytes",
+            "gauge",
+            "Resident memory of the collector process.",
+            [("process_resident_memory_bytes", rss_bytes())],
+        )
+        if self.rate_limiter is not None:
+            self._render_rate_limiter(self.rate_limiter, family)
+        if self.progress is not None:
+            self._render_progress(self.progress, family)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _render_rate_limiter(
+        self, limiter: "AdaptiveRateLimiter", family: Callable[..., None]
+    ) -> None:
+        """Budgets per API and the limiter's concurrency."""
+        states = [(api.value, limiter.get_state(api)) for api in limiter.api_types]
+        token = self.token_id
+        family(
+            "rate_limit_remaining",
+            "gauge",
+            "Requests (REST) or points (GraphQL) left in the window.",
+            [
+                (f"rate_limit_remaining{_labels(api=api, token=token)}", s.remaining)
+                for api, s in states
+            ],
+        )
+        family(
+            "rate_limit_limit",
+            "gauge",
+            "Size of the rate limit window.",
+            [(f"rate_limit_limit{_labels(api=api, token=token)}", s.limit) for api, s in states],
+        )
+        family(
+            "rate_limit_reset_timestamp_seconds",
+            "gauge",
+            "When the rate limit window resets.",
+            [
+                (f"rate_limit_reset_timestamp_seconds{_labels(api=api, token=token)}", s.reset_at)
+                for api, s in states
+            ],
+        )
+        family(
+            "requests_in_flight",
+            "gauge",
+            "Requests holding a rate limiter slot.",
+            [("requests_in_flight", limiter.in_flight)],
+        )
+        family(
+            "concurrency_limit",
+            "gauge",
+            "Rate limiter concurrency slots.",
+            [("concurrency_limit", limiter.config.max_concurrency)],
+        )
+
+    def _render_progress(self, progress: "ProgressTracker", family: Callable[..., None]) -> None:
+        """Current phase and repo progress."""
+        stats = progress.stats
+        if stats.current_phase:
+            family(
+                "phase",
+                "info",
+                "Phase currently running.",
+                [(f"phase_info{_labels(phase=stats.current_phase)}", 1)],
+            )
+        family(
+            "repos",
+            "gauge",
+            "Repositories by progress state.",
+            [
+                (f"repos{_labels(state='total')}", stats.total_repos),
+                (f"repos{_labels(state='completed')}", stats.completed_repos),
+                (f"repos{_labels(state='skipped')}", stats.skipped_repos),
+                (f"repos{_labels(state='failed')}", stats.failed_repos),
+            ],
+        )
+        family(
+            "planned_requests",
+            "gauge",
+            "Requests estimated by the pre-flight plan (0 without one).",
+            [("planned_requests", stats.planned_requests)],
+        )
+
+
+def active_metrics() -> RunMetrics | None:
+    """The run's live metrics, or None when export is off."""
+    return _active
+
+
+def observe_request(api: str, status: int, seconds: float) -> None:
+    """Count a completed request if metrics are being exported."""
+    if _active is not None:
+        _active.observe_request(api, status, seconds)
+
+
+def observe_items(kind: str, count: int) -> None:
+    """Count ingested items if metrics are being exported."""
+    if _active is not None:
+        _active.observe_items(kind, count)
+
+
+class OpenMetricsExporter:
+    """Serve and/or periodically write a run's metrics.
+
+    Example:
+        exporter = OpenMetricsExporter(metrics, textfile=Path("run.prom"), port=9464)
+        await exporter.start()
+        ...
+        await exporter.stop()
+    """
+
+    def __init__(
+        self,
+        metrics: RunMetrics,
+        textfile: Path | None = None,
+        port: int | None = None,
+        host: str = "127.0.0.1",
+        interval: float = 15.0,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            metrics: Metrics to export.
+            textfile: File rewritten atomically every ``interval`` seconds.
+            port: Port serving ``GET /metrics`` (0 picks a free port).
+            host: Interface the endpoint listens on.
+            interval: Seconds between textfile rewrites.
+        """
+        self.metrics = metrics
+        self.textfile = textfile
+        self.port = port
+        self.host = host
+        self.interval = interval
+        self._server: asyncio.Server | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+
+    @property
+    def bound_port(self) -> int | None:
+        """Port the endpoint is listening on, once started."""
+        if self._server is None or not self._server.sockets:
+            return None
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        """Activate the metrics and start the endpoint and textfile writer."""
+        self.metrics.activate()
+        if self.port is not None:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            logger.info("Serving OpenMetrics on http://%s:%d/metrics", self.host, self.bound_port)
+        if self.textfile is not None:
+            self._writer_task = asyncio.create_task(self._write_periodically())
+            logger.info("Writing OpenMetrics to %s every %.0fs", self.textfile, self.interval)
+
+    async def stop(self) -> None:
+        """Write a final textfile, stop serving, and deactivate the metrics."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer_task
+            self._writer_task = None
+            self.write_textfile()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.metrics.deactivate()
+
+    def write_textfile(self) -> None:
+        """Atomically replace the textfile with the current metrics."""
+        if self.textfile is None:
+            return
+        atomic_write_text(self.textfile, self.metrics.render(), prefix=".openmetrics_")
+
+    async def _write_periodically(self) -> None:
+        while True:
+            try:
+                self.write_textfile()
+            except OSError as e:
+                logger.warning("Could not write OpenMetrics textfile %s: %s", self.textfile, e)
+            await asyncio.sleep(self.interval)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer one HTTP/1.x request and close the connection."""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            method, _, rest = request_line.decode("latin-1").partition(" ")
+            path = rest.split(" ", 1)[0].split("?", 1)[0]
+            if method == "GET" and path in ("/metrics", "/"):
+                status, content_type = "200 OK", CONTENT_TYPE
+                body = self.metrics.render().encode()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", b"Not Found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except (TimeoutError, ConnectionError) as e:
+            logger.debug("OpenMetrics request failed: %s", e)
+        finally:
+            writer.close()
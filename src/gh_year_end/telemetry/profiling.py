@@ -0,0 +1,279 @@
+"""Per-phase CPU and memory profiling (``collect --profile``, ``build --profile``).
+
+While a ``PhaseProfiler`` is active, each phase (set through
+``ProgressTracker.set_phase`` during collection, or each ``build_site`` stage)
+runs under ``cProfile`` with ``tracemalloc`` snapshots taken at its start and
+end. For each phase the profiler writes ``NN-<phase>.prof`` (open with
+``python -m pstats`` or snakeviz) and summarizes:
+
+- wall seconds and the top functions by own CPU time
+- peak traced memory above the phase's starting point
+- the allocation sites that grew the most (net, by source line)
+- allocations per event, where events are API responses plus items ingested
+
+tracemalloc cannot attribute the peak itself to call sites, so the sites are
+those with the largest net growth over the phase. With no active profiler the
+hooks are no-ops.
+
+Example:
+    profiler = PhaseProfiler(paths.profile_root / "build").start()
+    profiler.set_phase("load")
+    ...
+    summary = profiler.close()
+"""
+
+import cProfile
+import json
+import logging
+import pstats
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rich.table import Table
+
+logger = logging.getLogger(__name__)
+
+TOP_ENTRIES = 10
+
+_active: "PhaseProfiler | None" = None
+
+
+@dataclass
+class _RunningPhase:
+    """Profiler state of the phase in progress."""
+
+    name: str
+    started: float
+    start_bytes: int
+    snapshot: tracemalloc.Snapshot
+    profile: cProfile.Profile = field(default_factory=cProfile.Profile)
+    events: int = 0
+
+
+def _function_label(key: tuple[str, int, str]) -> str:
+    filename, line, function = key
+    if filename == "~":
+        return function
+    return f"{function} ({Path(filename).name}:{line})"
+
+
+def top_functions(profile: cProfile.Profile, limit: int = TOP_ENTRIES) -> list[dict[str, Any]]:
+    """Functions with the most own CPU time in a profile.
+
+    Args:
+        profile: Finished profile.
+        limit: Entries to return.
+
+    Returns:
+        Function label, call count, own seconds, and cumulative seconds.
+    """
+    stats: dict[tuple[str, int, str], tuple[int, int, float, float, Any]]
+    stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+    ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+    return [
+        {
+            "function": _function_label(key),
+            "calls": calls,
+            "own_seconds": round(own, 4),
+            "cumulative_seconds": round(cumulative, 4),
+        }
+        for key, (_primitive, calls, own, cumulative, _callers) in ranked
+    ]
+
+
+def allocation_growth(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, limit: int = TOP_ENTRIES
+) -> tuple[int, int, list[dict[str, Any]]]:
+    """Memory allocated between two snapshots.
+
+    Args:
+        before: Snapshot at the start of the phase.
+        after: Snapshot at the end of the phase.
+        limit: Sites to return.
+
+    Returns:
+        New blocks, new bytes, and the sites with the largest net growth.
+    """
+    ignore = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ]
+    diffs = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+    blocks = sum(max(diff.count_diff, 0) for diff in diffs)
+    size = sum(max(diff.size_diff, 0) for diff in diffs)
+    sites = [
+        {
+            "site": f"{diff.traceback[0].filename}:{diff.traceback[0].lineno}",
+            "kib": round(diff.size_diff / 1024, 1),
+            "blocks": diff.count_diff,
+        }
+        for diff in sorted(diffs, key=lambda diff: diff.size_diff, reverse=True)[:limit]
+        if diff.size_diff > 0
+    ]
+    return blocks, size, sites
+
+
+class PhaseProfiler:
+    """Profile phases one after another and summarize them.
+
+    Example:
+        with PhaseProfiler(Path("profile")) as profiler:
+            profiler.set_phase("discovery")
+            ...
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        top: int = TOP_ENTRIES,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initialize the profiler (``start`` activates it).
+
+        Args:
+            output_dir: Directory for ``.prof`` files and ``summary.json``.
+            top: Functions and allocation sites kept per phase.
+            clock: Monotonic time source in seconds.
+        """
+        self.output_dir = output_dir
+        self.top = top
+        self.clock = clock
+        self.phases: list[dict[str, Any]] = []
+        self._current: _RunningPhase | None = None
+        self._started_tracemalloc = False
+        self._summary: dict[str, Any] | None = None
+
+    def start(self) -> "PhaseProfiler":
+        """Start tracing allocations and make this the active profiler."""
+        global _active
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        _active = self
+        logger.info("Profiling phases to %s", self.output_dir)
+        return self
+
+    def close(self) -> dict[str, Any]:
+        """End the open phase, stop, and write ``summary.json``.
+
+        Returns:
+            The summary (also returned by later calls).
+        """
+        global _active
+        if self._summary is not None:
+            return self._summary
+        self.end_phase()
+        if _active is self:
+            _active = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        self._summary = {"output_dir": str(self.output_dir), "phases": self.phases}
+        (self.output_dir / "summary.json").write_text(json.dumps(self._summary, indent=2))
+        logger.info("Wrote profiles of %d phases to %s", len(self.phases), self.output_dir)
+        return self._summary
+
+    def __enter__(self) -> "PhaseProfiler":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def set_phase(self, phase: str) -> None:
+        """End the current phase and start profiling ``phase``."""
+        self.end_phase()
+        tracemalloc.reset_peak()
+        current = _RunningPhase(
+            name=phase,
+            started=self.clock(),
+            start_bytes=tracemalloc.get_traced_memory()[0],
+            snapshot=tracemalloc.take_snapshot(),
+        )
+        self._current = current
+        current.profile.enable()
+
+    def end_phase(self, phase: str | None = None) -> None:
+        """End the current phase (only if it is ``phase``, when given)."""
+        current = self._current
+        if current is None or phase not in (None, current.name):
+            return
+        current.profile.disable()
+        seconds = self.clock() - current.started
+        peak = tracemalloc.get_traced_memory()[1]
+        blocks, size, sites = allocation_growth(current.snapshot, tracemalloc.take_snapshot())
+        self._current = None
+
+        profile_path = self.output_dir / f"{len(self.phases) + 1:02d}-{current.name}.prof"
+        current.profile.dump_stats(profile_path)
+        self.phases.append(
+            {
+                "phase": current.name,
+                "seconds": round(seconds, 3),
+                "profile": profile_path.name,
+                "top_functions": top_functions(current.profile, self.top),
+                "peak_kib": round(max(peak - current.start_bytes, 0) / 1024, 1),
+                "allocated_blocks": blocks,
+                "allocated_kib": round(size / 1024, 1),
+                "top_allocations": sites[: self.top],
+                "events": current.events,
+                "allocations_per_event": (
+                    round(blocks / current.events, 1) if current.events else None
+                ),
+            }
+        )
+
+    def count_events(self, count: int) -> None:
+        """Count API responses or ingested items of the current phase."""
+        if self._current is not None:
+            self._current.events += count
+
+
+def active_profiler() -> PhaseProfiler | None:
+    """The running profiler, or None when profiling is off."""
+    return _active
+
+
+def set_phase(phase: str) -> None:
+    """Start profiling a phase (ending the previous one)."""
+    if _active is not None:
+        _active.set_phase(phase)
+
+
+def end_phase(phase: str | None = None) -> None:
+    """End the profiled phase if ``phase`` is the current one."""
+    if _active is not None:
+        _active.end_phase(phase)
+
+
+def count_events(count: int = 1) -> None:
+    """Count events for allocations-per-event if a phase is being profiled."""
+    if _active is not None:
+        _active.count_events(count)
+
+
+def render_profile(summary: dict[str, Any]) -> Table:
+    """Rich table of a profiler summary, one row per phase."""
+    table = Table(title=f"Profile ({summary['output_dir']})")
+    table.add_column("Phase")
+    for column in ("Seconds", "Peak MiB", "Alloc/event"):
+        table.add_column(column, justify="right")
+    table.add_column("Top function (own s)")
+    table.add_column("Top allocation site")
+    for phase in summary["phases"]:
+        functions = phase["top_functions"]
+        sites = phase["top_allocations"]
+        per_event = phase["allocations_per_event"]
+        table.add_row(
+            phase["phase"],
+            f"{phase['seconds']:.1f}",
+            f"{phase['peak_kib'] / 1024:.1f}",
+            "-" if per_event is None else f"{per_event:.0f}",
+            f"{functions[0]['function']} ({functions[0]['own_seconds']:.2f})" if functions else "-",
+            f"{sites[0]['site']} (+{sites[0]['kib']:.0f} KiB)" if sites else "-",
+        )
+    return table
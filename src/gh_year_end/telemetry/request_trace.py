@@ -0,0 +1,308 @@
+"""Per-request JSONL trace.
+
+When ``telemetry.request_trace`` is enabled (or ``collect --trace-requests``),
+every API request appends one record to ``request_trace.jsonl`` under the
+telemetry directory, so a slow run can be attributed to the network, the rate
+limiter, or local CPU with ``gh-year-end analyze-trace``.
+
+Records (times in seconds, ``start`` relative to the start of the trace)::
+
+    {"type": "request", "start": 12.5, "method": "GET",
+     "endpoint": "GET /repos/{owner}/{repo}/pulls", "phase": "pulls",
+     "repo": "org/repo", "status": 200, "source": "network",
+     "queue": 0.0, "bucket": 0.0, "secondary": 0.0, "throttle": 0.0,
+     "retry": 0.0, "network": 0.31, "bytes": 48213, "decode": 0.002}
+    {"type": "ingest", "start": 12.8, "op": "add_prs", "phase": "pulls",
+     "repo": "org/repo", "seconds": 0.004}
+
+``queue`` is the wait for a concurrency slot in
+``AdaptiveRateLimiter.acquire``, ``bucket`` the token-bucket wait,
+``secondary`` the secondary-limit sleep, ``throttle`` the remaining limiter
+sleeps (exhausted budget, pacing, adaptive delay), and ``retry`` the back-off
+slept by the HTTP client before retries. ``source`` is ``memo`` or
+``coalesced`` for GETs answered without a request of their own.
+
+Phase and repo come from the current context (see ``set_phase`` and
+``trace_scope``), falling back to the ``/repos/{owner}/{repo}`` path or GraphQL
+``owner``/``name`` variables. With no active trace every hook is a no-op.
+"""
+
+import functools
+import json
+import logging
+import re
+import time
+from collections.abc import Callable, Iterator, Mapping, Sized
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import IO, Any, Concatenate, ParamSpec, TypeVar
+
+from gh_year_end.telemetry import openmetrics, profiling
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+S = TypeVar("S")
+
+WAIT_KINDS = ("queue", "bucket", "secondary", "throttle", "retry")
+
+_active: "RequestTrace | None" = None
+_scope: ContextVar[tuple[str | None, str | None]] = ContextVar(
+    "request_trace_scope", default=(None, None)
+)
+_waits: ContextVar[dict[str, float] | None] = ContextVar("request_trace_waits", default=None)
+
+_NUMBER_SEGMENT = re.compile(r"^\d+$")
+_SHA_SEGMENT = re.compile(r"^[0-9a-f]{40}$")
+_GRAPHQL_ROOT_FIELD = re.compile(r"\{\s*(?:\w+\s*:\s*)?(\w+)")
+
+
+class RequestTrace:
+    """JSONL sink for request and ingest records.
+
+    Records are written synchronously to a buffered file: they are small and
+    frequent, and an async writer per record would cost more than the write.
+
+    Example:
+        with RequestTrace(paths.request_trace_path):
+            await collect_and_aggregate(config)
+    """
+
+    def __init__(self, path: Path, clock: Callable[[], float] = time.perf_counter) -> None:
+        """Initialize the trace (``start`` opens the file and activates it).
+
+        Args:
+            path: JSONL output path (truncated on start).
+            clock: Monotonic time source in seconds.
+        """
+        self.path = path
+        self.clock = clock
+        self.records = 0
+        self._origin = 0.0
+        self._file: IO[str] | None = None
+
+    def start(self) -> "RequestTrace":
+        """Open the file and make this the active trace."""
+        global _active
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w")
+        self._origin = self.clock()
+        _active = self
+        logger.info("Tracing API requests to %s", self.path)
+        return self
+
+    def close(self) -> None:
+        """Deactivate the trace and close the file."""
+        global _active
+        if _active is self:
+            _active = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            logger.info("Wrote %d trace records to %s", self.records, self.path)
+
+    def __enter__(self) -> "RequestTrace":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def offset(self, timestamp: float) -> float:
+        """Seconds between the start of the trace and a clock reading."""
+        return round(timestamp - self._origin, 6)
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Append one record."""
+        if self._file is None:
+            return
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.records += 1
+
+
+def active_trace() -> RequestTrace | None:
+    """The running trace, or None when tracing is off."""
+    return _active
+
+
+def set_phase(phase: str) -> None:
+    """Label subsequent requests in this context with a phase."""
+    _scope.set((phase, _scope.get()[1]))
+
+
+@contextmanager
+def trace_scope(phase: str | None = None, repo: str | None = None) -> Iterator[None]:
+    """Label requests made inside the block with a phase and/or repo.
+
+    Args:
+        phase: Phase name (keeps the current one if None).
+        repo: Repository full name (keeps the current one if None).
+    """
+    current_phase, current_repo = _scope.get()
+    token = _scope.set((phase or current_phase, repo or current_repo))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def start_waits() -> dict[str, float] | None:
+    """Begin collecting rate limiter waits for the next request in this context.
+
+    Returns:
+        The wait accumulator to fill in, or None when tracing is off.
+    """
+    if _active is None:
+        return None
+    waits: dict[str, float] = {"start": _active.clock()}
+    _waits.set(waits)
+    return waits
+
+
+def add_wait(kind: str, seconds: float) -> None:
+    """Add time spent waiting (one of ``WAIT_KINDS``) to the pending request."""
+    waits = _waits.get()
+    if waits is not None:
+        waits[kind] = waits.get(kind, 0.0) + seconds
+
+
+def endpoint_template(method: str, path: str, body: Any = None) -> str:
+    """Endpoint with identifiers replaced by placeholders.
+
+    Args:
+        method: HTTP method.
+        path: API path (e.g. ``/repos/org/repo/pulls/12/reviews``).
+        body: JSON body (the GraphQL root field names GraphQL requests).
+
+    Returns:
+        e.g. ``GET /repos/{owner}/{repo}/pulls/{number}/reviews`` or
+        ``POST /graphql repository``.
+    """
+    parts = [part for part in path.split("?", 1)[0].split("/") if part]
+    if parts == ["graphql"]:
+        query = body.get("query", "") if isinstance(body, dict) else ""
+        match = _GRAPHQL_ROOT_FIELD.search(query)
+        return f"{method} /graphql {match.group(1)}" if match else f"{method} /graphql"
+
+    if parts[:1] == ["repos"] and len(parts) >= 3:
+        parts[1:3] = ["{owner}", "{repo}"]
+    elif parts[:1] in (["users"], ["orgs"]) and len(parts) >= 2:
+        parts[1] = "{user}" if parts[0] == "users" else "{org}"
+    for i, part in enumerate(parts):
+        previous = parts[i - 1] if i else ""
+        if previous == "contents":
+            parts[i:] = ["{path}"]
+            break
+        if _NUMBER_SEGMENT.match(part):
+            parts[i] = "{number}"
+        elif _SHA_SEGMENT.match(part) or previous == "trees":
+            parts[i] = "{ref}"
+        elif previous == "branches":
+            parts[i] = "{branch}"
+    return f"{method} /" + "/".join(parts)
+
+
+def _repo_from_request(path: str, body: Any) -> str | None:
+    """Repository a request is about, from its path or GraphQL variables."""
+    parts = [part for part in path.split("?", 1)[0].split("/") if part]
+    if parts[:1] == ["repos"] and len(parts) >= 3:
+        return f"{parts[1]}/{parts[2]}"
+    variables = body.get("variables") if isinstance(body, dict) else None
+    if isinstance(variables, dict) and "owner" in variables and "name" in variables:
+        return f"{variables['owner']}/{variables['name']}"
+    return None
+
+
+def record_request(
+    method: str,
+    path: str,
+    *,
+    body: Any,
+    started: float,
+    status: int,
+    source: str,
+    network: float,
+    nbytes: int,
+    decode: float,
+) -> None:
+    """Write the record for a finished request and its pending limiter waits.
+
+    Args:
+        method: HTTP method.
+        path: API path.
+        body: JSON body, if any.
+        started: Clock reading when the client was asked for the request.
+        status: HTTP status.
+        source: ``network``, ``memo``, or ``coalesced``.
+        network: Seconds until the response arrived (retry back-off recorded
+            for the request is subtracted).
+        nbytes: Response body size.
+        decode: Seconds spent parsing the JSON body.
+    """
+    trace = _active
+    if trace is None:
+        return
+    waits = _waits.get() or {}
+    _waits.set(None)
+    phase, repo = _scope.get()
+    trace.write(
+        {
+            "type": "request",
+            "start": trace.offset(waits.get("start", started)),
+            "method": method,
+            "endpoint": endpoint_template(method, path, body),
+            "phase": phase,
+            "repo": repo or _repo_from_request(path, body),
+            "status": status,
+            "source": source,
+            **{kind: round(waits.get(kind, 0.0), 6) for kind in WAIT_KINDS},
+            "network": round(max(network - waits.get("retry", 0.0), 0.0), 6),
+            "bytes": nbytes,
+            "decode": round(decode, 6),
+        }
+    )
+
+
+def _item_count(arguments: tuple[Any, ...]) -> int:
+    """Length of the first list-like argument, or 1."""
+    for argument in arguments:
+        if isinstance(argument, Sized) and not isinstance(argument, str | Mapping):
+            return len(argument)
+    return 1
+
+
+def traced_ingest(
+    method: Callable[Concatenate[S, str, P], R],
+) -> Callable[Concatenate[S, str, P], R]:
+    """Record the time an aggregator method spends ingesting a repo's data.
+
+    The wrapped method's first argument after ``self`` is the repository. Its
+    first list-like argument is also counted as items ingested (one item when
+    there is none) for OpenMetrics and the phase profiler.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: S, repo_id: str, /, *args: P.args, **kwargs: P.kwargs) -> R:
+        items = _item_count((*args, *kwargs.values()))
+        openmetrics.observe_items(method.__name__, items)
+        profiling.count_events(items)
+        trace = _active
+        if trace is None:
+            return method(self, repo_id, *args, **kwargs)
+        started = trace.clock()
+        try:
+            return method(self, repo_id, *args, **kwargs)
+        finally:
+            trace.write(
+                {
+                    "type": "ingest",
+                    "start": trace.offset(started),
+                    "op": method.__name__,
+                    "phase": _scope.get()[0],
+                    "repo": repo_id,
+                    "seconds": round(trace.clock() - started, 6),
+                }
+            )
+
+    return wrapper
@@ -0,0 +1,288 @@
+"""Chrome trace-event output (``--trace-events out.json``).
+
+Records spans for run phases, per-repo tasks, paginated listings, HTTP
+requests, and site build stages, and writes them as Chrome trace-event JSON
+that opens in Perfetto (ui.perfetto.dev) or ``chrome://tracing``.
+
+Spans are complete (``"ph": "X"``) events. Each asyncio task that opens a span
+gets a lane (a trace "thread") for as long as it has spans open, so lanes show
+concurrency and the gaps between them show idle time. Phases set through
+``ProgressTracker.set_phase`` get a lane of their own. The lane of the current
+task is kept in a context variable; with no active recorder, ``span`` returns a
+shared no-op object and nothing else runs.
+
+Example:
+    with TraceEventRecorder(Path("out.json")):
+        with span("discovery", "phase"):
+            ...
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PHASE_LANE = 0
+MAIN_LANE = 1
+
+_active: "TraceEventRecorder | None" = None
+
+
+class _Lane:
+    """A trace thread held by one asyncio task while it has spans open."""
+
+    __slots__ = ("depth", "task", "tid")
+
+    def __init__(self, tid: int, task: "asyncio.Task[Any] | None") -> None:
+        self.tid = tid
+        self.task = task
+        self.depth = 0
+
+
+_lane: ContextVar[_Lane | None] = ContextVar("trace_events_lane", default=None)
+
+
+class Span:
+    """An open span; ends on ``end()`` or when its ``with`` block exits."""
+
+    __slots__ = ("_lane", "_recorder", "args", "cat", "name", "start")
+
+    def __init__(
+        self,
+        recorder: "TraceEventRecorder",
+        name: str,
+        cat: str,
+        args: dict[str, Any],
+        lane: _Lane | None = None,
+    ) -> None:
+        self._recorder = recorder
+        self.name = name
+        self.cat = cat
+        self.args = args
+        if lane is None:
+            lane = recorder.enter_lane()
+        else:
+            lane.depth += 1
+        self._lane: _Lane | None = lane
+        self.start = recorder.clock()
+
+    def set(self, **args: Any) -> None:
+        """Attach arguments shown with the span."""
+        self.args.update(args)
+
+    def end(self) -> None:
+        """Record the span (only the first call counts)."""
+        lane = self._lane
+        if lane is None:
+            return
+        self._lane = None
+        self._recorder.add(self.name, self.cat, self.start, lane.tid, self.args)
+        self._recorder.leave_lane(lane)
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.end()
+
+    def __bool__(self) -> bool:
+        return True
+
+
+class _NullSpan:
+    """Stand-in returned while tracing is off."""
+
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        """Ignore arguments."""
+
+    def end(self) -> None:
+        """Do nothing."""
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def __bool__(self) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class TraceEventRecorder:
+    """In-memory trace-event buffer written as JSON on close.
+
+    Example:
+        recorder = TraceEventRecorder(Path("out.json"), process_name="collect").start()
+        ...
+        recorder.close()
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        process_name: str = "gh-year-end",
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initialize the recorder (``start`` activates it).
+
+        Args:
+            path: JSON output path.
+            process_name: Process label shown by trace viewers.
+            clock: Monotonic time source in seconds.
+        """
+        self.path = path
+        self.process_name = process_name
+        self.clock = clock
+        self.events: list[dict[str, Any]] = []
+        self._origin = 0.0
+        self._pid = os.getpid()
+        self._free_lanes: list[int] = []
+        self._lane_count = MAIN_LANE + 1
+        self._phase: Span | None = None
+
+    def start(self) -> "TraceEventRecorder":
+        """Make this the active recorder."""
+        global _active
+        self._origin = self.clock()
+        _active = self
+        logger.info("Recording trace events for %s", self.path)
+        return self
+
+    def close(self) -> None:
+        """End the open phase, deactivate, and write the trace."""
+        global _active
+        if _active is not self:
+            return
+        self.end_phase()
+        _active = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w") as f:
+            json.dump(
+                {"traceEvents": self._metadata() + self.events, "displayTimeUnit": "ms"},
+                f,
+                separators=(",", ":"),
+            )
+        logger.info("Wrote %d trace events to %s", len(self.events), self.path)
+
+    def __enter__(self) -> "TraceEventRecorder":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def add(self, name: str, cat: str, start: float, tid: int, args: dict[str, Any]) -> None:
+        """Record a complete span that started at ``start`` and ends now."""
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1e6, 1),
+            "dur": round((self.clock() - start) * 1e6, 1),
+            "pid": self._pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def enter_lane(self) -> _Lane:
+        """Lane for a span opened by the current task."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        lane = _lane.get()
+        if lane is None or lane.task is not task or (task is not None and lane.depth == 0):
+            if task is None:
+                lane = _Lane(MAIN_LANE, None)
+            else:
+                tid = self._free_lanes.pop() if self._free_lanes else self._next_lane()
+                lane = _Lane(tid, task)
+            _lane.set(lane)
+        lane.depth += 1
+        return lane
+
+    def leave_lane(self, lane: _Lane) -> None:
+        """Release a task's lane once its outermost span has ended."""
+        lane.depth -= 1
+        if lane.depth == 0 and lane.task is not None:
+            self._free_lanes.append(lane.tid)
+
+    def set_phase(self, phase: str) -> None:
+        """End the current phase span and start one for ``phase``."""
+        self.end_phase()
+        self._phase = Span(self, phase, "phase", {}, lane=_Lane(PHASE_LANE, None))
+
+    def end_phase(self, phase: str | None = None) -> None:
+        """End the current phase span (only if it is ``phase``, when given)."""
+        if self._phase is not None and phase in (None, self._phase.name):
+            self._phase.end()
+            self._phase = None
+
+    def _next_lane(self) -> int:
+        tid = self._lane_count
+        self._lane_count += 1
+        return tid
+
+    def _metadata(self) -> list[dict[str, Any]]:
+        """Process and lane names for trace viewers."""
+
+        def meta(name: str, tid: int, value: str) -> dict[str, Any]:
+            return {"name": name, "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": value}}
+
+        events = [meta("process_name", PHASE_LANE, self.process_name)]
+        events.append(meta("thread_name", PHASE_LANE, "phases"))
+        events.append(meta("thread_name", MAIN_LANE, "main"))
+        events.extend(
+            meta("thread_name", tid, f"task lane {tid - MAIN_LANE}")
+            for tid in range(MAIN_LANE + 1, self._lane_count)
+        )
+        return events
+
+
+def active_recorder() -> TraceEventRecorder | None:
+    """The running recorder, or None when trace events are off."""
+    return _active
+
+
+def span(name: str, cat: str = "", **args: Any) -> Span | _NullSpan:
+    """Open a span (use as a context manager or call ``end()``).
+
+    Args:
+        name: Span name (e.g. a repo, endpoint, or build stage).
+        cat: Category (``phase``, ``repo``, ``listing``, ``http``, ``build``).
+        **args: Arguments shown with the span.
+
+    Returns:
+        The span, or a no-op stand-in when tracing is off.
+    """
+    recorder = _active
+    if recorder is None:
+        return _NULL_SPAN
+    return Span(recorder, name, cat, args)
+
+
+def set_phase(phase: str) -> None:
+    """Start a phase span on the phase lane (ending the previous one)."""
+    if _active is not None:
+        _active.set_phase(phase)
+
+
+def end_phase(phase: str) -> None:
+    """End the phase span if ``phase`` is the current phase."""
+    if _active is not None:
+        _active.end_phase(phase)
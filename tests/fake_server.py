@@ -0,0 +1,935 @@
+"""Local stand-in for the GitHub API, serving a synthetic organization.
+
+``FakeGitHub`` answers the REST and GraphQL requests collection makes from a
+deterministic ``SyntheticOrg``: repositories, pull requests, issues, reviews,
+and comments in configurable numbers, listed with GitHub's ``page`` /
+``per_page`` pagination and ``Link`` headers. Every response carries rate
+limit headers from per-resource budgets (core, search, graphql) that reset on
+a fixed window; an exhausted budget answers 403 with
+``x-ratelimit-remaining: 0`` until its reset. A ``FaultProfile`` injects
+secondary rate limits (403/429 with ``retry-after``), 5xx errors, and
+log-normal latency, so collection throughput can be benchmarked and
+regression-tested without network access or quota.
+
+Collection runs against it by pointing ``github.api_url`` at ``server.url``
+(any well-formed token is accepted). Endpoints the model does not cover
+(branch protection, trees, vulnerability alerts, ...) answer 404 as they do for
+a token without access; commit metrics come from contributor statistics.
+
+Example:
+    async with FakeGitHub(SyntheticOrg(repos=20, pulls=200)) as server:
+        config.github.api_url = server.url
+        ...
+
+    # or as a subprocess
+    python -m tests.fake_server --repos 50 --port 8900  # from the repository root
+"""
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PER_PAGE = 30
+MAX_PER_PAGE = 100
+SEARCH_WINDOW_SECONDS = 60.0
+BOT_LOGIN = "dependabot[bot]"
+
+# Responses that consume no rate limit budget and never fail
+_FREE_PATHS = ("/rate_limit",)
+
+_STATUS_TEXT = {
+    200: "OK",
+    202: "Accepted",
+    204: "No Content",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+}
+
+
+@dataclass
+class SyntheticOrg:
+    """Shape of the synthetic organization.
+
+    Counts other than ``repos`` and ``users`` are per parent: PRs and issues per
+    repo, reviews and review comments per PR, comments per issue or PR.
+    ``bot_share`` of PRs and issues are opened by ``dependabot[bot]``.
+    """
+
+    name: str = "fake-org"
+    repos: int = 10
+    pulls: int = 20
+    issues: int = 20
+    reviews: int = 2
+    comments: int = 2
+    review_comments: int = 1
+    users: int = 25
+    bot_share: float = 0.1
+    year: int = 2025
+    seed: int = 0
+    stats_pending_polls: int = 0
+
+
+@dataclass
+class FaultProfile:
+    """Rate limits, injected failures, and latency of the fake server.
+
+    ``secondary_limit_rate`` and ``error_rate`` are per-request probabilities;
+    latency is log-normal with median ``latency`` seconds and shape
+    ``latency_sigma`` (0 makes it constant).
+    """
+
+    latency: float = 0.0
+    latency_sigma: float = 0.0
+    error_rate: float = 0.0
+    secondary_limit_rate: float = 0.0
+    retry_after: int = 1
+    rest_limit: int = 5000
+    graphql_limit: int = 5000
+    search_limit: int = 30
+    reset_seconds: float = 3600.0
+    seed: int = 0
+
+
+@dataclass
+class _Budget:
+    """Rate limit budget of one resource, reset on a fixed window."""
+
+    limit: int
+    window: float
+    used: int = 0
+    reset_at: float = 0.0
+
+    def refresh(self, now: float) -> None:
+        if now >= self.reset_at:
+            self.used = 0
+            self.reset_at = now + self.window
+
+    @property
+    def remaining(self) -> int:
+        return max(self.limit - self.used, 0)
+
+    def headers(self, resource: str) -> dict[str, str]:
+        return {
+            "x-ratelimit-limit": str(self.limit),
+            "x-ratelimit-remaining": str(self.remaining),
+            "x-ratelimit-reset": str(math.ceil(self.reset_at)),
+            "x-ratelimit-used": str(self.used),
+            "x-ratelimit-resource": resource,
+        }
+
+
+@dataclass
+class _Repo:
+    """Generated contents of one repository."""
+
+    data: dict[str, Any]
+    pulls: list[dict[str, Any]] = field(default_factory=list)
+    issues: list[dict[str, Any]] = field(default_factory=list)
+    reviews: dict[int, list[dict[str, Any]]] = field(default_factory=dict)
+    comments: dict[int, list[dict[str, Any]]] = field(default_factory=dict)
+    review_comments: dict[int, list[dict[str, Any]]] = field(default_factory=dict)
+    contributors: list[dict[str, Any]] = field(default_factory=list)
+    stats_polls: int = 0
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _sha(*parts: object) -> str:
+    return hashlib.sha1("/".join(map(str, parts)).encode()).hexdigest()
+
+
+class FakeGitHub:
+    """HTTP/1.1 server answering GitHub API requests from a synthetic org.
+
+    Example:
+        server = FakeGitHub(SyntheticOrg(repos=5), FaultProfile(error_rate=0.01))
+        await server.start()
+        ...
+        await server.stop()
+    """
+
+    def __init__(
+        self,
+        org: SyntheticOrg | None = None,
+        faults: FaultProfile | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the server (``start`` begins listening).
+
+        Args:
+            org: Synthetic organization to serve.
+            faults: Rate limits, failures, and latency to simulate.
+            host: Interface to listen on.
+            port: Port to listen on (0 picks a free port).
+            clock: Wall clock in epoch seconds (rate limit resets).
+        """
+        self.org = org or SyntheticOrg()
+        self.faults = faults or FaultProfile()
+        self.host = host
+        self.port = port
+        self.clock = clock
+        self.requests: Counter[str] = Counter()
+        self.statuses: Counter[int] = Counter()
+        self._random = random.Random(self.faults.seed)
+        self._budgets = {
+            "core": _Budget(self.faults.rest_limit, self.faults.reset_seconds),
+            "search": _Budget(self.faults.search_limit, SEARCH_WINDOW_SECONDS),
+            "graphql": _Budget(self.faults.graphql_limit, self.faults.reset_seconds),
+        }
+        self._secondary_limits = 0
+        self._server: asyncio.Server | None = None
+        self._handlers: set[asyncio.Task[Any]] = set()
+        self._repos: dict[str, _Repo] = {}
+        self._logins = [f"user-{i:03d}" for i in range(1, max(self.org.users, 1) + 1)]
+        self._routes: list[tuple[re.Pattern[str], Callable[..., Any]]] = [
+            (re.compile(pattern), handler)
+            for pattern, handler in (
+                (r"/orgs/([^/]+)/repos", self._list_repos),
+                (r"/users/([^/]+)/repos", self._list_repos),
+                (r"/search/repositories", self._search_repos),
+                (r"/orgs/([^/]+)", self._get_org),
+                (r"/users/([^/]+)", self._get_user),
+                (r"/repos/([^/]+)/([^/]+)", self._get_repo),
+                (r"/repos/([^/]+)/([^/]+)/pulls", self._list_pulls),
+                (r"/repos/([^/]+)/([^/]+)/issues", self._list_issues),
+                (r"/repos/([^/]+)/([^/]+)/pulls/(\d+)/reviews", self._list_reviews),
+                (r"/repos/([^/]+)/([^/]+)/pulls/(\d+)/comments", self._list_review_comments),
+                (r"/repos/([^/]+)/([^/]+)/issues/(\d+)/comments", self._list_comments),
+                (r"/repos/([^/]+)/([^/]+)/commits", self._list_commits),
+                (r"/repos/([^/]+)/([^/]+)/stats/contributors", self._contributor_stats),
+            )
+        ]
+
+    # -- lifecycle ---------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server (for ``github.api_url``)."""
+        if self._server is None or not self._server.sockets:
+            raise RuntimeError("FakeGitHub is not running")
+        port = int(self._server.sockets[0].getsockname()[1])
+        return f"http://{self.host}:{port}"
+
+    async def start(self) -> "FakeGitHub":
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(
+            "Fake GitHub API for %s (%d repos) on %s", self.org.name, self.org.repos, self.url
+        )
+        return self
+
+    async def stop(self) -> None:
+        """Stop listening and close open connections."""
+        if self._server is not None:
+            self._server.close()
+            handlers = list(self._handlers)
+            for handler in handlers:
+                handler.cancel()
+            await asyncio.gather(*handlers)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeGitHub":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    def summary(self) -> dict[str, Any]:
+        """Requests served, by endpoint and status, and secondary limits injected."""
+        return {
+            "requests": sum(self.requests.values()),
+            "by_endpoint": dict(self.requests),
+            "by_status": {str(status): count for status, count in sorted(self.statuses.items())},
+            "secondary_limits": self._secondary_limits,
+            "rate_limit": {
+                resource: {"limit": budget.limit, "used": budget.used}
+                for resource, budget in self._budgets.items()
+            },
+        }
+
+    # -- HTTP --------------------------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer HTTP/1.1 requests on one keep-alive connection."""
+        handler = asyncio.current_task()
+        if handler is not None:
+            self._handlers.add(handler)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _version = request_line.decode("latin-1").split(" ", 2)
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", "0"))
+                body = await reader.readexactly(length) if length else b""
+
+                status, response_headers, payload = await self.respond(
+                    method, target, headers, body
+                )
+                head = [f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, 'Unknown')}"]
+                head += [f"{name}: {value}" for name, value in response_headers.items()]
+                head.append(f"Content-Length: {len(payload)}")
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            logger.debug("Fake GitHub connection ended: %s", e)
+        except asyncio.CancelledError:
+            logger.debug("Fake GitHub connection closed by stop()")
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
+
+    async def respond(
+        self, method: str, target: str, headers: dict[str, str], body: bytes = b""
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Answer one request.
+
+        Args:
+            method: HTTP method.
+            target: Request target (path and query string).
+            headers: Request headers with lower-case names.
+            body: Request body.
+
+        Returns:
+            Status code, response headers, and body.
+        """
+        parts = urlsplit(target)
+        path = "/" + parts.path.strip("/")
+        query = dict(parse_qsl(parts.query))
+        self.requests[self._endpoint(path)] += 1
+
+        if self.faults.latency > 0:
+            await asyncio.sleep(
+                self.faults.latency * math.exp(self.faults.latency_sigma * self._random.gauss(0, 1))
+            )
+
+        status, response_headers, data = self._dispatch(method, path, query, headers, body)
+        self.statuses[status] += 1
+        response_headers["Content-Type"] = "application/json; charset=utf-8"
+        response_headers["X-GitHub-Request-Id"] = _sha(self.statuses.total())[:16].upper()
+        payload = b"" if data is None else json.dumps(data).encode()
+        return status, response_headers, payload
+
+    def _endpoint(self, path: str) -> str:
+        """Path with names and numbers templated, for request counts."""
+        if path == "/graphql":
+            return "graphql"
+        path = re.sub(r"^/repos/[^/]+/[^/]+", "/repos/{repo}", path)
+        path = re.sub(r"^/(orgs|users)/[^/]+", r"/\1/{name}", path)
+        return re.sub(r"/\d+(?=/|$)", "/{number}", path)
+
+    def _dispatch(
+        self,
+        method: str,
+        path: str,
+        query: dict[str, str],
+        headers: dict[str, str],
+        body: bytes,
+    ) -> tuple[int, dict[str, str], Any]:
+        if "authorization" not in headers:
+            return 401, {}, {"message": "Requires authentication"}
+
+        now = self.clock()
+        for budget in self._budgets.values():
+            budget.refresh(now)
+        if path in _FREE_PATHS:
+            return 200, self._budgets["core"].headers("core"), self._rate_limit_body()
+
+        resource = "graphql" if path == "/graphql" else "core"
+        if path.startswith("/search/"):
+            resource = "search"
+        budget = self._budgets[resource]
+        limit_headers = budget.headers(resource)
+
+        if budget.remaining == 0:
+            return 403, limit_headers, {"message": f"API rate limit exceeded for {resource}."}
+        roll = self._random.random()
+        if roll < self.faults.secondary_limit_rate:
+            self._secondary_limits += 1
+            status = 429 if self._secondary_limits % 2 else 403
+            limit_headers["retry-after"] = str(self.faults.retry_after)
+            return status, limit_headers, {"message": "You have exceeded a secondary rate limit."}
+        if roll < self.faults.secondary_limit_rate + self.faults.error_rate:
+            return self._random.choice((500, 502, 503)), {}, {"message": "Server Error"}
+
+        budget.used += 1
+        limit_headers = budget.headers(resource)
+        if path == "/graphql":
+            if method != "POST":
+                return 405, limit_headers, {"message": "Method Not Allowed"}
+            status, data = self._graphql(json.loads(body or b"{}"))
+            return status, limit_headers, data
+        if method != "GET":
+            return 404, limit_headers, {"message": "Not Found"}
+
+        for pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match:
+                result = handler(*match.groups(), query)
+                break
+        else:
+            result = None
+        if result is None:
+            return 404, limit_headers, {"message": "Not Found"}
+        if isinstance(result, int):
+            return result, limit_headers, None
+        if isinstance(result, _Page):
+            if result.last > 1:
+                limit_headers["Link"] = result.link(self.url, path, query)
+            return 200, limit_headers, result.body
+        return 200, limit_headers, result
+
+    def _rate_limit_body(self) -> dict[str, Any]:
+        resources = {
+            resource: {
+                "limit": budget.limit,
+                "remaining": budget.remaining,
+                "reset": math.ceil(budget.reset_at),
+                "used": budget.used,
+            }
+            for resource, budget in self._budgets.items()
+        }
+        return {"resources": resources, "rate": resources["core"]}
+
+    # -- synthetic model ---------------------------------------------------
+
+    def _user(self, login: str) -> dict[str, Any]:
+        return {
+            "login": login,
+            "id": int(_sha(login)[:8], 16),
+            "type": "Bot" if login.endswith("[bot]") else "User",
+            "avatar_url": f"https://avatars.example.com/{login}",
+            "html_url": f"https://github.com/{login}",
+        }
+
+    def _repo_names(self) -> list[str]:
+        return [f"repo-{i:03d}" for i in range(1, self.org.repos + 1)]
+
+    def _repo(self, owner: str, name: str) -> _Repo | None:
+        """Generate (once) the contents of ``owner/name``."""
+        if owner != self.org.name or name not in self._repo_names():
+            return None
+        cached = self._repos.get(name)
+        if cached is not None:
+            return cached
+
+        org = self.org
+        rng = random.Random(f"{org.seed}/{name}")
+        full_name = f"{owner}/{name}"
+        base = f"https://api.github.com/repos/{full_name}"
+        year_start = datetime(org.year, 1, 1, tzinfo=UTC)
+        year_seconds = (datetime(org.year + 1, 1, 1, tzinfo=UTC) - year_start).total_seconds()
+        index = self._repo_names().index(name)
+        created = year_start - timedelta(days=30 * (index + 1))
+
+        def when() -> datetime:
+            return year_start + timedelta(seconds=rng.random() * year_seconds)
+
+        def author() -> dict[str, Any]:
+            bot = rng.random() < org.bot_share
+            return self._user(BOT_LOGIN if bot else rng.choice(self._logins))
+
+        def later(start: datetime, mean_hours: float) -> datetime:
+            return start + timedelta(hours=rng.expovariate(1 / mean_hours))
+
+        repo = _Repo(
+            data={
+                "id": 1000 + index,
+                "node_id": f"R_{_sha(full_name)[:12]}",
+                "name": name,
+                "full_name": full_name,
+                "owner": {**self._user(owner), "type": "Organization"},
+                "private": False,
+                "visibility": "public",
+                "fork": False,
+                "archived": False,
+                "description": f"Synthetic repository {index + 1}",
+                "language": rng.choice(("Python", "Go", "TypeScript", "Rust")),
+                "default_branch": "main",
+                "stargazers_count": rng.randint(0, 500),
+                "forks_count": rng.randint(0, 50),
+                "size": rng.randint(100, 50_000),
+                "topics": [],
+                "has_issues": True,
+                "created_at": _timestamp(created),
+                "updated_at": _timestamp(year_start + timedelta(seconds=year_seconds - 1)),
+                "url": base,
+                "html_url": f"https://github.com/{full_name}",
+            }
+        )
+
+        for number in range(1, org.pulls + 1):
+            opened = when()
+            roll = rng.random()
+            merged_at = later(opened, 36) if roll < 0.6 else None
+            closed_at = merged_at or (later(opened, 72) if roll < 0.7 else None)
+            user = author()
+            reviews = []
+            for r in range(org.reviews):
+                reviewer = rng.choice(self._logins)
+                reviews.append(
+                    {
+                        "id": number * 1000 + r,
+                        "user": self._user(reviewer),
+                        "body": "",
+                        "state": rng.choice(("APPROVED", "COMMENTED", "CHANGES_REQUESTED")),
+                        "html_url": f"https://github.com/{full_name}/pull/{number}",
+                        "submitted_at": _timestamp(later(opened, 12)),
+                        "commit_id": _sha(full_name, number),
+                        "author_association": "MEMBER",
+                    }
+                )
+            repo.reviews[number] = reviews
+            repo.review_comments[number] = [
+                self._comment(rng, full_name, number, c, later(opened, 24), "pulls")
+                for c in range(org.review_comments)
+            ]
+            updated = max(closed_at or opened, later(opened, 48))
+            repo.pulls.append(
+                {
+                    "id": 10_000_000 + index * 100_000 + number,
+                    "number": number,
+                    "title": f"Change {number}",
+                    "state": "closed" if closed_at else "open",
+                    "draft": False,
+                    "user": user,
+                    "labels": [],
+                    "created_at": _timestamp(opened),
+                    "updated_at": _timestamp(updated),
+                    "closed_at": _timestamp(closed_at) if closed_at else None,
+                    "merged_at": _timestamp(merged_at) if merged_at else None,
+                    "html_url": f"https://github.com/{full_name}/pull/{number}",
+                    "url": f"{base}/pulls/{number}",
+                    "base": {"ref": "main"},
+                    "head": {"ref": f"change-{number}", "sha": _sha(full_name, number)},
+                    "author_association": "MEMBER",
+                }
+            )
+
+        for number in range(org.pulls + 1, org.pulls + org.issues + 1):
+            opened = when()
+            closed_at = later(opened, 120) if rng.random() < 0.5 else None
+            repo.issues.append(
+                {
+                    "id": 20_000_000 + index * 100_000 + number,
+                    "number": number,
+                    "title": f"Issue {number}",
+                    "state": "closed" if closed_at else "open",
+                    "user": author(),
+                    "labels": [],
+                    "comments": org.comments,
+                    "created_at": _timestamp(opened),
+                    "updated_at": _timestamp(max(opened, closed_at or opened)),
+                    "closed_at": _timestamp(closed_at) if closed_at else None,
+                    "html_url": f"https://github.com/{full_name}/issues/{number}",
+                    "url": f"{base}/issues/{number}",
+                    "author_association": "MEMBER",
+                }
+            )
+
+        for item in repo.pulls + repo.issues:
+            opened = datetime.fromisoformat(item["created_at"])
+            repo.comments[item["number"]] = [
+                self._comment(rng, full_name, item["number"], c, later(opened, 24), "issues")
+                for c in range(org.comments)
+            ]
+
+        committers = rng.sample(self._logins, min(len(self._logins), 8))
+        first_week = int((year_start - timedelta(days=year_start.weekday() + 1)).timestamp())
+        for login in committers:
+            weeks = [
+                {
+                    "w": first_week + week * 7 * 86400,
+                    "a": (commits := rng.choice((0, 0, 1, 2, 5))) * rng.randint(5, 80),
+                    "d": commits * rng.randint(1, 40),
+                    "c": commits,
+                }
+                for week in range(53)
+            ]
+            repo.contributors.append(
+                {
+                    "author": self._user(login),
+                    "total": sum(week["c"] for week in weeks),
+                    "weeks": weeks,
+                }
+            )
+
+        self._repos[name] = repo
+        return repo
+
+    def _comment(
+        self, rng: random.Random, full_name: str, number: int, index: int, at: datetime, kind: str
+    ) -> dict[str, Any]:
+        api = f"https://api.github.com/repos/{full_name}"
+        comment = {
+            "id": int(_sha(full_name, kind, number, index)[:10], 16),
+            "user": self._user(rng.choice(self._logins)),
+            "body": f"Comment {index + 1}",
+            "created_at": _timestamp(at),
+            "updated_at": _timestamp(at),
+            "html_url": f"https://github.com/{full_name}/{kind.rstrip('s')}/{number}",
+            "author_association": "MEMBER",
+        }
+        if kind == "pulls":
+            comment["pull_request_url"] = f"{api}/pulls/{number}"
+            comment["pull_request_review_id"] = number * 1000
+        else:
+            comment["issue_url"] = f"{api}/issues/{number}"
+        return comment
+
+    # -- REST handlers -----------------------------------------------------
+
+    def _listing(self, items: list[dict[str, Any]], query: dict[str, str]) -> "_Page":
+        sort = query.get("sort", "created")
+        if sort in ("created", "updated", "pushed"):
+            key = f"{sort}_at"
+            reverse = query.get("direction", "desc") == "desc"
+            items = sorted(items, key=lambda item: item.get(key) or "", reverse=reverse)
+        elif sort == "full_name":
+            items = sorted(items, key=lambda item: item["full_name"])
+        return _Page.of(items, query)
+
+    def _list_repos(self, owner: str, query: dict[str, str]) -> "_Page | None":
+        if owner != self.org.name:
+            return None
+        repos = [self._repo(owner, name) for name in self._repo_names()]
+        return self._listing([repo.data for repo in repos if repo], query)
+
+    def _search_repos(self, query: dict[str, str]) -> "_Page":
+        repos = [self._repo(self.org.name, name) for name in self._repo_names()]
+        page = _Page.of([repo.data for repo in repos if repo], query)
+        page.body = {"total_count": self.org.repos, "incomplete_results": False, "items": page.body}
+        return page
+
+    def _get_org(self, login: str, _query: dict[str, str]) -> dict[str, Any] | None:
+        if login != self.org.name:
+            return None
+        return {**self._user(login), "type": "Organization", "public_repos": self.org.repos}
+
+    def _get_user(self, login: str, _query: dict[str, str]) -> dict[str, Any] | None:
+        if login not in self._logins and login != BOT_LOGIN:
+            return None
+        return {**self._user(login), "name": login.replace("-", " ").title()}
+
+    def _get_repo(self, owner: str, name: str, _query: dict[str, str]) -> dict[str, Any] | None:
+        repo = self._repo(owner, name)
+        if repo is None:
+            return None
+        disabled = {"status": "disabled"}
+        return {
+            **repo.data,
+            "security_and_analysis": {
+                "secret_scanning": disabled,
+                "secret_scanning_push_protection": disabled,
+                "dependabot_security_updates": disabled,
+            },
+        }
+
+    def _list_pulls(self, owner: str, name: str, query: dict[str, str]) -> "_Page | None":
+        repo = self._repo(owner, name)
+        if repo is None:
+            return None
+        return self._listing(_by_state(repo.pulls, query.get("state", "open")), query)
+
+    def _list_issues(self, owner: str, name: str, query: dict[str, str]) -> "_Page | None":
+        repo = self._repo(owner, name)
+        if repo is None:
+            return None
+        # Like GitHub, the issues listing includes pull requests
+        items = repo.issues + [
+            {**pull, "pull_request": {"url": pull["url"]}, "comments": self.org.comments}
+            for pull in repo.pulls
+        ]
+        items = _by_state(items, query.get("state", "open"))
+        if "since" in query:
+            items = [item for item in items if item["updated_at"] >= query["since"]]
+        return self._listing(items, query)
+
+    def _children(
+        self, owner: str, name: str, number: str, query: dict[str, str], attribute: str
+    ) -> "_Page | None":
+        repo = self._repo(owner, name)
+        items = getattr(repo, attribute).get(int(number)) if repo else None
+        return None if items is None else _Page.of(items, query)
+
+    def _list_reviews(
+        self, owner: str, name: str, number: str, query: dict[str, str]
+    ) -> "_Page | None":
+        return self._children(owner, name, number, query, "reviews")
+
+    def _list_review_comments(
+        self, owner: str, name: str, number: str, query: dict[str, str]
+    ) -> "_Page | None":
+        return self._children(owner, name, number, query, "review_comments")
+
+    def _list_comments(
+        self, owner: str, name: str, number: str, query: dict[str, str]
+    ) -> "_Page | None":
+        return self._children(owner, name, number, query, "comments")
+
+    def _list_commits(self, owner: str, name: str, query: dict[str, str]) -> "_Page | None":
+        return None if self._repo(owner, name) is None else _Page.of([], query)
+
+    def _contributor_stats(
+        self, owner: str, name: str, _query: dict[str, str]
+    ) -> list[dict[str, Any]] | int | None:
+        repo = self._repo(owner, name)
+        if repo is None:
+            return None
+        if repo.stats_polls < self.org.stats_pending_polls:
+            repo.stats_polls += 1
+            return 202
+        return repo.contributors
+
+    # -- GraphQL -----------------------------------------------------------
+
+    def _graphql(self, payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        """Answer the batched queries collection sends, recognized by their variables."""
+        query = payload.get("query", "")
+        variables = payload.get("variables") or {}
+        data: dict[str, Any] = {}
+        errors: list[dict[str, Any]] = []
+
+        if "l0" in variables:
+            for i in range(len(variables)):
+                login = variables.get(f"l{i}")
+                if login in self._logins:
+                    user = self._user(login)
+                    data[f"u{i}"] = {
+                        "login": login,
+                        "name": login.replace("-", " ").title(),
+                        "avatarUrl": user["avatar_url"],
+                    }
+                elif login is not None:
+                    data[f"u{i}"] = None
+                    errors.append(_not_found(f"u{i}", login))
+        elif "qp0" in variables:
+            i = 0
+            while f"o{i}" in variables:
+                repo = self._repo(variables[f"o{i}"], variables[f"n{i}"])
+                if repo is None:
+                    data[f"r{i}"] = None
+                    errors.append(_not_found(f"r{i}", variables[f"n{i}"]))
+                else:
+                    commits = sum(c["total"] for c in repo.contributors)
+                    data[f"r{i}"] = {
+                        "pullRequests": {"totalCount": len(repo.pulls)},
+                        "issues": {"totalCount": len(repo.issues)},
+                        "defaultBranchRef": {"target": {"history": {"totalCount": commits}}},
+                    }
+                    data[f"p{i}"] = {"issueCount": len(repo.pulls)}
+                    data[f"i{i}"] = {"issueCount": len(repo.issues)}
+                i += 1
+        elif "owner" in variables and ("e0" in variables or "n0" in variables):
+            repo = self._repo(variables["owner"], variables.get("name", ""))
+            if repo is None:
+                data["repository"] = None
+                errors.append(_not_found("repository", variables.get("name")))
+            elif "e0" in variables:
+                data["repository"] = self._tree_entries(repo, variables)
+            else:
+                data["repository"] = self._pull_reviews(repo, variables)
+        elif "login" in variables and "organization(" in query:
+            data["organization"] = self._get_org(variables["login"], {})
+        else:
+            return 200, {"errors": [{"message": "Query not supported by the fake server"}]}
+
+        if "rateLimit" in query:
+            budget = self._budgets["graphql"]
+            data["rateLimit"] = {
+                "cost": 1,
+                "limit": budget.limit,
+                "remaining": budget.remaining,
+                "resetAt": _timestamp(datetime.fromtimestamp(budget.reset_at, UTC)),
+            }
+        response: dict[str, Any] = {"data": data}
+        if errors:
+            response["errors"] = errors
+        return 200, response
+
+    def _tree_entries(self, repo: _Repo, variables: dict[str, Any]) -> dict[str, Any]:
+        """Root directory holds a README and LICENSE; other directories do not exist."""
+        trees: dict[str, Any] = {}
+        i = 0
+        while f"e{i}" in variables:
+            expression = variables[f"e{i}"]
+            trees[f"t{i}"] = None
+            if expression.endswith(":"):
+                trees[f"t{i}"] = {
+                    "oid": _sha(repo.data["full_name"], expression),
+                    "entries": [
+                        {"name": entry, "type": "blob", "oid": _sha(entry), "size": 1024}
+                        for entry in ("README.md", "LICENSE")
+                    ],
+                }
+            i += 1
+        return trees
+
+    def _pull_reviews(self, repo: _Repo, variables: dict[str, Any]) -> dict[str, Any]:
+        pulls: dict[str, Any] = {}
+        i = 0
+        while f"n{i}" in variables:
+            reviews = repo.reviews.get(int(variables[f"n{i}"]))
+            pulls[f"p{i}"] = None
+            if reviews is not None:
+                pulls[f"p{i}"] = {
+                    "reviews": {
+                        "pageInfo": {"hasNextPage": False},
+                        "nodes": [_review_node(review) for review in reviews],
+                    }
+                }
+            i += 1
+        return pulls
+
+
+@dataclass
+class _Page:
+    """One page of a listing and the page numbers for its Link header."""
+
+    body: Any
+    page: int
+    per_page: int
+    last: int
+
+    @classmethod
+    def of(cls, items: list[dict[str, Any]], query: dict[str, str]) -> "_Page":
+        per_page = min(max(int(query.get("per_page", DEFAULT_PER_PAGE)), 1), MAX_PER_PAGE)
+        page = max(int(query.get("page", 1)), 1)
+        last = max(math.ceil(len(items) / per_page), 1)
+        start = (page - 1) * per_page
+        return cls(items[start : start + per_page], page, per_page, last)
+
+    def link(self, base_url: str, path: str, query: dict[str, str]) -> str:
+        """``Link`` header value in GitHub's format."""
+
+        def link(page: int, rel: str) -> str:
+            params = {**query, "per_page": str(self.per_page), "page": str(page)}
+            return f'<{base_url}{path}?{urlencode(params)}>; rel="{rel}"'
+
+        links = []
+        if self.page > 1:
+            links.append(link(self.page - 1, "prev"))
+        if self.page < self.last:
+            links += [link(self.page + 1, "next"), link(self.last, "last")]
+        if self.page > 1:
+            links.append(link(1, "first"))
+        return ", ".join(links)
+
+
+def _by_state(items: list[dict[str, Any]], state: str) -> list[dict[str, Any]]:
+    return items if state == "all" else [item for item in items if item["state"] == state]
+
+
+def _not_found(alias: str, name: object) -> dict[str, Any]:
+    return {
+        "type": "NOT_FOUND",
+        "path": [alias],
+        "message": f"Could not resolve to a node with the name of '{name}'.",
+    }
+
+
+def _review_node(review: dict[str, Any]) -> dict[str, Any]:
+    """REST review in the GraphQL shape ``review_to_rest`` reads."""
+    user = review["user"]
+    is_bot = user["type"] == "Bot"
+    return {
+        "databaseId": review["id"],
+        "author": {
+            # GraphQL's Bot.login has no "[bot]" suffix
+            "__typename": "Bot" if is_bot else "User",
+            "login": user["login"].removesuffix("[bot]") if is_bot else user["login"],
+            "avatarUrl": user["avatar_url"],
+        },
+        "authorAssociation": review["author_association"],
+        "state": review["state"],
+        "body": review["body"],
+        "submittedAt": review["submitted_at"],
+        "url": review["html_url"],
+        "commit": {"oid": review["commit_id"]},
+    }
+
+
+@contextlib.contextmanager
+def serve_in_thread(server: FakeGitHub) -> Iterator[str]:
+    """Run a server on its own event loop in a background thread.
+
+    Args:
+        server: Server to run (not yet started).
+
+    Yields:
+        The server's base URL.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="fake-github", daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+        yield server.url
+    finally:
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Serve a synthetic org until interrupted (``python -m tests.fake_server``)."""
+    parser = argparse.ArgumentParser(description="Local fake GitHub API for offline benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    for name, default in vars(SyntheticOrg()).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(default), default=default)
+    for name, default in vars(FaultProfile()).items():
+        if name != "seed":
+            parser.add_argument(f"--{name.replace('_', '-')}", type=type(default), default=default)
+    args = vars(parser.parse_args(argv))
+    org = SyntheticOrg(**{name: args[name] for name in vars(SyntheticOrg())})
+    faults = FaultProfile(
+        **{name: args[name] for name in vars(FaultProfile()) if name != "seed"}, seed=org.seed
+    )
+
+    async def serve() -> None:
+        async with FakeGitHub(org, faults, host=args["host"], port=args["port"]) as server:
+            print(f"Serving {org.name} on {server.url} (Ctrl+C to stop)", flush=True)
+            await asyncio.Event().wait()
+
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 """Tests for MetricsAggregator."""
 
-from datetime import datetime
+import json
 
 from gh_year_end.collect.aggregator import BOT_PATTERNS, MetricsAggregator
+from gh_year_end.collect.periods import PeriodCalendar
 
 
 class TestBotDetection:
@@ -112,23 +113,17 @@ class TestTimeBucketing:
 
     def test_get_week_key(self):
         """Test week key generation."""
-        agg = MetricsAggregator(year=2024, target_name="test", target_mode="user")
-        dt = datetime(2024, 1, 15)  # Week 3 of 2024
-        week_key = agg._get_week_key(dt)
+        week_key, _ = PeriodCalendar(2024).buckets("2024-01-15T00:00:00Z")  # Week 3 of 2024
         assert week_key == "2024-W03"
 
     def test_get_month_key(self):
         """Test month key generation."""
-        agg = MetricsAggregator(year=2024, target_name="test", target_mode="user")
-        dt = datetime(2024, 1, 15)
-        month_key = agg._get_month_key(dt)
+        _, month_key = PeriodCalendar(2024).buckets("2024-01-15T00:00:00Z")
         assert month_key == "2024-01"
 
     def test_get_week_key_year_boundary(self):
         """Test week key at year boundary."""
-        agg = MetricsAggregator(year=2024, target_name="test", target_mode="user")
-        dt = datetime(2024, 1, 1)  # First day of 2024
-        week_key = agg._get_week_key(dt)
+        week_key, _ = PeriodCalendar(2024).buckets("2024-01-01T00:00:00Z")  # First day of 2024
         # ISO week date: 2024-01-01 is in week 1 of 2024
         assert week_key == "2024-W01"
 
@@ -1196,3 +1191,101 @@ class TestIntegration:
         assert health["issue_count"] == 3
         assert health["review_count"] == 3
         assert health["comment_count"] == 3
+
+
+class TestBatchIngestion:
+    """Test that page-level batch methods match per-item ingestion."""
+
+    @staticmethod
+    def _page() -> dict:
+        users = [
+            {"login": "alice", "avatar_url": "a.png", "type": "User"},
+            {"login": "bob", "avatar_url": "b.png", "type": "User"},
+            {"login": "renovate[bot]", "avatar_url": "r.png", "type": "Bot"},
+            {"login": "carol", "avatar_url": "c.png", "type": "User"},
+        ]
+        prs = [
+            {
+                "number": n,
+                "title": f"PR {n}",
+                "state": "closed",
+                "user": users[n % len(users)],
+                "created_at": f"2024-0{1 + n % 3}-1{n % 10}T10:00:00Z",
+                "merged_at": f"2024-0{1 + n % 3}-2{n % 10}T12:00:00Z" if n % 2 else None,
+            }
+            for n in range(12)
+        ]
+        reviews = {
+            n: [
+                {
+                    "user": users[(n + i) % len(users)],
+                    "submitted_at": f"2024-0{1 + n % 3}-2{i}T09:00:00Z",
+                    "state": "APPROVED",
+                }
+                for i in range(n % 3)
+            ]
+            for n in range(12)
+        }
+        issues = [
+            {
+                "user": users[(n + 1) % len(users)],
+                "created_at": f"2024-05-0{1 + n}T10:00:00Z",
+                "state": "closed" if n % 2 else "open",
+                "closed_at": f"2024-05-1{n}T10:00:00Z" if n % 2 else None,
+            }
+            for n in range(6)
+        ]
+        comments = [
+            {"user": users[n % len(users)], "created_at": f"2024-12-3{n % 2}T23:00:00Z"}
+            for n in range(9)
+        ]
+        return {"prs": prs, "reviews": reviews, "issues": issues, "comments": comments}
+
+    def test_batches_match_single_items(self):
+        """Test batch ingestion exports exactly what per-item ingestion does."""
+        page = self._page()
+        single = MetricsAggregator(year=2024, target_name="test", target_mode="user")
+        batch = MetricsAggregator(year=2024, target_name="test", target_mode="user")
+        for agg in (single, batch):
+            agg.add_repo({"full_name": "owner/repo", "name": "repo"})
+
+        for pr in page["prs"]:
+            single.add_pr("owner/repo", pr)
+            for review in page["reviews"][pr["number"]]:
+                single.add_review("owner/repo", pr["number"], review)
+        for issue in page["issues"]:
+            single.add_issue("owner/repo", issue)
+        for comment in page["comments"]:
+            single.add_comment("owner/repo", comment, comment_type="review")
+
+        # Flush pending PRs before each PR's reviews, as the collector does
+        pending: list = []
+        for pr in page["prs"]:
+            pending.append(pr)
+            if page["reviews"][pr["number"]]:
+                batch.add_prs("owner/repo", pending)
+                pending.clear()
+                batch.add_reviews("owner/repo", pr["number"], page["reviews"][pr["number"]])
+        batch.add_prs("owner/repo", pending)
+        batch.add_issues("owner/repo", page["issues"])
+        batch.add_comments("owner/repo", page["comments"], comment_type="review")
+
+        assert json.dumps(batch.export()) == json.dumps(single.export())
+
+    def test_batch_skips_bots_and_out_of_year_buckets(self):
+        """Test bots are cached but not counted, and other years are not bucketed."""
+        agg = MetricsAggregator(year=2024, target_name="test", target_mode="user")
+        agg.add_repo({"full_name": "owner/repo", "name": "repo"})
+        agg.add_comments(
+            "owner/repo",
+            [
+                {"user": {"login": "dependabot[bot]", "type": "Bot"}, "created_at": "2024-01-01"},
+                {"user": {"login": "alice", "type": "User"}, "created_at": "2023-12-31T23:00:00Z"},
+                {"user": None, "created_at": "2024-01-02T00:00:00Z"},
+            ],
+        )
+
+        assert agg.users["dependabot[bot]"]["is_bot"] is True
+        assert dict(agg.leaderboards["comments_total"]) == {"alice": 1}
+        assert dict(agg._weekly_counters["comments_total"]) == {}
+        assert agg.repo_health["owner/repo"]["comment_count"] == 1
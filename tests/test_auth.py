@@ -55,6 +55,16 @@ class TestGitHubAuthValidTokens:
         auth = GitHubAuth(token=token)
         assert auth.token == token
 
+    def test_fingerprint_identifies_token_without_revealing_it(self) -> None:
+        """Test that the fingerprint is stable per token and distinct across tokens."""
+        token = "ghp_" + "a" * 36
+        fingerprint = GitHubAuth(token=token).fingerprint
+
+        assert fingerprint == GitHubAuth(token=token).fingerprint
+        assert fingerprint != GitHubAuth(token="ghp_" + "b" * 36).fingerprint
+        assert len(fingerprint) == 16
+        assert fingerprint not in token
+
 
 class TestGitHubAuthInvalidTokens:
     """Tests for GitHubAuth initialization with invalid tokens."""
@@ -0,0 +1,68 @@
+"""Tests for atomic JSON files and keyed on-disk caches."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from gh_year_end.storage.cache import (
+    KeyedCache,
+    atomic_write_json,
+    atomic_write_text,
+    read_json,
+)
+
+
+class ExampleCache(KeyedCache):
+    section = "items"
+    description = "example cache"
+
+
+class TestAtomicWrite:
+    """Tests for atomic file replacement."""
+
+    def test_replaces_file_and_creates_parents(self, tmp_path: Path) -> None:
+        """Test the target is replaced and no temporary file is left behind."""
+        path = tmp_path / "nested" / "data.json"
+        atomic_write_json(path, {"a": 1})
+        atomic_write_json(path, {"a": 2}, indent=2)
+
+        assert json.loads(path.read_text()) == {"a": 2}
+        assert [p.name for p in path.parent.iterdir()] == ["data.json"]
+
+    def test_failed_write_keeps_original(self, tmp_path: Path) -> None:
+        """Test an unserializable payload leaves the old file and no temp file."""
+        path = tmp_path / "data.json"
+        atomic_write_text(path, "old")
+
+        with pytest.raises(TypeError):
+            atomic_write_json(path, {"bad": object()})
+
+        assert path.read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    def test_read_json_ignores_missing_and_corrupt_files(self, tmp_path: Path) -> None:
+        """Test missing and unreadable files read as None."""
+        path = tmp_path / "data.json"
+        assert read_json(path, "test file") is None
+
+        path.write_text("{not json")
+        assert read_json(path, "test file") is None
+
+
+class TestKeyedCache:
+    """Tests for the shared cache base class."""
+
+    def test_save_only_when_touched(self, tmp_path: Path) -> None:
+        """Test unchanged caches are not written and changed ones round-trip."""
+        path = tmp_path / "items.json"
+        cache = ExampleCache(path, clock=lambda: 5.0).load()
+        cache.save()
+        assert not path.exists()
+
+        cache._entries["x"] = {"fetched_at": 5.0}
+        cache._touch()
+        cache.save()
+
+        assert json.loads(path.read_text()) == {"version": 1, "items": {"x": {"fetched_at": 5.0}}}
+        assert len(ExampleCache(path).load()) == 1
@@ -0,0 +1,56 @@
+"""Tests for the in-process PR/issue catalog."""
+
+from gh_year_end.collect.catalog import ISSUES, PULLS, CollectionCatalog
+
+REPOS = [{"full_name": "org/a"}, {"full_name": "org/b"}, {"full_name": "org/c"}]
+
+
+class TestCollectionCatalog:
+    """Tests for CollectionCatalog."""
+
+    def test_numbers_visible_after_complete(self) -> None:
+        """Test that staged numbers are published only on completion."""
+        catalog = CollectionCatalog()
+        catalog.begin(PULLS, "org/a")
+        catalog.publish(PULLS, "org/a", [{"number": 2, "updated_at": "2025-01-02T00:00:00Z"}])
+
+        assert not catalog.has(PULLS, "org/a")
+
+        catalog.publish(PULLS, "org/a", [{"number": 1, "review_comments": 3}])
+        catalog.complete(PULLS, "org/a")
+
+        assert catalog.has(PULLS, "org/a")
+        assert catalog.numbers(PULLS, "org/a") == {1, 2}
+
+    def test_numbers_by_repo_reports_missing(self) -> None:
+        """Test sorted numbers, empty repos omitted, unpublished repos missing."""
+        catalog = CollectionCatalog()
+        catalog.publish(ISSUES, "org/a", [{"number": 9}, {"number": 3}, {"number": 9}])
+        catalog.complete(ISSUES, "org/a")
+        catalog.begin(ISSUES, "org/b")
+        catalog.complete(ISSUES, "org/b")
+
+        numbers, missing = catalog.numbers_by_repo(ISSUES, REPOS)
+
+        assert numbers == {"org/a": [3, 9]}
+        assert missing == [{"full_name": "org/c"}]
+
+    def test_begin_discards_partial_attempt(self) -> None:
+        """Test that a retried repo does not keep keys from a failed attempt."""
+        catalog = CollectionCatalog()
+        catalog.begin(PULLS, "org/a")
+        catalog.publish(PULLS, "org/a", [{"number": 1}])
+        catalog.begin(PULLS, "org/a")
+        catalog.publish(PULLS, "org/a", [{"number": 2}, {"title": "no number"}])
+        catalog.complete(PULLS, "org/a")
+
+        assert catalog.numbers(PULLS, "org/a") == {2}
+
+    def test_kinds_are_separate(self) -> None:
+        """Test that PR and issue keys do not mix."""
+        catalog = CollectionCatalog()
+        catalog.publish(PULLS, "org/a", [{"number": 1}])
+        catalog.complete(PULLS, "org/a")
+
+        assert not catalog.has(ISSUES, "org/a")
+        assert catalog.numbers(ISSUES, "org/a") == set()
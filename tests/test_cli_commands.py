@@ -1,5 +1,6 @@
 """Tests for new CLI commands (collect, build, all)."""
 
+import json
 from datetime import UTC
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -171,6 +172,161 @@ class TestCollectCommand:
         assert "Collection complete!" in result.output
         assert "Files written: 6" in result.output
 
+    def test_plan_prints_estimate_without_collecting(
+        self, runner: CliRunner, config_file: Path
+    ) -> None:
+        """Test that --plan prints the pre-flight plan and skips collection."""
+        from gh_year_end.collect.preflight import Budget, CollectionPlan
+        from gh_year_end.github.ratelimit import APIType
+
+        plan = CollectionPlan(
+            repos=[],
+            rest_by_phase={"pulls": 7000},
+            graphql_by_phase={},
+            budgets={api: Budget(5000, 5000, 1800) for api in APIType},
+        )
+
+        async def mock_plan(*args, **kwargs):
+            return plan
+
+        with (
+            patch("gh_year_end.collect.orchestrator.plan_run", side_effect=mock_plan),
+            patch("gh_year_end.collect.orchestrator.collect_and_aggregate") as mock_collect,
+        ):
+            result = runner.invoke(main, ["collect", "--config", str(config_file), "--plan"])
+
+        assert result.exit_code == 0
+        assert "Estimated cost by phase" in result.output
+        assert "7,000" in result.output
+        mock_collect.assert_not_called()
+
+    def test_deadline_and_budget_set_limits(self, runner: CliRunner, config_file: Path) -> None:
+        """Test that --deadline and --budget bound the collection."""
+        seen = {}
+
+        async def mock_collect(config, *args, **kwargs):
+            seen["limits"] = config.collection.limits
+            return {}
+
+        with patch(
+            "gh_year_end.collect.orchestrator.collect_and_aggregate", side_effect=mock_collect
+        ):
+            runner.invoke(
+                main,
+                ["collect", "--config", str(config_file), "--deadline", "1h30m", "--budget", "500"],
+            )
+
+        assert seen["limits"].deadline_seconds == 5400
+        assert seen["limits"].max_requests == 500
+
+    def test_trace_requests_enables_request_trace(
+        self, runner: CliRunner, config_file: Path
+    ) -> None:
+        """Test that --trace-requests turns on the request trace."""
+        seen = {}
+
+        async def mock_collect(config, *args, **kwargs):
+            seen["telemetry"] = config.telemetry
+            return {}
+
+        with patch(
+            "gh_year_end.collect.orchestrator.collect_and_aggregate", side_effect=mock_collect
+        ):
+            result = runner.invoke(
+                main, ["collect", "--config", str(config_file), "--trace-requests"]
+            )
+
+        assert seen["telemetry"].request_trace is True
+        assert "request_trace.jsonl" in result.output
+
+    def test_metrics_options_enable_openmetrics(
+        self, runner: CliRunner, config_file: Path, tmp_path: Path
+    ) -> None:
+        """Test that --metrics-port and --metrics-file configure live metrics."""
+        seen = {}
+
+        async def mock_collect(config, *args, **kwargs):
+            seen["openmetrics"] = config.telemetry.openmetrics
+            return {}
+
+        with patch(
+            "gh_year_end.collect.orchestrator.collect_and_aggregate", side_effect=mock_collect
+        ):
+            runner.invoke(
+                main,
+                [
+                    "collect",
+                    "--config",
+                    str(config_file),
+                    "--metrics-port",
+                    "9464",
+                    "--metrics-file",
+                    str(tmp_path / "run.prom"),
+                ],
+            )
+
+        assert seen["openmetrics"].port == 9464
+        assert seen["openmetrics"].textfile == tmp_path / "run.prom"
+
+    def test_trace_events_option(
+        self, runner: CliRunner, config_file: Path, tmp_path: Path
+    ) -> None:
+        """Test that --trace-events sets the trace-event output file."""
+        seen = {}
+
+        async def mock_collect(config, *args, **kwargs):
+            seen["telemetry"] = config.telemetry
+            return {}
+
+        with patch(
+            "gh_year_end.collect.orchestrator.collect_and_aggregate", side_effect=mock_collect
+        ):
+            result = runner.invoke(
+                main,
+                [
+                    "collect",
+                    "--config",
+                    str(config_file),
+                    "--trace-events",
+                    str(tmp_path / "t.json"),
+                ],
+            )
+
+        assert seen["telemetry"].trace_events == tmp_path / "t.json"
+        assert "ui.perfetto.dev" in result.output
+
+    def test_profile_prints_summary(self, runner: CliRunner, config_file: Path) -> None:
+        """Test that --profile enables profiling and prints the phase table."""
+        from gh_year_end.config import load_config
+        from gh_year_end.storage.paths import PathManager
+
+        summary_dir = PathManager(load_config(config_file)).profile_root / "collect"
+
+        async def mock_collect(config, *args, **kwargs):
+            assert config.telemetry.profile is True
+            summary_dir.mkdir(parents=True)
+            (summary_dir / "summary.json").write_text(
+                json.dumps({"output_dir": str(summary_dir), "phases": []})
+            )
+            return {}
+
+        with patch(
+            "gh_year_end.collect.orchestrator.collect_and_aggregate", side_effect=mock_collect
+        ):
+            result = runner.invoke(main, ["collect", "--config", str(config_file), "--profile"])
+
+        assert result.exit_code == 0
+        assert "Profiles:" in result.output
+
+    def test_invalid_deadline_rejected(self, runner: CliRunner, config_file: Path) -> None:
+        """Test that a malformed --deadline is a usage error."""
+        result = runner.invoke(
+            main, ["collect", "--config", str(config_file), "--deadline", "soon"]
+        )
+
+        assert result.exit_code == 2
+        assert "Invalid duration" in result.output
+
     def test_force_flag_passed_through(self, runner: CliRunner, config_file: Path) -> None:
         """Test that --force flag is passed to collect_and_aggregate."""
         force_used = {}
@@ -454,6 +610,138 @@ class TestBuildCommand:
         assert config_received["until"] == datetime(2024, 1, 1, 0, 0, 0, tzinfo=UTC)
 
 
+class TestRebuildMetricsCommand:
+    """Tests for the rebuild-metrics command."""
+
+    def test_help_output(self, runner: CliRunner) -> None:
+        """Test rebuild-metrics command help output."""
+        result = runner.invoke(main, ["rebuild-metrics", "--help"])
+        assert result.exit_code == 0
+        assert "Regenerate metrics JSON from stored raw data" in result.output
+        assert "--engine" in result.output
+        assert "--workers" in result.output
+
+    def test_missing_raw_data(self, runner: CliRunner, config_file: Path) -> None:
+        """Test error when no raw data has been captured."""
+        result = runner.invoke(main, ["rebuild-metrics", "--config", str(config_file)])
+        assert result.exit_code == 1
+        assert "No raw data found" in result.output
+        assert "write_raw" in result.output
+
+    @pytest.mark.parametrize("engine", ["python", "duckdb"])
+    def test_successful_rebuild(
+        self,
+        runner: CliRunner,
+        config_file: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        engine: str,
+    ) -> None:
+        """Test metrics are rebuilt from raw JSONL without API access."""
+        from gh_year_end.config import load_config
+        from gh_year_end.storage.paths import PathManager
+        from gh_year_end.storage.writer import JSONLWriter
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        paths = PathManager(load_config(config_file))
+        paths.ensure_directories()
+        with JSONLWriter(paths.repos_raw_path) as writer:
+            writer.write(
+                source="github_rest",
+                endpoint="/orgs/test-org/repos",
+                data={"full_name": "test-org/repo", "name": "repo"},
+            )
+        with JSONLWriter(paths.pulls_raw_path("test-org/repo")) as writer:
+            writer.write(
+                source="github_rest",
+                endpoint="/repos/test-org/repo/pulls/1",
+                data={
+                    "number": 1,
+                    "user": {"login": "alice", "type": "User"},
+                    "created_at": "2024-06-01T00:00:00Z",
+                    "merged_at": None,
+                },
+            )
+
+        result = runner.invoke(
+            main,
+            ["rebuild-metrics", "--config", str(config_file), "--engine", engine, "-w", "1"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Metrics rebuilt!" in result.output
+        summary = json.loads((tmp_path / "site" / "2024" / "data" / "summary.json").read_text())
+        assert summary["total_prs"] == 1
+        assert summary["total_contributors"] == 1
+
+
+class TestAnalyzeTraceCommand:
+    """Tests for analyze-trace command."""
+
+    @pytest.fixture
+    def trace_file(self, tmp_path: Path) -> Path:
+        """Trace with two requests and one ingest."""
+        records = [
+            {
+                "type": "request",
+                "start": 0.0,
+                "endpoint": "GET /repos/{owner}/{repo}/pulls",
+                "phase": "pulls",
+                "repo": "o/r",
+                "queue": 0.5,
+                "network": 1.0,
+                "bytes": 2000,
+                "decode": 0.01,
+            },
+            {
+                "type": "request",
+                "start": 2.0,
+                "endpoint": "GET /repos/{owner}/{repo}/issues",
+                "phase": "issues",
+                "repo": "o/r",
+                "network": 0.2,
+                "bytes": 500,
+                "decode": 0.01,
+            },
+            {"type": "ingest", "start": 1.6, "op": "add_prs", "phase": "pulls", "seconds": 0.1},
+        ]
+        path = tmp_path / "request_trace.jsonl"
+        path.write_text("".join(json.dumps(record) + "\n" for record in records))
+        return path
+
+    def test_tables(self, runner: CliRunner, trace_file: Path) -> None:
+        """Test the critical path and grouping tables."""
+        result = runner.invoke(main, ["analyze-trace", str(trace_file)])
+
+        assert result.exit_code == 0
+        assert "2 requests, 1 aggregator ingests" in result.output
+        assert "mostly network bound" in result.output
+        assert "Critical path" in result.output
+        assert "By endpoint" in result.output
+
+    def test_json(self, runner: CliRunner, trace_file: Path) -> None:
+        """Test JSON output limited to one grouping."""
+        result = runner.invoke(
+            main, ["analyze-trace", str(trace_file), "--by", "phase", "--top", "1", "--json"]
+        )
+
+        analysis = json.loads(result.output)
+        assert list(analysis["groups"]) == ["phase"]
+        assert [group["key"] for group in analysis["groups"]["phase"]] == ["pulls"]
+        assert analysis["critical_path"]["run"]["bound"] == "network"
+
+    def test_invalid_trace(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that a corrupt trace aborts with the offending line."""
+        path = tmp_path / "bad.jsonl"
+        path.write_text("{not json\n")
+
+        result = runner.invoke(main, ["analyze-trace", str(path)])
+
+        assert result.exit_code != 0
+        assert "bad.jsonl:1" in result.output
+
+
 class TestAllCommand:
     """Tests for all command (collect + build)."""
 
@@ -951,6 +1239,7 @@ class TestRemovedCommands:
         assert "build" in command_names
         assert "all" in command_names
         assert "batch-years" in command_names
+        assert "rebuild-metrics" in command_names
 
         # Removed commands should NOT exist
         assert "normalize" not in command_names
@@ -236,3 +236,540 @@ async def test_collect_repo_hygiene_inline(tmp_path: Path) -> None:
 
     # Verify score is calculated (should be 100 with all features enabled)
     assert hygiene_data["score"] == 100
+
+
+@pytest.mark.asyncio
+async def test_collect_and_aggregate_write_raw_round_trip(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that raw capture replays to the same metrics as live collection."""
+    from collections.abc import AsyncIterator
+    from typing import Any
+    from unittest.mock import AsyncMock, patch
+
+    from gh_year_end.metrics import compute_metrics
+    from gh_year_end.storage.paths import PathManager
+    from gh_year_end.storage.writer import JSONLWriter
+
+    config = Config.model_validate(
+        {
+            "github": {
+                "target": {"mode": "org", "name": "test-org"},
+                "windows": {"year": 2024},
+            },
+            "collection": {"enable": {"commits": False, "hygiene": False}},
+            "storage": {"root": str(tmp_path / "data"), "write_raw": True},
+        }
+    )
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_test_token_dummy")
+
+    repo = {"full_name": "test-org/repo", "name": "repo", "default_branch": "main"}
+    alice = {"login": "alice", "type": "User"}
+    bob = {"login": "bob", "type": "User"}
+    pulls = [
+        {
+            "number": 1,
+            "user": alice,
+            "created_at": "2024-03-01T10:00:00Z",
+            "merged_at": "2024-03-02T10:00:00Z",
+            "state": "closed",
+            "title": "Fix",
+            "html_url": "https://github.com/test-org/repo/pull/1",
+        },
+        {"number": 2, "user": bob, "created_at": "2023-12-01T10:00:00Z", "state": "open"},
+    ]
+    issues = [
+        {"number": 3, "user": bob, "created_at": "2024-05-01T10:00:00Z", "state": "open"},
+        {
+            "number": 1,
+            "user": alice,
+            "created_at": "2024-03-01T10:00:00Z",
+            "pull_request": {},
+        },
+    ]
+
+    async def pages(items: list[dict[str, Any]]) -> AsyncIterator[tuple[list[Any], dict]]:
+        yield items, {"page": 1}
+
+    def list_reviews(**_kwargs: Any) -> AsyncIterator[tuple[list[Any], dict]]:
+        return pages([{"user": bob, "state": "APPROVED", "submitted_at": "2024-03-01T12:00:00Z"}])
+
+    def list_issue_comments(**_kwargs: Any) -> AsyncIterator[tuple[list[Any], dict]]:
+        return pages([{"user": alice, "created_at": "2024-05-02T10:00:00Z"}])
+
+    def list_review_comments(**_kwargs: Any) -> AsyncIterator[tuple[list[Any], dict]]:
+        return pages([{"user": bob, "created_at": "2024-03-01T11:00:00Z"}])
+
+    # A full unsampled capture replaces an earlier sampled one
+    stale_marker = PathManager(config).sampling_marker_path
+    stale_marker.parent.mkdir(parents=True, exist_ok=True)
+    stale_marker.write_text("{}")
+
+    with (
+        patch(
+            "gh_year_end.collect.orchestrator.discover_repos",
+            new_callable=AsyncMock,
+            return_value=[repo],
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.RestClient.list_pulls",
+            side_effect=lambda **_kwargs: pages(pulls),
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.RestClient.list_issues",
+            side_effect=lambda **_kwargs: pages(issues),
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.RestClient.list_reviews",
+            side_effect=list_reviews,
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.RestClient.list_issue_comments",
+            side_effect=list_issue_comments,
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.RestClient.list_review_comments",
+            side_effect=list_review_comments,
+        ),
+    ):
+        result = await collect_and_aggregate(config, quiet=True)
+
+    # Discovery is mocked, so record the repo the way discover_repos would
+    paths = PathManager(config)
+    with JSONLWriter(paths.repos_raw_path) as writer:
+        writer.write(source="github_rest", endpoint="/orgs/test-org/repos", data=repo)
+
+    assert result["summary"]["total_prs"] == 1
+    assert paths.pulls_raw_path("test-org/repo").exists()
+    assert not stale_marker.exists()
+    assert compute_metrics(config, paths) == result
+
+
+@pytest.mark.asyncio
+async def test_collect_and_aggregate_opens_hygiene_writer_once(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that raw hygiene records share one writer for the whole run."""
+    import json
+    from unittest.mock import AsyncMock, patch
+
+    from gh_year_end.storage.paths import PathManager
+    from gh_year_end.storage.writer import AsyncJSONLWriter
+
+    config = Config.model_validate(
+        {
+            "github": {
+                "target": {"mode": "org", "name": "test-org"},
+                "windows": {"year": 2024},
+            },
+            "collection": {
+                "enable": {
+                    "pulls": False,
+                    "issues": False,
+                    "reviews": False,
+                    "comments": False,
+                    "commits": False,
+                },
+            },
+            "storage": {"root": str(tmp_path / "data"), "write_raw": True},
+        }
+    )
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_test_token_dummy")
+    repos = [{"full_name": f"test-org/repo{i}", "name": f"repo{i}"} for i in range(3)]
+    opened: list[Path] = []
+    open_writer = AsyncJSONLWriter.open
+
+    async def record_open(writer: AsyncJSONLWriter) -> None:
+        opened.append(writer.path)
+        await open_writer(writer)
+
+    with (
+        patch(
+            "gh_year_end.collect.orchestrator.discover_repos",
+            new_callable=AsyncMock,
+            return_value=repos,
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator._collect_repo_hygiene_inline",
+            new_callable=AsyncMock,
+            side_effect=lambda repo, **_kwargs: {"repo": repo["full_name"], "score": 50},
+        ),
+        patch.object(AsyncJSONLWriter, "open", record_open),
+    ):
+        await collect_and_aggregate(config, quiet=True)
+
+    paths = PathManager(config)
+    records = [json.loads(line) for line in paths.hygiene_raw_path.read_text().splitlines()]
+    assert [record["data"]["repo"] for record in records] == [r["full_name"] for r in repos]
+    assert opened.count(paths.hygiene_raw_path) == 1
+
+
+@pytest.mark.asyncio
+async def test_collect_and_aggregate_request_budget(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that a bounded run visits valuable repos first and reports coverage."""
+    from collections.abc import AsyncIterator
+    from typing import Any
+    from unittest.mock import AsyncMock, patch
+
+    from gh_year_end.collect.deadline import RunBudget
+
+    config = Config.model_validate(
+        {
+            "github": {
+                "target": {"mode": "org", "name": "test-org"},
+                "windows": {"year": 2024},
+            },
+            "collection": {
+                "enable": {"comments": False, "commits": False, "hygiene": False},
+                "limits": {"max_requests": 1},
+            },
+            "storage": {"root": str(tmp_path / "data")},
+        }
+    )
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_test_token_dummy")
+
+    stale = {"full_name": "test-org/stale", "name": "stale", "pushed_at": "2020-01-01T00:00:00Z"}
+    active = {"full_name": "test-org/active", "name": "active", "pushed_at": "2024-06-01T00:00:00Z"}
+    listed: list[str] = []
+
+    async def list_pulls(**kwargs: Any) -> AsyncIterator[tuple[list[Any], dict]]:
+        listed.append(kwargs["repo"])
+        # The listing spends the whole request budget
+        state = budget_limiter[0].get_progress_state()
+        state.requests_made += 1
+        yield [], {"page": 1}
+
+    budget_limiter: list[Any] = []
+    original_start = RunBudget.start
+
+    def start(self: RunBudget, total_repos: int) -> None:
+        original_start(self, total_repos)
+        budget_limiter.append(self.rate_limiter)
+
+    with (
+        patch(
+            "gh_year_end.collect.orchestrator.discover_repos",
+            new_callable=AsyncMock,
+            return_value=[stale, active],
+        ),
+        patch.object(RunBudget, "start", start),
+        patch("gh_year_end.collect.orchestrator.RestClient.list_pulls", side_effect=list_pulls),
+        patch("gh_year_end.collect.orchestrator.RestClient.list_issues") as list_issues,
+    ):
+        result = await collect_and_aggregate(config, quiet=True)
+
+    assert listed == ["active"]
+    list_issues.assert_not_called()
+    coverage = result["coverage"]
+    assert coverage["complete"] is False
+    assert coverage["stop_reason"] == "request_budget"
+    assert coverage["repos_not_started"] == ["test-org/stale"]
+    assert coverage["repos"]["test-org/active"] == {
+        "pulls": "complete",
+        "reviews": "complete",
+        "issues": "skipped",
+    }
+
+
+@pytest.mark.asyncio
+async def test_collect_and_aggregate_sampled_reviews(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that sampling fetches reviews for a sample and keeps PR counts exact."""
+    from collections.abc import AsyncIterator
+    from typing import Any
+    from unittest.mock import AsyncMock, patch
+
+    from gh_year_end.metrics import MetricsEngineError, compute_metrics
+    from gh_year_end.storage.paths import PathManager
+
+    config = Config.model_validate(
+        {
+            "github": {
+                "target": {"mode": "org", "name": "test-org"},
+                "windows": {"year": 2024},
+            },
+            "collection": {
+                "enable": {"issues": False, "comments": False, "commits": False, "hygiene": False},
+                "sampling": {"enabled": True, "reviews_rate": 0.1, "min_per_stratum": 2},
+            },
+            "storage": {"root": str(tmp_path / "data"), "write_raw": True},
+        }
+    )
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_test_token_dummy")
+
+    pulls = [
+        {
+            "number": n,
+            "user": {"login": "alice", "type": "User"},
+            "created_at": "2024-03-01T10:00:00Z",
+            "merged_at": "2024-03-02T10:00:00Z",
+            "state": "closed",
+        }
+        for n in range(1, 51)
+    ]
+    reviewed: list[int] = []
+
+    async def pages(items: list[dict[str, Any]]) -> AsyncIterator[tuple[list[Any], dict]]:
+        yield items, {"page": 1}
+
+    def list_reviews(**kwargs: Any) -> AsyncIterator[tuple[list[Any], dict]]:
+        reviewed.append(kwargs["pull_number"])
+        review = {
+            "user": {"login": "bob", "type": "User"},
+            "state": "APPROVED",
+            "submitted_at": "2024-03-01T12:00:00Z",
+        }
+        return pages([review])
+
+    with (
+        patch(
+            "gh_year_end.collect.orchestrator.discover_repos",
+            new_callable=AsyncMock,
+            return_value=[{"full_name": "test-org/repo", "name": "repo"}],
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.RestClient.list_pulls",
+            side_effect=lambda **_kwargs: pages(pulls),
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.RestClient.list_reviews",
+            side_effect=list_reviews,
+        ),
+    ):
+        result = await collect_and_aggregate(config, quiet=True)
+
+    assert len(reviewed) == 5
+    assert result["summary"]["total_prs"] == 50
+    assert result["summary"]["prs_merged"] == 50
+    assert result["summary"]["total_reviews"] == 50
+    assert result["repo_health"][0]["review_coverage"] == 100.0
+    assert result["sampling"]["totals"]["reviews"] == {
+        "estimate": 50,
+        "ci_low": 50,
+        "ci_high": 50,
+        "sampled": 5,
+        "population": 50,
+    }
+
+    # Sampled raw reviews would rebuild as if complete
+    with pytest.raises(MetricsEngineError, match="sampling"):
+        compute_metrics(config, PathManager(config))
+
+
+@pytest.mark.asyncio
+async def test_collect_and_aggregate_contributor_stats(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test commit metrics from contributor stats with a history fallback."""
+    from collections.abc import AsyncIterator
+    from typing import Any
+    from unittest.mock import AsyncMock, patch
+
+    from gh_year_end.metrics import compute_metrics
+    from gh_year_end.storage.paths import PathManager
+    from gh_year_end.storage.writer import JSONLWriter
+
+    config = Config.model_validate(
+        {
+            "github": {
+                "target": {"mode": "org", "name": "test-org"},
+                "windows": {"year": 2024},
+            },
+            "collection": {
+                "enable": {"pulls": False, "issues": False, "comments": False, "hygiene": False},
+                "commits": {"contributor_stats": True, "stats_max_polls": 0},
+            },
+            "storage": {"root": str(tmp_path / "data"), "write_raw": True},
+        }
+    )
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_test_token_dummy")
+
+    march = 1709424000  # 2024-03-03, a Sunday
+    stats = {
+        "stats": (
+            [
+                {
+                    "author": {"login": "alice", "type": "User"},
+                    "weeks": [{"w": march, "a": 100, "d": 20, "c": 7}],
+                }
+            ],
+            200,
+        ),
+        "history": (None, 202),
+    }
+
+    async def list_commits(**kwargs: Any) -> AsyncIterator[tuple[list[Any], dict]]:
+        assert kwargs["repo"] == "history"
+        commit = {
+            "author": {"login": "bob", "type": "User"},
+            "commit": {"author": {"date": "2024-06-01T00:00:00Z"}},
+        }
+        yield [commit, commit], {"page": 1}
+
+    repos = [
+        {"full_name": "test-org/stats", "name": "stats"},
+        {"full_name": "test-org/history", "name": "history"},
+    ]
+
+    with (
+        patch(
+            "gh_year_end.collect.orchestrator.discover_repos",
+            new_callable=AsyncMock,
+            return_value=repos,
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.RestClient.get_contributor_stats",
+            side_effect=lambda _owner, repo: stats[repo],
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.RestClient.list_commits",
+            side_effect=list_commits,
+        ),
+    ):
+        result = await collect_and_aggregate(config, quiet=True)
+
+    commits = {e["user"]: e["count"] for e in result["leaderboards"]["commits"]}
+    assert commits == {"alice": 7, "bob": 2}
+    assert result["leaderboards"]["lines_added"] == [
+        {"user": "alice", "count": 100, "avatar_url": ""}
+    ]
+    assert result["summary"]["total_commits"] == 9
+
+    # Recorded stats and fallback commits rebuild the same metrics with either engine
+    paths = PathManager(config)
+    with JSONLWriter(paths.repos_raw_path) as writer:
+        for repo in repos:
+            writer.write(source="github_rest", endpoint="/orgs/test-org/repos", data=repo)
+
+    assert paths.contributor_stats_raw_path("test-org/stats").exists()
+    assert paths.commits_raw_path("test-org/history").exists()
+    assert compute_metrics(config, paths) == result
+    duckdb_config = config.model_copy(
+        update={"metrics": config.metrics.model_copy(update={"engine": "duckdb"})}
+    )
+    assert compute_metrics(duckdb_config, PathManager(duckdb_config)) == result
+
+
+@pytest.mark.asyncio
+async def test_collect_and_aggregate_cancels_stats_polling_on_failure(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that a failed run stops contributor stats polling before closing the client."""
+    import asyncio
+    from unittest.mock import AsyncMock, patch
+
+    config = Config.model_validate(
+        {
+            "github": {
+                "target": {"mode": "org", "name": "test-org"},
+                "windows": {"year": 2024},
+            },
+            "collection": {
+                "commits": {
+                    "contributor_stats": True,
+                    "stats_poll_interval": 60,
+                    "stats_max_polls": 5,
+                },
+            },
+            "storage": {"root": str(tmp_path / "data")},
+        }
+    )
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_test_token_dummy")
+
+    with (
+        patch(
+            "gh_year_end.collect.orchestrator.discover_repos",
+            new_callable=AsyncMock,
+            return_value=[{"full_name": "test-org/repo", "name": "repo"}],
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.RestClient.get_contributor_stats",
+            new_callable=AsyncMock,
+            return_value=(None, 202),
+        ),
+        patch(
+            "gh_year_end.collect.orchestrator.build_hygiene_engine",
+            side_effect=RuntimeError("boom"),
+        ),
+        pytest.raises(RuntimeError, match="boom"),
+    ):
+        await collect_and_aggregate(config, quiet=True)
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_collect_and_aggregate_bounded_run_gates_contributor_stats(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that a bounded run only requests stats for started repos while commits are allowed."""
+    from collections.abc import AsyncIterator
+    from typing import Any
+    from unittest.mock import AsyncMock, patch
+
+    from gh_year_end.collect.deadline import RunBudget
+
+    def bounded_config(max_requests: int) -> Config:
+        return Config.model_validate(
+            {
+                "github": {
+                    "target": {"mode": "org", "name": "test-org"},
+                    "windows": {"year": 2024},
+                },
+                "collection": {
+                    "enable": {"issues": False, "comments": False, "hygiene": False},
+                    "commits": {"contributor_stats": True, "stats_max_polls": 0},
+                    "limits": {"max_requests": max_requests},
+                },
+                "storage": {"root": str(tmp_path / "data")},
+            }
+        )
+
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_test_token_dummy")
+    stale = {"full_name": "test-org/stale", "name": "stale", "pushed_at": "2020-01-01T00:00:00Z"}
+    active = {"full_name": "test-org/active", "name": "active", "pushed_at": "2024-06-01T00:00:00Z"}
+    budget_limiter: list[Any] = []
+    original_start = RunBudget.start
+
+    def start(self: RunBudget, total_repos: int) -> None:
+        original_start(self, total_repos)
+        budget_limiter.append(self.rate_limiter)
+
+    async def list_pulls(**_kwargs: Any) -> AsyncIterator[tuple[list[Any], dict]]:
+        # The listing spends one request of the budget
+        budget_limiter[-1].get_progress_state().requests_made += 1
+        yield [], {"page": 1}
+
+    async def collect(max_requests: int) -> tuple[dict[str, Any], AsyncMock]:
+        with (
+            patch(
+                "gh_year_end.collect.orchestrator.discover_repos",
+                new_callable=AsyncMock,
+                return_value=[stale, active],
+            ),
+            patch.object(RunBudget, "start", start),
+            patch("gh_year_end.collect.orchestrator.RestClient.list_pulls", side_effect=list_pulls),
+            patch(
+                "gh_year_end.collect.orchestrator.RestClient.get_contributor_stats",
+                new_callable=AsyncMock,
+                return_value=([], 204),
+            ) as get_stats,
+        ):
+            result = await collect_and_aggregate(bounded_config(max_requests), quiet=True)
+        return result, get_stats
+
+    # Budget spent by the first repo: no stats requests at all
+    result, get_stats = await collect(1)
+    get_stats.assert_not_awaited()
+    assert result["coverage"]["repos"]["test-org/active"]["commits"] == "skipped"
+
+    # Budget left: stats only for the repos the run started
+    result, get_stats = await collect(1000)
+    assert sorted(call.args for call in get_stats.await_args_list) == [
+        ("test-org", "active"),
+        ("test-org", "stale"),
+    ]
+    assert result["coverage"]["repos"]["test-org/active"]["commits"] == "complete"
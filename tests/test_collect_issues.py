@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from gh_year_end.collect.catalog import ISSUES, CollectionCatalog
 from gh_year_end.collect.issues import IssueCollectionStats, collect_issues
 from gh_year_end.config import Config
 
@@ -220,6 +221,41 @@ class TestCollectIssues:
             # Should filter out items with "pull_request" key
             assert result["pull_requests_filtered"] == 2
 
+    async def test_collect_issues_publishes_to_catalog(
+        self,
+        sample_repos,
+        sample_issues,
+        mock_rest_client,
+        mock_rate_limiter,
+        mock_paths,
+        sample_config,
+    ):
+        """Test that only written issues (not PRs) are published to the catalog."""
+
+        async def mock_list_issues(*args, **kwargs):
+            yield sample_issues, {"page": 1}
+
+        mock_rest_client.list_issues = mock_list_issues
+        catalog = CollectionCatalog()
+
+        with patch("gh_year_end.collect.issues.AsyncJSONLWriter") as mock_writer_class:
+            mock_writer_class.return_value.__aenter__.return_value = AsyncMock()
+
+            result = await collect_issues(
+                repos=sample_repos[:1],
+                rest_client=mock_rest_client,
+                paths=mock_paths,
+                rate_limiter=mock_rate_limiter,
+                config=sample_config,
+                catalog=catalog,
+            )
+
+        numbers = catalog.numbers(ISSUES, "owner/repo1")
+        assert len(numbers) == result["issues_collected"]
+        assert all(
+            "pull_request" not in issue for issue in sample_issues if issue["number"] in numbers
+        )
+
     async def test_collect_issues_with_error(
         self, sample_repos, mock_rest_client, mock_rate_limiter, mock_paths, sample_config
     ):
@@ -1,14 +1,18 @@
 """Tests for collection phase modules."""
 
 import json
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from gh_year_end.collect.catalog import ISSUES, PULLS, CollectionCatalog
 from gh_year_end.collect.phases.comments import (
     _extract_issue_numbers_from_raw,
     _extract_pr_numbers_from_raw,
+    collected_issue_numbers,
+    collected_pr_numbers,
     run_comments_phase,
 )
 from gh_year_end.collect.phases.commits import run_commits_phase
@@ -18,6 +22,7 @@ from gh_year_end.collect.phases.hygiene import (
     run_security_features_phase,
 )
 from gh_year_end.collect.phases.issues import run_issues_phase
+from gh_year_end.collect.phases.pipeline import run_pipelined_collection
 from gh_year_end.collect.phases.pulls import run_pulls_phase
 from gh_year_end.collect.phases.repos import run_repo_metadata_phase
 from gh_year_end.collect.phases.reviews import run_reviews_phase
@@ -98,6 +103,7 @@ def mock_paths(tmp_path: Path):
     paths.repos_raw_path = tmp_path / "data" / "raw" / "repos.jsonl"
     paths.raw_root = tmp_path / "data" / "raw"
     paths.site_data_path = tmp_path / "data" / "site"
+    paths.hygiene_tree_cache_path = tmp_path / "data" / "cache" / "hygiene_trees.json"
     paths.pulls_raw_path = MagicMock(
         return_value=tmp_path / "data" / "raw" / "pulls" / "repo.jsonl"
     )
@@ -731,6 +737,43 @@ class TestRunSecurityFeaturesPhase:
         assert stats["skipped"] is True
 
 
+class TestCollectedNumbers:
+    """Tests for catalog-first PR/issue number resolution."""
+
+    @pytest.mark.asyncio
+    async def test_catalog_used_without_reading_files(self, sample_repos, mock_paths):
+        """Test that published repos never touch raw files."""
+        catalog = CollectionCatalog()
+        for repo in sample_repos:
+            catalog.publish(PULLS, repo["full_name"], [{"number": 5}, {"number": 4}])
+            catalog.complete(PULLS, repo["full_name"])
+
+        with patch(
+            "gh_year_end.collect.phases.comments._extract_pr_numbers_from_raw",
+            new=AsyncMock(),
+        ) as mock_extract:
+            result = await collected_pr_numbers(sample_repos, mock_paths, catalog)
+
+        assert result == {"test-org/repo1": [4, 5], "test-org/repo2": [4, 5]}
+        mock_extract.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resumed_repos_fall_back_to_raw_files(self, sample_repos, mock_paths):
+        """Test that repos collected by an earlier run are read from disk."""
+        catalog = CollectionCatalog()
+        catalog.publish(ISSUES, "test-org/repo1", [{"number": 1}])
+        catalog.complete(ISSUES, "test-org/repo1")
+
+        with patch(
+            "gh_year_end.collect.phases.comments._extract_issue_numbers_from_raw",
+            new=AsyncMock(return_value={"test-org/repo2": [7]}),
+        ) as mock_extract:
+            result = await collected_issue_numbers(sample_repos, mock_paths, catalog)
+
+        assert result == {"test-org/repo1": [1], "test-org/repo2": [7]}
+        mock_extract.assert_awaited_once_with([sample_repos[1]], mock_paths)
+
+
 class TestExtractIssueNumbersFromRaw:
     """Tests for _extract_issue_numbers_from_raw function."""
 
@@ -827,3 +870,176 @@ class TestExtractPRNumbersFromRaw:
 
         # Should skip record without number
         assert result["test-org/repo1"] == [10, 20]
+
+
+class TestRunPipelinedCollection:
+    """Tests for run_pipelined_collection function."""
+
+    @staticmethod
+    def _collector_patches(calls: list[tuple[str, str]]) -> list:
+        """Patch every collector to record (phase, repo) and return small stats."""
+
+        def fake(phase: str, stats: dict) -> AsyncMock:
+            async def run(**kwargs):
+                repos = kwargs["repos"]
+                calls.append((phase, repos[0]["full_name"] if len(repos) == 1 else "*"))
+                return dict(stats)
+
+            return AsyncMock(side_effect=run)
+
+        module = "gh_year_end.collect.phases.pipeline"
+        return [
+            patch(f"{module}.collect_repo_metadata", fake("repo_metadata", {"repos_processed": 1})),
+            patch(f"{module}.collect_issues", fake("issues", {"issues_collected": 2})),
+            patch(f"{module}.collect_reviews", fake("reviews", {"reviews_collected": 3})),
+            patch(f"{module}.collect_commits", fake("commits", {"commits_collected": 4})),
+            patch(
+                f"{module}.collect_issue_comments",
+                fake("issue_comments", {"comments_collected": 5}),
+            ),
+            patch(
+                f"{module}.collect_review_comments",
+                fake("review_comments", {"comments_collected": 6}),
+            ),
+            patch(
+                f"{module}.collect_security_features",
+                fake("security_features", {"repos_processed": 1}),
+            ),
+            patch(
+                f"{module}.collect_branch_protection",
+                fake("branch_protection", {"repos_processed": 2}),
+            ),
+            patch(
+                "gh_year_end.collect.phases.comments._extract_issue_numbers_from_raw",
+                AsyncMock(return_value={"r": [1]}),
+            ),
+            patch(
+                "gh_year_end.collect.phases.comments._extract_pr_numbers_from_raw",
+                AsyncMock(return_value={"r": [2]}),
+            ),
+        ]
+
+    async def _run(self, calls, pulls_fn, **fixtures):
+        async def collect_repos_parallel(repos, collect_fn, endpoint_name, **kwargs):
+            return await pulls_fn(repos[0]["full_name"])
+
+        with ExitStack() as stack:
+            for p in self._collector_patches(calls):
+                stack.enter_context(p)
+            return await run_pipelined_collection(
+                collect_repos_parallel=collect_repos_parallel, **fixtures
+            )
+
+    @pytest.fixture
+    def pipeline_args(
+        self,
+        sample_config,
+        sample_repos,
+        mock_rest_client,
+        mock_graphql_client,
+        mock_rate_limiter,
+        mock_paths,
+        mock_checkpoint,
+        mock_progress,
+    ):
+        sample_config.collection.scheduler.mode = "dag"
+        return {
+            "config": sample_config,
+            "repos": sample_repos,
+            "rest_client": mock_rest_client,
+            "graphql_client": mock_graphql_client,
+            "rate_limiter": mock_rate_limiter,
+            "paths": mock_paths,
+            "checkpoint": mock_checkpoint,
+            "progress": mock_progress,
+        }
+
+    @pytest.mark.asyncio
+    async def test_pipeline_runs_all_phases(self, pipeline_args, mock_checkpoint):
+        """Test stats shapes, per-repo dependencies, and phase completion."""
+        calls: list[tuple[str, str]] = []
+
+        async def pulls(repo):
+            calls.append(("pulls", repo))
+            return {"pulls_collected": 10}
+
+        stats = await self._run(calls, pulls, **pipeline_args)
+
+        assert stats["repos"]["repos_processed"] == 2
+        assert stats["pulls"]["pulls_collected"] == 20
+        assert stats["issues"]["issues_collected"] == 4
+        assert stats["reviews"]["reviews_collected"] == 6
+        assert stats["commits"]["commits_collected"] == 8
+        assert stats["comments"]["total_comments"] == 22
+        assert stats["comments"]["issue_comments"]["comments_collected"] == 10
+        assert stats["hygiene"]["repos_processed"] == 2
+        assert stats["security_features"]["repos_processed"] == 2
+        assert "pipeline_failures" not in stats
+
+        # Branch protection runs once over all repos
+        assert calls.count(("branch_protection", "*")) == 1
+        for repo in ("test-org/repo1", "test-org/repo2"):
+            assert calls.index(("pulls", repo)) < calls.index(("reviews", repo))
+            assert calls.index(("pulls", repo)) < calls.index(("review_comments", repo))
+            assert calls.index(("issues", repo)) < calls.index(("issue_comments", repo))
+
+        completed = {c.args[0] for c in mock_checkpoint.mark_phase_complete.call_args_list}
+        assert completed == {
+            "repo_metadata",
+            "pulls",
+            "issues",
+            "reviews",
+            "comments",
+            "commits",
+            "branch_protection",
+            "security_features",
+        }
+
+    @pytest.mark.asyncio
+    async def test_pipeline_failure_isolated_to_repo(self, pipeline_args, mock_checkpoint):
+        """Test that a failed repo skips its dependents and leaves the phase incomplete."""
+        calls: list[tuple[str, str]] = []
+
+        async def pulls(repo):
+            if repo == "test-org/repo1":
+                msg = "pulls failed"
+                raise RuntimeError(msg)
+            calls.append(("pulls", repo))
+            return {"pulls_collected": 10}
+
+        stats = await self._run(calls, pulls, **pipeline_args)
+
+        assert stats["pulls"]["pulls_collected"] == 10
+        assert ("reviews", "test-org/repo1") not in calls
+        assert ("reviews", "test-org/repo2") in calls
+        assert ("issue_comments", "test-org/repo1") in calls
+        assert set(stats["pipeline_failures"]) == {
+            "pulls:test-org/repo1",
+            "reviews:test-org/repo1",
+            "review_comments:test-org/repo1",
+        }
+        completed = {c.args[0] for c in mock_checkpoint.mark_phase_complete.call_args_list}
+        assert "pulls" not in completed
+        assert "reviews" not in completed
+        assert "comments" not in completed
+        assert "issues" in completed
+
+    @pytest.mark.asyncio
+    async def test_pipeline_skips_disabled_and_complete_phases(
+        self, pipeline_args, sample_config, mock_checkpoint
+    ):
+        """Test skipped phases report the phased pipeline's skip stats."""
+        sample_config.collection.enable.hygiene = False
+        mock_checkpoint.is_phase_complete.side_effect = lambda phase: phase == "commits"
+        calls: list[tuple[str, str]] = []
+
+        async def pulls(repo):
+            return {"pulls_collected": 1}
+
+        stats = await self._run(calls, pulls, **pipeline_args)
+
+        assert stats["repos"] == {"repos_processed": 0, "skipped": True}
+        assert stats["hygiene"] == {"repos_processed": 0, "skipped": True}
+        assert stats["commits"] == {"commits_collected": 0, "skipped": True}
+        assert not [c for c in calls if c[0] in ("commits", "repo_metadata", "branch_protection")]
+        assert stats["pulls"]["pulls_collected"] == 2
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from gh_year_end.collect.catalog import PULLS, CollectionCatalog
 from gh_year_end.collect.pulls import (
     _all_prs_before_date,
     _filter_prs_by_date,
@@ -261,6 +262,33 @@ class TestCollectPulls:
             assert result["repos_resumed"] == 0
             assert result["errors"] == []
 
+    async def test_collect_pulls_publishes_to_catalog(
+        self, sample_repos, sample_prs, mock_rest_client, mock_paths, sample_config
+    ):
+        """Test that collected PR keys are published for downstream phases."""
+
+        async def mock_list_pulls(*args, **kwargs):
+            yield sample_prs, {"page": 1}
+
+        mock_rest_client.list_pulls = mock_list_pulls
+        catalog = CollectionCatalog()
+
+        with patch("gh_year_end.collect.pulls.AsyncJSONLWriter") as mock_writer_class:
+            mock_writer_class.return_value.__aenter__.return_value = AsyncMock()
+
+            result = await collect_pulls(
+                repos=sample_repos,
+                rest_client=mock_rest_client,
+                paths=mock_paths,
+                config=sample_config,
+                catalog=catalog,
+            )
+
+        numbers, missing = catalog.numbers_by_repo(PULLS, sample_repos)
+        assert missing == []
+        assert len(numbers["owner/repo1"]) == 2
+        assert sum(len(n) for n in numbers.values()) == result["pulls_collected"]
+
     async def test_collect_pulls_empty_repos(self, mock_rest_client, mock_paths, sample_config):
         """Test collection with no repos."""
         result = await collect_pulls(
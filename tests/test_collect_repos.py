@@ -5,9 +5,9 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from gh_year_end.collect.repo_store import RepoStore
 from gh_year_end.collect.repos import (
     _check_file_presence,
-    _check_workflows_presence,
     _fetch_branch_protection,
     _fetch_repo_metadata,
     _parse_repo_name,
@@ -172,6 +172,8 @@ def sample_repo_metadata() -> dict:
 def mock_graphql_client():
     """Create mock GraphQL client."""
     client = AsyncMock()
+    # No directory listings unless a test provides them
+    client.query_tree_entries.return_value = {}
     return client
 
 
@@ -409,6 +411,17 @@ class TestFetchBranchProtection:
         assert result is None
 
 
+def tree_listing(oid: str, *entries: tuple[str, str]) -> dict:
+    """GraphQL directory listing with (name, type) entries."""
+    return {
+        "oid": oid,
+        "entries": [
+            {"name": name, "type": type_, "oid": f"{name}-oid", "size": 1}
+            for name, type_ in entries
+        ],
+    }
+
+
 class TestCheckFilePresence:
     """Tests for _check_file_presence function."""
 
@@ -417,38 +430,16 @@ class TestCheckFilePresence:
         self, mock_graphql_client, mock_rate_limiter, sample_config
     ):
         """Test checking file presence when all files exist."""
-
-        # Mock file presence responses
-        def mock_execute(query, variables):
-            if "FILE_PRESENCE_QUERY" in query or "expression" in variables:
-                return {
-                    "repository": {
-                        "object": {
-                            "id": "blob123",
-                            "byteSize": 1024,
-                        }
-                    }
-                }
-            # Workflows query
-            return {
-                "repository": {
-                    "defaultBranchRef": {
-                        "target": {
-                            "tree": {
-                                "entries": [
-                                    {
-                                        "path": ".github/workflows/ci.yml",
-                                        "type": "blob",
-                                        "name": "ci.yml",
-                                    }
-                                ]
-                            }
-                        }
-                    }
-                }
-            }
-
-        mock_graphql_client.execute.side_effect = mock_execute
+        mock_graphql_client.query_tree_entries.return_value = {
+            "main:": tree_listing(
+                "root",
+                ("README.md", "blob"),
+                ("LICENSE", "blob"),
+                ("SECURITY.md", "blob"),
+                (".github", "tree"),
+            ),
+            "main:.github/workflows": tree_listing("wf", ("ci.yml", "blob")),
+        }
 
         result = await _check_file_presence(
             owner="test-org",
@@ -463,21 +454,20 @@ class TestCheckFilePresence:
         assert result["LICENSE"] is True
         assert result["SECURITY.md"] is True
         assert result["_has_workflows"] is True
+        # One batched query for the root and the workflows directory
+        mock_graphql_client.query_tree_entries.assert_awaited_once_with(
+            "test-org", "repo1", ["main:", "main:.github/workflows"]
+        )
 
     @pytest.mark.asyncio
     async def test_check_file_presence_no_files_exist(
         self, mock_graphql_client, mock_rate_limiter, sample_config
     ):
         """Test checking file presence when no files exist."""
-
-        # Mock empty responses
-        def mock_execute(query, variables):
-            if "expression" in variables:
-                return {"repository": {"object": None}}
-            # Workflows query
-            return {"repository": {"defaultBranchRef": {"target": {"tree": {"entries": []}}}}}
-
-        mock_graphql_client.execute.side_effect = mock_execute
+        mock_graphql_client.query_tree_entries.return_value = {
+            "main:": tree_listing("root", ("src", "tree")),
+            "main:.github/workflows": None,
+        }
 
         result = await _check_file_presence(
             owner="test-org",
@@ -498,7 +488,9 @@ class TestCheckFilePresence:
         self, mock_graphql_client, mock_rate_limiter, sample_config
     ):
         """Test handling GraphQL error during file presence check."""
-        mock_graphql_client.execute.side_effect = GraphQLError([{"message": "Not found"}])
+        mock_graphql_client.query_tree_entries.side_effect = GraphQLError(
+            [{"message": "Not found"}]
+        )
 
         result = await _check_file_presence(
             owner="test-org",
@@ -520,7 +512,7 @@ class TestCheckFilePresence:
         self, mock_graphql_client, mock_rate_limiter, sample_config
     ):
         """Test handling unexpected error during file presence check."""
-        mock_graphql_client.execute.side_effect = Exception("Network error")
+        mock_graphql_client.query_tree_entries.side_effect = Exception("Network error")
 
         result = await _check_file_presence(
             owner="test-org",
@@ -539,145 +531,69 @@ class TestCheckFilePresence:
 
 
 class TestCheckWorkflowsPresence:
-    """Tests for _check_workflows_presence function."""
+    """Tests for workflow detection in _check_file_presence."""
 
-    @pytest.mark.asyncio
-    async def test_check_workflows_presence_has_workflows(
-        self, mock_graphql_client, mock_rate_limiter, sample_config
-    ):
-        """Test checking workflows when they exist."""
-        mock_graphql_client.execute.return_value = {
-            "repository": {
-                "defaultBranchRef": {
-                    "target": {
-                        "tree": {
-                            "entries": [
-                                {
-                                    "path": ".github/workflows/ci.yml",
-                                    "type": "blob",
-                                    "name": "ci.yml",
-                                },
-                                {
-                                    "path": ".github/workflows/release.yml",
-                                    "type": "blob",
-                                    "name": "release.yml",
-                                },
-                            ]
-                        }
-                    }
-                }
-            }
+    async def check(self, mock_graphql_client, mock_rate_limiter, sample_config, workflows):
+        mock_graphql_client.query_tree_entries.return_value = {
+            "main:": tree_listing("root", ("README.md", "blob"), (".github", "tree")),
+            "main:.github/workflows": workflows,
         }
-
-        result = await _check_workflows_presence(
+        result = await _check_file_presence(
             owner="test-org",
             name="repo1",
+            default_branch="main",
             graphql_client=mock_graphql_client,
             rate_limiter=mock_rate_limiter,
             config=sample_config,
         )
-
-        assert result is True
+        return result["_has_workflows"]
 
     @pytest.mark.asyncio
-    async def test_check_workflows_presence_no_workflows(
+    async def test_check_workflows_presence_has_workflows(
         self, mock_graphql_client, mock_rate_limiter, sample_config
     ):
-        """Test checking workflows when none exist."""
-        mock_graphql_client.execute.return_value = {
-            "repository": {
-                "defaultBranchRef": {
-                    "target": {
-                        "tree": {
-                            "entries": [
-                                {
-                                    "path": "README.md",
-                                    "type": "blob",
-                                    "name": "README.md",
-                                },
-                            ]
-                        }
-                    }
-                }
-            }
-        }
+        """Test checking workflows when they exist."""
+        workflows = tree_listing("wf", ("ci.yml", "blob"), ("release.yml", "blob"))
 
-        result = await _check_workflows_presence(
-            owner="test-org",
-            name="repo1",
-            graphql_client=mock_graphql_client,
-            rate_limiter=mock_rate_limiter,
-            config=sample_config,
-        )
+        assert await self.check(mock_graphql_client, mock_rate_limiter, sample_config, workflows)
 
-        assert result is False
+    @pytest.mark.asyncio
+    async def test_check_workflows_presence_no_workflows(
+        self, mock_graphql_client, mock_rate_limiter, sample_config
+    ):
+        """Test checking workflows when the directory does not exist."""
+        assert not await self.check(mock_graphql_client, mock_rate_limiter, sample_config, None)
 
     @pytest.mark.asyncio
     async def test_check_workflows_presence_has_directory_but_no_files(
         self, mock_graphql_client, mock_rate_limiter, sample_config
     ):
         """Test checking workflows when directory exists but has no workflow files."""
-        mock_graphql_client.execute.return_value = {
-            "repository": {
-                "defaultBranchRef": {
-                    "target": {
-                        "tree": {
-                            "entries": [
-                                {
-                                    "path": ".github/workflows",
-                                    "type": "tree",
-                                    "name": "workflows",
-                                },
-                            ]
-                        }
-                    }
-                }
-            }
-        }
+        workflows = tree_listing("wf", ("templates", "tree"))
 
-        result = await _check_workflows_presence(
-            owner="test-org",
-            name="repo1",
-            graphql_client=mock_graphql_client,
-            rate_limiter=mock_rate_limiter,
-            config=sample_config,
+        assert not await self.check(
+            mock_graphql_client, mock_rate_limiter, sample_config, workflows
         )
 
-        assert result is False
-
     @pytest.mark.asyncio
     async def test_check_workflows_presence_graphql_error(
         self, mock_graphql_client, mock_rate_limiter, sample_config
     ):
         """Test handling GraphQL error during workflows check."""
-        mock_graphql_client.execute.side_effect = GraphQLError([{"message": "Not found"}])
-
-        result = await _check_workflows_presence(
-            owner="test-org",
-            name="repo1",
-            graphql_client=mock_graphql_client,
-            rate_limiter=mock_rate_limiter,
-            config=sample_config,
+        mock_graphql_client.query_tree_entries.side_effect = GraphQLError(
+            [{"message": "Not found"}]
         )
 
-        assert result is False
+        assert not await self.check(mock_graphql_client, mock_rate_limiter, sample_config, None)
 
     @pytest.mark.asyncio
     async def test_check_workflows_presence_unexpected_error(
         self, mock_graphql_client, mock_rate_limiter, sample_config
     ):
         """Test handling unexpected error during workflows check."""
-        mock_graphql_client.execute.side_effect = Exception("Network error")
+        mock_graphql_client.query_tree_entries.side_effect = Exception("Network error")
 
-        result = await _check_workflows_presence(
-            owner="test-org",
-            name="repo1",
-            graphql_client=mock_graphql_client,
-            rate_limiter=mock_rate_limiter,
-            config=sample_config,
-        )
-
-        assert result is False
+        assert not await self.check(mock_graphql_client, mock_rate_limiter, sample_config, None)
 
 
 class TestCollectRepoMetadata:
@@ -774,6 +690,44 @@ class TestCollectRepoMetadata:
         assert stats["repos_failed"] == 0
         assert mock_writer.write.call_count == 2
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("permission", "recorded"), [("ADMIN", True), ("READ", False)])
+    async def test_records_vulnerability_alerts_for_admins(
+        self,
+        sample_repos,
+        sample_repo_metadata,
+        mock_graphql_client,
+        mock_writer,
+        mock_rate_limiter,
+        sample_config,
+        permission,
+        recorded,
+    ):
+        """Test that the alerts flag reaches the repo store only for admins."""
+        metadata = {
+            **sample_repo_metadata,
+            "hasVulnerabilityAlertsEnabled": True,
+            "viewerPermission": permission,
+        }
+        mock_graphql_client.execute.side_effect = lambda query, _variables: (
+            {"repository": {"branchProtectionRule": {"nodes": []}}}
+            if "branchProtectionRule" in query
+            else {"repository": metadata}
+        )
+        store = RepoStore()
+
+        await collect_repo_metadata(
+            repos=sample_repos[:1],
+            graphql_client=mock_graphql_client,
+            writer=mock_writer,
+            rate_limiter=mock_rate_limiter,
+            config=sample_config,
+            store=store,
+        )
+
+        known = store.get(sample_repos[0]["full_name"]) or {}
+        assert ("vulnerability_alerts_enabled" in known) is recorded
+
     @pytest.mark.asyncio
     async def test_collect_repo_metadata_with_branch_protection(
         self,
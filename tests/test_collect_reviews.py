@@ -6,7 +6,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from gh_year_end.collect.reviews import ReviewCollectionStats, collect_reviews
-from gh_year_end.config import Config
+from gh_year_end.config import Config, RateLimitConfig
+from gh_year_end.github.graphql import GraphQLError
+from gh_year_end.github.ratelimit import AdaptiveRateLimiter
 
 
 @pytest.fixture
@@ -390,3 +392,121 @@ class TestCollectReviews:
 
             # Repo should be skipped
             assert result["repos_skipped"] == 1
+
+
+@pytest.mark.asyncio
+class TestCollectReviewsWorkStealing:
+    """Tests for serving review batches from GraphQL or REST."""
+
+    @pytest.fixture
+    def stealing_config(self, sample_config: Config) -> Config:
+        """Config with work stealing enabled and small batches."""
+        sample_config.rate_limit.work_stealing.enabled = True
+        sample_config.rate_limit.work_stealing.review_batch_size = 2
+        return sample_config
+
+    @pytest.fixture
+    def rate_limiter(self) -> AdaptiveRateLimiter:
+        """Rate limiter with both budgets full."""
+        return AdaptiveRateLimiter(RateLimitConfig())
+
+    async def test_batches_served_by_graphql(
+        self, sample_reviews, mock_rest_client, mock_paths, stealing_config, rate_limiter
+    ):
+        """Test that GraphQL serves batches and REST covers PRs it cannot."""
+        rest_calls: list[int] = []
+
+        async def mock_list_reviews(owner, repo, pr_number):
+            rest_calls.append(pr_number)
+            yield sample_reviews, {"page": 1}
+
+        async def mock_query(owner, name, numbers):
+            # PR 2 has more than one page of reviews
+            return {n: (None if n == 2 else [sample_reviews[0]]) for n in numbers}
+
+        mock_rest_client.list_reviews = mock_list_reviews
+        graphql_client = MagicMock()
+        graphql_client.query_pull_request_reviews = AsyncMock(side_effect=mock_query)
+
+        with patch("gh_year_end.collect.reviews.AsyncJSONLWriter") as mock_writer_class:
+            mock_writer = AsyncMock()
+            mock_writer_class.return_value.__aenter__.return_value = mock_writer
+
+            result = await collect_reviews(
+                repos=[{"full_name": "owner/repo1"}],
+                rest_client=mock_rest_client,
+                paths=mock_paths,
+                rate_limiter=rate_limiter,
+                config=stealing_config,
+                pr_numbers_by_repo={"owner/repo1": [1, 2, 3]},
+                graphql_client=graphql_client,
+            )
+
+        assert graphql_client.query_pull_request_reviews.await_count == 2
+        assert rest_calls == [2]
+        assert result["prs_processed"] == 3
+        assert result["prs_via_graphql"] == 2
+        assert result["reviews_collected"] == 2 + len(sample_reviews)
+        sources = {call.kwargs["source"] for call in mock_writer.write.await_args_list}
+        endpoints = {call.kwargs["endpoint"] for call in mock_writer.write.await_args_list}
+        assert sources == {"github_graphql", "github_rest"}
+        assert "/repos/owner/repo1/pulls/1/reviews" in endpoints
+
+    async def test_graphql_error_falls_back_to_rest(
+        self, sample_reviews, mock_rest_client, mock_paths, stealing_config, rate_limiter
+    ):
+        """Test that a failed GraphQL batch is collected via REST."""
+
+        async def mock_list_reviews(*args, **kwargs):
+            yield sample_reviews, {"page": 1}
+
+        mock_rest_client.list_reviews = mock_list_reviews
+        graphql_client = MagicMock()
+        graphql_client.query_pull_request_reviews = AsyncMock(
+            side_effect=GraphQLError([{"message": "Something went wrong"}])
+        )
+
+        with patch("gh_year_end.collect.reviews.AsyncJSONLWriter") as mock_writer_class:
+            mock_writer_class.return_value.__aenter__.return_value = AsyncMock()
+
+            result = await collect_reviews(
+                repos=[{"full_name": "owner/repo1"}],
+                rest_client=mock_rest_client,
+                paths=mock_paths,
+                rate_limiter=rate_limiter,
+                config=stealing_config,
+                pr_numbers_by_repo={"owner/repo1": [1, 2]},
+                graphql_client=graphql_client,
+            )
+
+        assert result["prs_processed"] == 2
+        assert result["prs_via_graphql"] == 0
+        assert result["errors"] == 0
+
+    async def test_disabled_ignores_graphql_client(
+        self, sample_reviews, mock_rest_client, mock_paths, sample_config, rate_limiter
+    ):
+        """Test that GraphQL is unused unless work stealing is enabled."""
+
+        async def mock_list_reviews(*args, **kwargs):
+            yield sample_reviews, {"page": 1}
+
+        mock_rest_client.list_reviews = mock_list_reviews
+        graphql_client = MagicMock()
+        graphql_client.query_pull_request_reviews = AsyncMock()
+
+        with patch("gh_year_end.collect.reviews.AsyncJSONLWriter") as mock_writer_class:
+            mock_writer_class.return_value.__aenter__.return_value = AsyncMock()
+
+            result = await collect_reviews(
+                repos=[{"full_name": "owner/repo1"}],
+                rest_client=mock_rest_client,
+                paths=mock_paths,
+                rate_limiter=rate_limiter,
+                config=sample_config,
+                pr_numbers_by_repo={"owner/repo1": [1, 2]},
+                graphql_client=graphql_client,
+            )
+
+        graphql_client.query_pull_request_reviews.assert_not_awaited()
+        assert result["prs_processed"] == 2
@@ -0,0 +1,171 @@
+"""Tests for deadline- and budget-bounded collection."""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from gh_year_end.collect.deadline import (
+    COMPLETE,
+    PARTIAL,
+    SKIPPED,
+    CoverageTracker,
+    RunBudget,
+    order_by_value,
+    parse_duration,
+    repo_value,
+)
+from gh_year_end.config import CollectionLimitsConfig, RateLimitConfig
+from gh_year_end.github.ratelimit import AdaptiveRateLimiter
+
+SINCE = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def make_budget(**limits: object) -> RunBudget:
+    """Run budget over a fresh rate limiter."""
+    budget = RunBudget(
+        CollectionLimitsConfig.model_validate(limits), AdaptiveRateLimiter(RateLimitConfig())
+    )
+    budget.start(total_repos=3)
+    return budget
+
+
+def spend(budget: RunBudget, requests: int) -> None:
+    """Count requests against the budget's progress state."""
+    state = budget.rate_limiter.get_progress_state()
+    assert state is not None
+    state.requests_made += requests
+
+
+class TestParseDuration:
+    """Tests for parse_duration."""
+
+    @pytest.mark.parametrize(
+        ("text", "seconds"),
+        [("45m", 2700), ("2h", 7200), ("1h30m", 5400), ("90", 90), ("1.5h", 5400), (" 30S ", 30)],
+    )
+    def test_valid(self, text: str, seconds: float) -> None:
+        """Test accepted duration formats."""
+        assert parse_duration(text) == seconds
+
+    @pytest.mark.parametrize("text", ["", "soon", "10d", "m5", "0", "0m"])
+    def test_invalid(self, text: str) -> None:
+        """Test that malformed or zero durations are rejected."""
+        with pytest.raises(ValueError):
+            parse_duration(text)
+
+
+class TestRepoValue:
+    """Tests for value-ordered scheduling."""
+
+    def test_recent_push_outranks_stale_repo(self) -> None:
+        """Test that a repo pushed in the window beats a larger stale one."""
+        active = {"full_name": "o/active", "pushed_at": "2024-06-01T00:00:00Z"}
+        stale = {
+            "full_name": "o/stale",
+            "pushed_at": "2022-01-01T00:00:00Z",
+            "stargazers_count": 5000,
+            "open_issues_count": 300,
+        }
+
+        assert repo_value(active, SINCE) > repo_value(stale, SINCE)
+
+    def test_activity_halves_every_90_days(self) -> None:
+        """Test the decay for repos last pushed before the window."""
+        in_window = repo_value({"pushed_at": "2024-02-01T00:00:00Z"}, SINCE)
+        before = repo_value({"pushed_at": "2023-10-03T00:00:00Z"}, SINCE)
+
+        assert before == pytest.approx(in_window / 2)
+
+    def test_naive_since_is_treated_as_utc(self) -> None:
+        """Test that a naive window start compares against aware push times."""
+        repo = {"pushed_at": "2023-10-03T00:00:00Z"}
+        naive = SINCE.replace(tzinfo=None)
+
+        assert repo_value(repo, naive) == repo_value(repo, SINCE)
+
+    def test_order_by_value(self) -> None:
+        """Test descending order with ties kept in discovery order."""
+        repos = [
+            {"full_name": "o/a", "pushed_at": "2024-03-01T00:00:00Z"},
+            {"full_name": "o/b", "pushed_at": "2024-03-01T00:00:00Z", "open_issues_count": 40},
+            {"full_name": "o/c"},
+            {"full_name": "o/d", "pushed_at": "2024-04-01T00:00:00Z"},
+        ]
+
+        ordered = [repo["full_name"] for repo in order_by_value(repos, SINCE)]
+
+        assert ordered == ["o/b", "o/a", "o/d", "o/c"]
+
+
+class TestRunBudget:
+    """Tests for RunBudget."""
+
+    def test_unbounded_never_exhausts(self) -> None:
+        """Test that an unbounded budget allows every phase."""
+        budget = make_budget()
+        spend(budget, 10_000)
+
+        assert not budget.bounded
+        assert not budget.exhausted()
+        assert budget.allows("hygiene")
+
+    def test_request_budget_drops_phases_by_tier(self) -> None:
+        """Test that hygiene, then comments, then everything stops."""
+        budget = make_budget(max_requests=100)
+
+        spend(budget, 75)
+        assert not budget.allows("hygiene")
+        assert budget.allows("comments")
+
+        spend(budget, 15)
+        assert not budget.allows("comments")
+        assert budget.allows("issues")
+
+        spend(budget, 10)
+        assert budget.exhausted()
+        assert not budget.allows("pulls")
+        assert budget.stop_reason == "request_budget"
+
+    def test_deadline(self) -> None:
+        """Test that passing the deadline exhausts the budget."""
+        budget = make_budget(deadline_seconds=60)
+
+        with patch("gh_year_end.collect.deadline.time.monotonic", return_value=budget.started + 61):
+            assert budget.exhausted()
+
+        assert budget.stop_reason == "deadline"
+
+
+class TestCoverageTracker:
+    """Tests for CoverageTracker."""
+
+    def test_partial_run(self) -> None:
+        """Test the coverage summary of a run cut short."""
+        budget = make_budget(max_requests=10)
+        repos = [{"full_name": "o/a"}, {"full_name": "o/b"}, {"full_name": "o/c"}]
+        coverage = CoverageTracker(repos, budget)
+        coverage.record("o/a", "pulls", COMPLETE)
+        coverage.record("o/a", "hygiene", SKIPPED)
+        coverage.record("o/b", "pulls", PARTIAL)
+        spend(budget, 10)
+        budget.exhausted()
+
+        summary = coverage.to_dict()
+
+        assert summary["complete"] is False
+        assert summary["stop_reason"] == "request_budget"
+        assert summary["bound"] == {"deadline_seconds": None, "max_requests": 10}
+        assert summary["requests_made"] == 10
+        assert summary["repos_started"] == 2
+        assert summary["repos_not_started"] == ["o/c"]
+        assert summary["phases"]["pulls"] == {COMPLETE: 1, PARTIAL: 1, SKIPPED: 0}
+        assert summary["repos"]["o/a"] == {"pulls": COMPLETE, "hygiene": SKIPPED}
+
+    def test_complete_run(self) -> None:
+        """Test that a run visiting every repo fully is complete."""
+        budget = make_budget(max_requests=10)
+        coverage = CoverageTracker([{"full_name": "o/a"}], budget)
+        coverage.record("o/a", "pulls", COMPLETE)
+
+        assert coverage.to_dict()["complete"] is True
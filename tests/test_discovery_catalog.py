@@ -0,0 +1,240 @@
+"""Tests for the persisted discovery catalog and incremental refresh."""
+
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from gh_year_end.collect.discovery import _fetch_pushed_since, discover_repos
+from gh_year_end.collect.discovery_catalog import DiscoveryCatalog
+from gh_year_end.collect.repo_store import RepoStore
+from gh_year_end.config import Config
+from gh_year_end.github.http import GitHubClient, GitHubResponse
+from gh_year_end.storage.paths import PathManager
+
+DAY = 86400
+TARGET = "org:org@token-a"
+
+
+def repo(id_: int, pushed_at: str, **fields: Any) -> dict[str, Any]:
+    """Raw list-endpoint repo."""
+    return {
+        "id": id_,
+        "name": f"repo{id_}",
+        "full_name": f"org/repo{id_}",
+        "fork": False,
+        "archived": False,
+        "pushed_at": pushed_at,
+        **fields,
+    }
+
+
+def make_client(fingerprint: str = "token-a") -> AsyncMock:
+    """Mock client authenticated with the token digested as ``fingerprint``."""
+    client = AsyncMock(spec=GitHubClient)
+    client.auth_fingerprint = fingerprint
+    return client
+
+
+def page(*repos: dict[str, Any]) -> GitHubResponse:
+    """Successful list page."""
+    return GitHubResponse(status_code=200, data=list(repos), headers=MagicMock())
+
+
+def make_config(tmp_path: Path, year: int = 2024, **catalog: Any) -> Config:
+    """Org config storing data under ``tmp_path``."""
+    return Config.model_validate(
+        {
+            "github": {
+                "target": {"mode": "org", "name": "org"},
+                "discovery": {"catalog": {"enabled": True, **catalog}},
+                "windows": {"year": year},
+            },
+            "storage": {"root": str(tmp_path / "data")},
+        }
+    )
+
+
+SEED = [repo(1, "2024-03-01T00:00:00Z"), repo(2, "2024-05-01T00:00:00Z")]
+
+
+async def seed(config: Config) -> PathManager:
+    """Run a first discovery listing SEED."""
+    paths = PathManager(config)
+    paths.ensure_directories()
+    client = make_client()
+    client.get.side_effect = [page(*SEED), page()]
+    await discover_repos(config, client, paths)
+    return paths
+
+
+def age_catalog(paths: PathManager, seconds: float) -> None:
+    """Move the catalog's refresh timestamps into the past."""
+    catalog = DiscoveryCatalog(paths.discovery_catalog_path, TARGET).load()
+    catalog.refreshed_at -= seconds
+    catalog.full_at -= seconds
+    catalog._dirty = True
+    catalog.save()
+
+
+class TestDiscoveryCatalog:
+    """Tests for DiscoveryCatalog persistence."""
+
+    def test_round_trip_and_watermark(self, tmp_path: Path) -> None:
+        """Test saving, loading, merging, and the pushed_at watermark."""
+        path = tmp_path / "catalog.json"
+        catalog = DiscoveryCatalog(path, "org:org")
+        catalog.replace(SEED, "list")
+        catalog.save()
+
+        loaded = DiscoveryCatalog(path, "org:org").load()
+        assert loaded.repos() == SEED
+        assert loaded.watermark == "2024-05-01T00:00:00Z"
+        assert not loaded.needs_full_refresh("list", 7)
+        assert loaded.needs_full_refresh("search", 7)
+
+        added = loaded.merge([repo(1, "2024-06-01T00:00:00Z"), repo(3, "2024-06-02T00:00:00Z")])
+        assert added == 1
+        assert [r["id"] for r in loaded.repos()] == [1, 2, 3]
+        assert loaded.watermark == "2024-06-02T00:00:00Z"
+
+    def test_other_target_and_corrupt_files_are_ignored(self, tmp_path: Path) -> None:
+        """Test that a catalog for another target or a corrupt file is empty."""
+        path = tmp_path / "catalog.json"
+        catalog = DiscoveryCatalog(path, "org:org")
+        catalog.replace(SEED, "list")
+        catalog.save()
+
+        assert len(DiscoveryCatalog(path, "user:org").load()) == 0
+
+        path.write_text("{not json")
+        assert len(DiscoveryCatalog(path, "org:org").load()) == 0
+
+
+class TestFetchPushedSince:
+    """Tests for the watermark-bounded listing."""
+
+    @pytest.mark.asyncio
+    async def test_stops_at_watermark(self) -> None:
+        """Test that listing stops on the first page reaching the watermark."""
+        client = make_client()
+        full_page = [repo(i, "2024-09-01T00:00:00Z") for i in range(100)]
+        client.get.side_effect = [
+            page(*full_page),
+            page(
+                repo(200, "2024-08-01T00:00:00Z"),
+                *[repo(i, "2024-01-01T00:00:00Z") for i in range(300, 399)],
+            ),
+            page(repo(500, "2023-01-01T00:00:00Z")),
+        ]
+
+        repos, pages = await _fetch_pushed_since(client, "org", "org", "2024-06-01T00:00:00Z")
+
+        assert pages == 2
+        assert len(repos) == 200
+        assert client.get.call_args_list[0].kwargs["params"] == {
+            "page": 1,
+            "sort": "pushed",
+            "direction": "desc",
+            "per_page": 100,
+        }
+
+
+class TestCatalogDiscovery:
+    """Tests for discover_repos served from the catalog."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_catalog_costs_nothing(self, tmp_path: Path) -> None:
+        """Test that another year right after a run reuses the catalog."""
+        paths = await seed(make_config(tmp_path))
+        config = make_config(tmp_path, year=2023)
+        client = make_client()
+
+        metadata = await discover_repos(config, client, PathManager(config))
+
+        client.get.assert_not_called()
+        assert [r["id"] for r in metadata] == [1, 2]
+        assert paths.discovery_catalog_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh(self, tmp_path: Path) -> None:
+        """Test one pushed-order request, merged repos, and local filters."""
+        config = make_config(tmp_path)
+        paths = await seed(config)
+        age_catalog(paths, 3600)
+        client = make_client()
+        client.get.side_effect = [
+            page(
+                repo(3, "2024-07-01T00:00:00Z"),
+                repo(2, "2024-06-01T00:00:00Z", archived=True),
+                repo(1, "2024-03-01T00:00:00Z"),
+            )
+        ]
+
+        metadata = await discover_repos(config, client, paths)
+
+        assert client.get.call_count == 1
+        assert client.get.call_args.kwargs["params"]["sort"] == "pushed"
+        # repo2 was archived since the last run and is filtered out locally
+        assert [r["id"] for r in metadata] == [1, 3]
+        catalog = DiscoveryCatalog(paths.discovery_catalog_path, TARGET).load()
+        assert len(catalog) == 3
+        assert time.time() - catalog.refreshed_at < 60
+
+    @pytest.mark.asyncio
+    async def test_full_refresh_when_old(self, tmp_path: Path) -> None:
+        """Test that an old catalog is re-listed, dropping deleted repos."""
+        config = make_config(tmp_path)
+        paths = await seed(config)
+        age_catalog(paths, 8 * DAY)
+        client = make_client()
+        client.get.side_effect = [page(SEED[1]), page()]
+
+        metadata = await discover_repos(config, client, paths)
+
+        assert client.get.call_args_list[0].kwargs["params"]["sort"] == "created"
+        assert [r["id"] for r in metadata] == [2]
+
+    @pytest.mark.asyncio
+    async def test_catalog_of_another_token_is_not_reused(self, tmp_path: Path) -> None:
+        """Test that a listing made with another token's permissions is re-listed."""
+        config = make_config(tmp_path)
+        paths = await seed(config)
+        client = make_client("token-b")
+        client.get.side_effect = [page(SEED[0]), page()]
+
+        metadata = await discover_repos(config, client, paths)
+
+        assert client.get.call_count == 2
+        assert [r["id"] for r in metadata] == [1]
+
+    @pytest.mark.asyncio
+    async def test_store_only_receives_repos_listed_this_run(self, tmp_path: Path) -> None:
+        """Test that catalog entries from earlier runs do not seed the repo store."""
+        config = make_config(tmp_path)
+        paths = await seed(config)
+        age_catalog(paths, 3600)
+        client = make_client()
+        client.get.side_effect = [page(repo(2, "2024-06-01T00:00:00Z"))]
+        store = RepoStore()
+
+        await discover_repos(config, client, paths, store=store)
+
+        assert "org/repo2" in store
+        assert "org/repo1" not in store
+
+    @pytest.mark.asyncio
+    async def test_disabled_catalog_lists_everything(self, tmp_path: Path) -> None:
+        """Test that a disabled catalog neither reads nor writes the cache."""
+        config = make_config(tmp_path, enabled=False)
+        paths = PathManager(config)
+        paths.ensure_directories()
+        client = make_client()
+        client.get.side_effect = [page(*SEED), page()]
+
+        await discover_repos(config, client, paths)
+
+        assert client.get.call_count == 2
+        assert not paths.discovery_catalog_path.exists()
@@ -0,0 +1,198 @@
+"""Tests for contributor profile enrichment and its persistent cache."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from gh_year_end.collect.enrichment import (
+    UserProfileCache,
+    apply_user_profiles,
+    contributor_logins,
+    enrich_contributors,
+)
+from gh_year_end.github.graphql import GraphQLError
+from gh_year_end.github.http import GitHubHTTPError, RateLimitExceeded
+
+
+class FakeClock:
+    """Controllable epoch-seconds clock."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeGraphQL:
+    """Records batched user lookups and serves canned profiles."""
+
+    def __init__(self, fail_on: str | None = None, error: Exception | None = None) -> None:
+        self.batches: list[list[str]] = []
+        self.fail_on = fail_on
+        self.error = error or GraphQLError([{"message": "HTTP 502"}])
+
+    async def query_users(self, logins: list[str]) -> dict[str, dict[str, Any] | None]:
+        self.batches.append(list(logins))
+        if self.fail_on in logins:
+            raise self.error
+        return {
+            login: None if login == "ghost" else {"login": login, "name": login.title()}
+            for login in logins
+        }
+
+
+def _metrics() -> dict[str, Any]:
+    return {
+        "leaderboards": {
+            "prs_opened": [
+                {"user": "alice", "count": 3, "avatar_url": "a.png"},
+                {"user": "bob", "count": 1, "avatar_url": ""},
+            ],
+            "reviews_submitted": [{"user": "ghost", "count": 2, "avatar_url": ""}],
+        },
+        "leaderboards_full": {"prs_opened": [{"user": "carol", "count": 1, "avatar_url": ""}]},
+        "awards": {"top_pr_author": {"user": "alice", "count": 3, "avatar_url": "a.png"}},
+    }
+
+
+class TestUserProfileCache:
+    """Tests for the on-disk TTL cache."""
+
+    def test_ttl_and_round_trip(self, tmp_path: Path) -> None:
+        """Test entries expire after the TTL and survive a save/load cycle."""
+        clock = FakeClock()
+        path = tmp_path / "cache" / "users.json"
+        cache = UserProfileCache(path, ttl_seconds=100, clock=clock).load()
+        cache.put({"alice": {"name": "Alice"}, "ghost": None})
+        cache.save()
+
+        reloaded = UserProfileCache(path, ttl_seconds=100, clock=clock).load()
+        assert reloaded.lookup(["alice", "ghost", "bob"]) == (
+            {"alice": {"name": "Alice"}, "ghost": None},
+            ["bob"],
+        )
+
+        clock.now += 100
+        assert reloaded.lookup(["alice"]) == ({}, ["alice"])
+        assert reloaded.lookup(["alice"], include_stale=True)[0] == {"alice": {"name": "Alice"}}
+
+    def test_save_keeps_newer_entries_from_other_runs(self, tmp_path: Path) -> None:
+        """Test concurrent runs sharing the cache do not drop each other's entries."""
+        clock = FakeClock()
+        path = tmp_path / "users.json"
+        first = UserProfileCache(path, ttl_seconds=100, clock=clock).load()
+        second = UserProfileCache(path, ttl_seconds=100, clock=clock).load()
+
+        first.put({"alice": {"name": "Old"}})
+        clock.now += 1
+        second.put({"alice": {"name": "New"}, "bob": {"name": "Bob"}})
+        second.save()
+        first.save()
+
+        merged = UserProfileCache(path, ttl_seconds=100, clock=clock).load()
+        assert merged.lookup(["alice", "bob"])[0] == {
+            "alice": {"name": "New"},
+            "bob": {"name": "Bob"},
+        }
+
+    def test_unreadable_or_foreign_cache_is_ignored(self, tmp_path: Path) -> None:
+        """Test corrupt files and unknown versions start an empty cache."""
+        path = tmp_path / "users.json"
+        path.write_text("{not json")
+        assert len(UserProfileCache(path, ttl_seconds=100).load()) == 0
+
+        path.write_text(json.dumps({"version": 99, "users": {"alice": {}}}))
+        assert len(UserProfileCache(path, ttl_seconds=100).load()) == 0
+
+
+class TestApplyProfiles:
+    """Tests for merging profiles into exported metrics."""
+
+    def test_logins_and_application(self) -> None:
+        """Test logins span all rankings and entries gain display names."""
+        metrics = _metrics()
+        assert contributor_logins(metrics) == ["alice", "bob", "ghost", "carol"]
+
+        updated = apply_user_profiles(
+            metrics,
+            {"alice": {"name": "Alice A."}, "bob": {"name": None, "avatarUrl": "b.png"}},
+        )
+
+        assert updated == 3
+        assert metrics["leaderboards"]["prs_opened"][0]["display_name"] == "Alice A."
+        assert metrics["leaderboards"]["prs_opened"][1] == {
+            "user": "bob",
+            "count": 1,
+            "avatar_url": "b.png",
+            "display_name": None,
+        }
+        assert metrics["awards"]["top_pr_author"]["display_name"] == "Alice A."
+        assert "display_name" not in metrics["leaderboards"]["reviews_submitted"][0]
+
+
+class TestEnrichContributors:
+    """Tests for the batched enrichment stage."""
+
+    @pytest.mark.asyncio
+    async def test_batches_and_reuses_cache(self, tmp_path: Path) -> None:
+        """Test misses are fetched in batches and repeat runs make no requests."""
+        path = tmp_path / "users.json"
+        client = FakeGraphQL()
+
+        stats = await enrich_contributors(
+            _metrics(), client, UserProfileCache(path, ttl_seconds=3600).load(), batch_size=3
+        )
+        assert client.batches == [["alice", "bob", "ghost"], ["carol"]]
+        assert stats["fetched"] == 4
+        assert stats["requests"] == 2
+
+        metrics = _metrics()
+        stats = await enrich_contributors(
+            metrics, client, UserProfileCache(path, ttl_seconds=3600).load(), batch_size=3
+        )
+        assert len(client.batches) == 2
+        assert stats["cached"] == 4
+        assert stats["requests"] == 0
+        assert metrics["leaderboards_full"]["prs_opened"][0]["display_name"] == "Carol"
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_are_not_cached(self, tmp_path: Path) -> None:
+        """Test a failing batch is skipped and retried on the next run."""
+        cache = UserProfileCache(tmp_path / "users.json", ttl_seconds=3600).load()
+
+        stats = await enrich_contributors(
+            _metrics(), FakeGraphQL(fail_on="carol"), cache, batch_size=3
+        )
+
+        assert stats["failed"] == 1
+        assert cache.lookup(["carol"]) == ({}, ["carol"])
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_leave_contributors_unenriched(self, tmp_path: Path) -> None:
+        """Test network errors are contained and rate limiting stops further batches."""
+        cache = UserProfileCache(tmp_path / "users.json", ttl_seconds=3600).load()
+        metrics = _metrics()
+
+        stats = await enrich_contributors(
+            metrics,
+            FakeGraphQL(fail_on="carol", error=GitHubHTTPError("Request timeout")),
+            cache,
+            batch_size=3,
+        )
+        assert stats["failed"] == 1
+        assert stats["fetched"] == 3
+
+        client = FakeGraphQL(fail_on="alice", error=RateLimitExceeded(datetime.now(UTC)))
+        stats = await enrich_contributors(
+            _metrics(),
+            client,
+            UserProfileCache(tmp_path / "other.json", ttl_seconds=3600).load(),
+            batch_size=1,
+        )
+        assert len(client.batches) == 1
+        assert stats["failed"] == 4
+        assert stats["entries_updated"] == 0
@@ -4,6 +4,9 @@ Tests GraphQL client initialization, query execution, pagination,
 error handling, and integration with rate limiter.
 """
 
+import json
+from datetime import UTC, datetime
+
 import httpx
 import pytest
 import respx
@@ -18,6 +21,9 @@ from gh_year_end.github.graphql import (
     USER_INFO_QUERY,
     GraphQLClient,
     GraphQLError,
+    build_pull_request_reviews_query,
+    build_repo_counts_query,
+    build_users_query,
 )
 from gh_year_end.github.http import GitHubClient
 from gh_year_end.github.ratelimit import AdaptiveRateLimiter
@@ -519,6 +525,155 @@ class TestGraphQLClientWithRateLimiter:
 class TestGraphQLClientPrebuiltQueries:
     """Tests for GraphQLClient prebuilt query methods."""
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_query_users_batches_and_tolerates_missing(self) -> None:
+        """Test batched user lookup maps aliases back and keeps partial data."""
+        route = respx.post("https://api.github.com/graphql").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "u0": {"login": "alice", "name": "Alice A.", "avatarUrl": "a.png"},
+                        "u1": None,
+                    },
+                    "errors": [
+                        {"type": "NOT_FOUND", "path": ["u1"], "message": "Could not resolve"}
+                    ],
+                },
+            )
+        )
+
+        auth = GitHubAuth(token=TEST_TOKEN)
+        async with GitHubClient(auth=auth) as http_client:
+            graphql = GraphQLClient(http_client)
+            users = await graphql.query_users(["alice", "ghost"])
+            assert await graphql.query_users([]) == {}
+
+        assert users == {
+            "alice": {"login": "alice", "name": "Alice A.", "avatarUrl": "a.png"},
+            "ghost": None,
+        }
+        assert route.call_count == 1
+        body = json.loads(route.calls[0].request.content)
+        assert body["variables"] == {"l0": "alice", "l1": "ghost"}
+        assert body["query"] == build_users_query(2)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_query_pull_request_reviews(self) -> None:
+        """Test batched review lookup returns REST-shaped reviews per PR."""
+        route = respx.post("https://api.github.com/graphql").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "repository": {
+                            "p0": {
+                                "reviews": {
+                                    "pageInfo": {"hasNextPage": False},
+                                    "nodes": [
+                                        {
+                                            "databaseId": 7,
+                                            "author": {
+                                                "__typename": "Bot",
+                                                "login": "ci",
+                                                "avatarUrl": "b.png",
+                                            },
+                                            "authorAssociation": "NONE",
+                                            "state": "APPROVED",
+                                            "body": None,
+                                            "submittedAt": "2024-03-01T00:00:00Z",
+                                            "url": "https://github.com/o/r/pull/1#r7",
+                                            "commit": {"oid": "abc"},
+                                        },
+                                        {"databaseId": 8, "author": None, "state": "COMMENTED"},
+                                    ],
+                                }
+                            },
+                            "p1": {"reviews": {"pageInfo": {"hasNextPage": True}, "nodes": []}},
+                            "p2": None,
+                        }
+                    },
+                    "errors": [
+                        {"type": "NOT_FOUND", "path": ["repository", "p2"], "message": "No PR"}
+                    ],
+                },
+            )
+        )
+
+        auth = GitHubAuth(token=TEST_TOKEN)
+        async with GitHubClient(auth=auth) as http_client:
+            graphql = GraphQLClient(http_client)
+            reviews = await graphql.query_pull_request_reviews("o", "r", [1, 2, 3])
+
+        assert reviews[2] is None
+        assert reviews[3] is None
+        first, deleted = reviews[1] or []
+        assert first["id"] == 7
+        assert first["user"] == {"login": "ci[bot]", "type": "Bot", "avatar_url": "b.png"}
+        assert first["state"] == "APPROVED"
+        assert first["submitted_at"] == "2024-03-01T00:00:00Z"
+        assert first["commit_id"] == "abc"
+        assert first["body"] == ""
+        assert deleted["user"] is None
+        body = json.loads(route.calls[0].request.content)
+        assert body["variables"] == {"owner": "o", "name": "r", "n0": 1, "n1": 2, "n2": 3}
+        assert body["query"] == build_pull_request_reviews_query(3)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_query_repo_counts(self) -> None:
+        """Test batched count lookup with window search strings and point cost."""
+        route = respx.post("https://api.github.com/graphql").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "rateLimit": {"cost": 1},
+                        "r0": {
+                            "pullRequests": {"totalCount": 250},
+                            "issues": {"totalCount": 40},
+                            "defaultBranchRef": {"target": {"history": {"totalCount": 120}}},
+                        },
+                        "p0": {"issueCount": 30},
+                        "i0": {"issueCount": 10},
+                        "r1": None,
+                        "p1": {"issueCount": 0},
+                        "i1": {"issueCount": 0},
+                    },
+                    "errors": [{"type": "NOT_FOUND", "path": ["r1"], "message": "No repo"}],
+                },
+            )
+        )
+
+        auth = GitHubAuth(token=TEST_TOKEN)
+        async with GitHubClient(auth=auth) as http_client:
+            graphql = GraphQLClient(http_client)
+            counts, cost = await graphql.query_repo_counts(
+                ["o/a", "o/gone"],
+                datetime(2024, 1, 1, tzinfo=UTC),
+                datetime(2025, 1, 1, tzinfo=UTC),
+            )
+
+        assert cost == 1
+        assert counts == {
+            "o/a": {
+                "pulls_total": 250,
+                "issues_total": 40,
+                "pulls_window": 30,
+                "issues_window": 10,
+                "commits_window": 120,
+            },
+            "o/gone": None,
+        }
+        body = json.loads(route.calls[0].request.content)
+        assert body["query"] == build_repo_counts_query(2)
+        assert body["variables"]["qp0"] == "repo:o/a is:pr created:2024-01-01..2024-12-31"
+        assert body["variables"]["qi1"] == "repo:o/gone is:issue created:2024-01-01..2024-12-31"
+        assert body["variables"]["o1"] == "o"
+        assert body["variables"]["n1"] == "gone"
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_query_repository_info(self) -> None:
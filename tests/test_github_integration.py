@@ -369,6 +369,46 @@ class TestRestClientPagination:
             assert pages[0][0][0]["name"] == "repo1"
             assert pages[1][0][0]["name"] == "repo2"
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_paginate_follows_next_link_query(self) -> None:
+        """Test the query string of the Link next URL is sent with the next request."""
+        requested: list[dict[str, str]] = []
+
+        def pages(request: httpx.Request) -> httpx.Response:
+            params = dict(request.url.params)
+            requested.append(params)
+            if params.get("page") == "2":
+                return httpx.Response(200, json=[{"id": 2, "name": "repo2"}])
+            return httpx.Response(
+                200,
+                json=[{"id": 1, "name": "repo1"}],
+                headers={
+                    "link": "<https://api.github.com/orgs/testorg/repos"
+                    '?type=all&per_page=100&sort=full_name&page=2>; rel="next"'
+                },
+            )
+
+        respx.get("https://api.github.com/orgs/testorg/repos").mock(side_effect=pages)
+
+        auth = GitHubAuth(token=TEST_TOKEN)
+        async with GitHubClient(auth=auth) as http_client:
+            rest = RestClient(http_client)
+
+            names = []
+            async for page_items, _metadata in rest.list_org_repos("testorg"):
+                names.extend(item["name"] for item in page_items)
+                if len(requested) > 2:
+                    break
+
+        assert names == ["repo1", "repo2"]
+        assert requested[1] == {
+            "type": "all",
+            "per_page": "100",
+            "sort": "full_name",
+            "page": "2",
+        }
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_list_user_repos(self) -> None:
@@ -126,12 +126,12 @@ class TestCollectRepoHygiene:
         assert stats["repos_errored"] == 0
         assert stats["files_checked"] > 0
 
-        # Verify REST client was called
+        # Verify REST client read the root tree without recursion
         mock_rest_client.get_repository_tree.assert_called_once_with(
             owner="org",
             repo="repo1",
             tree_sha="main",
-            recursive=True,
+            recursive=False,
         )
 
     @pytest.mark.asyncio
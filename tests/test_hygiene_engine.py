@@ -0,0 +1,247 @@
+"""Tests for the shared hygiene lookup engine and its tree cache."""
+
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from gh_year_end.collect.hygiene_engine import HygieneEngine, TreeCache, lookup_dirs
+from gh_year_end.config import RateLimitConfig
+from gh_year_end.github.planner import APIPlanner
+from gh_year_end.github.ratelimit import AdaptiveRateLimiter, APIType
+
+REPO = {"full_name": "org/repo", "default_branch": "main", "pushed_at": "2024-06-01T00:00:00Z"}
+PATHS = ["README.md", "SECURITY.md", ".github/CODEOWNERS"]
+PREFIXES = [".github/workflows/"]
+
+
+def rest_entry(path: str, type_: str = "blob", sha: str | None = None) -> dict[str, Any]:
+    """REST tree entry."""
+    return {"path": path, "type": type_, "sha": sha or f"{path}-sha", "size": 10}
+
+
+def make_rest_client(github_sha: str = "gh1", root_sha: str = "root1") -> MagicMock:
+    """REST client serving a root tree and a recursive .github subtree."""
+    trees = {
+        "main": {
+            "sha": root_sha,
+            "tree": [
+                rest_entry("README.md"),
+                rest_entry("src", "tree"),
+                rest_entry(".github", "tree", github_sha),
+            ],
+        },
+        github_sha: {
+            "sha": github_sha,
+            "tree": [
+                rest_entry("CODEOWNERS"),
+                rest_entry("workflows", "tree", "wf1"),
+                rest_entry("workflows/ci.yml"),
+            ],
+            "truncated": False,
+        },
+    }
+
+    async def get_tree(owner: str, repo: str, tree_sha: str, recursive: bool = True) -> Any:
+        return trees.get(tree_sha)
+
+    client = MagicMock()
+    client.get_repository_tree = AsyncMock(side_effect=get_tree)
+    return client
+
+
+def make_graphql_client() -> MagicMock:
+    """GraphQL client answering batched directory listings."""
+
+    def listing(oid: str, *entries: tuple[str, str]) -> dict[str, Any]:
+        return {
+            "oid": oid,
+            "entries": [
+                {"name": name, "type": type_, "oid": f"{name}-oid", "size": 5}
+                for name, type_ in entries
+            ],
+        }
+
+    client = MagicMock()
+    client.query_tree_entries = AsyncMock(
+        return_value={
+            "main:": listing("root1", ("README.md", "blob"), (".github", "tree")),
+            "main:.github": listing("gh1", ("CODEOWNERS", "blob"), ("workflows", "tree")),
+            "main:.github/workflows": listing("wf1", ("ci.yml", "blob")),
+        }
+    )
+    return client
+
+
+class TestLookupDirs:
+    """Tests for the directories a lookup lists."""
+
+    def test_parents_and_prefixes(self) -> None:
+        """Test root, path parents, and prefix directories."""
+        assert lookup_dirs(PATHS, PREFIXES) == ["", ".github", ".github/workflows"]
+        assert lookup_dirs([], ["docs/guide"]) == ["", "docs"]
+
+
+class TestLookupMethods:
+    """Tests for the GraphQL and tree lookups."""
+
+    @pytest.mark.asyncio
+    async def test_graphql_single_query(self) -> None:
+        """Test one batched query resolving paths and workflow files."""
+        graphql_client = make_graphql_client()
+        engine = HygieneEngine(graphql_client=graphql_client)
+
+        facts = await engine.lookup(REPO, PATHS, PREFIXES)
+
+        assert facts is not None
+        graphql_client.query_tree_entries.assert_awaited_once_with(
+            "org", "repo", ["main:", "main:.github", "main:.github/workflows"]
+        )
+        assert facts.requests == 1
+        assert facts.root_sha == "root1"
+        assert facts.exists("README.md")
+        assert facts.exists(".github/CODEOWNERS")
+        assert not facts.exists("SECURITY.md")
+        assert [path for path, _ in facts.files_under(".github/workflows/")] == [
+            ".github/workflows/ci.yml"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_tree_reads_root_and_github(self) -> None:
+        """Test a non-recursive root read plus one .github subtree read."""
+        rest_client = make_rest_client()
+        engine = HygieneEngine(rest_client=rest_client)
+
+        facts = await engine.lookup(REPO, PATHS, PREFIXES)
+
+        assert facts is not None
+        calls = [call.kwargs for call in rest_client.get_repository_tree.await_args_list]
+        assert calls == [
+            {"owner": "org", "repo": "repo", "tree_sha": "main", "recursive": False},
+            {"owner": "org", "repo": "repo", "tree_sha": "gh1", "recursive": True},
+        ]
+        assert facts.requests == 2
+        assert facts.entry(".github/CODEOWNERS") == {
+            "type": "blob",
+            "sha": "CODEOWNERS-sha",
+            "size": 10,
+        }
+        assert facts.names() == [".github", "README.md", "src"]
+        assert len(facts.files_under(".github/workflows/")) == 1
+        assert len(facts.responses) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_tree(self) -> None:
+        """Test that an empty repository has no facts."""
+        rest_client = MagicMock()
+        rest_client.get_repository_tree = AsyncMock(return_value=None)
+        engine = HygieneEngine(rest_client=rest_client)
+
+        assert await engine.lookup(REPO, PATHS) is None
+        assert await engine.lookup({**REPO, "default_branch": None}, PATHS) is None
+
+    @pytest.mark.asyncio
+    async def test_auto_follows_budget_headroom(self) -> None:
+        """Test that auto uses REST trees when GraphQL is exhausted."""
+        limiter = AdaptiveRateLimiter(RateLimitConfig())
+        for api_type, remaining in ((APIType.REST, 4000), (APIType.GRAPHQL, 0)):
+            state = limiter.get_state(api_type)
+            state.limit, state.remaining, state.reset_at = 5000, remaining, time.time() + 600
+        rest_client = make_rest_client()
+        graphql_client = make_graphql_client()
+        engine = HygieneEngine(
+            rest_client=rest_client,
+            graphql_client=graphql_client,
+            planner=APIPlanner(limiter),
+        )
+
+        facts = await engine.lookup(REPO, PATHS, PREFIXES)
+
+        assert facts is not None
+        assert facts.method == "tree"
+        graphql_client.query_tree_entries.assert_not_awaited()
+
+
+class TestTreeCache:
+    """Tests for lookups served from the tree cache."""
+
+    async def warm(self, tmp_path: Path) -> TreeCache:
+        cache = TreeCache(tmp_path / "trees.json").load()
+        await HygieneEngine(rest_client=make_rest_client(), cache=cache).lookup(
+            REPO, PATHS, PREFIXES
+        )
+        cache.save()
+        return TreeCache(tmp_path / "trees.json").load()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_push_costs_nothing(self, tmp_path: Path) -> None:
+        """Test that an unchanged pushed_at is served without requests."""
+        cache = await self.warm(tmp_path)
+        rest_client = make_rest_client()
+        engine = HygieneEngine(rest_client=rest_client, cache=cache)
+
+        facts = await engine.lookup(REPO, PATHS, PREFIXES)
+
+        assert facts is not None
+        assert facts.method == "cache"
+        assert facts.exists(".github/CODEOWNERS")
+        rest_client.get_repository_tree.assert_not_awaited()
+        assert engine.stats() == {"graphql": 0, "tree": 0, "cache": 1, "requests": 0}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_root_costs_one_request(self, tmp_path: Path) -> None:
+        """Test that a new push with the same root tree reads only the root."""
+        cache = await self.warm(tmp_path)
+        rest_client = make_rest_client()
+        engine = HygieneEngine(rest_client=rest_client, cache=cache)
+
+        facts = await engine.lookup({**REPO, "pushed_at": "2024-07-01T00:00:00Z"}, PATHS, PREFIXES)
+
+        assert facts is not None
+        assert facts.requests == 1
+        assert rest_client.get_repository_tree.await_count == 1
+        assert len(facts.files_under(".github/workflows/")) == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_subtree_is_reused(self, tmp_path: Path) -> None:
+        """Test that a changed root re-reads only subtrees whose SHA changed."""
+        cache = await self.warm(tmp_path)
+        rest_client = make_rest_client(root_sha="root2")
+        engine = HygieneEngine(rest_client=rest_client, cache=cache)
+
+        facts = await engine.lookup({**REPO, "pushed_at": "2024-07-01T00:00:00Z"}, PATHS, PREFIXES)
+
+        assert facts is not None
+        assert facts.root_sha == "root2"
+        assert facts.requests == 1
+        assert facts.exists(".github/CODEOWNERS")
+
+        changed = HygieneEngine(rest_client=make_rest_client("gh2", "root3"), cache=cache)
+        facts = await changed.lookup({**REPO, "pushed_at": "2024-08-01T00:00:00Z"}, PATHS)
+        assert facts is not None
+        assert facts.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_new_paths_are_fetched(self, tmp_path: Path) -> None:
+        """Test that directories missing from the cached lookup are read."""
+        cache = await self.warm(tmp_path)
+        rest_client = make_rest_client()
+        engine = HygieneEngine(rest_client=rest_client, cache=cache)
+
+        facts = await engine.lookup(REPO, [*PATHS, "src/README.md"], PREFIXES)
+
+        assert facts is not None
+        assert facts.method == "tree"
+        trees = [
+            call.kwargs["tree_sha"] for call in rest_client.get_repository_tree.await_args_list
+        ]
+        assert trees == ["main", "src-sha"]
+
+    def test_unreadable_cache_is_ignored(self, tmp_path: Path) -> None:
+        """Test that a corrupt cache file starts an empty cache."""
+        path = tmp_path / "trees.json"
+        path.write_text("{not json")
+
+        assert len(TreeCache(path).load()) == 0
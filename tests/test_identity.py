@@ -1,6 +1,10 @@
 """Tests for bot detection and identity resolution."""
 
-from gh_year_end.collect.identity import BotDetector
+import pickle
+
+from gh_year_end.collect.aggregator import MetricsAggregator
+from gh_year_end.collect.identity import BOT_PATTERNS, BotDetector, get_bot_detector
+from gh_year_end.config import IdentityConfig
 
 
 class TestBotDetector:
@@ -207,3 +211,96 @@ class TestBotDetector:
         result = detector.detect("other[bot]", "User")
         assert result.is_bot is True
         assert r".*\[bot\]$" in result.reason
+
+
+class TestUnifiedClassifier:
+    """Tests for the combined matcher, cache, and shared detector."""
+
+    def test_substring_patterns_are_case_insensitive(self) -> None:
+        """Test built-in substrings match anywhere in the login, in any case."""
+        detector = BotDetector(
+            exclude_patterns=[r"^dependabot$"],
+            include_overrides=[],
+            substring_patterns=BOT_PATTERNS,
+        )
+
+        assert detector.is_bot("GitHub-Actions", "User") is True
+        assert detector.is_bot("my-stale-helper", "User") is True
+        assert detector.is_bot("alice", "User") is False
+        assert detector.detect("GitHub-Actions", "User").reason == "contains: github-actions"
+        assert detector.detect("dependabot", "User").reason == "matches pattern: ^dependabot$"
+
+    def test_decisions_are_memoized(self) -> None:
+        """Test repeated lookups hit the bounded cache."""
+        detector = BotDetector(exclude_patterns=[r".*\[bot\]$"], include_overrides=[], cache_size=2)
+
+        for _ in range(3):
+            detector.is_bot("alice", "User")
+        detector.is_bot("bob", "User")
+        detector.is_bot("carol", "User")
+
+        info = detector.cache_info()
+        assert info.hits == 2
+        assert info.misses == 3
+        assert info.currsize == 2
+
+    def test_inline_flag_patterns_fall_back_to_individual_matching(self) -> None:
+        """Test patterns that cannot be combined still classify correctly."""
+        detector = BotDetector(
+            exclude_patterns=[r"(?i)^release-", r"^ci$"],
+            include_overrides=[],
+            substring_patterns=["[bot]"],
+        )
+
+        assert detector.is_bot("Release-Manager", "User") is True
+        assert detector.is_bot("ci", "User") is True
+        assert detector.is_bot("Foo[BOT]", "User") is True
+        assert detector.is_bot("alice", "User") is False
+
+    def test_patterns_with_backreferences_match_on_their_own(self) -> None:
+        """Test that group numbers in a pattern are not shifted by combining."""
+        detector = BotDetector(
+            exclude_patterns=[r"^(ci|cd)-runner$", r"^(\w+)-\1$", r"^(?P<name>\w+)-mirror$"],
+            include_overrides=[],
+            substring_patterns=["[bot]"],
+        )
+
+        assert detector.is_bot("sync-sync", "User") is True
+        assert detector.is_bot("docs-mirror", "User") is True
+        assert detector.is_bot("cd-runner", "User") is True
+        assert detector.is_bot("Foo[BOT]", "User") is True
+        assert detector.is_bot("sync-docs", "User") is False
+        assert detector.is_bot("alice", "User") is False
+
+    def test_pickle_round_trip(self) -> None:
+        """Test detectors pickle by configuration."""
+        detector = BotDetector([r"^ci$"], ["keep[bot]"], substring_patterns=["[bot]"])
+        restored = pickle.loads(pickle.dumps(detector))
+
+        assert restored.is_bot("ci", "User") is True
+        assert restored.is_bot("keep[bot]", "Bot") is False
+        assert restored.is_bot("other[bot]", "User") is True
+
+    def test_shared_detector_per_configuration(self) -> None:
+        """Test identical configurations share one detector instance."""
+        config = IdentityConfig.model_validate({"bots": {"include_overrides": ["stale-tracker"]}})
+
+        assert get_bot_detector(config) is get_bot_detector(config.model_copy(deep=True))
+        assert get_bot_detector(config) is not get_bot_detector()
+        assert get_bot_detector(config).is_bot("stale-tracker", "User") is False
+        assert get_bot_detector().is_bot("stale-tracker", "User") is True
+
+    def test_aggregator_honours_identity_config(self) -> None:
+        """Test the aggregator applies configured patterns and overrides."""
+        identity = IdentityConfig.model_validate(
+            {"bots": {"exclude_patterns": [r"^ci-"], "include_overrides": ["renovate-fan"]}}
+        )
+        agg = MetricsAggregator(
+            year=2024, target_name="test", bot_detector=get_bot_detector(identity)
+        )
+        agg.add_repo({"full_name": "o/r", "name": "r"})
+        for login in ("ci-runner", "renovate-fan", "alice"):
+            agg.add_pr("o/r", {"user": {"login": login}, "created_at": "2024-03-01T00:00:00Z"})
+
+        assert dict(agg.leaderboards["prs_opened"]) == {"renovate-fan": 1, "alice": 1}
+        assert agg.users["ci-runner"]["is_bot"] is True
@@ -0,0 +1,537 @@
+"""Tests for the DuckDB metrics engine and raw data replay."""
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from gh_year_end.collect.aggregator import MetricsAggregator
+from gh_year_end.config import Config
+from gh_year_end.metrics import (
+    DuckDBMetricsEngine,
+    MetricsEngineError,
+    compute_metrics,
+    expand_timeseries,
+    load_raw_repos,
+    replay_raw_data,
+)
+from gh_year_end.storage.paths import PathManager
+
+LOGINS = ["alice", "bob", "carol", "dave", "erin", "dependabot[bot]", "ci-bot-runner"]
+
+
+def _write_raw(path: Path, records: list[tuple[str, dict[str, Any]]]) -> None:
+    """Write (endpoint, data) pairs as enveloped JSONL records."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        for endpoint, data in records:
+            envelope = {
+                "timestamp": "2025-06-01T00:00:00+00:00",
+                "source": "github_rest",
+                "endpoint": endpoint,
+                "request_id": "00000000-0000-0000-0000-000000000000",
+                "page": 1,
+                "data": data,
+            }
+            f.write(json.dumps(envelope) + "\n")
+
+
+def _user(rng: random.Random) -> dict[str, Any]:
+    login = rng.choice(LOGINS)
+    return {
+        "login": login,
+        "type": "Bot" if login.endswith("[bot]") else "User",
+        "avatar_url": f"https://avatars.example.com/{login}",
+    }
+
+
+def _timestamp(rng: random.Random, year: int) -> str:
+    month = rng.randint(1, 12)
+    day = rng.randint(1, 28)
+    return f"{year}-{month:02d}-{day:02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00Z"
+
+
+def _build_raw_dataset(paths: PathManager, seed: int = 7) -> None:
+    """Create a deterministic raw dataset with bots, ties, and out-of-window items."""
+    rng = random.Random(seed)
+    repos = [
+        {"full_name": "test-org/alpha", "name": "alpha", "default_branch": "main"},
+        {"full_name": "test-org/beta", "name": "beta", "default_branch": "main"},
+        {"full_name": "test-org/empty", "name": "empty", "default_branch": "main"},
+    ]
+    # Duplicate discovery record (discovery appends on re-run)
+    _write_raw(
+        paths.repos_raw_path,
+        [(f"/repos/{r['full_name']}", r) for r in [*repos, repos[0]]],
+    )
+
+    for repo in repos[:2]:
+        name = repo["full_name"]
+        pulls, reviews, review_comments = [], [], []
+        for number in range(1, 40):
+            year = rng.choice([2024, 2025, 2025, 2025])
+            created = _timestamp(rng, year)
+            pr: dict[str, Any] = {
+                "number": number,
+                "title": f"PR {number}",
+                "html_url": f"https://github.com/{name}/pull/{number}",
+                "user": _user(rng),
+                "created_at": created,
+                "merged_at": None,
+                "state": "closed",
+            }
+            if rng.random() < 0.6:
+                pr["merged_at"] = created[:11] + "23:59:00Z"
+                pr["additions"] = rng.randint(0, 400)
+                pr["deletions"] = rng.randint(0, 50)
+            pulls.append((f"/repos/{name}/pulls/{number}", pr))
+            for _ in range(rng.randint(0, 3)):
+                reviews.append(
+                    (
+                        f"/repos/{name}/pulls/{number}/reviews",
+                        {
+                            "user": _user(rng),
+                            "state": rng.choice(["APPROVED", "COMMENTED", "changes_requested"]),
+                            "submitted_at": created[:11] + "23:00:00Z",
+                        },
+                    )
+                )
+            for _ in range(rng.randint(0, 2)):
+                review_comments.append(
+                    (
+                        f"/repos/{name}/pulls/{number}/comments",
+                        {"user": _user(rng), "created_at": _timestamp(rng, 2025)},
+                    )
+                )
+        # Review for a PR that is not in the window must be ignored
+        reviews.append(
+            (f"/repos/{name}/pulls/999/reviews", {"user": _user(rng), "state": "APPROVED"})
+        )
+
+        issues, issue_comments = [], []
+        for number in range(100, 130):
+            issue: dict[str, Any] = {
+                "number": number,
+                "user": _user(rng),
+                "created_at": _timestamp(rng, rng.choice([2024, 2025])),
+                "state": rng.choice(["open", "closed"]),
+                "closed_at": _timestamp(rng, 2025),
+            }
+            if number % 7 == 0:
+                issue["pull_request"] = {"url": "https://example.com"}
+            issues.append((f"/repos/{name}/issues/{number}", issue))
+            for _ in range(rng.randint(0, 3)):
+                issue_comments.append(
+                    (
+                        f"/repos/{name}/issues/{number}/comments",
+                        {"user": _user(rng), "created_at": _timestamp(rng, 2025)},
+                    )
+                )
+
+        _write_raw(paths.pulls_raw_path(name), pulls)
+        _write_raw(paths.reviews_raw_path(name), reviews)
+        _write_raw(paths.review_comments_raw_path(name), review_comments)
+        _write_raw(paths.issues_raw_path(name), issues)
+        _write_raw(paths.issue_comments_raw_path(name), issue_comments)
+
+    # Contributor stats for alpha (weeks spanning the year boundary), history for beta
+    first_week = 1735430400  # 2024-12-29, a Sunday
+    stats = [
+        {
+            "author": _user(rng),
+            "weeks": [
+                {
+                    "w": first_week + week * 7 * 86400,
+                    "a": rng.choice([0, rng.randint(1, 300)]),
+                    "d": rng.randint(0, 40),
+                    "c": rng.choice([0, 0, rng.randint(1, 9)]),
+                }
+                for week in range(0, 60, rng.randint(1, 4))
+            ],
+        }
+        for _ in range(6)
+    ]
+    _write_raw(
+        paths.contributor_stats_raw_path("test-org/alpha"),
+        [("/repos/test-org/alpha/stats/contributors", contributor) for contributor in stats],
+    )
+    _write_raw(
+        paths.commits_raw_path("test-org/beta"),
+        [
+            (
+                "/repos/test-org/beta/commits",
+                {
+                    "author": _user(rng),
+                    "commit": {"author": {"date": _timestamp(rng, rng.choice([2024, 2025]))}},
+                },
+            )
+            for _ in range(25)
+        ],
+    )
+
+    _write_raw(
+        paths.hygiene_raw_path,
+        [("hygiene", {"repo": "test-org/alpha", "score": 55, "has_readme": True})],
+    )
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> Config:
+    """Create a test configuration rooted in a temp directory."""
+    return Config.model_validate(
+        {
+            "github": {
+                "target": {"mode": "org", "name": "test-org"},
+                "windows": {"year": 2025},
+            },
+            "storage": {"root": str(tmp_path / "data")},
+            "collection": {"commits": {"contributor_stats": True}},
+            "report": {"output_dir": str(tmp_path / "site")},
+        }
+    )
+
+
+@pytest.fixture
+def paths(config: Config) -> PathManager:
+    """Create a path manager with a populated raw dataset."""
+    path_manager = PathManager(config)
+    _build_raw_dataset(path_manager)
+    return path_manager
+
+
+def _python_export(config: Config, paths: PathManager) -> dict[str, Any]:
+    aggregator = MetricsAggregator.from_config(config)
+    replay_raw_data(aggregator, config, paths)
+    return aggregator.export()
+
+
+class TestReplay:
+    """Tests for replaying raw JSONL through the aggregator."""
+
+    def test_load_raw_repos_deduplicates(self, paths: PathManager) -> None:
+        """Test that repeated discovery records are collapsed."""
+        repos = load_raw_repos(paths)
+        assert [r["full_name"] for r in repos] == [
+            "test-org/alpha",
+            "test-org/beta",
+            "test-org/empty",
+        ]
+
+    def test_replay_applies_window_and_skips_pull_requests(
+        self, config: Config, paths: PathManager
+    ) -> None:
+        """Test that replay keeps only in-window items and ignores PR-shaped issues."""
+        metrics = _python_export(config, paths)
+
+        assert metrics["summary"]["total_repos"] == 3
+        assert metrics["summary"]["total_prs"] > 0
+        for entries in metrics["timeseries"]["weekly"].values():
+            assert all(e["period"].startswith("2025") for e in entries)
+        assert metrics["hygiene_scores"]["test-org/alpha"]["score"] == 55
+
+    def test_replay_missing_raw_data(self, config: Config) -> None:
+        """Test that replay with no raw data produces empty metrics."""
+        metrics = _python_export(config, PathManager(config))
+        assert metrics["summary"]["total_repos"] == 0
+        assert metrics["repo_health"] == []
+
+
+class TestDuckDBMetricsEngine:
+    """Tests for DuckDB engine parity with MetricsAggregator."""
+
+    def test_export_matches_aggregator(self, config: Config, paths: PathManager) -> None:
+        """Test that DuckDB output is byte-identical to the Python aggregator."""
+        expected = _python_export(config, paths)
+        actual = DuckDBMetricsEngine(config, paths).export()
+
+        assert json.dumps(actual) == json.dumps(expected)
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_export_matches_aggregator_various_datasets(self, tmp_path: Path, seed: int) -> None:
+        """Test parity across several generated datasets with multiple threads."""
+        config = Config.model_validate(
+            {
+                "github": {
+                    "target": {"mode": "user", "name": f"user-{seed}"},
+                    "windows": {"year": 2025},
+                },
+                "storage": {"root": str(tmp_path / "data")},
+                "collection": {"commits": {"contributor_stats": True}},
+                "metrics": {"engine": "duckdb", "threads": 4},
+            }
+        )
+        path_manager = PathManager(config)
+        _build_raw_dataset(path_manager, seed=seed)
+
+        expected = _python_export(config, path_manager)
+        actual = DuckDBMetricsEngine(config, path_manager).export()
+
+        assert json.dumps(actual) == json.dumps(expected)
+
+    def test_export_respects_disabled_collectors(self, tmp_path: Path) -> None:
+        """Test parity when reviews and comments are disabled."""
+        config = Config.model_validate(
+            {
+                "github": {
+                    "target": {"mode": "org", "name": "test-org"},
+                    "windows": {"year": 2025},
+                },
+                "storage": {"root": str(tmp_path / "data")},
+                "collection": {
+                    "enable": {"reviews": False, "comments": False},
+                    "commits": {"contributor_stats": True},
+                },
+            }
+        )
+        path_manager = PathManager(config)
+        _build_raw_dataset(path_manager)
+
+        actual = DuckDBMetricsEngine(config, path_manager).export()
+
+        assert actual == _python_export(config, path_manager)
+        assert actual["summary"]["total_reviews"] == 0
+        assert actual["summary"]["total_comments"] == 0
+
+    def test_export_with_no_raw_data(self, config: Config) -> None:
+        """Test that an empty raw directory matches an empty aggregator."""
+        path_manager = PathManager(config)
+        actual = DuckDBMetricsEngine(config, path_manager).export()
+
+        assert json.dumps(actual) == json.dumps(_python_export(config, path_manager))
+
+
+class TestComputeMetrics:
+    """Tests for config-driven engine selection."""
+
+    def test_default_engine_is_python(self, config: Config) -> None:
+        """Test that the Python aggregator is the default engine."""
+        assert config.metrics.engine == "python"
+
+    def test_engines_agree(self, config: Config, paths: PathManager) -> None:
+        """Test that both configured engines produce the same metrics."""
+        python_metrics = compute_metrics(config, paths)
+        duckdb_config = config.model_copy(
+            update={"metrics": config.metrics.model_copy(update={"engine": "duckdb"})}
+        )
+        duckdb_metrics = compute_metrics(duckdb_config, PathManager(duckdb_config))
+
+        assert duckdb_metrics == python_metrics
+
+    @pytest.mark.parametrize("engine", ["python", "duckdb"])
+    def test_sampled_raw_data_rejected(
+        self, config: Config, paths: PathManager, engine: str
+    ) -> None:
+        """Test that raw data from a sampled collection is not rebuilt."""
+        paths.sampling_marker_path.write_text("{}")
+        engine_config = config.model_copy(
+            update={"metrics": config.metrics.model_copy(update={"engine": engine})}
+        )
+
+        with pytest.raises(MetricsEngineError, match="sampling"):
+            compute_metrics(engine_config, paths)
+
+    def test_invalid_engine_rejected(self) -> None:
+        """Test that unknown engine names fail validation."""
+        with pytest.raises(ValueError):
+            Config.model_validate(
+                {
+                    "github": {
+                        "target": {"mode": "org", "name": "test-org"},
+                        "windows": {"year": 2025},
+                    },
+                    "metrics": {"engine": "spark"},
+                }
+            )
+
+
+class TestParallelReplay:
+    """Tests for multi-process replay and aggregator merging."""
+
+    def test_parallel_replay_matches_sequential(self, config: Config, paths: PathManager) -> None:
+        """Test that merging per-repo partial aggregators matches a sequential replay."""
+        expected = _python_export(config, paths)
+
+        aggregator = MetricsAggregator(
+            year=config.github.windows.year,
+            target_name=config.github.target.name,
+            target_mode=config.github.target.mode,
+        )
+        replayed = replay_raw_data(aggregator, config, paths, workers=2)
+
+        assert replayed == 3
+        assert json.dumps(aggregator.export()) == json.dumps(expected)
+
+    def test_merge_combines_overlapping_state(self) -> None:
+        """Test that merge sums counters and unions contributor sets."""
+        first = MetricsAggregator(year=2025, target_name="test-org", target_mode="org")
+        second = MetricsAggregator(year=2025, target_name="test-org", target_mode="org")
+        pr = {
+            "number": 1,
+            "user": {"login": "alice", "type": "User"},
+            "created_at": "2025-03-01T10:00:00Z",
+            "merged_at": None,
+        }
+        for aggregator in (first, second):
+            aggregator.add_repo({"full_name": "test-org/alpha", "name": "alpha"})
+        first.add_pr("test-org/alpha", pr)
+        second.add_pr("test-org/alpha", {**pr, "number": 2})
+
+        first.merge(second)
+        metrics = first.export()
+
+        assert metrics["summary"]["total_prs"] == 2
+        assert metrics["summary"]["total_contributors"] == 1
+        assert metrics["repo_health"][0]["pr_count"] == 2
+
+
+def _sorted_entries(series: dict[str, list[dict[str, Any]]]) -> dict[str, list[tuple]]:
+    return {
+        metric: sorted((e["period"], e["user"], e["count"]) for e in entries)
+        for metric, entries in series.items()
+    }
+
+
+class TestColumnarTimeseries:
+    """Tests for the compact timeseries layout from both engines."""
+
+    def test_aggregator_columnar_export(self, tmp_path: Path) -> None:
+        """Test the aggregator's columnar export expands to its legacy export."""
+        config = Config.model_validate(
+            {
+                "github": {
+                    "target": {"mode": "org", "name": "test-org"},
+                    "windows": {"year": 2025},
+                },
+                "storage": {"root": str(tmp_path / "data")},
+                "collection": {"commits": {"contributor_stats": True}},
+            }
+        )
+        paths = PathManager(config)
+        _build_raw_dataset(paths)
+        legacy = _python_export(config, paths)["timeseries"]
+
+        columnar_config = config.model_copy(
+            update={"metrics": config.metrics.model_copy(update={"timeseries_layout": "columnar"})}
+        )
+        columnar = _python_export(columnar_config, paths)["timeseries"]
+
+        assert columnar["layout"] == "columnar"
+        assert len(json.dumps(columnar)) < len(json.dumps(legacy))
+        expanded = expand_timeseries(columnar)
+        for granularity in ("weekly", "monthly"):
+            assert _sorted_entries(expanded[granularity]) == _sorted_entries(legacy[granularity])
+
+    def test_duckdb_columnar_matches_aggregator(self, tmp_path: Path) -> None:
+        """Test the DuckDB engine emits the same compact layout as the aggregator."""
+        config = Config.model_validate(
+            {
+                "github": {
+                    "target": {"mode": "org", "name": "test-org"},
+                    "windows": {"year": 2025},
+                },
+                "storage": {"root": str(tmp_path / "data")},
+                "collection": {"commits": {"contributor_stats": True}},
+                "metrics": {"timeseries_layout": "columnar"},
+            }
+        )
+        paths = PathManager(config)
+        _build_raw_dataset(paths, seed=3)
+
+        expected = _python_export(config, paths)
+        actual = DuckDBMetricsEngine(config, paths).export()
+
+        assert json.dumps(actual) == json.dumps(expected)
+
+
+class TestTopKLeaderboards:
+    """Tests for top-K leaderboards and full rankings from both engines."""
+
+    def test_top_k_matches_full_ranking_prefix(self, config: Config, paths: PathManager) -> None:
+        """Test top-K export keeps the full ranking prefix and unchanged awards."""
+        full_config = config.model_copy(
+            update={
+                "metrics": config.metrics.model_copy(
+                    update={"leaderboard_top_k": None, "leaderboard_full_rankings": False}
+                )
+            }
+        )
+        full = _python_export(full_config, paths)
+        top_k_config = config.model_copy(
+            update={
+                "metrics": config.metrics.model_copy(
+                    update={"leaderboard_top_k": 2, "leaderboard_full_rankings": True}
+                )
+            }
+        )
+        trimmed = _python_export(top_k_config, paths)
+
+        assert trimmed["leaderboards"] == {
+            metric: ranked[:2] for metric, ranked in full["leaderboards"].items()
+        }
+        assert trimmed["leaderboards_full"] == full["leaderboards"]
+        assert trimmed["awards"] == full["awards"]
+        assert "leaderboards_full" not in full
+
+    def test_duckdb_top_k_matches_aggregator(self, tmp_path: Path) -> None:
+        """Test the DuckDB engine trims and exports full rankings identically."""
+        config = Config.model_validate(
+            {
+                "github": {
+                    "target": {"mode": "org", "name": "test-org"},
+                    "windows": {"year": 2025},
+                },
+                "storage": {"root": str(tmp_path / "data")},
+                "collection": {"commits": {"contributor_stats": True}},
+                "metrics": {"leaderboard_top_k": 1, "leaderboard_full_rankings": True},
+            }
+        )
+        paths = PathManager(config)
+        _build_raw_dataset(paths, seed=5)
+
+        expected = _python_export(config, paths)
+        actual = DuckDBMetricsEngine(config, paths).export()
+
+        assert json.dumps(actual) == json.dumps(expected)
+
+
+class TestRepoHealthSketches:
+    """Tests for sketch-mode repo health from both engines."""
+
+    @pytest.fixture
+    def sketch_config(self, tmp_path: Path) -> Config:
+        """Create a sketch-mode configuration with a small KLL size."""
+        return Config.model_validate(
+            {
+                "github": {
+                    "target": {"mode": "org", "name": "test-org"},
+                    "windows": {"year": 2025},
+                },
+                "storage": {"root": str(tmp_path / "data")},
+                "collection": {"commits": {"contributor_stats": True}},
+                "metrics": {"repo_health_mode": "sketch", "sketch_k": 8},
+            }
+        )
+
+    def test_duckdb_sketches_match_aggregator(self, sketch_config: Config) -> None:
+        """Test both engines build identical sketches and repo health."""
+        paths = PathManager(sketch_config)
+        _build_raw_dataset(paths, seed=9)
+
+        expected = _python_export(sketch_config, paths)
+        actual = DuckDBMetricsEngine(sketch_config, paths).export()
+
+        assert "time_to_merge_quantiles" in expected["repo_health"][0]
+        assert json.dumps(actual) == json.dumps(expected)
+
+    def test_parallel_replay_merges_sketches(self, sketch_config: Config) -> None:
+        """Test per-repo sketches from worker processes merge into the same export."""
+        paths = PathManager(sketch_config)
+        _build_raw_dataset(paths, seed=9)
+
+        expected = _python_export(sketch_config, paths)
+        aggregator = MetricsAggregator.from_config(sketch_config)
+        replay_raw_data(aggregator, sketch_config, paths, workers=2)
+
+        assert json.dumps(aggregator.export()) == json.dumps(expected)
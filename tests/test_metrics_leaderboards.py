@@ -0,0 +1,127 @@
+"""Tests for top-K leaderboard ranking and sharded full rankings."""
+
+import json
+from pathlib import Path
+
+from gh_year_end.collect.aggregator import MetricsAggregator
+from gh_year_end.metrics.leaderboards import (
+    awards_from_leaderboards,
+    rank_users,
+    read_full_rankings,
+    shard_rankings,
+    write_full_rankings,
+)
+
+COUNTS = {"alice": 3, "bob": 5, "bot[bot]": 9, "carol": 3, "dave": 1, "erin": 5}
+
+
+def _is_bot(user: str) -> bool:
+    return user.endswith("[bot]")
+
+
+class TestRankUsers:
+    """Tests for heap-based top-K ranking."""
+
+    def test_top_k_matches_stable_sort(self) -> None:
+        """Test every K yields the prefix of the full stable sort, ties included."""
+        full = rank_users(COUNTS, _is_bot)
+
+        assert full == [("bob", 5), ("erin", 5), ("alice", 3), ("carol", 3), ("dave", 1)]
+        for k in range(1, len(COUNTS) + 2):
+            assert rank_users(COUNTS, _is_bot, top_k=k) == full[:k]
+
+    def test_empty_counts(self) -> None:
+        """Test ranking with no eligible users."""
+        assert rank_users({}, _is_bot, top_k=3) == []
+        assert rank_users({"bot[bot]": 2}, _is_bot) == []
+
+
+class TestAwards:
+    """Tests for deriving awards from ranked leaderboards."""
+
+    def test_awards_take_top_entries(self) -> None:
+        """Test each award copies its metric's top entry and skips empty boards."""
+        leaderboards = {
+            "prs_opened": [{"user": "bob", "count": 5, "avatar_url": "b.png"}],
+            "reviews_submitted": [],
+        }
+
+        awards = awards_from_leaderboards(leaderboards)
+
+        assert awards == {"top_pr_author": {"user": "bob", "count": 5, "avatar_url": "b.png"}}
+        assert awards["top_pr_author"] is not leaderboards["prs_opened"][0]
+
+    def test_aggregator_awards_match_legacy_max(self) -> None:
+        """Test single-pass awards pick the same winner as a max() scan."""
+        agg = MetricsAggregator(year=2025, target_name="test")
+        agg.users = {"bot[bot]": {"is_bot": True}, "bob": {"avatar_url": "b.png"}}
+        for user, count in COUNTS.items():
+            agg.leaderboards["prs_opened"][user] = count
+
+        winner = max(
+            ((u, c) for u, c in COUNTS.items() if not _is_bot(u)), key=lambda item: item[1]
+        )
+        awards = agg._compute_awards()
+
+        assert awards["top_pr_author"] == {"user": winner[0], "count": 5, "avatar_url": "b.png"}
+        assert "top_reviewer" not in awards
+
+
+class TestShardedRankings:
+    """Tests for the sharded full rankings writer."""
+
+    def test_shard_layout(self) -> None:
+        """Test shards split at shard_size and the index lists them."""
+        ranked = [{"user": f"u{i}", "count": 10 - i, "avatar_url": ""} for i in range(5)]
+
+        files = shard_rankings({"prs_opened": ranked, "approvals": []}, shard_size=2)
+
+        assert files["index.json"] == {
+            "shard_size": 2,
+            "metrics": {
+                "prs_opened": {
+                    "total": 5,
+                    "shards": [
+                        "prs_opened-00000.json",
+                        "prs_opened-00001.json",
+                        "prs_opened-00002.json",
+                    ],
+                },
+                "approvals": {"total": 0, "shards": []},
+            },
+        }
+        assert files["prs_opened-00001.json"] == {
+            "metric": "prs_opened",
+            "offset": 2,
+            "entries": ranked[2:4],
+        }
+
+    def test_write_replaces_stale_shards(self, tmp_path: Path) -> None:
+        """Test writing removes shards left over from a previous run."""
+        out_dir = tmp_path / "leaderboards_full"
+        out_dir.mkdir()
+        (out_dir / "old_metric-00000.json").write_text("{}")
+        ranked = [{"user": "alice", "count": 1, "avatar_url": ""}]
+
+        written = write_full_rankings({"prs_opened": ranked}, out_dir, shard_size=10)
+
+        assert sorted(p.name for p in out_dir.iterdir()) == [
+            "index.json",
+            "prs_opened-00000.json",
+        ]
+        assert len(written) == 2
+        shard = json.loads((out_dir / "prs_opened-00000.json").read_text())
+        assert shard["entries"] == ranked
+
+    def test_read_round_trips_written_shards(self, tmp_path: Path) -> None:
+        """Test reading the shards back yields the full rankings."""
+        out_dir = tmp_path / "leaderboards_full"
+        rankings = {
+            "prs_opened": [{"user": f"u{i}", "count": 10 - i, "avatar_url": ""} for i in range(5)],
+            "reviews_submitted": [],
+        }
+
+        assert read_full_rankings(out_dir) is None
+        write_full_rankings(rankings, out_dir, shard_size=2)
+
+        assert read_full_rankings(out_dir) == rankings
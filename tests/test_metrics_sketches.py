@@ -0,0 +1,194 @@
+"""Tests for mergeable quantile and cardinality sketches."""
+
+import json
+import random
+
+import pytest
+
+from gh_year_end.collect.aggregator import MetricsAggregator
+from gh_year_end.metrics.sketches import (
+    HyperLogLog,
+    KLLSketch,
+    merge_repo_health_sketch,
+    repo_health_sketch_from_dict,
+    summarize_repo_health_sketch,
+)
+
+
+def _rank_error(values: list[float], estimate: float, q: float) -> float:
+    ordered = sorted(values)
+    rank = sum(1 for v in ordered if v <= estimate) / len(ordered)
+    return abs(rank - q)
+
+
+class TestKLLSketch:
+    """Tests for the KLL quantile sketch."""
+
+    def test_exact_below_capacity(self) -> None:
+        """Test quantiles are exact nearest-rank values before any compaction."""
+        sketch = KLLSketch(k=50)
+        for value in [5.0, 1.0, 3.0, 2.0, 4.0]:
+            sketch.update(value)
+
+        assert sketch.quantile(0.5) == 3.0
+        assert sketch.quantile(0.0) == 1.0
+        assert sketch.quantile(1.0) == 5.0
+        assert KLLSketch().quantile(0.5) is None
+
+    def test_bounded_memory_and_accuracy(self) -> None:
+        """Test stored items stay bounded while rank error stays small."""
+        rng = random.Random(11)
+        values = [rng.expovariate(0.1) for _ in range(50_000)]
+        sketch = KLLSketch(k=200)
+        for value in values:
+            sketch.update(value)
+
+        stored = sum(len(items) for items in sketch.to_dict()["levels"])
+        assert sketch.n == len(values)
+        assert stored < 3 * 200 + 64
+        for q in (0.5, 0.9, 0.99):
+            estimate = sketch.quantile(q)
+            assert estimate is not None
+            assert _rank_error(values, estimate, q) < 0.02
+
+    def test_merge_matches_union(self) -> None:
+        """Test merging shard sketches approximates a sketch of all values."""
+        rng = random.Random(3)
+        shards = [[rng.uniform(0, 100) for _ in range(5_000)] for _ in range(4)]
+        merged = KLLSketch(k=200)
+        for shard in shards:
+            sketch = KLLSketch(k=200)
+            for value in shard:
+                sketch.update(value)
+            merged.merge(sketch)
+
+        everything = [v for shard in shards for v in shard]
+        assert merged.n == len(everything)
+        estimate = merged.quantile(0.9)
+        assert estimate is not None
+        assert _rank_error(everything, estimate, 0.9) < 0.02
+
+    def test_round_trip_and_determinism(self) -> None:
+        """Test serialization round-trips and identical input gives identical state."""
+        first, second = KLLSketch(k=16), KLLSketch(k=16)
+        for value in range(1_000):
+            first.update(float(value))
+            second.update(float(value))
+
+        assert first.to_dict() == second.to_dict()
+        restored = KLLSketch.from_dict(json.loads(json.dumps(first.to_dict())))
+        assert restored.to_dict() == first.to_dict()
+        assert restored.quantile(0.5) == first.quantile(0.5)
+
+    def test_merge_rejects_different_k(self) -> None:
+        """Test sketches of different sizes cannot be merged."""
+        with pytest.raises(ValueError, match="k=16"):
+            KLLSketch(k=32).merge(KLLSketch(k=16))
+
+
+class TestHyperLogLog:
+    """Tests for the HyperLogLog distinct counter."""
+
+    def test_small_counts_are_near_exact(self) -> None:
+        """Test linear counting handles small cardinalities and duplicates."""
+        sketch = HyperLogLog()
+        for login in ["alice", "bob", "carol", "alice", "bob"]:
+            sketch.add(login)
+
+        assert sketch.estimate() == 3
+        assert HyperLogLog().estimate() == 0
+
+    def test_large_count_accuracy_and_merge(self) -> None:
+        """Test estimates stay within a few percent and merging equals the union."""
+        left, right, union = HyperLogLog(), HyperLogLog(), HyperLogLog()
+        for i in range(60_000):
+            (left if i % 2 else right).add(f"user-{i}")
+            union.add(f"user-{i}")
+        for i in range(30_000):
+            left.add(f"user-{i}")
+
+        left.merge(right)
+
+        assert left.to_dict() == union.to_dict()
+        assert abs(left.estimate() - 60_000) / 60_000 < 0.05
+
+    def test_round_trip(self) -> None:
+        """Test serialization round-trips."""
+        sketch = HyperLogLog(precision=8)
+        for pr_number in range(40):
+            sketch.add(pr_number)
+
+        restored = HyperLogLog.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        assert restored.estimate() == sketch.estimate()
+
+    def test_invalid_precision(self) -> None:
+        """Test precision bounds and merge compatibility are enforced."""
+        with pytest.raises(ValueError, match="between 4 and 16"):
+            HyperLogLog(precision=20)
+        with pytest.raises(ValueError, match="precision"):
+            HyperLogLog(precision=10).merge(HyperLogLog(precision=12))
+
+
+class TestAggregatorSketchMode:
+    """Tests for repo health in sketch mode."""
+
+    def _aggregator(self) -> MetricsAggregator:
+        agg = MetricsAggregator(year=2025, target_name="test", repo_health_mode="sketch")
+        agg.add_repo({"full_name": "org/repo", "name": "repo"})
+        for number, merge_hours in enumerate([2, 4, 6, 8, 10], start=1):
+            agg.add_pr(
+                "org/repo",
+                {
+                    "number": number,
+                    "user": {"login": f"author{number % 2}", "type": "User"},
+                    "created_at": "2025-03-01T00:00:00Z",
+                    "merged_at": f"2025-03-01T{merge_hours:02d}:00:00Z",
+                },
+            )
+        for number, hours in ((1, 1), (1, 5), (2, 3)):
+            agg.add_review(
+                "org/repo",
+                number,
+                {
+                    "user": {"login": "reviewer", "type": "User"},
+                    "state": "APPROVED",
+                    "submitted_at": f"2025-03-01T{hours:02d}:00:00Z",
+                },
+            )
+        return agg
+
+    def test_repo_health_quantiles(self) -> None:
+        """Test sketch mode reports percentiles and estimated counts."""
+        health = self._aggregator().compute_repo_health("org/repo")
+
+        assert health["contributor_count"] == 3
+        assert health["pr_count"] == 5
+        assert health["review_count"] == 3
+        assert health["review_coverage"] == 40.0
+        assert health["median_time_to_merge"] == 6.0
+        assert health["time_to_merge_quantiles"] == {"p50": 6.0, "p90": 10.0, "p99": 10.0}
+        # Only the first review of each PR counts toward time to first review
+        assert health["time_to_first_review_quantiles"] == {"p50": 1.0, "p90": 3.0, "p99": 3.0}
+
+    def test_exported_sketches_merge_across_runs(self) -> None:
+        """Test exported sketch state can be reloaded and merged."""
+        exported = self._aggregator().export()["repo_health_sketches"]["org/repo"]
+
+        state = repo_health_sketch_from_dict(json.loads(json.dumps(exported)))
+        other = repo_health_sketch_from_dict(json.loads(json.dumps(exported)))
+        merge_repo_health_sketch(state, other)
+
+        merged = summarize_repo_health_sketch("org/repo", state)
+        assert merged["pr_count"] == 10
+        assert merged["contributor_count"] == 3
+        assert merged["time_to_merge_quantiles"]["p50"] == 6.0
+
+    def test_exact_mode_unchanged(self) -> None:
+        """Test exact mode exports no sketches and keeps true medians."""
+        agg = MetricsAggregator(year=2025, target_name="test")
+        agg.add_repo({"full_name": "org/repo", "name": "repo"})
+
+        metrics = agg.export()
+
+        assert "repo_health_sketches" not in metrics
+        assert "time_to_merge_quantiles" not in metrics["repo_health"][0]
@@ -0,0 +1,177 @@
+"""Tests for the columnar time series representation."""
+
+import json
+from typing import Any
+
+import numpy as np
+import pytest
+
+from gh_year_end.config import Config
+from gh_year_end.metrics import (
+    TimeseriesFrame,
+    build_columnar_timeseries,
+    expand_timeseries,
+    load_timeseries,
+)
+from gh_year_end.report.contributors import populate_activity_timelines
+from gh_year_end.report.transformers import (
+    calculate_fun_facts,
+    generate_chart_data,
+    generate_engineer_charts,
+    transform_activity_timeline,
+)
+
+WEEKLY = {
+    "prs_opened": {
+        "2025-W02": {"alice": 2, "bot[bot]": 5, "_total": 1},
+        "2025-W01": {"bob": 1, "alice": 1},
+    },
+    "reviews_submitted": {"2025-W02": {"bob": 3}},
+}
+MONTHLY = {
+    "prs_opened": {"2025-01": {"alice": 3, "bob": 1, "bot[bot]": 5}},
+    "reviews_submitted": {"2025-01": {"bob": 3}},
+}
+
+
+def _sorted_entries(series: dict[str, list[dict[str, Any]]]) -> dict[str, list[tuple]]:
+    return {
+        metric: sorted((e["period"], e["user"], e["count"]) for e in entries)
+        for metric, entries in series.items()
+    }
+
+
+class TestTimeseriesFrame:
+    """Tests for TimeseriesFrame construction and reductions."""
+
+    def test_from_counters_builds_sparse_cells(self) -> None:
+        """Test integer coding of periods and users into per-metric sparse cells."""
+        frame = TimeseriesFrame.from_counters(WEEKLY, exclude={"_total", "bot[bot]"})
+
+        assert frame.periods == ["2025-W01", "2025-W02"]
+        assert frame.users == ["alice", "bob"]
+        cells, counts = frame.counts["prs_opened"]
+        np.testing.assert_array_equal(cells, [0, 1, 2])
+        np.testing.assert_array_equal(counts, [1, 1, 2])
+        cells, counts = frame.counts["reviews_submitted"]
+        np.testing.assert_array_equal(cells, [3])
+        np.testing.assert_array_equal(counts, [3])
+
+    def test_reductions(self) -> None:
+        """Test period totals, active users, and per-user activity."""
+        frame = TimeseriesFrame.from_counters(WEEKLY, exclude={"_total", "bot[bot]"})
+
+        assert frame.period_totals(["prs_opened"]) == {"2025-W01": 2, "2025-W02": 2}
+        assert frame.period_totals(["prs_opened", "missing"]) == {"2025-W01": 2, "2025-W02": 2}
+        assert frame.metric_total(["prs_opened", "reviews_submitted"]) == 7
+        assert frame.active_users(["prs_opened", "reviews_submitted"]) == {
+            "2025-W01": 2,
+            "2025-W02": 2,
+        }
+        assert frame.user_activity(["prs_opened", "reviews_submitted"]) == {
+            "alice": [1, 2],
+            "bob": [1, 3],
+        }
+
+    def test_from_entries_sums_duplicates_and_skips_malformed(self) -> None:
+        """Test the legacy parser tolerates malformed input."""
+        frame = TimeseriesFrame.from_entries(
+            {
+                "prs_opened": [
+                    {"period": "2025-W01", "user": "alice", "count": 1},
+                    {"period": "2025-W01", "user": "alice", "count": 2},
+                    {"period": "", "user": "bob", "count": 9},
+                    {"period": "2025-W02", "count": 4},
+                ],
+                "broken": "not-a-list",
+            }
+        )
+
+        assert frame.period_totals(["prs_opened"]) == {"2025-W01": 3, "2025-W02": 4}
+        assert frame.active_users(["prs_opened"]) == {"2025-W01": 1}
+        assert "broken" not in frame.counts
+        assert TimeseriesFrame.from_entries(["not", "a", "dict"]).periods == []
+
+
+class TestColumnarLayout:
+    """Tests for the compact timeseries.json layout."""
+
+    def test_round_trip_matches_legacy_entries(self) -> None:
+        """Test that expanding the compact layout yields the legacy entries."""
+        compact = build_columnar_timeseries(WEEKLY, MONTHLY, exclude={"_total", "bot[bot]"})
+
+        assert compact["layout"] == "columnar"
+        assert compact["users"] == ["alice", "bob"]
+        assert compact["weekly"]["metrics"]["prs_opened"] == {
+            "period": [0, 0, 1],
+            "user": [0, 1, 0],
+            "count": [1, 1, 2],
+        }
+
+        expanded = expand_timeseries(json.loads(json.dumps(compact)))
+        assert _sorted_entries(expanded["weekly"]) == {
+            "prs_opened": [
+                ("2025-W01", "alice", 1),
+                ("2025-W01", "bob", 1),
+                ("2025-W02", "alice", 2),
+            ],
+            "reviews_submitted": [("2025-W02", "bob", 3)],
+        }
+        assert _sorted_entries(expanded["monthly"]) == {
+            "prs_opened": [("2025-01", "alice", 3), ("2025-01", "bob", 1)],
+            "reviews_submitted": [("2025-01", "bob", 3)],
+        }
+
+    def test_legacy_passthrough(self) -> None:
+        """Test that legacy and malformed data are returned unchanged."""
+        legacy = {"weekly": {}, "monthly": {}}
+        assert expand_timeseries(legacy) is legacy
+        assert expand_timeseries([]) == []
+        assert load_timeseries(None)["weekly"].periods == []
+
+    def test_config_rejects_unknown_layout(self) -> None:
+        """Test that only known layouts validate."""
+        with pytest.raises(ValueError):
+            Config.model_validate(
+                {
+                    "github": {
+                        "target": {"mode": "org", "name": "test-org"},
+                        "windows": {"year": 2025},
+                    },
+                    "metrics": {"timeseries_layout": "parquet"},
+                }
+            )
+
+
+class TestReportConsumers:
+    """Tests that report transformers accept both layouts."""
+
+    def test_transformers_agree_across_layouts(self) -> None:
+        """Test chart, timeline, and contributor outputs are layout independent."""
+        weekly = {
+            "prs_opened": {"2025-W01": {"alice": 2, "bob": 1}, "2025-W03": {"bob": 4}},
+            "prs_merged": {"2025-W01": {"alice": 1}, "2025-W03": {"bob": 2}},
+            "reviews_submitted": {"2025-W03": {"alice": 5}},
+            "comments_total": {"2025-W01": {"bob": 7}},
+        }
+        compact = build_columnar_timeseries(weekly, {})
+        legacy = expand_timeseries(compact)
+
+        summary = {"total_comments": 7}
+        for layout in (legacy, compact):
+            assert generate_chart_data(layout, summary, {}) == generate_chart_data(
+                legacy, summary, {}
+            )
+            assert generate_engineer_charts(layout, summary) == generate_engineer_charts(
+                legacy, summary
+            )
+            assert transform_activity_timeline(layout) == [
+                {"date": "2024-12-30", "value": 1},
+                {"date": "2025-01-13", "value": 2},
+            ]
+            assert calculate_fun_facts(summary, layout, {})["busiest_day_count"] == 4
+
+            contributors: list[dict[str, Any]] = [{"login": "alice"}, {"login": "carol"}]
+            populate_activity_timelines(contributors, layout)
+            assert contributors[0]["activity_timeline"] == [3, 5]
+            assert contributors[1]["activity_timeline"] == []
@@ -0,0 +1,40 @@
+"""Tests for precomputed period bucket keys."""
+
+from datetime import datetime
+
+from gh_year_end.collect.periods import PeriodCalendar
+
+
+class TestPeriodCalendar:
+    """Test day-indexed week and month keys."""
+
+    def test_day_index_bounds(self):
+        """Test the first and last day of the year, and dates outside it."""
+        calendar = PeriodCalendar(2024)
+        assert calendar.day_index("2024-01-01T00:00:00Z") == 0
+        assert calendar.day_index("2024-12-31T23:59:59Z") == 365
+        assert calendar.day_index("2023-12-31T23:59:59Z") is None
+        assert calendar.day_index("2025-01-01T00:00:00Z") is None
+        assert calendar.day_index("") is None
+
+    def test_iso_week_at_year_boundaries(self):
+        """Test ISO week keys that belong to the neighbouring ISO year."""
+        calendar = PeriodCalendar(2025)
+        assert calendar.buckets("2025-12-29T10:00:00Z") == ("2026-W01", "2025-12")
+        assert PeriodCalendar(2021).buckets("2021-01-01T10:00:00Z") == ("2020-W53", "2021-01")
+
+    def test_offset_timestamps_use_local_date(self):
+        """Test that timestamps with a UTC offset bucket by their local date."""
+        calendar = PeriodCalendar(2025)
+        assert calendar.buckets("2025-03-31T23:30:00-05:00") == ("2025-W14", "2025-03")
+
+    def test_matches_datetime_keys(self):
+        """Test every day agrees with keys computed from datetime."""
+        calendar = PeriodCalendar(2024)
+        for day in range(366):
+            timestamp = datetime.fromordinal(datetime(2024, 1, 1).toordinal() + day)
+            year, week, _ = timestamp.isocalendar()
+            assert calendar.period_keys(day) == (
+                f"{year}-W{week:02d}",
+                f"{timestamp.year}-{timestamp.month:02d}",
+            )
@@ -0,0 +1,87 @@
+"""Tests for the dual-API work planner."""
+
+import time
+
+import pytest
+
+from gh_year_end.config import RateLimitConfig
+from gh_year_end.github.planner import APIPlanner, graphql_points
+from gh_year_end.github.ratelimit import AdaptiveRateLimiter, APIType
+
+
+def make_limiter(
+    rest_remaining: int,
+    graphql_remaining: int,
+    rest_reset_in: float = 1800,
+    graphql_reset_in: float = 1800,
+) -> AdaptiveRateLimiter:
+    """Create a rate limiter with the given remaining budgets."""
+    limiter = AdaptiveRateLimiter(RateLimitConfig())
+    now = time.time()
+    for api_type, remaining, reset_in in (
+        (APIType.REST, rest_remaining, rest_reset_in),
+        (APIType.GRAPHQL, graphql_remaining, graphql_reset_in),
+    ):
+        state = limiter.get_state(api_type)
+        state.limit = 5000
+        state.remaining = remaining
+        state.reset_at = now + reset_in
+    return limiter
+
+
+class TestGraphQLPoints:
+    """Tests for graphql_points."""
+
+    @pytest.mark.parametrize(("connections", "points"), [(0, 1), (1, 1), (100, 1), (101, 2)])
+    def test_points(self, connections: int, points: int) -> None:
+        """Test one point per 100 connections, minimum one."""
+        assert graphql_points(connections) == points
+
+
+class TestAPIPlanner:
+    """Tests for APIPlanner."""
+
+    def test_headroom_subtracts_reserve(self) -> None:
+        """Test that the reserve share of the limit is held back."""
+        planner = APIPlanner(make_limiter(1000, 5000), reserve_percent=10)
+
+        assert planner.headroom(APIType.REST) == 500
+        assert planner.headroom(APIType.GRAPHQL) == 4500
+
+    def test_headroom_after_reset(self) -> None:
+        """Test that a window that has already reset counts as full."""
+        planner = APIPlanner(make_limiter(0, 5000, rest_reset_in=-5), reserve_percent=0)
+
+        assert planner.headroom(APIType.REST) == 5000
+
+    def test_choose_prefers_smaller_share(self) -> None:
+        """Test that work goes to the API for which it is the smaller share."""
+        planner = APIPlanner(make_limiter(4000, 4000))
+
+        api = planner.choose({APIType.GRAPHQL: 1, APIType.REST: 25})
+
+        assert api == APIType.GRAPHQL
+
+    def test_choose_steals_when_one_budget_exhausted(self) -> None:
+        """Test that work moves to REST once GraphQL is inside its reserve."""
+        planner = APIPlanner(make_limiter(4000, 100))
+
+        api = planner.choose({APIType.GRAPHQL: 1, APIType.REST: 25})
+
+        assert api == APIType.REST
+        assert planner.stats() == {"rest": 1, "graphql": 0}
+
+    def test_choose_without_headroom_picks_earliest_reset(self) -> None:
+        """Test that with both budgets exhausted the sooner reset wins."""
+        planner = APIPlanner(make_limiter(0, 0, rest_reset_in=600, graphql_reset_in=60))
+
+        api = planner.choose({APIType.REST: 25, APIType.GRAPHQL: 1})
+
+        assert api == APIType.GRAPHQL
+
+    def test_choose_requires_costs(self) -> None:
+        """Test that choosing without candidate APIs is an error."""
+        planner = APIPlanner(make_limiter(5000, 5000))
+
+        with pytest.raises(ValueError, match="No API"):
+            planner.choose({})
@@ -0,0 +1,79 @@
+"""Tests for per-phase profiling."""
+
+import json
+import pstats
+import tracemalloc
+from pathlib import Path
+
+from gh_year_end.collect.aggregator import MetricsAggregator
+from gh_year_end.collect.progress import ProgressTracker
+from gh_year_end.telemetry import PhaseProfiler, active_profiler, render_profile
+from gh_year_end.telemetry.profiling import count_events
+
+
+def allocate(count: int) -> list[list[int]]:
+    """Allocate ``count`` small lists."""
+    return [[i] for i in range(count)]
+
+
+class TestPhaseProfiler:
+    """Tests for phase profiles and their summary."""
+
+    def test_phase_summary(self, tmp_path: Path) -> None:
+        """Test the profile file, top functions, allocations, and events."""
+        kept = []
+
+        with PhaseProfiler(tmp_path) as profiler:
+            assert active_profiler() is profiler
+            profiler.set_phase("load")
+            kept.append(allocate(5000))
+            count_events(10)
+        assert active_profiler() is None
+        assert not tracemalloc.is_tracing()
+
+        (phase,) = profiler.phases
+        assert phase["phase"] == "load"
+        assert phase["profile"] == "01-load.prof"
+        pstats.Stats(str(tmp_path / "01-load.prof"))
+        assert any("allocate" in f["function"] for f in phase["top_functions"])
+        assert phase["allocated_blocks"] >= 5000
+        assert phase["peak_kib"] > 0
+        assert "test_profiling.py" in phase["top_allocations"][0]["site"]
+        assert phase["events"] == 10
+        assert phase["allocations_per_event"] >= 500
+        summary = json.loads((tmp_path / "summary.json").read_text())
+        assert summary["phases"][0]["phase"] == "load"
+
+    def test_phases_from_progress_and_ingest(self, tmp_path: Path) -> None:
+        """Test that progress phases are profiled and ingested items counted."""
+        progress = ProgressTracker(quiet=True)
+        aggregator = MetricsAggregator(year=2024, target_name="o")
+
+        with PhaseProfiler(tmp_path) as profiler:
+            progress.set_phase("discovery")
+            progress.mark_phase_complete("discovery")
+            progress.set_phase("issues")
+            aggregator.add_issues("o/r", [{"number": 1}, {"number": 2}])
+
+        assert [(p["phase"], p["events"]) for p in profiler.phases] == [
+            ("discovery", 0),
+            ("issues", 2),
+        ]
+        assert profiler.phases[0]["allocations_per_event"] is None
+
+    def test_close_is_idempotent(self, tmp_path: Path) -> None:
+        """Test that a second close returns the same summary."""
+        profiler = PhaseProfiler(tmp_path).start()
+        profiler.set_phase("only")
+
+        assert profiler.close() is profiler.close()
+
+    def test_render_profile(self, tmp_path: Path) -> None:
+        """Test one table row per phase."""
+        with PhaseProfiler(tmp_path) as profiler:
+            profiler.set_phase("render")
+            allocate(10)
+
+        table = render_profile(profiler.close())
+
+        assert table.row_count == 1
@@ -401,6 +401,17 @@ class TestProgressTracker:
 
         assert eta == ""
 
+    def test_calculate_eta_uses_planned_requests(self) -> None:
+        """Test that a pre-flight plan drives the ETA before any repo completes."""
+        tracker = ProgressTracker(total_repos=10, quiet=True)
+        tracker.set_planned_requests(1000)
+
+        for _ in range(10):
+            tracker.record_request(1.0)
+
+        # 990 planned requests left at 1s each
+        assert tracker._calculate_eta() == "~16m"
+
     def test_calculate_eta_completed(self) -> None:
         """Test ETA when all repos are complete."""
         tracker = ProgressTracker(total_repos=5, quiet=True)
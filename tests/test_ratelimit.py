@@ -733,6 +733,43 @@ class TestAdaptiveRateLimiterAcquireRelease:
         # Additional checks would need more failures to open circuit
 
 
+class TestAdaptiveRateLimiterPacing:
+    """Tests for pre-flight pacing."""
+
+    @pytest.mark.asyncio
+    async def test_paced_requests_are_spaced(self) -> None:
+        """Test that paced requests start at least one interval apart."""
+        limiter = AdaptiveRateLimiter(RateLimitConfig(max_concurrency=5))
+        limiter.set_pace(APIType.REST, 0.05)
+
+        start = time.time()
+        for _ in range(3):
+            await limiter.acquire(APIType.REST)
+            limiter.release(success=True)
+        elapsed = time.time() - start
+
+        assert limiter.get_pace(APIType.REST) == 0.05
+        assert elapsed >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_pacing_is_per_api(self) -> None:
+        """Test that pacing one API leaves the other unpaced, and 0 disables it."""
+        limiter = AdaptiveRateLimiter(RateLimitConfig(max_concurrency=5))
+        limiter.set_pace(APIType.REST, 10.0)
+        limiter.set_pace(APIType.REST, 0)
+        limiter.set_pace(APIType.GRAPHQL, 10.0)
+
+        start = time.time()
+        await limiter.acquire(APIType.REST)
+        limiter.release(success=True)
+        await limiter.acquire(APIType.REST)
+        limiter.release(success=True)
+
+        assert time.time() - start < 1.0
+        assert limiter.get_pace(APIType.REST) == 0.0
+        assert limiter.get_pace(APIType.GRAPHQL) == 10.0
+
+
 class TestAdaptiveRateLimiterProgressTracking:
     """Tests for AdaptiveRateLimiter progress tracking."""
 
@@ -771,6 +808,21 @@ class TestAdaptiveRateLimiterProgressTracking:
 
         assert progress.requests_made == 1
 
+    @pytest.mark.asyncio
+    async def test_discount_request_takes_back_count(self) -> None:
+        """Test discount_request undoes the count of an unsent request."""
+        limiter = AdaptiveRateLimiter(RateLimitConfig())
+
+        progress = ProgressState(phase="collection", total_items=100)
+        limiter.set_progress_state(progress)
+
+        await limiter.acquire()
+        limiter.discount_request()
+        limiter.release(success=True)
+        limiter.discount_request()
+
+        assert progress.requests_made == 0
+
 
 class TestAdaptiveRateLimiterContextManager:
     """Tests for AdaptiveRateLimiter async context manager."""
@@ -0,0 +1,62 @@
+"""Tests for raw response capture during inline collection."""
+
+from pathlib import Path
+
+import pytest
+
+from gh_year_end.config import Config
+from gh_year_end.storage.paths import PathManager
+from gh_year_end.storage.recorder import COMMIT_KINDS, RawRecorder
+from gh_year_end.storage.writer import JSONLWriter
+
+
+@pytest.fixture
+def paths(tmp_path: Path) -> PathManager:
+    """Create a path manager rooted in a temp directory."""
+    config = Config.model_validate(
+        {
+            "github": {"target": {"mode": "org", "name": "test-org"}, "windows": {"year": 2025}},
+            "storage": {"root": str(tmp_path / "data"), "write_raw": True},
+        }
+    )
+    return PathManager(config)
+
+
+class TestRawRecorder:
+    """Tests for RawRecorder."""
+
+    @pytest.mark.asyncio
+    async def test_write_routes_by_kind(self, paths: PathManager) -> None:
+        """Test that records land in the per-kind raw file for the repo."""
+        async with RawRecorder(paths, "test-org/repo") as recorder:
+            await recorder.write("pulls", "/repos/test-org/repo/pulls/1", {"number": 1}, page=2)
+            await recorder.write("reviews", "/repos/test-org/repo/pulls/1/reviews", {"id": 9})
+
+        pulls = list(JSONLWriter.read_records(paths.pulls_raw_path("test-org/repo")))
+        assert [(r.endpoint, r.page, r.data) for r in pulls] == [
+            ("/repos/test-org/repo/pulls/1", 2, {"number": 1})
+        ]
+        assert paths.reviews_raw_path("test-org/repo").exists()
+        assert not paths.issues_raw_path("test-org/repo").exists()
+
+    @pytest.mark.asyncio
+    async def test_open_replaces_previous_capture(self, paths: PathManager) -> None:
+        """Test that re-recording a repo does not duplicate records."""
+        for _ in range(2):
+            async with RawRecorder(paths, "test-org/repo") as recorder:
+                await recorder.write("issues", "/repos/test-org/repo/issues/3", {"number": 3})
+
+        assert len(list(JSONLWriter.read_records(paths.issues_raw_path("test-org/repo")))) == 1
+
+    @pytest.mark.asyncio
+    async def test_open_replaces_only_owned_kinds(self, paths: PathManager) -> None:
+        """Test that a commit recorder leaves the repo's event capture in place."""
+        async with RawRecorder(paths, "test-org/repo") as recorder:
+            await recorder.write("pulls", "/repos/test-org/repo/pulls/1", {"number": 1})
+        async with RawRecorder(paths, "test-org/repo", kinds=COMMIT_KINDS) as recorder:
+            await recorder.write(
+                "contributor_stats", "/repos/test-org/repo/stats/contributors", {"total": 3}
+            )
+
+        assert paths.pulls_raw_path("test-org/repo").exists()
+        assert paths.contributor_stats_raw_path("test-org/repo").exists()
@@ -0,0 +1,98 @@
+"""Tests for the per-run repository payload store."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from gh_year_end.collect.hygiene import _get_security_features
+from gh_year_end.collect.repo_store import RepoStore
+
+ANALYSIS = {
+    "dependabot_security_updates": {"status": "enabled"},
+    "secret_scanning": {"status": "disabled"},
+    "secret_scanning_push_protection": {"status": "enabled"},
+}
+
+
+def make_rest_client(payload: dict | None = None) -> MagicMock:
+    """REST client whose repository request returns ``payload``."""
+    client = MagicMock()
+    client.get_repo_security_analysis = AsyncMock(return_value=payload)
+    client.check_vulnerability_alerts = AsyncMock(return_value=True)
+    return client
+
+
+class TestRepoStore:
+    """Tests for RepoStore lookups and enrichment."""
+
+    def test_add_and_update_merge(self) -> None:
+        """Test that payloads and later facts are merged per repo."""
+        store = RepoStore()
+        store.add([{"full_name": "o/a", "archived": False}, {"name": "no-full-name"}])
+        store.update("o/a", {"vulnerability_alerts_enabled": True})
+        store.add([{"full_name": "o/a", "archived": True}])
+
+        assert len(store) == 1
+        assert "o/a" in store
+        assert store.get("o/a") == {
+            "full_name": "o/a",
+            "archived": True,
+            "vulnerability_alerts_enabled": True,
+        }
+        assert store.get("o/b") is None
+
+    @pytest.mark.asyncio
+    async def test_field_in_hand_costs_nothing(self) -> None:
+        """Test that a field from discovery is served without a request."""
+        store = RepoStore()
+        store.add([{"full_name": "o/a", "security_and_analysis": ANALYSIS}])
+        client = make_rest_client()
+
+        assert await store.field("o/a", "security_and_analysis", client) == ANALYSIS
+        client.get_repo_security_analysis.assert_not_awaited()
+        assert store.stats() == {"repos": 1, "hits": 1, "fetches": 0}
+
+    @pytest.mark.asyncio
+    async def test_missing_field_is_fetched_once(self) -> None:
+        """Test one lazy fetch per repo, even when the field stays missing."""
+        store = RepoStore()
+        store.add([{"full_name": "o/a"}])
+        client = make_rest_client({"full_name": "o/a", "default_branch": "main"})
+
+        assert await store.field("o/a", "security_and_analysis", client) is None
+        assert await store.field("o/a", "security_and_analysis", client) is None
+        assert await store.field("o/a", "default_branch", client) == "main"
+        client.get_repo_security_analysis.assert_awaited_once_with("o", "a")
+
+
+class TestSecurityFeaturesFromStore:
+    """Tests for security features served from the store."""
+
+    @pytest.mark.asyncio
+    async def test_no_requests_when_known(self) -> None:
+        """Test that discovery and repo metadata facts replace both requests."""
+        store = RepoStore()
+        store.add([{"full_name": "org/repo", "security_and_analysis": ANALYSIS}])
+        store.update("org/repo", {"vulnerability_alerts_enabled": False})
+        client = make_rest_client()
+
+        features = await _get_security_features("org", "repo", client, store=store)
+
+        assert features["dependabot_alerts_enabled"] is False
+        assert features["dependabot_security_updates_enabled"] is True
+        assert features["secret_scanning_enabled"] is False
+        assert features["secret_scanning_push_protection_enabled"] is True
+        client.check_vulnerability_alerts.assert_not_awaited()
+        client.get_repo_security_analysis.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unknown_repo_falls_back_to_requests(self) -> None:
+        """Test that facts missing from the store are requested."""
+        client = make_rest_client({"security_and_analysis": ANALYSIS})
+
+        features = await _get_security_features("org", "repo", client, store=RepoStore())
+
+        assert features["dependabot_alerts_enabled"] is True
+        assert features["dependabot_security_updates_enabled"] is True
+        client.check_vulnerability_alerts.assert_awaited_once()
+        client.get_repo_security_analysis.assert_awaited_once()
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from gh_year_end.config import Config
+from gh_year_end.metrics.leaderboards import write_full_rankings
 from gh_year_end.report.build import (
     _calculate_fun_facts,
     _calculate_highlights,
@@ -262,6 +263,42 @@ class TestBuildSite:
         assert (paths.site_root / "index.html").exists()
         assert (paths.site_root / "dashboard.html").exists()
 
+    def test_trace_events_cover_build_stages(
+        self,
+        config: Config,
+        paths: PathManager,
+        sample_metrics_data: None,
+        sample_templates: Path,
+        sample_assets: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test that telemetry.trace_events records a span per build stage."""
+        config.telemetry.trace_events = tmp_path / "build_trace.json"
+
+        build_site(config, paths)
+
+        events = json.loads(config.telemetry.trace_events.read_text())["traceEvents"]
+        stages = [e["name"] for e in events if e.get("cat") == "build"]
+        assert {"load", "copy", "transform", "render", "index.html"} <= set(stages)
+
+    def test_profile_in_manifest(
+        self,
+        config: Config,
+        paths: PathManager,
+        sample_metrics_data: None,
+        sample_templates: Path,
+    ) -> None:
+        """Test that telemetry.profile profiles each stage into the manifest."""
+        config.telemetry.profile = True
+
+        stats = build_site(config, paths)
+
+        manifest = json.loads((paths.site_root / "manifest.json").read_text())
+        phases = [phase["phase"] for phase in manifest["profile"]["phases"]]
+        assert phases == ["load", "transform", "render", "search_index"]
+        assert stats["profile"] == manifest["profile"]
+        assert (paths.profile_root / "build" / "02-transform.prof").exists()
+
     def test_copies_assets(
         self,
         config: Config,
@@ -403,6 +440,23 @@ class TestLoadJsonData:
         assert "summary" in data_context
         assert "leaderboards" not in data_context
 
+    def test_prefers_full_rankings_over_top_k(self, paths: PathManager) -> None:
+        """Test that contributors cut from top-K leaderboards come from the full rankings."""
+        paths.site_data_path.mkdir(parents=True, exist_ok=True)
+        ranked = [
+            {"user": "alice", "count": 3, "avatar_url": ""},
+            {"user": "bob", "count": 1, "avatar_url": ""},
+        ]
+        with (paths.site_data_path / "leaderboards.json").open("w") as f:
+            json.dump({"prs_merged": ranked[:1]}, f)
+        write_full_rankings({"prs_merged": ranked}, paths.site_data_path / "leaderboards_full", 1)
+
+        data_context = _load_json_data(paths.site_data_path)
+
+        assert data_context["leaderboards"] == {"prs_merged": ranked}
+        engineers = _get_engineers_list(data_context["leaderboards"], None)
+        assert sorted(e["login"] for e in engineers) == ["alice", "bob"]
+
     def test_handles_invalid_json_gracefully(self, paths: PathManager) -> None:
         """Test that invalid JSON files are skipped."""
         paths.site_data_path.mkdir(parents=True, exist_ok=True)
@@ -1,5 +1,6 @@
 """Tests for report contributors module."""
 
+from gh_year_end.collect.identity import get_bot_detector
 from gh_year_end.report.contributors import (
     get_engineers_list,
     populate_activity_timelines,
@@ -253,6 +254,20 @@ class TestGetEngineersList:
         # Avatar URL should be preserved from first metric
         assert result[0]["avatar_url"] == "https://example.com/alice.jpg"
 
+    def test_bot_detector_filters_bots(self):
+        """Test that a bot detector drops bot logins from older metrics."""
+        leaderboards_data = {
+            "prs_opened": [
+                {"user": "dependabot[bot]", "count": 9},
+                {"user": "alice", "count": 3},
+            ]
+        }
+
+        result = get_engineers_list(leaderboards_data, bot_detector=get_bot_detector())
+
+        assert [e["login"] for e in result] == ["alice"]
+        assert len(get_engineers_list(leaderboards_data)) == 2
+
 
 class TestPopulateActivityTimelines:
     """Tests for populate_activity_timelines function."""
@@ -0,0 +1,209 @@
+"""Tests for stratified review and comment sampling."""
+
+import pytest
+
+from gh_year_end.collect.aggregator import MetricsAggregator
+from gh_year_end.collect.sampling import (
+    StratifiedSample,
+    issue_stratum,
+    pr_stratum,
+    sample_size,
+    weighted_median_interval,
+)
+from gh_year_end.config import SamplingConfig
+
+REPO = "org/repo"
+
+
+def make_prs(merged: int, open_: int) -> list[dict]:
+    """In-window PRs: some merged, the rest open."""
+    prs = [
+        {"number": n, "state": "closed", "merged_at": "2024-03-02T00:00:00Z"}
+        for n in range(1, merged + 1)
+    ]
+    prs += [{"number": merged + n, "state": "open"} for n in range(1, open_ + 1)]
+    return prs
+
+
+def make_sample(**overrides: object) -> StratifiedSample:
+    """Sample with a 10% rate and at least 2 items per stratum."""
+    settings = {"enabled": True, "reviews_rate": 0.1, "comments_rate": 0.1, "min_per_stratum": 2}
+    settings.update(overrides)
+    return StratifiedSample(SamplingConfig.model_validate(settings))
+
+
+class TestSelection:
+    """Tests for stratified selection."""
+
+    def test_strata(self) -> None:
+        """Test state strata for PRs and issues."""
+        assert pr_stratum({"state": "closed", "merged_at": "2024-01-01T00:00:00Z"}) == "merged"
+        assert pr_stratum({"state": "closed", "merged_at": None}) == "closed"
+        assert pr_stratum({"state": "open"}) == "open"
+        assert issue_stratum({"state": "closed"}) == "closed"
+        assert issue_stratum({"state": "open"}) == "open"
+
+    @pytest.mark.parametrize(
+        ("population", "expected"), [(0, 0), (1, 1), (5, 5), (50, 5), (200, 20)]
+    )
+    def test_sample_size(self, population: int, expected: int) -> None:
+        """Test the rate, the per-stratum minimum, and the population cap."""
+        assert sample_size(population, 0.1, 5) == expected
+
+    def test_select_per_stratum(self) -> None:
+        """Test sample sizes, weights, and listing order."""
+        prs = make_prs(merged=100, open_=3)
+        units = make_sample().select("reviews", REPO, prs, pr_stratum)
+
+        merged = [unit for unit in units if unit.key[2] == "merged"]
+        open_ = [unit for unit in units if unit.key[2] == "open"]
+        assert len(merged) == 10
+        assert all(unit.weight == 10 for unit in merged)
+        assert len(open_) == 2
+        assert all(unit.weight == 1.5 for unit in open_)
+        numbers = [unit.item["number"] for unit in units]
+        assert numbers == sorted(numbers)
+
+    def test_select_is_reproducible(self) -> None:
+        """Test that the seed fixes the sample."""
+        prs = make_prs(merged=100, open_=0)
+
+        def numbers(seed: int) -> list[int]:
+            units = make_sample(seed=seed).select("reviews", REPO, prs, pr_stratum)
+            return [unit.item["number"] for unit in units]
+
+        assert numbers(1) == numbers(1)
+        assert numbers(1) != numbers(2)
+
+    def test_full_rate_is_exact(self) -> None:
+        """Test that a rate of 1 selects everything with weight 1."""
+        prs = make_prs(merged=30, open_=4)
+        units = make_sample(reviews_rate=1).select("reviews", REPO, prs, pr_stratum)
+
+        assert [unit.item for unit in units] == prs
+        assert {unit.weight for unit in units} == {1}
+
+
+class TestEstimates:
+    """Tests for estimated totals and medians."""
+
+    def test_exact_when_everything_sampled(self) -> None:
+        """Test a census: estimate equals the total with no interval."""
+        sample = make_sample(reviews_rate=1)
+        for unit in sample.select("reviews", REPO, make_prs(3, 0), pr_stratum):
+            sample.observe(unit, 2)
+
+        assert sample.estimate_total(["reviews"]) == {
+            "estimate": 6,
+            "ci_low": 6,
+            "ci_high": 6,
+            "sampled": 3,
+            "population": 3,
+        }
+
+    def test_interval_covers_population_total(self) -> None:
+        """Test scaling by stratum size and an interval around the truth."""
+        sample = make_sample(reviews_rate=0.2)
+        prs = make_prs(merged=100, open_=0)
+        # Every PR has 1-3 reviews; the population total is 200
+        reviews = {pr["number"]: 1 + pr["number"] % 3 for pr in prs}
+        for unit in sample.select("reviews", REPO, prs, pr_stratum):
+            sample.observe(unit, reviews[unit.item["number"]])
+
+        total = sample.estimate_total(["reviews"])
+
+        assert total["sampled"] == 20
+        assert total["population"] == 100
+        assert total["ci_low"] < total["estimate"] < total["ci_high"]
+        assert total["ci_low"] <= 200 <= total["ci_high"]
+
+    def test_weighted_median_interval(self) -> None:
+        """Test the weighted median and its Woodruff interval."""
+        result = weighted_median_interval([(float(v), 1.0) for v in range(1, 101)], 0.95)
+
+        assert result is not None
+        assert result["median"] == 50
+        assert result["sample_size"] == 100
+        # 0.5 ± 1.96 * 0.05 -> roughly the 40th and 60th values
+        assert result["ci_low"] == 41
+        assert result["ci_high"] == 60
+        assert weighted_median_interval([], 0.95) is None
+
+    def test_weights_shift_median(self) -> None:
+        """Test that heavier observations pull the median."""
+        result = weighted_median_interval([(1.0, 1), (2.0, 1), (10.0, 5)], 0.95)
+
+        assert result is not None
+        assert result["median"] == 10
+
+
+class TestWeightedAggregation:
+    """Tests for sample weights in MetricsAggregator."""
+
+    def make_aggregator(self) -> MetricsAggregator:
+        agg = MetricsAggregator(year=2024, target_name="test", target_mode="org")
+        agg.add_repo({"full_name": REPO, "name": "repo"})
+        agg.add_prs(
+            REPO,
+            [
+                {
+                    "number": n,
+                    "user": {"login": "alice", "type": "User"},
+                    "created_at": "2024-03-01T10:00:00Z",
+                    "state": "open",
+                }
+                for n in range(1, 11)
+            ],
+        )
+        return agg
+
+    def test_weighted_reviews_scale_at_export(self) -> None:
+        """Test scaled leaderboards, time series, and review coverage."""
+        agg = self.make_aggregator()
+        agg.sampling = make_sample()
+        review = {
+            "user": {"login": "bob", "type": "User"},
+            "state": "APPROVED",
+            "submitted_at": "2024-03-01T12:00:00Z",
+        }
+        agg.add_reviews(REPO, 1, [review], weight=2.5)
+        agg.add_reviews(REPO, 2, [review], weight=2.5)
+
+        metrics = agg.export()
+
+        reviews = metrics["leaderboards"]["reviews_submitted"]
+        assert reviews == [{"user": "bob", "count": 5, "avatar_url": ""}]
+        assert metrics["leaderboards"]["approvals"][0]["count"] == 5
+        assert sum(e["count"] for e in metrics["timeseries"]["monthly"]["reviews_submitted"]) == 5
+        health = metrics["repo_health"][0]
+        assert health["review_count"] == 5
+        assert health["review_coverage"] == 50.0
+        assert metrics["summary"]["total_prs"] == 10
+        sampling = metrics["sampling"]
+        assert sampling["median_time_to_first_review"]["median"] == 2.0
+        assert set(sampling["totals"]) == {"reviews", "comments"}
+
+    def test_weighted_comments(self) -> None:
+        """Test scaled comment counts."""
+        agg = self.make_aggregator()
+        comment = {"user": {"login": "carol", "type": "User"}, "created_at": "2024-04-01T00:00:00Z"}
+        agg.add_comments(REPO, [comment, comment], comment_type="review", weight=4)
+
+        metrics = agg.export()
+
+        assert metrics["leaderboards"]["comments_total"][0]["count"] == 8
+        assert metrics["leaderboards"]["review_comments_total"][0]["count"] == 8
+        assert metrics["repo_health"][0]["comment_count"] == 8
+        assert "sampling" not in metrics
+
+    def test_merge_keeps_weighted_counts(self) -> None:
+        """Test that merging carries weighted counts and PR weights."""
+        agg = self.make_aggregator()
+        other = MetricsAggregator(year=2024, target_name="test", target_mode="org")
+        comment = {"user": {"login": "carol", "type": "User"}, "created_at": "2024-04-01T00:00:00Z"}
+        other.add_comments(REPO, [comment], weight=1.5)
+        agg.add_comments(REPO, [comment], weight=1.5)
+
+        agg.merge(other)
+
+        assert agg.export()["leaderboards"]["comments_total"][0]["count"] == 3
@@ -0,0 +1,209 @@
+"""Tests for the phase dependency scheduler."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from gh_year_end.collect.scheduler import (
+    GLOBAL,
+    DependencyFailedError,
+    PhaseScheduler,
+    ResourceClass,
+    SchedulerError,
+    merge_stats,
+)
+
+
+class Recorder:
+    """Records node start/end order and peak concurrency per resource."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str, str]] = []
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    def node(self, phase: str, repo: str, resource: str = "rest", fail: bool = False) -> Any:
+        async def run() -> dict[str, Any]:
+            self.events.append(("start", phase, repo))
+            self.active[resource] = self.active.get(resource, 0) + 1
+            self.peak[resource] = max(self.peak.get(resource, 0), self.active[resource])
+            await asyncio.sleep(0.001)
+            self.active[resource] -= 1
+            self.events.append(("end", phase, repo))
+            if fail:
+                msg = f"{phase} boom"
+                raise RuntimeError(msg)
+            return {"count": 1}
+
+        return run
+
+    def index(self, kind: str, phase: str, repo: str) -> int:
+        return self.events.index((kind, phase, repo))
+
+
+class TestPhaseScheduler:
+    """Tests for PhaseScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_dependencies_run_first(self) -> None:
+        """Test that a node starts only after its dependencies finish."""
+        rec = Recorder()
+        scheduler = PhaseScheduler({ResourceClass.REST: 4})
+        for repo in ("a", "b"):
+            scheduler.add("pulls", repo, ResourceClass.REST, rec.node("pulls", repo))
+            scheduler.add(
+                "reviews",
+                repo,
+                ResourceClass.REST,
+                rec.node("reviews", repo),
+                depends_on=[("pulls", repo)],
+            )
+
+        outcome = await scheduler.run()
+
+        assert len(outcome.results) == 4
+        assert not outcome.failures
+        for repo in ("a", "b"):
+            assert rec.index("end", "pulls", repo) < rec.index("start", "reviews", repo)
+
+    @pytest.mark.asyncio
+    async def test_resource_limits(self) -> None:
+        """Test that concurrency is limited per resource class, independently."""
+        rec = Recorder()
+        scheduler = PhaseScheduler({ResourceClass.REST: 2, ResourceClass.GRAPHQL: 1})
+        for i in range(6):
+            scheduler.add("pulls", f"r{i}", ResourceClass.REST, rec.node("pulls", f"r{i}"))
+            scheduler.add(
+                "repo_metadata",
+                f"r{i}",
+                ResourceClass.GRAPHQL,
+                rec.node("repo_metadata", f"r{i}", resource="graphql"),
+            )
+
+        await scheduler.run()
+
+        assert rec.peak == {"rest": 2, "graphql": 1}
+
+    @pytest.mark.asyncio
+    async def test_insertion_order_is_priority(self) -> None:
+        """Test that ready nodes are dispatched in insertion order."""
+        rec = Recorder()
+        scheduler = PhaseScheduler({ResourceClass.REST: 1})
+        scheduler.add("pulls", "a", ResourceClass.REST, rec.node("pulls", "a"))
+        scheduler.add(
+            "reviews", "a", ResourceClass.REST, rec.node("reviews", "a"), [("pulls", "a")]
+        )
+        scheduler.add("pulls", "b", ResourceClass.REST, rec.node("pulls", "b"))
+
+        await scheduler.run()
+
+        starts = [(phase, repo) for kind, phase, repo in rec.events if kind == "start"]
+        assert starts == [("pulls", "a"), ("reviews", "a"), ("pulls", "b")]
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_dependents_only(self) -> None:
+        """Test that a failure cascades to dependents but not to other repos."""
+        rec = Recorder()
+        finished: list[tuple[str, str, bool]] = []
+        scheduler = PhaseScheduler(
+            {ResourceClass.REST: 2},
+            on_finish=lambda node, ok: finished.append((node.phase, node.repo, ok)),
+        )
+        scheduler.add("pulls", "a", ResourceClass.REST, rec.node("pulls", "a", fail=True))
+        scheduler.add(
+            "reviews", "a", ResourceClass.REST, rec.node("reviews", "a"), [("pulls", "a")]
+        )
+        scheduler.add(
+            "review_comments",
+            "a",
+            ResourceClass.REST,
+            rec.node("review_comments", "a"),
+            [("reviews", "a")],
+        )
+        scheduler.add("pulls", "b", ResourceClass.REST, rec.node("pulls", "b"))
+
+        outcome = await scheduler.run()
+
+        assert set(outcome.results) == {("pulls", "b")}
+        assert isinstance(outcome.failures[("pulls", "a")], RuntimeError)
+        assert isinstance(outcome.failures[("reviews", "a")], DependencyFailedError)
+        assert isinstance(outcome.failures[("review_comments", "a")], DependencyFailedError)
+        assert ("start", "reviews", "a") not in rec.events
+        assert sorted(finished) == [
+            ("pulls", "a", False),
+            ("pulls", "b", True),
+            ("review_comments", "a", False),
+            ("reviews", "a", False),
+        ]
+
+    def test_unknown_dependency_rejected(self) -> None:
+        """Test that dependencies must be added first."""
+        scheduler = PhaseScheduler({})
+        with pytest.raises(SchedulerError, match="unknown node"):
+            scheduler.add(
+                "reviews", "a", ResourceClass.REST, Recorder().node("r", "a"), [("x", "a")]
+            )
+
+    def test_duplicate_node_rejected(self) -> None:
+        """Test that each (phase, repo) key is added once."""
+        scheduler = PhaseScheduler({})
+        scheduler.add("branch_protection", GLOBAL, ResourceClass.REST, Recorder().node("b", ""))
+        with pytest.raises(SchedulerError, match="Duplicate"):
+            scheduler.add("branch_protection", GLOBAL, ResourceClass.REST, Recorder().node("b", ""))
+
+    @pytest.mark.asyncio
+    async def test_cancelling_run_cancels_running_nodes(self) -> None:
+        """Test that cancelling the run cancels and awaits nodes still in flight."""
+        started = asyncio.Event()
+        cancelled: list[str] = []
+
+        def node(repo: str) -> Any:
+            async def run() -> dict[str, Any]:
+                started.set()
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.append(repo)
+                    raise
+                return {}
+
+            return run
+
+        scheduler = PhaseScheduler({ResourceClass.REST: 2})
+        for repo in ("a", "b"):
+            scheduler.add("pulls", repo, ResourceClass.REST, node(repo))
+
+        run = asyncio.ensure_future(scheduler.run())
+        await started.wait()
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        assert sorted(cancelled) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_empty_graph(self) -> None:
+        """Test that running an empty scheduler returns no results."""
+        outcome = await PhaseScheduler({}).run()
+
+        assert outcome.results == {}
+        assert outcome.failures == {}
+
+
+class TestMergeStats:
+    """Tests for merge_stats."""
+
+    def test_merges_by_type(self) -> None:
+        """Test summing numbers, concatenating lists, and merging dicts."""
+        total: dict[str, Any] = {}
+        merge_stats(total, {"n": 1, "errors": ["x"], "by": {"a": 1}, "mode": "sample"})
+        merge_stats(total, {"n": 2.5, "errors": ["y"], "by": {"a": 2, "b": 1}, "skipped": True})
+
+        assert total == {
+            "n": 3.5,
+            "errors": ["x", "y"],
+            "by": {"a": 3, "b": 1},
+            "mode": "sample",
+            "skipped": True,
+        }
@@ -0,0 +1,111 @@
+"""Tests for request trace analysis."""
+
+from typing import Any
+
+import pytest
+
+from gh_year_end.telemetry import analyze_trace, critical_path, render_analysis, summarize
+
+
+def request(start: float, network: float, **fields: Any) -> dict[str, Any]:
+    """Request record with defaults."""
+    return {
+        "type": "request",
+        "start": start,
+        "endpoint": "GET /repos/{owner}/{repo}/pulls",
+        "phase": "pulls",
+        "repo": "o/r",
+        "network": network,
+        "bytes": 100,
+        "decode": 0.0,
+        **fields,
+    }
+
+
+class TestSummarize:
+    """Tests for grouped summaries."""
+
+    def test_percentiles_and_totals(self) -> None:
+        """Test nearest-rank percentiles, totals, and ordering."""
+        records = [request(i, (i + 1) / 10) for i in range(10)]
+        records.append(request(20, 6.0, phase="issues", throttle=1.0))
+        records.append(
+            {"type": "ingest", "start": 0, "op": "add_prs", "phase": "pulls", "seconds": 1}
+        )
+
+        issues, pulls = summarize(records, "phase")
+
+        assert issues.key == "issues"
+        assert issues.wait == 1.0
+        assert pulls.to_dict() == {
+            "key": "pulls",
+            "requests": 10,
+            "total_seconds": 6.5,
+            "wait_seconds": 0.0,
+            "network_seconds": 5.5,
+            "decode_seconds": 0.0,
+            "ingest_seconds": 1.0,
+            "bytes": 1000,
+            "p50_ms": 500.0,
+            "p90_ms": 900.0,
+            "p99_ms": 1000.0,
+        }
+
+    def test_ingest_grouped_by_operation(self) -> None:
+        """Test that ingest records get their own endpoint rows."""
+        records = [{"type": "ingest", "start": 0, "op": "add_prs", "seconds": 0.5}]
+
+        assert [group.key for group in summarize(records, "endpoint")] == ["ingest add_prs"]
+        assert [group.key for group in summarize(records, "repo")] == ["(none)"]
+
+
+class TestCriticalPath:
+    """Tests for wall time attribution."""
+
+    def test_network_wins_over_waiting(self) -> None:
+        """Test overlap priority and the untraced remainder."""
+        records = [
+            # waits 0-2, network 2-3
+            request(0.0, 1.0, queue=2.0),
+            # network 1-4
+            request(1.0, 3.0),
+            # idle 4-5, CPU 5-6
+            {"type": "ingest", "start": 5.0, "op": "add_prs", "seconds": 1.0},
+        ]
+
+        path = critical_path(records)
+
+        assert path["wall_seconds"] == 6.0
+        assert path["seconds"] == {"network": 3.0, "rate_limit": 1.0, "cpu": 1.0, "untraced": 1.0}
+        assert path["bound"] == "network"
+
+    def test_rate_limit_bound(self) -> None:
+        """Test a run dominated by limiter sleeps."""
+        path = critical_path([request(0.0, 0.5, secondary=10.0)])
+
+        assert path["bound"] == "rate_limit"
+        assert path["seconds"]["rate_limit"] == pytest.approx(10.0)
+
+    def test_empty(self) -> None:
+        """Test that an empty trace has no bound."""
+        assert critical_path([])["bound"] is None
+
+
+class TestAnalyzeTrace:
+    """Tests for the full analysis."""
+
+    def test_phases_and_tables(self) -> None:
+        """Test per-phase critical paths and rendered tables."""
+        records = [request(0, 1.0), request(1, 1.0, phase="issues", queue=3.0)]
+
+        analysis = analyze_trace(records, top=5)
+
+        assert analysis["requests"] == 2
+        assert analysis["critical_path"]["phases"]["issues"]["bound"] == "rate_limit"
+        assert analysis["critical_path"]["phases"]["pulls"]["bound"] == "network"
+        assert [table.title for table in render_analysis(analysis)] == [
+            "Critical path (seconds of wall time)",
+            "By phase",
+            "By endpoint",
+            "By repo",
+        ]